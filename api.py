@@ -81,21 +81,31 @@ def generate_personas_api():
     demographics = data.get('demographics', {})
     diversity_constraints = data.get('diversity_constraints', {})
 
+    # 불가능한 제약 조건은 생성을 시도하지 않고 위반 규칙과 함께 즉시 거부
+    feasibility = get_generator().analyze_feasibility(demographics)
+    if not feasibility.feasible:
+        return jsonify({
+            "error": feasibility.message,
+            "violated_rules": feasibility.violated_rules,
+            "feasibility": feasibility.to_dict()
+        }), 400
+
     result = get_generator().generate_personas(count=count, 
                                                demographics_constraints=demographics,
-                                               diversity_constraints=diversity_constraints)
+                                               diversity_constraints=diversity_constraints,
+                                               vectorized=True)
     
     personas = result["personas"]
     generation_stats = result["generation_stats"]
     
-    # 생성된 페르소나를 DB에 저장
-    for persona in personas:
-        get_db().insert_persona(persona)
+    # 생성된 페르소나를 DB에 일괄 저장
+    saved_count = get_db().insert_personas(personas)
     
     return jsonify({
-        "message": f"{len(personas)} valid personas generated and saved.",
+        "message": f"{len(personas)} valid personas generated, {saved_count} saved.",
         "personas": personas,
         "generation_stats": generation_stats,
+        "feasibility": feasibility.to_dict(),
         "success_rate": f"{result['success_rate']:.1f}%"
     })
 
@@ -149,6 +159,11 @@ def get_personas_stats_api():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/metrics/generation', methods=['GET'])
+def get_generation_metrics_api():
+    """제약 조건 집합별 생성 지표 (규칙별 거부 횟수, 재시도 깊이 히스토그램, 수용률)를 반환합니다"""
+    return jsonify(get_generator().generation_metrics())
+
 @app.route('/api/database/info', methods=['GET'])
 def get_database_info_api():
     """현재 데이터베이스 설정 정보를 반환합니다"""
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+행동 패턴 추출 모듈
+미디어 소비와 소비 행태를 균등 선택 대신 연도별 트렌드 지표(technology_adoption, consumption_patterns,
+media_consumption)와 세대별 디지털 친화도(get_generational_trends)로 정한 확률 테이블에서 추출합니다.
+테이블은 연도마다 한 번 [세대, 선택지] 확률로 만들고, 묶음 생성은 세대별로 별칭 테이블에서 한 번에 추출합니다.
+"""
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from timeseries_data import DEFAULT_TREND_FACTOR
+from weighted_sampler import AliasSampler
+
+# 선택지 -> 선택 가중치를 정하는 (카테고리, 지표) 목록 (여러 개면 평균, 목록에 없는 선택지는 DEFAULT_TREND_FACTOR)
+BEHAVIOR_OPTION_METRICS = {
+    "media_consumption": {
+        "유튜브/OTT 시청": (("media_consumption", "youtube_usage"), ("media_consumption", "streaming_services"),
+                       ("technology_adoption", "streaming_service_usage")),
+        "뉴스 앱/포털 이용": (("media_consumption", "news_source_digital"), ("technology_adoption", "internet_usage")),
+        "SNS 활발": (("media_consumption", "social_media_time"), ("technology_adoption", "social_media_users")),
+        "웹툰/웹소설 소비": (("media_consumption", "short_form_content"), ("technology_adoption", "smartphone_penetration"))
+    },
+    "shopping_habit": {
+        "온라인 쇼핑 선호": (("consumption_patterns", "online_vs_offline_shopping"),
+                      ("technology_adoption", "online_shopping_adoption")),
+        "배달 앱 사용 빈번": (("consumption_patterns", "delivery_service_usage"),),
+        "해외 직구": (("technology_adoption", "online_shopping_adoption"), ("technology_adoption", "digital_payment_usage")),
+        "중고거래 활발": (("consumption_patterns", "secondhand_market"),)
+    }
+}
+
+# 세대별 디지털 친화도로 사용할 get_generational_trends 항목
+GENERATION_DIGITAL_METRICS = {
+    "Z세대": "digital_nativity",
+    "밀레니얼": "digital_adoption",
+    "X세대": "technology_adaptation",
+    "베이비부머": "technology_adoption"
+}
+
+# 선택지별 세대 보정 민감도: 가중치 *= (세대 친화도 / 세대 평균 친화도) ** 민감도 (없으면 0 = 보정 없음)
+BEHAVIOR_GENERATION_SENSITIVITY = {
+    "유튜브/OTT 시청": 1.0,
+    "뉴스 앱/포털 이용": -0.5,
+    "SNS 활발": 2.0,
+    "웹툰/웹소설 소비": 2.0,
+    "온라인 쇼핑 선호": 1.0,
+    "배달 앱 사용 빈번": 1.0,
+    "해외 직구": 1.5,
+    "중고거래 활발": 0.5
+}
+
+
+class BehaviorTables:
+    """
+    한 연도의 행동 패턴 확률 테이블.
+    행 0은 어느 세대에도 속하지 않는 연령(세대 보정 없음), 행 1부터는 generation_bands 순서의 세대입니다.
+    """
+
+    def __init__(self, year: int, labels: Dict[str, Sequence[str]], probabilities: Dict[str, np.ndarray],
+                 generation_bands: Sequence[Tuple[str, int, Optional[int]]]):
+        self.year = year
+        self.labels = {field: list(options) for field, options in labels.items()}
+        self.probabilities = probabilities  # 필드 -> [세대 행, 선택지] 확률
+        self.generation_bands = tuple(generation_bands)
+        self._samplers = {
+            field: [AliasSampler(dict(zip(range(len(self.labels[field])), row))) for row in table]
+            for field, table in probabilities.items()
+        }
+
+    def generation_rows(self, ages: np.ndarray) -> np.ndarray:
+        """연령 배열 -> 세대 행 인덱스"""
+        ages = np.asarray(ages)
+        rows = np.zeros(len(ages), dtype=np.intp)
+        for row, (_, min_age, max_age) in enumerate(self.generation_bands, 1):
+            rows[(ages >= min_age) if max_age is None else (ages >= min_age) & (ages <= max_age)] = row
+        return rows
+
+    def generation_row(self, age: Optional[int]) -> int:
+        if age is None:
+            return 0
+        for row, (_, min_age, max_age) in enumerate(self.generation_bands, 1):
+            if min_age <= age and (max_age is None or age <= max_age):
+                return row
+        return 0
+
+    def sample(self, ages: np.ndarray, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+        """연령별 세대 행에서 필드별 선택지 코드(labels 순서)를 한 번에 추출"""
+        rows = self.generation_rows(ages)
+        result = {}
+        for field, samplers in self._samplers.items():
+            codes = np.zeros(len(rows), dtype=np.int16)
+            for row, sampler in enumerate(samplers):
+                in_row = rows == row
+                size = int(in_row.sum())
+                if size:
+                    codes[in_row] = sampler.draw_codes(size, rng)
+            result[field] = codes
+        return result
+
+    def draw(self, field: str, age: Optional[int], rand) -> str:
+        """한 건 추출 (rand: random 모듈 또는 random.Random 인스턴스)"""
+        return self.labels[field][self._samplers[field][self.generation_row(age)].draw(rand)]
+
+
+def build_behavior_tables(ts_manager, year: int, labels: Dict[str, Sequence[str]],
+                          generation_bands: Sequence[Tuple[str, int, Optional[int]]]) -> BehaviorTables:
+    """
+    연도별 트렌드 지표와 세대 트렌드로 행동 패턴 확률 테이블을 만듭니다.
+    통계가 없는 연도의 지표는 데이터가 있는 가장 가까운 연도 값을 사용합니다.
+
+    Args:
+        ts_manager: TimeSeriesDataManager
+        year: 생성 연도
+        labels: 필드 -> 선택지 목록 (코드표 순서)
+        generation_bands: (세대 이름, 최소 연령, 최대 연령) 목록
+    """
+    trends = ts_manager.interpolate(year)
+
+    def metric_value(category, metric):
+        names = trends.metric_names.get(category, ())
+        if metric not in names:
+            return DEFAULT_TREND_FACTOR
+        value = float(trends.values[category][0, names.index(metric)])
+        return DEFAULT_TREND_FACTOR if np.isnan(value) else value
+
+    generational = ts_manager.get_generational_trends(year)
+    affinity = np.array([
+        generational.get(name, {}).get(GENERATION_DIGITAL_METRICS.get(name), DEFAULT_TREND_FACTOR)
+        for name, _, _ in generation_bands
+    ], dtype=np.float64)
+    relative = np.concatenate([[1.0], affinity / affinity.mean()])  # 행 0 = 세대 보정 없음
+
+    probabilities = {}
+    for field, options in labels.items():
+        option_metrics = BEHAVIOR_OPTION_METRICS.get(field, {})
+        base = np.array([
+            np.mean([metric_value(*metric) for metric in option_metrics[option]])
+            if option_metrics.get(option) else DEFAULT_TREND_FACTOR
+            for option in options
+        ], dtype=np.float64)
+        sensitivity = np.array([BEHAVIOR_GENERATION_SENSITIVITY.get(option, 0.0) for option in options])
+        weights = base[None, :] * relative[:, None] ** sensitivity[None, :]
+        probabilities[field] = weights / weights.sum(axis=1, keepdims=True)
+    return BehaviorTables(year, labels, probabilities, generation_bands)
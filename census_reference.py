@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""
+인구총조사 참조 통계 모듈
+통계청 교육정도별 인구 CSV(성 × 행정구역 × 연령 × 혼인상태 × 교육정도)를 한 번에 읽어 조밀한 NumPy 인구수 텐서로
+변환합니다. 변환 결과는 CSV 내용의 SHA-256 해시를 키로 .npz 파일에 캐시되어, 같은 파일로 다시 시작할 때는
+pandas를 불러오거나 CSV를 파싱하지 않고 배열만 읽습니다.
+CensusJointSampler는 이 텐서를 결합 분포로 펼쳐 다섯 속성을 한 번의 범주형 추출로 뽑습니다.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from weighted_sampler import AliasSampler
+
+logger = logging.getLogger(__name__)
+
+# 인구수 텐서의 축 순서와 CSV 열 이름
+CENSUS_DIMENSIONS = ("gender", "region", "age_band", "marital_status", "education")
+CENSUS_KEY_COLUMNS = ("성별", "행정구역별", "연령별", "혼인상태별")
+EDUCATION_COLUMNS = ("중학교", "고등학교", "대학(4년제 미만)", "대학교(4년제 이상)", "대학원(석사 과정)", "대학원(박사 과정)")
+CENSUS_ENCODING = "euc-kr"
+CENSUS_HEADER_ROWS = 1  # 열 이름 앞의 조사 연도 행
+
+# 변환 캐시 디렉토리 (환경 변수로 변경 가능)
+CENSUS_CACHE_DIR_ENV = "PERSONA_REFERENCE_CACHE_DIR"
+DEFAULT_CENSUS_CACHE_DIR = Path(__file__).resolve().parent / "ref" / ".compiled"
+# 캐시 형식 버전 (저장하는 배열 구성이 바뀌면 올려서 이전 캐시를 무시)
+CENSUS_CACHE_VERSION = 1
+
+_ARRAY_NAMES = ("counts", "present", "genders", "regions", "age_labels", "age_bounds", "marital_statuses", "educations")
+
+
+class CensusReferenceError(ValueError):
+    """참조 통계 CSV 형식이 잘못된 경우"""
+
+
+class CensusCounts:
+    """
+    인구수 텐서 counts[성별, 행정구역, 연령대, 혼인상태, 교육정도]와 축별 라벨.
+    present는 통계표에 값이 있는 칸('-'나 빈칸이 아닌 칸)이며, 연령대 상한이 없으면(예: 85세이상) None입니다.
+    """
+
+    def __init__(self, counts: np.ndarray, present: np.ndarray, genders, regions, age_labels,
+                 age_bounds: np.ndarray, marital_statuses, educations, content_hash: str = ""):
+        self.counts = counts
+        self.present = present
+        self.genders = tuple(genders)
+        self.regions = tuple(regions)
+        self.age_labels = tuple(age_labels)
+        self.age_bands = tuple((int(low), int(high) if high >= 0 else None) for low, high in age_bounds.tolist())
+        self.marital_statuses = tuple(marital_statuses)
+        self.educations = tuple(educations)
+        self.content_hash = content_hash
+
+    def _arrays(self) -> Dict[str, np.ndarray]:
+        age_bounds = np.array([(low, -1 if high is None else high) for low, high in self.age_bands], dtype=np.int64)
+        return {
+            "counts": self.counts, "present": self.present,
+            "genders": np.array(self.genders), "regions": np.array(self.regions),
+            "age_labels": np.array(self.age_labels), "age_bounds": age_bounds.reshape(-1, 2),
+            "marital_statuses": np.array(self.marital_statuses), "educations": np.array(self.educations)
+        }
+
+    def _closed_age_bands(self):
+        """(인덱스, (최소 연령, 최대 연령)) - 상한이 있는 연령대만 ('15~19' 형식)"""
+        return [(index, band) for index, band in enumerate(self.age_bands) if band[1] is not None]
+
+    def education_stats(self) -> Dict[Tuple[int, int], Dict[Tuple[str, str], Dict[int, int]]]:
+        """연령대 -> (성별, 혼인상태) -> 교육정도 인덱스 -> 인구수 (행정구역 합계, 값이 있는 교육정도만)"""
+        by_key = self.counts.sum(axis=1)  # [성별, 연령대, 혼인상태, 교육정도]
+        has_value = self.present.any(axis=1)
+        stats = {}
+        for age, band in self._closed_age_bands():
+            stats[band] = {
+                (gender, marital): {int(i): int(by_key[g, age, m, i]) for i in np.flatnonzero(has_value[g, age, m])}
+                for g, gender in enumerate(self.genders)
+                for m, marital in enumerate(self.marital_statuses)
+            }
+        return stats
+
+    def marital_stats(self) -> Dict[Tuple[int, int], Dict[str, Dict[str, int]]]:
+        """연령대 -> 성별 -> 혼인상태 -> 인구수 (행정구역·교육정도 합계, 0명인 혼인상태는 제외)"""
+        totals = self.counts.sum(axis=(1, 4))  # [성별, 연령대, 혼인상태]
+        stats = {}
+        for age, band in self._closed_age_bands():
+            stats[band] = {
+                gender: {marital: int(totals[g, age, m]) for m, marital in enumerate(self.marital_statuses)
+                         if totals[g, age, m] > 0}
+                for g, gender in enumerate(self.genders)
+            }
+        return stats
+
+
+def parse_age_band(label: str) -> Tuple[int, Optional[int]]:
+    """'15~19' -> (15, 19), '85세이상' -> (85, None)"""
+    text = label.replace("　", "").replace(" ", "")
+    try:
+        if "~" in text:
+            low, high = text.split("~")
+            return int(low.rstrip("세")), int(high.rstrip("세"))
+        if text.endswith("세이상"):
+            return int(text[:-len("세이상")]), None
+    except ValueError:
+        pass
+    raise CensusReferenceError(f"연령대를 해석할 수 없습니다: {label!r}")
+
+
+def parse_census_csv(raw: bytes, content_hash: str = "") -> CensusCounts:
+    """
+    CSV 내용을 인구수 텐서로 변환 (행 단위 반복 없이 factorize와 np.add.at으로 집계).
+
+    Raises:
+        CensusReferenceError: 필요한 열이 없거나 값을 해석할 수 없는 경우
+    """
+    import pandas as pd  # 캐시가 있으면 불러오지 않음
+
+    try:
+        df = pd.read_csv(io.StringIO(raw.decode(CENSUS_ENCODING)), skiprows=CENSUS_HEADER_ROWS, dtype=str)
+    except (UnicodeDecodeError, pd.errors.ParserError) as e:
+        raise CensusReferenceError(f"참조 통계 CSV를 읽을 수 없습니다: {e}") from e
+    missing = [column for column in CENSUS_KEY_COLUMNS + EDUCATION_COLUMNS if column not in df.columns]
+    if missing:
+        raise CensusReferenceError(f"참조 통계 CSV에 필요한 열이 없습니다: {', '.join(missing)}")
+
+    keys = df[list(CENSUS_KEY_COLUMNS)].apply(lambda column: column.str.replace("　", "").str.strip())
+    codes, labels = zip(*(pd.factorize(keys[column]) for column in CENSUS_KEY_COLUMNS))
+    values = df[list(EDUCATION_COLUMNS)].apply(lambda column: column.str.strip())
+    present = values.notna() & (values != "-")
+    try:
+        numbers = values.where(present, "0").astype(np.int64).to_numpy()
+    except ValueError as e:
+        raise CensusReferenceError(f"인구수를 숫자로 해석할 수 없습니다: {e}") from e
+
+    shape = tuple(len(label) for label in labels) + (len(EDUCATION_COLUMNS),)
+    counts = np.zeros(shape, dtype=np.int64)
+    observed = np.zeros(shape, dtype=bool)
+    np.add.at(counts, codes, numbers)
+    np.logical_or.at(observed, codes, present.to_numpy())
+
+    age_bounds = np.array([(low, -1 if high is None else high) for low, high in map(parse_age_band, labels[2])],
+                          dtype=np.int64).reshape(-1, 2)
+    return CensusCounts(counts, observed, labels[0], labels[1], labels[2], age_bounds, labels[3],
+                        EDUCATION_COLUMNS, content_hash)
+
+
+def _cache_dir(cache_dir: Optional[Union[str, Path]]) -> Path:
+    if cache_dir is not None:
+        return Path(cache_dir)
+    return Path(os.environ.get(CENSUS_CACHE_DIR_ENV, DEFAULT_CENSUS_CACHE_DIR))
+
+
+def _cache_path(cache_dir: Path, content_hash: str) -> Path:
+    return cache_dir / f"{content_hash}-v{CENSUS_CACHE_VERSION}.npz"
+
+
+def _read_cached(path: Path, content_hash: str) -> Optional[CensusCounts]:
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            arrays = {name: data[name] for name in _ARRAY_NAMES}
+    except FileNotFoundError:
+        return None
+    except Exception as e:  # 손상되었거나 호환되지 않는 캐시는 무시하고 다시 변환
+        logger.warning(f"참조 통계 캐시를 읽지 못했습니다 ({path}): {e}")
+        return None
+    return CensusCounts(arrays["counts"], arrays["present"], arrays["genders"].tolist(), arrays["regions"].tolist(),
+                        arrays["age_labels"].tolist(), arrays["age_bounds"], arrays["marital_statuses"].tolist(),
+                        arrays["educations"].tolist(), content_hash)
+
+
+def _write_cached(path: Path, census: CensusCounts):
+    """임시 파일에 쓴 뒤 os.replace로 교체 (동시에 시작한 워커가 반쯤 쓰인 캐시를 읽지 않도록)"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **census._arrays())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:  # 읽기 전용 배포 환경 등에서는 캐시 없이 동작
+        logger.warning(f"참조 통계 캐시를 저장하지 못했습니다 ({path}): {e}")
+
+
+_loaded_counts: Dict[str, CensusCounts] = {}  # 내용 해시 -> CensusCounts (프로세스 내 재사용)
+_loaded_lock = threading.Lock()
+
+
+def load_census_counts(path: Union[str, Path], cache_dir: Optional[Union[str, Path]] = None,
+                       use_cache: bool = True) -> CensusCounts:
+    """
+    참조 통계 CSV를 인구수 텐서로 읽습니다.
+    같은 내용(해시)의 파일은 프로세스 안에서는 메모리에서, 다른 프로세스에서는 디스크 캐시에서 재사용됩니다.
+
+    Args:
+        path: 참조 통계 CSV 경로
+        cache_dir: 변환 캐시 디렉토리 (기본: PERSONA_REFERENCE_CACHE_DIR 환경 변수 또는 ref/.compiled)
+        use_cache: False이면 캐시를 읽거나 쓰지 않고 항상 CSV를 파싱
+
+    Raises:
+        OSError: 파일을 읽을 수 없는 경우
+        CensusReferenceError: CSV 형식이 잘못된 경우
+    """
+    raw = Path(path).read_bytes()
+    content_hash = hashlib.sha256(raw).hexdigest()
+    if not use_cache:
+        return parse_census_csv(raw, content_hash)
+
+    with _loaded_lock:
+        census = _loaded_counts.get(content_hash)
+    if census is not None:
+        return census
+    cache_path = _cache_path(_cache_dir(cache_dir), content_hash)
+    census = _read_cached(cache_path, content_hash)
+    if census is not None:
+        logger.debug(f"변환된 참조 통계 캐시 사용: {cache_path}")
+    else:
+        census = parse_census_csv(raw, content_hash)
+        _write_cached(cache_path, census)
+    with _loaded_lock:
+        return _loaded_counts.setdefault(content_hash, census)
+
+
+class CensusJointSampler:
+    """
+    인구수 텐서를 (성별, 행정구역, 연령, 혼인상태, 교육정도) 결합 분포로 한 번 펼친 별칭 테이블.
+    연령대 인구는 대역 안의 각 연령에 균등하게 나누고(상한 없는 연령대는 max_age까지), valid[연령, 혼인, 교육]이
+    False인 칸은 제외하므로 한 번의 범주형 추출로 속성 간 실제 상관관계를 유지한 조합을 얻습니다.
+    """
+
+    def __init__(self, census: CensusCounts, max_age: int = 100, valid: Optional[np.ndarray] = None):
+        self.census = census
+        self.max_age = max_age
+        genders, regions, _, maritals, educations = census.counts.shape
+        weights = np.zeros((genders, regions, max_age + 1, maritals, educations), dtype=np.float64)
+        for band, (low, high) in enumerate(census.age_bands):
+            high = max_age if high is None else min(high, max_age)
+            if low <= high:
+                weights[:, :, low:high + 1] = census.counts[:, :, band, None] / (high - low + 1)
+        if valid is not None:
+            weights *= valid[None, None]
+        self.shape = weights.shape
+        cells = np.flatnonzero(weights)
+        if not len(cells):
+            raise CensusReferenceError("유효한 조합이 없어 결합 분포를 만들 수 없습니다")
+        self._cells = cells
+        self._sampler = AliasSampler(dict(zip(range(len(cells)), weights.ravel()[cells].tolist())))
+
+    def probabilities(self) -> np.ndarray:
+        """결합 확률 텐서 [성별, 행정구역, 연령, 혼인상태, 교육정도]"""
+        probabilities = np.zeros(int(np.prod(self.shape)), dtype=np.float64)
+        probabilities[self._cells] = self._sampler.probabilities
+        return probabilities.reshape(self.shape)
+
+    def _decode(self, cells: np.ndarray) -> Dict[str, np.ndarray]:
+        gender, region, age, marital, education = np.unravel_index(cells, self.shape)
+        return {"gender": gender, "region": region, "age": age, "marital_status": marital, "education": education}
+
+    def sample(self, size: int, rng: Optional[np.random.Generator] = None) -> Dict[str, np.ndarray]:
+        """size개 조합을 한 번에 추출: 축 이름 -> 코드 배열 (age는 연령 자체, 나머지는 CensusCounts 라벨 인덱스)"""
+        return self._decode(self._cells[self._sampler.draw_codes(size, rng)])
+
+    def sample_one(self, rand) -> Dict[str, int]:
+        """조합 하나를 추출 (rand: random 모듈 또는 random.Random 인스턴스)"""
+        return {axis: int(code) for axis, code in self._decode(self._cells[self._sampler.draw(rand)]).items()}
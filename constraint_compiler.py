@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+제약 조건 컴파일러 모듈
+PersonaValidator의 연령 관계 규칙(연령-직업/교육/결혼/소득)을 연령별 조건부 샘플링 테이블로 변환합니다.
+컴파일된 테이블에서 추출한 값은 생성 시점에 이미 유효하므로 재시도가 필요 없습니다.
+"""
+
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from weighted_sampler import AliasSampler
+
+# 샘플링 대상 속성 -> 해당 속성을 제약하는 검증 규칙 이름
+RULE_FIELDS = {
+    "occupation": "age_occupation",
+    "education": "age_education",
+    "marital_status": "age_marital",
+    "income_bracket": "age_income"
+}
+
+
+class InfeasibleConstraintsError(ValueError):
+    """제약 조건을 만족하는 페르소나가 존재하지 않을 때 발생"""
+
+    def __init__(self, message: str, violated_rules: List[str]):
+        super().__init__(message)
+        self.violated_rules = violated_rules
+
+
+class CompiledConstraints:
+    """연령 분포와 연령별 조건부 속성 분포로 구성된 샘플링 테이블"""
+
+    def __init__(self, ages: np.ndarray, age_probabilities: np.ndarray,
+                 tables: Dict[str, np.ndarray], categories: Dict[str, List[str]],
+                 acceptance_rate: float = 1.0):
+        self.ages = ages
+        self.age_probabilities = age_probabilities
+        self.tables = tables  # 속성 -> [연령, 코드] 조건부 확률 (연령 행마다 합 1, 불가능 연령은 0)
+        self.categories = categories
+        self.acceptance_rate = acceptance_rate  # 사전 분포에서 뽑아 검증했을 때 통과할 확률
+
+        support = age_probabilities > 0
+        self._age_sampler = AliasSampler(dict(zip(ages[support].tolist(), age_probabilities[support].tolist())))
+        self._cdfs = {field: np.cumsum(table, axis=1) for field, table in tables.items()}
+        # 부동소수점 오차로 확률 0인 뒤쪽 코드가 뽑히지 않도록 행별 마지막 유효 코드로 제한
+        self._last_codes = {
+            field: np.where(table > 0, np.arange(table.shape[1]), 0).max(axis=1)
+            for field, table in tables.items()
+        }
+        self._row_samplers = {}
+
+    def feasible_combinations(self) -> int:
+        """확률이 0보다 큰 (연령, 규칙 대상 속성값) 조합의 수"""
+        support = np.ones(len(self.ages), dtype=np.int64) * (self.age_probabilities > 0)
+        for table in self.tables.values():
+            support = support * np.count_nonzero(table, axis=1)
+        return int(support.sum())
+
+    def feasible_age_range(self) -> Tuple[int, int]:
+        """유효한 페르소나가 존재하는 최소/최대 연령"""
+        supported = self.ages[self.age_probabilities > 0]
+        return int(supported.min()), int(supported.max())
+
+    def sample(self, count: int, rng: Optional[np.random.Generator] = None) -> Dict[str, np.ndarray]:
+        """연령과 규칙 대상 속성 코드를 count개 한 번에 추출"""
+        rng = rng if rng is not None else np.random.default_rng()
+        ages = np.asarray(self._age_sampler.items, dtype=np.int16)[self._age_sampler.draw_codes(count, rng)]
+
+        result = {"age": ages}
+        result.update(self.sample_for_ages(ages, rng))
+        return result
+
+    def sample_for_ages(self, ages: np.ndarray, rng: Optional[np.random.Generator] = None,
+                        fields: Optional[Tuple[str, ...]] = None) -> Dict[str, np.ndarray]:
+        """주어진 연령별로 규칙 대상 속성 코드를 추출 (연령은 유효 연령 범위 안이어야 함, fields 기본: 전체)"""
+        rng = rng if rng is not None else np.random.default_rng()
+        count = len(ages)
+        result = {}
+        for field in (fields if fields is not None else tuple(self._cdfs)):
+            rows = self._cdfs[field][ages]
+            codes = (rows < rng.random(count)[:, None] * rows[:, -1:]).sum(axis=1)
+            result[field] = np.minimum(codes, self._last_codes[field][ages]).astype(np.int16)
+        return result
+
+    def sample_one(self, rand=random) -> Dict[str, Any]:
+        """연령과 규칙 대상 속성 값을 하나 추출"""
+        age = self._age_sampler.draw(rand)
+        demographics = {"age": age}
+        for field in self.tables:
+            sampler = self._row_samplers.get((field, age))
+            if sampler is None:
+                row = self.tables[field][age]
+                support = np.flatnonzero(row)
+                sampler = self._row_samplers[(field, age)] = AliasSampler(
+                    {self.categories[field][code]: row[code] for code in support.tolist()})
+            demographics[field] = sampler.draw(rand)
+        return demographics
+
+
+class ConstraintCompiler:
+    """검증 규칙을 연령 × 속성값 유효성 격자로 평가하고 조건부 샘플링 테이블을 만드는 컴파일러"""
+
+    def __init__(self, validator):
+        self.validator = validator
+        self._validity_cache = {}
+        self._rules_version = getattr(validator, "rules_version", None)
+
+    def _refresh_cache(self):
+        """검증 규칙이 바뀌었으면 (validator.rules_version 증가) 캐시된 격자를 버림"""
+        rules_version = getattr(self.validator, "rules_version", None)
+        if rules_version != self._rules_version:
+            self._validity_cache.clear()
+            self._rules_version = rules_version
+
+    def _rule_check(self, field: str):
+        return {
+            "occupation": self.validator._validate_age_occupation,
+            "education": self.validator._validate_age_education,
+            "marital_status": self.validator._validate_age_marital_status,
+            "income_bracket": self.validator._validate_age_income
+        }[field]
+
+    def validity(self, field: str, label: str, ages: np.ndarray) -> np.ndarray:
+        """속성값 label이 각 연령에서 규칙을 통과하는지 여부 (캐시됨)"""
+        self._refresh_cache()
+        key = (field, label, len(ages))
+        valid = self._validity_cache.get(key)
+        if valid is None:
+            check = self._rule_check(field)
+            valid = np.array([check(int(age), label) is None for age in ages], dtype=bool)
+            self._validity_cache[key] = valid
+        return valid
+
+    def age_validity(self, ages: np.ndarray) -> np.ndarray:
+        self._refresh_cache()
+        key = ("age", None, len(ages))
+        valid = self._validity_cache.get(key)
+        if valid is None:
+            valid = np.array([self.validator._validate_age_range(int(age)) for age in ages], dtype=bool)
+            self._validity_cache[key] = valid
+        return valid
+
+    def clear_cache(self):
+        """검증 규칙이 바뀌었을 때 캐시된 유효성 격자를 비움"""
+        self._validity_cache.clear()
+
+    def compile(self, ages: np.ndarray, age_prior: np.ndarray,
+                attribute_priors: Dict[str, np.ndarray],
+                categories: Dict[str, List[str]]) -> CompiledConstraints:
+        """
+        사전 분포에 규칙 유효성 마스크를 곱해 조건부 샘플링 테이블을 만듭니다.
+        결과 분포는 "전체 생성 후 검증, 실패 시 재시도"와 동일하지만 재시도가 없습니다.
+
+        Args:
+            ages: 연령 격자 (0부터 연속)
+            age_prior: 연령별 사전 확률
+            attribute_priors: 속성 -> [연령, 코드] 사전 가중치 (제약 조건은 원-핫으로 반영)
+            categories: 속성 -> 코드표
+
+        Raises:
+            InfeasibleConstraintsError: 유효한 조합이 하나도 없는 경우
+        """
+        age_valid = self.age_validity(ages)
+        joint = age_prior * age_valid
+        if not joint.any():
+            raise InfeasibleConstraintsError(
+                "요청한 연령 범위에 유효한 연령이 없습니다 (허용 범위: "
+                f"{self.validator.validation_rules['age_limits']['min_age']}-"
+                f"{self.validator.validation_rules['age_limits']['max_age']}세)",
+                ["age_limits"])
+
+        tables = {}
+        masses = {}
+        # 사전 분포에서 뽑은 조합이 검증을 통과할 확률 (속성 사전 분포는 연령 행마다 정규화해 계산)
+        accepted = joint.copy()
+        for field, prior in attribute_priors.items():
+            if field in RULE_FIELDS:
+                mask = np.stack([self.validity(field, label, ages) for label in categories[field]], axis=1)
+                weighted = prior * mask
+            else:
+                weighted = prior.astype(np.float64)
+            masses[field] = weighted.sum(axis=1)
+            joint = joint * masses[field]
+            tables[field] = weighted
+            prior_mass = prior.sum(axis=1)
+            accepted = accepted * np.divide(masses[field], prior_mass, out=np.zeros(len(ages)), where=prior_mass > 0)
+
+        if not joint.any():
+            supported = age_prior * age_valid > 0
+            violated = [RULE_FIELDS.get(field, field) for field, mass in masses.items()
+                        if not (mass[supported] > 0).any()]
+            if not violated:
+                # 개별 규칙은 만족 가능하지만 동시에 만족하는 연령이 없는 경우
+                violated = [RULE_FIELDS.get(field, field) for field, mass in masses.items()
+                            if (mass[supported] == 0).any()]
+            raise InfeasibleConstraintsError(
+                f"제약 조건을 동시에 만족하는 페르소나가 없습니다 (위반 규칙: {', '.join(violated)})",
+                violated)
+
+        for field, weighted in tables.items():
+            with np.errstate(invalid="ignore", divide="ignore"):
+                normalized = weighted / masses[field][:, None]
+            normalized[masses[field] == 0] = 0.0
+            normalized[joint == 0] = 0.0
+            tables[field] = normalized
+
+        return CompiledConstraints(ages, joint / joint.sum(), tables, categories,
+                                   acceptance_rate=float(accepted.sum() / age_prior.sum()))
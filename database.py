@@ -5,6 +5,10 @@ import logging
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from database_interface import DatabaseInterface
+from id_allocator import BlockIdAllocator
+
+# 기존 무작위 9자리 ID와 겹치지 않도록 10자리부터 할당
+FIRST_PERSONA_ID = 1000000000
 
 class SQLiteDatabase(DatabaseInterface):
     def __init__(self, db_path=None):
@@ -16,6 +20,7 @@ class SQLiteDatabase(DatabaseInterface):
             else:
                 db_path = 'personas.db'
         self.db_path = db_path
+        self.id_allocator = BlockIdAllocator(self)  # ID 없이 삽입되는 페르소나용
         self._create_tables()
     
     def _reconstruct_persona_structure(self, row_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -79,6 +84,14 @@ class SQLiteDatabase(DatabaseInterface):
             )
         """)
         
+        # ID 블록 예약용 시퀀스 테이블
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS id_sequences (
+                name TEXT PRIMARY KEY,
+                next_value INTEGER
+            )
+        """)
+        
         # persona_relationships 테이블 생성
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS persona_relationships (
@@ -95,26 +108,40 @@ class SQLiteDatabase(DatabaseInterface):
         conn.commit()
         conn.close()
 
-    def insert_persona(self, persona_data: Dict[str, Any]) -> bool:
-        """페르소나 데이터를 삽입합니다"""
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # JSON 필드는 문자열로 변환하여 저장
-            personality_traits_json = json.dumps(persona_data["psychological_attributes"]["personality_traits"], ensure_ascii=False)
-            persona_values_json = json.dumps(persona_data["psychological_attributes"]["values"], ensure_ascii=False) # 컬럼명 변경
-            interests_json = json.dumps(persona_data["behavioral_patterns"]["interests"], ensure_ascii=False)
-            lifestyle_attributes_json = json.dumps(persona_data["psychological_attributes"]["lifestyle_attributes"], ensure_ascii=False)
-            social_relations_json = json.dumps(persona_data["social_relations"], ensure_ascii=False) # 위치 변경
-
-            cursor.execute("""
+    _INSERT_PERSONA_SQL = """
             INSERT INTO personas (
                 id, name, age, gender, location, occupation, education, income_bracket, marital_status,
                 personality_traits, persona_values, interests, lifestyle_attributes, media_consumption, shopping_habit, social_relations,
                 created_at, version
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        """
+
+    def reserve_id_block(self, count: int, name: str = "personas") -> int:
+        """
+        count개의 연속 정수 ID를 예약하고 시작 값을 반환합니다.
+        BEGIN IMMEDIATE로 쓰기 잠금을 잡으므로 같은 DB 파일을 쓰는 여러 프로세스 사이에서도 범위가 겹치지 않습니다.
+        """
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT next_value FROM id_sequences WHERE name = ?", (name,)).fetchone()
+            start = row[0] if row else FIRST_PERSONA_ID
+            conn.execute("INSERT OR REPLACE INTO id_sequences (name, next_value) VALUES (?, ?)", (name, start + count))
+            conn.execute("COMMIT")
+            return start
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def _persona_row(self, persona_data: Dict[str, Any]) -> tuple:
+        """페르소나를 personas 테이블 행 튜플로 변환합니다 (JSON 필드는 문자열로 변환, ID가 없으면 할당)"""
+        if not persona_data.get("id"):
+            persona_data["id"] = self.id_allocator.allocate()
+            persona_data.setdefault("name", f"가상인물_{persona_data['id']}")
+        return (
             persona_data["id"],
             persona_data["name"],
             persona_data["demographics"]["age"],
@@ -124,16 +151,23 @@ class SQLiteDatabase(DatabaseInterface):
             persona_data["demographics"]["education"],
             persona_data["demographics"]["income_bracket"],
             persona_data["demographics"]["marital_status"],
-            personality_traits_json,
-            persona_values_json, # 컬럼명 변경
-            interests_json,
-            lifestyle_attributes_json,
+            json.dumps(persona_data["psychological_attributes"]["personality_traits"], ensure_ascii=False),
+            json.dumps(persona_data["psychological_attributes"]["values"], ensure_ascii=False), # 컬럼명 변경
+            json.dumps(persona_data["behavioral_patterns"]["interests"], ensure_ascii=False),
+            json.dumps(persona_data["psychological_attributes"]["lifestyle_attributes"], ensure_ascii=False),
             persona_data["behavioral_patterns"]["media_consumption"],
             persona_data["behavioral_patterns"]["shopping_habit"],
-            social_relations_json,
+            json.dumps(persona_data["social_relations"], ensure_ascii=False), # 위치 변경
             persona_data["created_at"],
             persona_data["version"]
-            ))
+        )
+
+    def insert_persona(self, persona_data: Dict[str, Any]) -> bool:
+        """페르소나 데이터를 삽입합니다"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute(self._INSERT_PERSONA_SQL, self._persona_row(persona_data))
             conn.commit()
             conn.close()
             return True
@@ -141,6 +175,40 @@ class SQLiteDatabase(DatabaseInterface):
             self.logger.error(f"페르소나 삽입 실패: {e}")
             return False
 
+    def insert_personas(self, personas: List[Dict[str, Any]]) -> int:
+        """
+        페르소나 청크를 하나의 트랜잭션으로 일괄 삽입하고 실제로 저장된 수를 반환합니다.
+        행으로 변환할 수 없는 페르소나는 건너뛰고, 일괄 삽입이 실패하면 (중복 ID 등) 행 단위로 다시 삽입해
+        잘못된 행만 제외합니다.
+        """
+        rows = []
+        for persona in personas:
+            try:
+                rows.append(self._persona_row(persona))
+            except (KeyError, TypeError) as e:
+                self.logger.error(f"페르소나 삽입 실패 (필드 누락): {e}")
+        if not rows:
+            return 0
+        conn = sqlite3.connect(self.db_path)
+        try:
+            try:
+                with conn:
+                    conn.executemany(self._INSERT_PERSONA_SQL, rows)
+                return len(rows)
+            except sqlite3.Error as e:
+                self.logger.warning(f"페르소나 일괄 삽입 실패, 행 단위로 재시도: {e}")
+            inserted = 0
+            for row in rows:
+                try:
+                    with conn:
+                        conn.execute(self._INSERT_PERSONA_SQL, row)
+                    inserted += 1
+                except sqlite3.Error as e:
+                    self.logger.error(f"페르소나 삽입 실패 ({row[0]}): {e}")
+            return inserted
+        finally:
+            conn.close()
+
     def get_persona(self, persona_id: str) -> Optional[Dict[str, Any]]:
         try:
             conn = sqlite3.connect(self.db_path)
@@ -14,6 +14,14 @@ class DatabaseInterface(ABC):
         """페르소나 데이터를 삽입합니다."""
         pass
     
+    def insert_personas(self, personas: List[Dict[str, Any]]) -> int:
+        """페르소나 청크를 한 번에 삽입하고 삽입된 수를 반환합니다. 기본 구현은 한 건씩 삽입합니다."""
+        return sum(1 for persona in personas if self.insert_persona(persona))
+    
+    def reserve_id_block(self, count: int) -> int:
+        """count개의 연속 정수 ID를 원자적으로 예약하고 시작 값을 반환합니다 (BlockIdAllocator 저장소)."""
+        raise NotImplementedError(f"{type(self).__name__}은 ID 블록 예약을 지원하지 않습니다")
+    
     @abstractmethod
     def get_persona(self, persona_id: str) -> Optional[Dict[str, Any]]:
         """특정 ID의 페르소나를 조회합니다."""
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+제약 조건 실현 가능성 분석 모듈
+생성 요청 전에 제약 조건이 만족 가능한지, 만족 가능한 조합이 얼마나 되는지, "생성 후 검증" 방식의
+수용률이 얼마인지 계산하고 그에 맞는 샘플링 전략을 고릅니다.
+불가능한 요청은 생성을 한 번도 시도하지 않고 위반 규칙과 함께 거부할 수 있습니다.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+# 수용률이 이 값 이상이면 기존 분포에서 뽑고 검증하는 방식(rejection)이 조건부 테이블 추출보다 빠름
+REJECTION_MIN_ACCEPTANCE = 0.95
+
+
+class FeasibilityReport:
+    """제약 조건 실현 가능성 분석 결과"""
+
+    def __init__(self, constraints: Dict[str, Any], feasible: bool, violated_rules: List[str],
+                 message: str, acceptance_rate: float = 0.0, feasible_combinations: int = 0,
+                 feasible_age_range: Optional[Tuple[int, int]] = None, strategy: Optional[str] = None):
+        self.constraints = constraints
+        self.feasible = feasible
+        self.violated_rules = violated_rules
+        self.message = message
+        self.acceptance_rate = acceptance_rate
+        self.feasible_combinations = feasible_combinations
+        self.feasible_age_range = feasible_age_range
+        self.strategy = strategy  # "rejection" | "conditional" | None (불가능)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "feasible": self.feasible,
+            "violated_rules": self.violated_rules,
+            "message": self.message,
+            "acceptance_rate": round(self.acceptance_rate, 4),
+            "feasible_combinations": self.feasible_combinations,
+            "feasible_age_range": list(self.feasible_age_range) if self.feasible_age_range else None,
+            "strategy": self.strategy
+        }
+
+
+def _check_age_range(constraints: Dict[str, Any]) -> Optional[str]:
+    """age_range 형식 검사 (컴파일 전에 잘못된 입력을 걸러냄)"""
+    if "age_range" not in constraints:
+        return None
+    age_range = constraints["age_range"]
+    if (not isinstance(age_range, (list, tuple)) or len(age_range) != 2
+            or not all(isinstance(age, int) and not isinstance(age, bool) for age in age_range)):
+        return f"age_range는 [최소 연령, 최대 연령] 형식의 정수 두 개여야 합니다: {age_range}"
+    if age_range[0] > age_range[1]:
+        return f"age_range의 최소 연령이 최대 연령보다 큽니다: {age_range}"
+    return None
+
+
+def analyze_feasibility(generator, constraints: Optional[Dict[str, Any]] = None) -> FeasibilityReport:
+    """
+    PersonaGenerator의 생성 계획(검증 규칙으로 마스킹한 조건부 테이블)으로 제약 조건을 분석합니다.
+
+    Args:
+        generator: PersonaGenerator 인스턴스
+        constraints: 인구통계학적 제약 조건
+
+    Returns:
+        FeasibilityReport: 불가능하면 feasible=False와 위반 규칙, 가능하면 수용률과 샘플링 전략
+    """
+    constraints = constraints if constraints else {}
+    message = _check_age_range(constraints)
+    if message:
+        return FeasibilityReport(constraints, False, ["age_range"], message)
+
+    plan = generator.get_generation_plan(constraints)
+    if plan.infeasible is not None:
+        return FeasibilityReport(constraints, False, plan.infeasible.violated_rules, str(plan.infeasible))
+
+    compiled = plan.compiled
+    acceptance_rate = compiled.acceptance_rate
+    strategy = "rejection" if acceptance_rate >= REJECTION_MIN_ACCEPTANCE else "conditional"
+    return FeasibilityReport(
+        constraints, True, [],
+        f"생성 가능 (수용률 {acceptance_rate:.1%}, 전략: {strategy})",
+        acceptance_rate=acceptance_rate,
+        feasible_combinations=compiled.feasible_combinations(),
+        feasible_age_range=compiled.feasible_age_range(),
+        strategy=strategy
+    )
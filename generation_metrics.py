@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+생성 지표 모듈
+검증 규칙별 거부 횟수, 재시도 깊이 히스토그램, 제약 조건 집합별 수용률을 정수 카운터로 집계합니다.
+생성 처리량이 떨어질 때 어떤 규칙이 추출을 거부하고 있는지 generation_stats와 지표 API로 확인할 수 있습니다.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from persona_validator import BATCH_ERROR_RULES
+from rule_engine import decode_violation
+
+# generation_stats에서 샤드 간에 합산하는 정수 카운터
+COUNTER_FIELDS = ("total_attempts", "successful_generations", "validation_failures", "warnings_count",
+                  "draws", "accepted_draws")
+
+
+class GenerationMetrics:
+    """generate_personas 한 번의 추출/거부 카운터"""
+
+    def __init__(self, max_retries: int):
+        self.draws = 0
+        self.accepted_draws = 0
+        self.rule_rejections = dict.fromkeys(BATCH_ERROR_RULES, 0)
+        # retry_depths[k] = k+1번째 시도에서 통과한 페르소나 수
+        self.retry_depths = [0] * max(max_retries, 1)
+
+    def record_rejection(self, error_codes: Sequence[int]):
+        """스칼라 경로: 거부된 추출 하나의 위반 코드"""
+        self.draws += 1
+        for code in error_codes:
+            self.rule_rejections[decode_violation(code)[0]] += 1
+
+    def record_acceptance(self, attempt: int, count: int = 1):
+        """attempt번째 시도(0부터)에서 count명이 통과"""
+        self.draws += count
+        self.accepted_draws += count
+        self.retry_depths[attempt] += count
+
+    def record_batch(self, attempt: int, validation: Dict[str, Any]):
+        """배치 경로: validate_batch 결과 전체를 한 번에 집계"""
+        valid = validation["is_valid"]
+        accepted = int(np.count_nonzero(valid))
+        self.record_acceptance(attempt, accepted)
+        self.draws += len(valid) - accepted
+        for rule, codes in validation["violations"].items():
+            self.rule_rejections[rule] += int(np.count_nonzero(codes))
+
+    def update_stats(self, stats: Dict[str, Any]) -> Dict[str, Any]:
+        """generation_stats에 지표 항목을 추가"""
+        stats["draws"] = self.draws
+        stats["accepted_draws"] = self.accepted_draws
+        stats["acceptance_rate"] = acceptance_rate(self.accepted_draws, self.draws)
+        stats["rule_rejections"] = dict(self.rule_rejections)
+        stats["retry_depth_histogram"] = list(self.retry_depths)
+        return stats
+
+
+def acceptance_rate(accepted: int, draws: int) -> float:
+    return accepted / draws if draws else 0.0
+
+
+def merge_generation_stats(total: Dict[str, Any], stats: Dict[str, Any]) -> Dict[str, Any]:
+    """샤드별 generation_stats를 합산 (카운터는 더하고, 수용률은 합산된 카운터로 다시 계산)"""
+    for field in COUNTER_FIELDS:
+        total[field] = total.get(field, 0) + stats.get(field, 0)
+    rejections = total.setdefault("rule_rejections", dict.fromkeys(BATCH_ERROR_RULES, 0))
+    for rule, count in stats.get("rule_rejections", {}).items():
+        rejections[rule] = rejections.get(rule, 0) + count
+    histogram = total.setdefault("retry_depth_histogram", [])
+    for depth, count in enumerate(stats.get("retry_depth_histogram", [])):
+        if depth < len(histogram):
+            histogram[depth] += count
+        else:
+            histogram.append(count)
+    total["acceptance_rate"] = acceptance_rate(total["accepted_draws"], total["draws"])
+    return total
+
+
+class GenerationMetricsRegistry:
+    """
+    제약 조건 집합별 누적 지표 (지표 API용). 프로세스 단위로 유지되며,
+    가장 오래 갱신되지 않은 제약 조건 집합부터 제거해 메모리를 제한합니다.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # (연도, 제약 조건 JSON) -> 누적 generation_stats
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # 프로세스 풀로 생성기를 보낼 때 잠금 객체는 제외
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def record(self, key: Tuple[int, str], stats: Dict[str, Any]):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = {"requests": 0, "infeasible_requests": 0}
+            self._entries.move_to_end(key)
+            entry["requests"] += 1
+            if stats.get("infeasible_rules"):
+                entry["infeasible_requests"] += 1
+                entry["infeasible_rules"] = list(stats["infeasible_rules"])
+            merge_generation_stats(entry, stats)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """제약 조건 집합별 누적 지표 목록 (수용률이 낮은 순)"""
+        with self._lock:
+            entries = [
+                {"year": year, "constraints": json.loads(constraints), **json.loads(json.dumps(entry))}
+                for (year, constraints), entry in self._entries.items()
+            ]
+        return sorted(entries, key=lambda entry: entry["acceptance_rate"])
+
+    def totals(self) -> Dict[str, Any]:
+        """모든 제약 조건 집합을 합친 지표"""
+        total = merge_generation_stats({"requests": 0}, {})
+        for entry in self.snapshot():
+            total["requests"] += entry["requests"]
+            merge_generation_stats(total, entry)
+        return total
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
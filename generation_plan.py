@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+생성 계획 모듈
+(연도, 제약 조건)마다 한 번만 수행하면 되는 준비 작업 - 연도별 분포 조회, 연령대 문자열 파싱,
+제약 조건 해석, 조건부 샘플링 테이블 컴파일 - 의 결과를 GenerationPlan으로 묶고 LRU 캐시로 재사용합니다.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+from weighted_sampler import AliasSampler
+
+# 제약 조건 중 값 하나로 고정되는 범주형 속성
+OVERRIDE_FIELDS = ("gender", "location", "education", "income_bracket", "marital_status")
+
+
+def parse_age_group(age_group: str, max_age: int = 100) -> Tuple[int, int]:
+    """연령대 문자열("20-29", "80+")을 (최소, 최대) 연령으로 변환"""
+    if '-' in age_group:
+        age_min, age_max = age_group.split('-')
+        return int(age_min), int(age_max)
+    return int(age_group.replace('+', '')), max_age
+
+
+def constraints_key(year: int, constraints: Dict[str, Any]) -> Tuple[int, str]:
+    """캐시 키: 연도와 정렬된 제약 조건 JSON (리스트 값도 해시 가능하도록 문자열화)"""
+    return year, json.dumps(constraints, sort_keys=True, ensure_ascii=False, default=str)
+
+
+class GenerationPlan:
+    """한 (연도, 제약 조건) 조합에 대해 바로 샘플링할 수 있도록 준비된 테이블 묶음"""
+
+    def __init__(self, year: int, constraints: Dict[str, Any],
+                 age_distribution: Dict[str, float], regional_distribution: Dict[str, float],
+                 categories: Dict[str, List[str]]):
+        self.year = year
+        self.constraints = dict(constraints)
+        self.age_distribution = age_distribution
+        self.regional_distribution = regional_distribution
+        self.categories = categories
+
+        # 제약 조건으로 고정된 값 (빈 값은 제약 없음으로 취급)
+        self.overrides = {field: constraints[field] for field in OVERRIDE_FIELDS if constraints.get(field)}
+        self.age_range = tuple(constraints["age_range"]) if "age_range" in constraints else None
+
+        # 연령대 분포: 샘플러 코드 순서와 맞춘 (최소, 최대) 경계 배열
+        self.age_group_sampler = AliasSampler(age_distribution)
+        self.age_group_bounds = np.array([parse_age_group(group) for group in self.age_group_sampler.items])
+        self.age_group_ranges = {group: parse_age_group(group) for group in age_distribution}
+        self.location_sampler = AliasSampler(regional_distribution)
+
+        self.compiled = None  # CompiledConstraints
+        self.infeasible = None  # InfeasibleConstraintsError (만족 불가능한 제약 조건이면 저장해 두고 재사용)
+
+    def require_compiled(self):
+        """컴파일된 조건부 테이블을 반환 (만족 불가능한 제약 조건이면 저장된 예외를 다시 발생)"""
+        if self.infeasible is not None:
+            raise self.infeasible
+        return self.compiled
+
+
+class GenerationPlanCache:
+    """
+    GenerationPlan LRU 캐시 (가장 오래 사용하지 않은 계획부터 제거).
+    스레드 간에 공유해도 안전합니다: 조회/삽입/제거는 잠금 안에서 하고, 계획 컴파일은 잠금 밖에서 하되
+    여러 스레드가 같은 키를 동시에 컴파일하면 먼저 저장된 계획을 모두가 사용합니다.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._plans = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self):
+        # 잠금은 pickle할 수 없으므로 프로세스 풀로 보낼 때는 제외하고 복원 시 새로 만듦
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[int, str], build: Callable[[], GenerationPlan]) -> GenerationPlan:
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                self.hits += 1
+                return plan
+            self.misses += 1
+
+        built = build()
+        with self._lock:
+            plan = self._plans.setdefault(key, built)
+            self._plans.move_to_end(key)
+            while len(self._plans) > self.maxsize:
+                self._plans.popitem(last=False)
+        return plan
+
+    def clear(self):
+        with self._lock:
+            self._plans.clear()
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._plans), "maxsize": self.maxsize}
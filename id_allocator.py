@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+페르소나 ID 할당 모듈
+무작위 9자리 ID는 약 3만 명부터 충돌(생일 문제)이 생겨 PRIMARY KEY 삽입 실패로 행이 사라집니다.
+이 모듈의 할당기는 연속 ID 블록을 예약하는 방식으로 프로세스/노드 간에도 충돌 없는 ID를 만듭니다.
+
+- TimeWorkerIdAllocator: "밀리초 타임스탬프-워커 ID-시퀀스" 형식, 공유 저장소 없이 워커 ID만으로 유일성 보장
+- BlockIdAllocator: 저장소(예: SQLiteDatabase)에서 단조 증가 정수 블록을 원자적으로 예약
+"""
+
+import os
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Iterator, Optional
+
+
+class IdBlock:
+    """예약된 연속 ID 범위 (prefix + start ... prefix + start + count - 1). pickle 가능하므로 샤드로 전달할 수 있음"""
+
+    def __init__(self, start: int, count: int, prefix: str = ""):
+        self.start = start
+        self.count = count
+        self.prefix = prefix
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> str:
+        if not 0 <= index < self.count:
+            raise IndexError(f"ID 블록 범위를 벗어났습니다: {index} (크기 {self.count})")
+        return f"{self.prefix}{self.start + index}"
+
+    def __iter__(self) -> Iterator[str]:
+        return (f"{self.prefix}{value}" for value in range(self.start, self.start + self.count))
+
+    def slice(self, offset: int, count: int) -> "IdBlock":
+        """블록의 [offset, offset + count) 부분 블록"""
+        if offset < 0 or offset + count > self.count:
+            raise IndexError(f"ID 블록 범위를 벗어났습니다: {offset}+{count} (크기 {self.count})")
+        return IdBlock(self.start + offset, count, self.prefix)
+
+
+class IdAllocator(ABC):
+    """ID 할당기 공통 인터페이스"""
+
+    @abstractmethod
+    def reserve(self, count: int) -> IdBlock:
+        """count개의 연속 ID 블록을 예약합니다. 한 번 예약된 ID는 다시 할당되지 않습니다."""
+        pass
+
+    def allocate(self) -> str:
+        """ID 하나를 할당합니다"""
+        return self.reserve(1)[0]
+
+
+class TimeWorkerIdAllocator(IdAllocator):
+    """
+    "타임스탬프-워커-시퀀스" ID 할당기.
+    같은 워커 안에서는 타임스탬프가 감소하지 않고 같은 타임스탬프의 시퀀스는 재사용되지 않으므로,
+    워커 ID가 서로 다르면 프로세스/노드 간에도 ID가 겹치지 않습니다.
+    워커 ID는 인자, 환경변수 PERSONA_WORKER_ID, 무작위 48비트 값 순으로 정해집니다.
+    """
+
+    def __init__(self, worker_id: Optional[int] = None):
+        if worker_id is None and os.environ.get("PERSONA_WORKER_ID"):
+            worker_id = int(os.environ["PERSONA_WORKER_ID"])
+        self._auto_worker_id = worker_id is None
+        self.worker_id = worker_id if worker_id is not None else random.SystemRandom().getrandbits(48)
+        self._timestamp = 0
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        if self._auto_worker_id:
+            # 복사본이 원본과 같은 (워커, 타임스탬프, 시퀀스)를 다시 쓰지 않도록 새 워커 ID 사용
+            self.worker_id = random.SystemRandom().getrandbits(48)
+
+    def reserve(self, count: int) -> IdBlock:
+        with self._lock:
+            now = int(time.time() * 1000)
+            if now > self._timestamp:
+                self._timestamp = now
+                self._sequence = 0
+            # 시계가 뒤로 가면 이전 타임스탬프에서 시퀀스를 이어서 사용
+            start = self._sequence
+            self._sequence += count
+            return IdBlock(start, count, prefix=f"{self._timestamp}-{self.worker_id}-")
+
+
+class BlockIdAllocator(IdAllocator):
+    """
+    단조 증가 정수 ID 할당기.
+    store.reserve_id_block(count)로 공유 저장소에서 연속 범위를 원자적으로 예약하고,
+    단건 할당은 block_size만큼 미리 예약해 둔 로컬 블록에서 꺼내므로 저장소 왕복이 드뭅니다.
+    """
+
+    def __init__(self, store, block_size: int = 10000):
+        self.store = store
+        self.block_size = block_size
+        self._block = IdBlock(0, 0)
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # 남은 로컬 블록을 복사본과 공유하면 같은 ID가 두 번 나가므로 블록은 넘기지 않음
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_block"] = IdBlock(0, 0)
+        state["_next"] = 0
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def reserve(self, count: int) -> IdBlock:
+        return IdBlock(self.store.reserve_id_block(count), count)
+
+    def allocate(self) -> str:
+        with self._lock:
+            if self._next >= len(self._block):
+                self._block = self.reserve(self.block_size)
+                self._next = 0
+            persona_id = self._block[self._next]
+            self._next += 1
+            return persona_id
+
+
+class LocalIdBlockStore:
+    """프로세스 내부 카운터 저장소 (테스트/단일 프로세스용, 프로세스 간 유일성은 보장하지 않음)"""
+
+    def __init__(self, start: int = 1):
+        self._next_value = start
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def reserve_id_block(self, count: int) -> int:
+        with self._lock:
+            start = self._next_value
+            self._next_value += count
+            return start
@@ -14,13 +14,8 @@ if __name__ == '__main__':
     print(f"포트 {port}에서 서버를 시작합니다.")
     print("/ 로 접속하여 페르소나 생성 Playground를 이용하세요.")
     print("/static/search.html 로 접속하여 페르소나 검색 Playground를 이용하세요.")
-    print("\n주의: 5천만 페르소나 생성은 현재 SQLite 및 단일 프로세스 환경에서는 매우 오랜 시간이 소요되며, 시스템 리소스 제약으로 인해 실제 실행이 어렵습니다.")
-    print("이를 위해서는 다음과 같은 확장성 전략이 필요합니다:")
-    print("1. 분산 데이터베이스 시스템 (예: PostgreSQL, Cassandra) 사용")
-    print("2. 배치 처리 및 비동기 처리 도입")
-    print("3. 클라우드 기반의 분산 컴퓨팅 환경 (예: AWS Lambda, Kubernetes) 활용")
-    print("4. LLM 연동 시, LLM API 호출 비용 및 속도 고려")
-    print("현재 구현은 한국 인구통계 및 문화적 특성을 반영한 페르소나 생성 로직에 중점을 둡니다.")
+    print("\n참고: 5천만 명 규모의 대량 생성은 PersonaGenerator.iter_personas(count, chunk_size)로 청크 단위 스트리밍 생성하세요.")
+    print("각 청크는 db.insert_personas(chunk)로 일괄 저장하거나 persona_export.export_personas()로 JSONL/CSV 파일에 기록할 수 있으며, 메모리 사용량은 전체 수와 무관합니다.")
     
     # 프로덕션에서는 debug=False 사용
     debug_mode = os.environ.get('FLASK_ENV', 'production') == 'development'
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+패널(종단) 생성 모듈
+기준 연도 인구를 한 번 생성한 뒤 매년 나이를 한 살씩 더하고, 그 해에 바뀌는 속성만 다시 추출합니다.
+같은 사람은 모든 연도에서 같은 ID를 유지하므로 연도별 인구를 따로 생성하지 않고 종단 분석을 할 수 있습니다.
+
+- 교육/직업: 연령 분기 경계를 넘은 사람만 그 해의 조건부 테이블에서 다시 추출 (교육 수준은 낮아지지 않음)
+- 소득 분위: 미성년 소득 제한 연령을 벗어난 사람만 다시 추출
+- 혼인 상태: 연간 전이 확률로 변경 (검증 규칙상 불가능한 전이는 적용하지 않음)
+- 출생/사망: 그 해 age_distribution에 맞도록 초과 연령대에서 제거하고 부족한 연령대에 추가
+  (0세를 포함하는 연령대는 0세 출생, 그 외 연령대는 전입으로 추가)
+"""
+
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from persona_batch import PersonaBatch
+from persona_validator import LOOKUP_RULE_BITS
+from rule_engine import INCOME_MINOR_MAX_AGE
+
+# 연간 혼인 상태 전이 확률 (근사치) - 전이 후 상태가 해당 연령에서 불가능하면 전이하지 않음
+MARITAL_TRANSITION_RATES = {
+    "미혼": {"기혼": 0.05},
+    "기혼": {"이혼": 0.008, "사별": 0.006},
+    "이혼": {"기혼": 0.03},
+    "사별": {"기혼": 0.01}
+}
+
+
+class PersonaPanel:
+    """연도별 PersonaBatch와 연도별 변화 집계 (같은 사람은 모든 연도에서 같은 ID)"""
+
+    def __init__(self):
+        self.waves: Dict[int, PersonaBatch] = {}
+        self.events: Dict[int, Dict[str, Any]] = {}
+
+    @property
+    def years(self):
+        return list(self.waves)
+
+    def __len__(self) -> int:
+        return len(self.waves)
+
+    def __getitem__(self, year: int) -> PersonaBatch:
+        return self.waves[year]
+
+    def __iter__(self) -> Iterator[Tuple[int, PersonaBatch]]:
+        return iter(self.waves.items())
+
+
+def _apportion(total: int, weights: np.ndarray) -> np.ndarray:
+    """total을 weights 비율로 나눈 정수 배분 (최대 나머지 방식, 합계가 정확히 total)"""
+    exact = weights / weights.sum() * total
+    counts = np.floor(exact).astype(np.int64)
+    remainder = total - int(counts.sum())
+    if remainder:
+        counts[np.argsort(-(exact - counts), kind="stable")[:remainder]] += 1
+    return counts
+
+
+def _age_group_index(plan, max_age: int) -> np.ndarray:
+    """연령 -> 연령대 인덱스 (plan.age_group_bounds 순서, 어느 연령대에도 속하지 않으면 -1)"""
+    group_of_age = np.full(max_age + 1, -1, dtype=np.int64)
+    for group, (low, high) in enumerate(plan.age_group_bounds.tolist()):
+        group_of_age[low:min(high, max_age) + 1] = group
+    return group_of_age
+
+
+def _year_plan(generator, constraints, year):
+    plan = generator.get_generation_plan(dict(constraints, year=year))
+    return plan, plan.require_compiled()
+
+
+def iter_panel(generator, count: int, start_year: int, end_year: int, constraints: Optional[Dict[str, Any]] = None,
+               rng: Optional[np.random.Generator] = None) -> Iterator[Tuple[int, PersonaBatch, Dict[str, Any]]]:
+    """
+    (연도, 그 해 인구 PersonaBatch, 변화 집계)를 start_year부터 end_year까지 차례로 생성합니다.
+    인구 수는 매년 count명으로 유지됩니다.
+
+    Raises:
+        ValueError: age_range 제약 조건 (연도별 연령 분포를 맞출 수 없음) 또는 잘못된 연도 범위
+        InfeasibleConstraintsError: 제약 조건을 만족하는 조합이 없는 경우
+    """
+    constraints = dict(constraints or {})
+    constraints.pop("year", None)
+    if "age_range" in constraints:
+        raise ValueError("패널 생성은 연도별 연령 분포를 맞추므로 age_range 제약 조건을 지원하지 않습니다")
+    if end_year < start_year:
+        raise ValueError(f"종료 연도가 시작 연도보다 앞섭니다: {start_year}-{end_year}")
+    rng = rng if rng is not None else np.random.default_rng()
+
+    plan, compiled = _year_plan(generator, constraints, start_year)
+    batch = generator._persona_batch(count, constraints, compiled, rng, generator.id_allocator.reserve(count))
+    yield start_year, batch, {"year": start_year, "population": count, "births": 0, "entrants": count,
+                              "deaths": 0, "resampled": {}, "revalidated": 0}
+
+    for year in range(start_year + 1, end_year + 1):
+        plan, compiled = _year_plan(generator, constraints, year)
+        batch, events = _advance_year(generator, batch, constraints, plan, compiled, rng)
+        events["year"] = year
+        yield year, batch, events
+
+
+def generate_panel(generator, count: int, start_year: int, end_year: int,
+                   constraints: Optional[Dict[str, Any]] = None,
+                   rng: Optional[np.random.Generator] = None) -> PersonaPanel:
+    """iter_panel 결과를 PersonaPanel로 모아 반환"""
+    panel = PersonaPanel()
+    for year, batch, events in iter_panel(generator, count, start_year, end_year, constraints, rng):
+        panel.waves[year] = batch
+        panel.events[year] = events
+    return panel
+
+
+def _advance_year(generator, batch: PersonaBatch, constraints, plan, compiled, rng) -> Tuple[PersonaBatch, Dict[str, Any]]:
+    """한 해 진행: 나이 증가, 연령 분포에 맞춘 제거/추가, 바뀌는 속성만 다시 추출"""
+    count = len(batch)
+    max_age = compiled.feasible_age_range()[1]
+    previous_ages = batch.age.astype(np.int64)
+    ages = previous_ages + 1
+
+    # 연령대별 목표 인원과 비교해 초과 연령대에서 무작위 제거 (최대 연령을 넘으면 항상 제거)
+    group_of_age = _age_group_index(plan, max_age)
+    groups = np.where(ages <= max_age, group_of_age[np.minimum(ages, max_age)], -1)
+    weights = np.array([plan.age_distribution[group] for group in plan.age_group_sampler.items], dtype=np.float64)
+    target = _apportion(count, weights)
+    current = np.bincount(groups[groups >= 0], minlength=len(target))
+    excess = np.maximum(current - target, 0)
+
+    order = np.lexsort((rng.random(count), groups))
+    sorted_groups = groups[order]
+    rank = np.arange(count) - np.searchsorted(sorted_groups, sorted_groups, side="left")
+    keep = np.zeros(count, dtype=bool)
+    keep[order] = (sorted_groups >= 0) & (rank >= excess[np.maximum(sorted_groups, 0)])
+
+    survivors = batch.take(keep)
+    survivors.age = ages[keep].astype(batch.age.dtype)
+    resampled = _resample_changed(generator, survivors, previous_ages[keep], constraints, compiled, rng)
+
+    # 부족한 연령대에 추가 (0세를 포함하는 연령대는 출생)
+    deficit = np.maximum(target - current, 0)
+    bounds = plan.age_group_bounds
+    entrant_ages = []
+    births = 0
+    for group in np.flatnonzero(deficit).tolist():
+        low, high = int(bounds[group, 0]), min(int(bounds[group, 1]), max_age)
+        size = int(deficit[group])
+        if low == 0:
+            entrant_ages.append(np.zeros(size, dtype=np.int64))
+            births += size
+        else:
+            entrant_ages.append(low + np.floor(rng.random(size) * (high - low + 1)).astype(np.int64))
+
+    waves = [survivors]
+    if entrant_ages:
+        entrant_ages = np.concatenate(entrant_ages).astype(batch.age.dtype)
+        size = len(entrant_ages)
+        demographics = generator._compiled_demographics_batch(size, constraints, compiled, rng, ages=entrant_ages)
+        waves.append(generator._persona_batch(size, constraints, compiled, rng,
+                                              generator.id_allocator.reserve(size), demographics=demographics))
+    wave = PersonaBatch.concatenate(waves)
+    revalidated = _revalidate(generator, wave, compiled, rng)
+
+    return wave, {
+        "population": len(wave),
+        "births": births,
+        "entrants": len(wave) - len(survivors) - births,
+        "deaths": count - len(survivors),
+        "resampled": resampled,
+        "revalidated": revalidated
+    }
+
+
+def _resample_changed(generator, survivors: PersonaBatch, previous_ages: np.ndarray, constraints, compiled,
+                      rng) -> Dict[str, int]:
+    """연령 분기 경계를 넘었거나 상태가 전이된 속성만 다시 추출하고, 속성별 변경 인원을 반환"""
+    ages = survivors.age.astype(np.int64)
+    codes = survivors.codes
+    resampled = {}
+
+    for field in ("education", "occupation"):
+        if constraints.get(field):
+            continue
+        limits = np.array([max_age for max_age, _ in generator._age_branches(field) if max_age is not None])
+        crossed = np.searchsorted(limits, previous_ages, side="left") != np.searchsorted(limits, ages, side="left")
+        drawn = compiled.sample_for_ages(ages[crossed], rng, fields=(field,))[field]
+        if field == "education":
+            # 교육 수준 코드표는 낮은 수준부터 정렬되어 있으므로 큰 코드를 유지해 학력이 낮아지지 않게 함
+            drawn = np.maximum(drawn, codes[field][crossed])
+        codes[field][crossed] = drawn
+        resampled[field] = int(crossed.sum())
+
+    if not constraints.get("income_bracket"):
+        crossed = (previous_ages <= INCOME_MINOR_MAX_AGE) & (ages > INCOME_MINOR_MAX_AGE)
+        codes["income_bracket"][crossed] = compiled.sample_for_ages(ages[crossed], rng, fields=("income_bracket",))["income_bracket"]
+        resampled["income_bracket"] = int(crossed.sum())
+
+    if not constraints.get("marital_status"):
+        labels = survivors.categories["marital_status"]
+        allowed = compiled.tables["marital_status"][ages] > 0  # [사람, 혼인 상태 코드]
+        current = codes["marital_status"]
+        draws = rng.random(len(ages))
+        updated = current.copy()
+        for source, targets in MARITAL_TRANSITION_RATES.items():
+            if source not in labels:
+                continue
+            from_source = current == labels.index(source)
+            threshold = 0.0
+            for target, rate in targets.items():
+                if target in labels:
+                    code = labels.index(target)
+                    hit = from_source & (draws >= threshold) & (draws < threshold + rate) & allowed[:, code]
+                    updated[hit] = code
+                threshold += rate
+        resampled["marital_status"] = int((updated != current).sum())
+        codes["marital_status"] = updated
+
+    return resampled
+
+
+def _revalidate(generator, wave: PersonaBatch, compiled, rng) -> int:
+    """검증 규칙을 위반하는 사람(예: 전이 후 규칙 변경)은 위반한 속성만 연령 조건부 테이블에서 다시 추출"""
+    validation = generator.validator.validate_batch(wave.age, wave.codes, wave.categories)
+    for rule, field, _ in LOOKUP_RULE_BITS:
+        invalid = validation["violations"][rule] != 0
+        if invalid.any():
+            ages = wave.age[invalid].astype(np.int64)
+            wave.codes[field][invalid] = compiled.sample_for_ages(ages, rng, fields=(field,))[field]
+    return int((~validation["is_valid"]).sum())
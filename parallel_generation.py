@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+병렬 샤드 생성 모듈
+생성 요청을 고정 크기 샤드로 나누고, 마스터 시드에서 파생한 샤드별 독립 난수 스트림으로
+프로세스 풀에서 실행합니다. 샤드 분할과 시드 파생이 워커 수와 무관하므로
+같은 마스터 시드는 워커 수와 관계없이 같은 결과를 만듭니다.
+생성기 같은 큰 payload는 워커 프로세스마다 한 번만 (풀 initializer로) 전달하고, 샤드 작업에는
+(샤드 번호, 시작 위치, 크기, 시드)만 담아 보냅니다.
+"""
+
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_SHARD_SIZE = 10000
+
+# 워커 프로세스별 payload (_init_worker가 프로세스 시작 시 한 번 설정)
+_worker_payload = None
+
+
+def plan_shards(count: int, shard_size: int = DEFAULT_SHARD_SIZE) -> List[Tuple[int, int]]:
+    """count를 (시작 위치, 크기) 샤드 목록으로 분할"""
+    if shard_size <= 0:
+        raise ValueError(f"shard_size는 양수여야 합니다: {shard_size}")
+    return [(start, min(shard_size, count - start)) for start in range(0, count, shard_size)]
+
+
+def shard_random_streams(seed_sequence: np.random.SeedSequence) -> Tuple[np.random.Generator, random.Random]:
+    """샤드 시드로부터 NumPy 난수 생성기와 파이썬 random.Random 인스턴스를 만듦"""
+    np_seed, py_seed = seed_sequence.spawn(2)
+    return np.random.default_rng(np_seed), random.Random(int(py_seed.generate_state(2, dtype=np.uint64)[0]))
+
+
+def _init_worker(payload: Any):
+    """프로세스 풀 initializer: payload를 프로세스 전역에 보관"""
+    global _worker_payload
+    _worker_payload = payload
+
+
+def _run_shard(shard_fn: Callable[[tuple], Any], task: tuple) -> Any:
+    """워커에서 보관 중인 payload와 샤드 작업을 합쳐 shard_fn 실행"""
+    return shard_fn((_worker_payload,) + task)
+
+
+def iter_sharded(shard_fn: Callable[[tuple], Any], payload: Any, count: int,
+                 seed: Optional[int] = None, workers: Optional[int] = None,
+                 shard_size: int = DEFAULT_SHARD_SIZE) -> Iterator[Any]:
+    """
+    샤드별로 shard_fn((payload, shard_index, start, size, seed_sequence))를 실행하고 결과를 샤드 순서대로 내보냅니다.
+    병렬 실행 시에도 동시에 진행 중인 샤드는 워커 수의 2배로 제한되므로 메모리 사용량이 전체 수와 무관합니다.
+
+    Args:
+        shard_fn: 모듈 최상위 함수 (프로세스 풀로 전달되므로 pickle 가능해야 함)
+        payload: 모든 샤드에 전달할 데이터 (생성기 인스턴스, 제약 조건 등 - 워커 프로세스마다 한 번만 전달)
+        count: 전체 생성 수
+        seed: 마스터 시드 (None이면 재현 불가능한 새 엔트로피 사용)
+        workers: 프로세스 수 (2 이상일 때만 프로세스 풀 사용, None이나 1이면 현재 프로세스에서 순차 실행)
+        shard_size: 샤드 크기 (결과 재현성은 shard_size와 seed에만 의존)
+    """
+    shards = plan_shards(count, shard_size)
+    master = np.random.SeedSequence(seed)
+    tasks = (
+        (index, start, size, seed_sequence)
+        for (index, (start, size)), seed_sequence in zip(enumerate(shards), master.spawn(len(shards)))
+    )
+
+    if workers is None or workers <= 1 or len(shards) <= 1:
+        for task in tasks:
+            yield shard_fn((payload,) + task)
+        return
+
+    max_pending = workers * 2
+    with ProcessPoolExecutor(max_workers=min(workers, len(shards)),
+                             initializer=_init_worker, initargs=(payload,)) as executor:
+        pending = deque()
+        for task in tasks:
+            pending.append(executor.submit(_run_shard, shard_fn, task))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def run_sharded(shard_fn: Callable[[tuple], Any], payload: Any, count: int,
+                seed: Optional[int] = None, workers: Optional[int] = None,
+                shard_size: int = DEFAULT_SHARD_SIZE) -> List[Any]:
+    """iter_sharded의 결과를 샤드 순서대로 모두 모아 반환"""
+    return list(iter_sharded(shard_fn, payload, count, seed=seed, workers=workers, shard_size=shard_size))
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+열 지향 페르소나 묶음 모듈
+페르소나 N명을 문자열 중첩 딕셔너리 N개 대신 열 배열로 보관합니다.
+범주형 속성은 정수 코드 배열 + 코드표, 연령은 NumPy 배열, 가치관/관심사/라이프스타일/사회적 관계는
+어휘 인덱스 비트마스크(uint64)로 저장하고, 딕셔너리는 필요할 때만 만듭니다.
+"""
+
+from typing import Any, Dict, Iterator, List, Sequence
+
+import numpy as np
+
+# 인구통계 코드 열 (persona["demographics"] 키 순서)
+DEMOGRAPHIC_FIELDS = ("gender", "location", "occupation", "education", "income_bracket", "marital_status")
+# 행동 패턴 코드 열
+BEHAVIORAL_FIELDS = ("media_consumption", "shopping_habit")
+# 다중 선택 속성 (비트마스크 열)
+MULTI_HOT_FIELDS = ("values", "lifestyle_attributes", "interests", "social_relations")
+
+
+def encode_multi_hot(selected: np.ndarray) -> np.ndarray:
+    """[N, 어휘 크기] 불리언 선택 행렬을 uint64 비트마스크로 변환"""
+    if selected.shape[1] > 64:
+        raise ValueError(f"비트마스크 어휘는 64개 이하여야 합니다: {selected.shape[1]}")
+    bits = np.left_shift(np.uint64(1), np.arange(selected.shape[1], dtype=np.uint64))
+    return (selected.astype(np.uint64) * bits).sum(axis=1, dtype=np.uint64)
+
+
+def decode_multi_hot(mask: int, vocabulary: Sequence[str]) -> List[str]:
+    """비트마스크 하나를 어휘 순서의 항목 목록으로 변환"""
+    return [label for bit, label in enumerate(vocabulary) if mask >> bit & 1]
+
+
+class PersonaBatch:
+    """
+    페르소나 묶음의 struct-of-arrays 표현.
+    len()/인덱싱/반복은 기존 페르소나 딕셔너리를 그때그때 만들어 반환하므로 리스트 대신 그대로 쓸 수 있습니다.
+    """
+
+    def __init__(self, ids: Sequence[str], age: np.ndarray, codes: Dict[str, np.ndarray],
+                 categories: Dict[str, List[str]], traits: Dict[str, np.ndarray],
+                 trait_categories: Dict[str, List[str]], multi_hot: Dict[str, np.ndarray],
+                 vocabularies: Dict[str, List[str]], created_at: str, version: int = 1):
+        self.ids = ids
+        self.age = age
+        self.codes = codes  # 범주형 필드 -> 코드 배열 (인구통계 + 행동 패턴)
+        self.categories = categories  # 범주형 필드 -> 코드표
+        self.traits = traits  # 성격 특성 -> 코드 배열
+        self.trait_categories = trait_categories
+        self.multi_hot = multi_hot  # 다중 선택 필드 -> uint64 비트마스크 배열
+        self.vocabularies = vocabularies
+        self.created_at = created_at
+        self.version = version
+
+    def __len__(self) -> int:
+        return len(self.age)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(np.arange(len(self))[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"PersonaBatch 범위를 벗어났습니다: {index}")
+        return next(iter(self.take([index])))
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        # 열 단위로 한 번에 문자열로 복호화한 뒤 행 딕셔너리를 조립
+        labels = {field: self.decode(field) for field in self.codes}
+        traits = {
+            trait: [self.trait_categories[trait][code] for code in codes.tolist()]
+            for trait, codes in self.traits.items()
+        }
+        multi_hot = {field: self.decode_labels(field) for field in self.multi_hot}
+        ages = self.age.tolist()
+
+        for index in range(len(ages)):
+            persona_id = self.ids[index]
+            yield {
+                "demographics": {
+                    "age": ages[index],
+                    **{field: labels[field][index] for field in DEMOGRAPHIC_FIELDS}
+                },
+                "psychological_attributes": {
+                    "personality_traits": {trait: codes[index] for trait, codes in traits.items()},
+                    "values": list(multi_hot["values"][index]),
+                    "lifestyle_attributes": list(multi_hot["lifestyle_attributes"][index])
+                },
+                "behavioral_patterns": {
+                    "interests": list(multi_hot["interests"][index]),
+                    "media_consumption": labels["media_consumption"][index],
+                    "shopping_habit": labels["shopping_habit"][index]
+                },
+                "social_relations": list(multi_hot["social_relations"][index]),
+                "id": persona_id,
+                "name": f"가상인물_{persona_id}",
+                "created_at": self.created_at,
+                "version": self.version
+            }
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """기존 생성 경로와 같은 구조의 페르소나 딕셔너리 목록으로 변환"""
+        return list(self)
+
+    def decode(self, field: str) -> List[str]:
+        """범주형 열 하나를 문자열 목록으로 변환"""
+        labels = self.categories[field]
+        return [labels[code] for code in self.codes[field].tolist()]
+
+    def decode_labels(self, field: str) -> List[List[str]]:
+        """비트마스크 열 하나를 항목 목록의 목록으로 변환 (같은 조합은 한 번만 복호화해 공유하므로 수정하지 말 것)"""
+        vocabulary = self.vocabularies[field]
+        decoded = {}
+        column = []
+        for mask in self.multi_hot[field].tolist():
+            labels = decoded.get(mask)
+            if labels is None:
+                labels = decoded[mask] = decode_multi_hot(mask, vocabulary)
+            column.append(labels)
+        return column
+
+    def has(self, field: str, label: str) -> np.ndarray:
+        """다중 선택 필드에 label이 포함된 페르소나 마스크"""
+        bit = np.uint64(1) << np.uint64(self.vocabularies[field].index(label))
+        return (self.multi_hot[field] & bit) != 0
+
+    @classmethod
+    def concatenate(cls, batches: Sequence["PersonaBatch"]) -> "PersonaBatch":
+        """
+        묶음들을 이어 붙임 (created_at과 version은 첫 묶음 기준).
+        범주형 코드표가 다르면 첫 묶음의 코드표에 없는 값을 뒤에 추가해 다시 코딩합니다.
+        """
+        first = batches[0]
+        categories = {field: list(labels) for field, labels in first.categories.items()}
+        columns = {field: [] for field in first.codes}
+        for batch in batches:
+            if batch.trait_categories != first.trait_categories or batch.vocabularies != first.vocabularies:
+                raise ValueError("성격 특성 코드표나 다중 선택 어휘가 다른 묶음은 이어 붙일 수 없습니다")
+            for field, codes in batch.codes.items():
+                labels = batch.categories[field]
+                if labels != categories[field]:
+                    categories[field].extend(label for label in labels if label not in categories[field])
+                    codes = np.array([categories[field].index(label) for label in labels], dtype=codes.dtype)[codes]
+                columns[field].append(codes)
+        return cls(
+            ids=[persona_id for batch in batches for persona_id in batch.ids],
+            age=np.concatenate([batch.age for batch in batches]),
+            codes={field: np.concatenate(codes) for field, codes in columns.items()},
+            categories=categories,
+            traits={trait: np.concatenate([batch.traits[trait] for batch in batches]) for trait in first.traits},
+            trait_categories=first.trait_categories,
+            multi_hot={field: np.concatenate([batch.multi_hot[field] for batch in batches]) for field in first.multi_hot},
+            vocabularies=first.vocabularies,
+            created_at=first.created_at,
+            version=first.version
+        )
+
+    def take(self, indices) -> "PersonaBatch":
+        """인덱스 배열 또는 불리언 마스크로 부분 묶음을 만듦"""
+        indices = np.flatnonzero(indices) if np.asarray(indices).dtype == bool else np.asarray(indices, dtype=np.int64)
+        return PersonaBatch(
+            ids=[self.ids[i] for i in indices.tolist()],
+            age=self.age[indices],
+            codes={field: codes[indices] for field, codes in self.codes.items()},
+            categories=self.categories,
+            traits={trait: codes[indices] for trait, codes in self.traits.items()},
+            trait_categories=self.trait_categories,
+            multi_hot={field: masks[indices] for field, masks in self.multi_hot.items()},
+            vocabularies=self.vocabularies,
+            created_at=self.created_at,
+            version=self.version
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """열 배열이 차지하는 바이트 수 (ID 제외)"""
+        arrays = [self.age, *self.codes.values(), *self.traits.values(), *self.multi_hot.values()]
+        return sum(array.nbytes for array in arrays)
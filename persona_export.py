@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+페르소나 파일 내보내기 모듈
+iter_personas가 내보내는 청크를 받아 JSONL/CSV 파일에 순차적으로 기록합니다.
+청크 단위로 쓰고 버리므로 전체 수와 무관하게 메모리 사용량이 일정합니다.
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+# CSV 열 순서 (SQLite personas 테이블과 동일, values는 persona_values로 저장)
+PERSONA_CSV_FIELDS = [
+    "id", "name", "age", "gender", "location", "occupation", "education", "income_bracket", "marital_status",
+    "personality_traits", "persona_values", "interests", "lifestyle_attributes", "media_consumption",
+    "shopping_habit", "social_relations", "created_at", "version"
+]
+
+
+def flatten_persona(persona: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    페르소나를 CSV 한 행으로 평면화합니다.
+    중첩 구조(PersonaGenerator)는 테이블 열로 펼치고, 이미 평면인 구조(HierarchicalPersonaGenerator)는
+    목록/사전 값만 JSON 문자열로 변환합니다.
+    """
+    if "demographics" not in persona:
+        return {
+            key: json.dumps(value, ensure_ascii=False) if isinstance(value, (list, dict)) else value
+            for key, value in persona.items()
+        }
+
+    demographics = persona.get("demographics", {})
+    psychological = persona.get("psychological_attributes", {})
+    behavioral = persona.get("behavioral_patterns", {})
+    return {
+        "id": persona.get("id"),
+        "name": persona.get("name"),
+        "age": demographics.get("age"),
+        "gender": demographics.get("gender"),
+        "location": demographics.get("location"),
+        "occupation": demographics.get("occupation"),
+        "education": demographics.get("education"),
+        "income_bracket": demographics.get("income_bracket"),
+        "marital_status": demographics.get("marital_status"),
+        "personality_traits": json.dumps(psychological.get("personality_traits", {}), ensure_ascii=False),
+        "persona_values": json.dumps(psychological.get("values", []), ensure_ascii=False),
+        "interests": json.dumps(behavioral.get("interests", []), ensure_ascii=False),
+        "lifestyle_attributes": json.dumps(psychological.get("lifestyle_attributes", []), ensure_ascii=False),
+        "media_consumption": behavioral.get("media_consumption"),
+        "shopping_habit": behavioral.get("shopping_habit"),
+        "social_relations": json.dumps(persona.get("social_relations", []), ensure_ascii=False),
+        "created_at": persona.get("created_at"),
+        "version": persona.get("version", 1)
+    }
+
+
+def export_personas(chunks: Iterable[List[Dict[str, Any]]], output_path: str, format: str = "jsonl") -> int:
+    """
+    페르소나 청크를 파일로 내보내고 기록한 페르소나 수를 반환합니다.
+
+    Args:
+        chunks: 페르소나 목록의 iterable (예: generator.iter_personas(...))
+        output_path: 출력 파일 경로
+        format: 'jsonl' (한 줄에 페르소나 하나) 또는 'csv'
+
+    Raises:
+        ValueError: 지원되지 않는 형식
+    """
+    format = format.lower()
+    if format not in ("jsonl", "csv"):
+        raise ValueError(f"지원되지 않는 형식: {format}")
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    written = 0
+    if format == "jsonl":
+        with open(output_path, "w", encoding="utf-8") as f:
+            for chunk in chunks:
+                f.writelines(json.dumps(persona, ensure_ascii=False) + "\n" for persona in chunk)
+                written += len(chunk)
+        return written
+
+    with open(output_path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = None
+        for chunk in chunks:
+            rows = [flatten_persona(persona) for persona in chunk]
+            if not rows:
+                continue
+            if writer is None:
+                fields = PERSONA_CSV_FIELDS if "demographics" in chunk[0] else list(rows[0])
+                writer = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
+                writer.writeheader()
+            writer.writerows(rows)
+            written += len(rows)
+    return written
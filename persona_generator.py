@@ -1,15 +1,77 @@
 import random
 import json
+import copy
 from datetime import datetime
+import numpy as np
 from timeseries_data import TimeSeriesDataManager
 from persona_validator import PersonaValidator
+from weighted_sampler import AliasSampler
+from id_allocator import TimeWorkerIdAllocator
+from feasibility import analyze_feasibility
+from generation_plan import GenerationPlan, GenerationPlanCache, constraints_key
+from generation_metrics import GenerationMetrics, GenerationMetricsRegistry, merge_generation_stats
+from persona_batch import DEMOGRAPHIC_FIELDS, PersonaBatch, encode_multi_hot
+from constraint_compiler import ConstraintCompiler, InfeasibleConstraintsError
+from parallel_generation import DEFAULT_SHARD_SIZE, iter_sharded, run_sharded, shard_random_streams
+from panel_generation import generate_panel, iter_panel
+from behavior_sampling import build_behavior_tables
 
 class PersonaGenerator:
-    def __init__(self, config=None):
+    # 연령 구간별 교육 수준 가중치 (구간 상한 연령, 가중치) - 23세 이상은 config의 education_levels 사용
+    EDUCATION_AGE_BRANCHES = (
+        (6, {"없음": 1.0}),
+        (12, {"없음": 0.6, "초졸": 0.4}),
+        (15, {"초졸": 0.8, "중졸": 0.2}),
+        (18, {"중졸": 0.7, "고졸": 0.3}),
+        (22, {"고졸": 0.6, "대졸": 0.4})
+    )
+    # 연령 구간별 직업 가중치 (구간 상한 연령, 가중치) - 20세 이상은 OCCUPATION_CATEGORY_BRANCHES 사용
+    OCCUPATION_AGE_BRANCHES = (
+        (6, {"기타 무직": 1.0}),
+        (12, {"초등학생": 1.0}),
+        (15, {"중학생": 1.0}),
+        (18, {"고등학생": 1.0}),
+        (19, {"대학생": 0.5, "고등학생": 0.5})  # 19세는 대학생 또는 고등학생
+    )
+    # 성인 직업군 가중치 (구간 상한 연령, 직업군 가중치) - 직업군 안에서는 균등 선택
+    OCCUPATION_CATEGORY_BRANCHES = (
+        (59, {"직장인": 0.6, "자영업자": 0.15, "무직": 0.1, "주부": 0.1, "농림어업": 0.05}),
+        (None, {"무직": 0.5, "자영업자": 0.2, "직장인": 0.2, "농림어업": 0.1})
+    )
+
+    # 세대 구분 (이름, 최소 연령, 최대 연령) - 세대별 가치관 적용 기준
+    GENERATION_AGE_BANDS = (
+        ("Z세대", 10, 24),
+        ("밀레니얼", 25, 44),
+        ("X세대", 45, 59),
+        ("베이비부머", 60, None)
+    )
+
+    def __init__(self, config=None, id_allocator=None):
         self.config = config if config else self._load_default_config()
         self.ts_manager = TimeSeriesDataManager()
         self.validator = PersonaValidator()
         self.current_year = 2024  # 기본 생성 연도
+        self._samplers = {}  # (분포 이름, 연도) -> AliasSampler
+        self._behavior_tables = {}  # 연도 -> BehaviorTables (트렌드 기반 행동 패턴 확률)
+        self.constraint_compiler = ConstraintCompiler(self.validator)
+        self._plans = GenerationPlanCache(maxsize=128)  # (연도, 제약 조건) -> GenerationPlan
+        self._plans_rules_version = self.validator.rules_version
+        self.metrics = GenerationMetricsRegistry()  # 제약 조건 집합별 누적 생성 지표
+        self.random = random  # 스칼라 경로 난수원 (random 모듈 또는 random.Random 인스턴스)
+        self.id_allocator = id_allocator if id_allocator is not None else TimeWorkerIdAllocator()
+
+    def __getstate__(self):
+        # random 모듈은 pickle할 수 없으므로 프로세스 풀로 보낼 때는 제외하고 복원 시 다시 연결
+        state = self.__dict__.copy()
+        if state.get("random") is random:
+            state["random"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.random is None:
+            self.random = random
 
     def _load_default_config(self):
         # 한국 인구통계 및 문화적 특성을 반영한 기본 설정 (근사치)
@@ -72,68 +134,80 @@ class PersonaGenerator:
             }
         }
 
-    def _weighted_choice(self, choices_dict):
+    def _weighted_choice(self, choices_dict, key=None):
+        # key가 주어지면 미리 컴파일된 별칭 테이블로 O(1) 추출
+        if key is not None:
+            return self._sampler(key, choices_dict).draw(self.random)
         items = list(choices_dict.keys())
         weights = list(choices_dict.values())
-        return random.choices(items, weights=weights, k=1)[0]
+        return self.random.choices(items, weights=weights, k=1)[0]
+
+    def _sampler(self, key, choices_dict):
+        """분포별(연도별) 샘플러를 한 번만 컴파일하고 재사용합니다. config 변경 시 self._samplers를 비워야 합니다."""
+        sampler = self._samplers.get(key)
+        if sampler is None:
+            sampler = self._samplers[key] = AliasSampler(choices_dict)
+        return sampler
+
+    def _behavior_table(self, year):
+        """연도별 행동 패턴 확률 테이블을 한 번만 만들고 재사용합니다 (config 변경 시 clear_generation_plans 호출)"""
+        tables = self._behavior_tables.get(year)
+        if tables is None:
+            nuances = self.config["korean_cultural_nuances"]
+            labels = {
+                "media_consumption": nuances.get("미디어_소비", ["기타 미디어"]),
+                "shopping_habit": nuances.get("소비_행태", ["기타 소비"])
+            }
+            tables = self._behavior_tables[year] = build_behavior_tables(
+                self.ts_manager, year, labels, self.GENERATION_AGE_BANDS)
+        return tables
+
+    def _age_branches(self, field):
+        """속성별 (구간 상한 연령, 가중치) 목록 - 마지막 구간의 상한은 None"""
+        if field == "education":
+            return list(self.EDUCATION_AGE_BRANCHES) + [(None, self.config["education_levels"])]
+        return list(self.OCCUPATION_AGE_BRANCHES) + [
+            (max_age, self._occupation_category_weights(weights))
+            for max_age, weights in self.OCCUPATION_CATEGORY_BRANCHES
+        ]
+
+    def _branch_sampler(self, field, age):
+        """연령 구간에 해당하는 교육 수준/직업 샘플러 반환"""
+        for max_age, weights in self._age_branches(field):
+            if max_age is None or age <= max_age:
+                return self._sampler((field, max_age), weights)
 
     def _generate_demographics(self, constraints):
-        # 연도별 인구통계 데이터 가져오기
-        year = constraints.get("year", self.current_year)
-        year_data = self.ts_manager.get_year_data(year)
-        
-        # 연도별 연령 분포 적용
-        age_distribution = year_data.get("demographic_trends", {}).get("age_distribution", self.config["age_distribution"])
-        regional_distribution = year_data.get("demographic_trends", {}).get("regional_distribution", self.config["regional_distribution"])
+        # (연도, 제약 조건)별로 컴파일된 생성 계획 사용
+        plan = self.get_generation_plan(constraints)
         
         # 연령 생성 (constraints의 age_range를 우선 적용)
-        if "age_range" in constraints:
-            age_min, age_max = constraints["age_range"]
-            age = random.randint(age_min, age_max)
+        if plan.age_range:
+            age_min, age_max = plan.age_range
+            age = self.random.randint(age_min, age_max)
         else:
-            age_group = self._weighted_choice(age_distribution)
-            age_min, age_max = map(int, age_group.split('-')) if '-' in age_group else (int(age_group.replace('+', '')), 100)
-            age = random.randint(age_min, age_max)
+            age_min, age_max = plan.age_group_ranges[plan.age_group_sampler.draw(self.random)]
+            age = self.random.randint(age_min, age_max)
         
-        gender = constraints.get("gender", self._weighted_choice(self.config["gender_ratio"]))
-        location = constraints.get("location", self._weighted_choice(regional_distribution))
+        overrides = plan.overrides  # 제약 조건으로 고정된 값
+        gender = overrides.get("gender") or self._weighted_choice(self.config["gender_ratio"], key="gender_ratio")
+        location = overrides.get("location") or plan.location_sampler.draw(self.random)
         
         # 교육 수준 (연령에 따라 가중치 조정)
-        education_weights = self.config["education_levels"].copy()
-        if age <= 6: education_weights = {"없음": 1.0}
-        elif age <= 12: education_weights = {"없음": 0.6, "초졸": 0.4}
-        elif age <= 15: education_weights = {"초졸": 0.8, "중졸": 0.2}
-        elif age <= 18: education_weights = {"중졸": 0.7, "고졸": 0.3}
-        elif age < 23: education_weights = {"고졸": 0.6, "대졸": 0.4}
-        education = constraints.get("education", self._weighted_choice(education_weights))
+        education = overrides.get("education") or self._branch_sampler("education", age).draw(self.random)
 
         # 직업 (연령에 따라 구체적으로 조정)
-        if age <= 6:
-            occupation = "기타 무직"
-        elif age <= 12:
-            occupation = "초등학생"
-        elif age <= 15:
-            occupation = "중학생"
-        elif age <= 18:
-            occupation = "고등학생"
-        elif age < 20:
-            occupation = random.choice(["대학생", "고등학생"])  # 18-19세는 대학생 또는 고등학생
-        elif age >= 60:
-            occupation_category = random.choices(["무직", "자영업자", "직장인", "농림어업"], weights=[0.5, 0.2, 0.2, 0.1], k=1)[0]
-            occupation = random.choice(self.config["occupations"].get(occupation_category, ["기타 직업"]))
-        else:
-            occupation_category = random.choices(["직장인", "자영업자", "무직", "주부", "농림어업"], weights=[0.6, 0.15, 0.1, 0.1, 0.05], k=1)[0]
-            occupation = random.choice(self.config["occupations"].get(occupation_category, ["기타 직업"]))
+        occupation = self._branch_sampler("occupation", age).draw(self.random)
         
         # 소득 분위 (연령 및 직업에 따라 조정)
-        income_bracket = constraints.get("income_bracket")
+        income_bracket = overrides.get("income_bracket")
         if not income_bracket:
             if age <= 18:
                 income_bracket = "하위 20%"  # 0~18세는 하위 20%로 고정
             else:
-                income_bracket = self._weighted_choice(self.config["income_brackets"])
+                income_bracket = self._weighted_choice(self.config["income_brackets"], key="income_brackets")
         
-        marital_status = constraints.get("marital_status", self._weighted_choice(self.config["marital_statuses"]))
+        marital_status = overrides.get("marital_status") or self._weighted_choice(self.config["marital_statuses"], key="marital_statuses")
 
         return {
             "age": age,
@@ -145,23 +219,422 @@ class PersonaGenerator:
             "marital_status": marital_status
         }
 
+    def _demographic_categories(self, regional_distribution):
+        """배치 생성용 범주형 속성의 코드표를 반환합니다 (코드 = 리스트 인덱스)"""
+        return {
+            "gender": list(self.config["gender_ratio"].keys()),
+            "location": list(regional_distribution.keys()),
+            "education": list(self.config["education_levels"].keys()),
+            "occupation": [occupation for group in self.config["occupations"].values() for occupation in group],
+            "income_bracket": list(self.config["income_brackets"].keys()),
+            "marital_status": list(self.config["marital_statuses"].keys())
+        }
+
+    def _draw_category_codes(self, rng, key, choices_dict, labels, size):
+        """컴파일된 샘플러로 size개를 추출하고 코드표(labels) 기준 코드로 변환"""
+        sampler = self._sampler(key, choices_dict)
+        code_map = np.array([labels.index(item) for item in sampler.items], dtype=np.int16)
+        return code_map[sampler.draw_codes(size, rng)]
+
+    @staticmethod
+    def _fill_constraint(categories, field, value, size):
+        """제약 조건 값을 코드 배열로 변환 (코드표에 없는 값은 코드표에 추가)"""
+        if value not in categories[field]:
+            categories[field] = categories[field] + [value]
+        return np.full(size, categories[field].index(value), dtype=np.int16)
+
+    def _sample_age_batch(self, rng, count, plan):
+        if plan.age_range:
+            age_min, age_max = plan.age_range
+            return rng.integers(age_min, age_max + 1, size=count).astype(np.int16)
+
+        group_codes = plan.age_group_sampler.draw_codes(count, rng)
+        lows = plan.age_group_bounds[group_codes, 0]
+        spans = plan.age_group_bounds[group_codes, 1] - lows + 1
+        return (lows + np.floor(rng.random(count) * spans)).astype(np.int16)
+
+    def _sample_branches_batch(self, rng, field, ages, categories):
+        """연령대별 교육 수준/직업 분기를 마스크 연산으로 처리"""
+        codes = np.empty(len(ages), dtype=np.int16)
+        lower = 0
+        for max_age, weights in self._age_branches(field):
+            mask = ages >= lower if max_age is None else (ages >= lower) & (ages <= max_age)
+            size = int(mask.sum())
+            if size:
+                codes[mask] = self._draw_category_codes(rng, (field, max_age), weights, categories[field], size)
+            if max_age is not None:
+                lower = max_age + 1
+        return codes
+
+    def _occupation_category_weights(self, category_weights):
+        """직업군 가중치를 개별 직업 가중치로 펼침 (직업군 내 균등 선택과 동일)"""
+        weights = {}
+        for category, weight in category_weights.items():
+            occupations = self.config["occupations"].get(category, [])
+            for occupation in occupations:
+                weights[occupation] = weights.get(occupation, 0.0) + weight / len(occupations)
+        return weights
+
+    def generate_demographics_batch(self, count, constraints=None, rng=None):
+        """
+        N명의 인구통계 속성을 NumPy 배열로 한 번에 샘플링합니다.
+        _generate_demographics와 동일한 분포를 따르며, 범주형 속성은 코드 배열로 반환됩니다.
+
+        Args:
+            count (int): 생성할 인원 수
+            constraints (dict): 생성 제약 조건 (_generate_demographics와 동일)
+            rng (np.random.Generator): 난수 생성기 (없으면 새로 생성)
+
+        Returns:
+            dict: {"age": 배열, "gender": 코드 배열, ..., "categories": 코드표}
+        """
+        constraints = constraints or {}
+        rng = rng if rng is not None else np.random.default_rng()
+
+        plan = self.get_generation_plan(constraints)
+        categories = dict(plan.categories)
+
+        ages = self._sample_age_batch(rng, count, plan)
+
+        def categorical(field, key, choices_dict):
+            if constraints.get(field):
+                return self._fill_constraint(categories, field, constraints[field], count)
+            return self._draw_category_codes(rng, key, choices_dict, categories[field], count)
+
+        gender = categorical("gender", "gender_ratio", self.config["gender_ratio"])
+        location = categorical("location", ("regional_distribution", plan.year), plan.regional_distribution)
+
+        if constraints.get("education"):
+            education = self._fill_constraint(categories, "education", constraints["education"], count)
+        else:
+            education = self._sample_branches_batch(rng, "education", ages, categories)
+
+        occupation = self._sample_branches_batch(rng, "occupation", ages, categories)
+
+        if constraints.get("income_bracket"):
+            income_bracket = self._fill_constraint(categories, "income_bracket", constraints["income_bracket"], count)
+        else:
+            income_bracket = self._draw_category_codes(
+                rng, "income_brackets", self.config["income_brackets"], categories["income_bracket"], count)
+            income_bracket[ages <= 18] = categories["income_bracket"].index("하위 20%")  # 0~18세는 하위 20%로 고정
+
+        marital_status = categorical("marital_status", "marital_statuses", self.config["marital_statuses"])
+
+        return {
+            "age": ages,
+            "gender": gender,
+            "location": location,
+            "occupation": occupation,
+            "education": education,
+            "income_bracket": income_bracket,
+            "marital_status": marital_status,
+            "categories": categories
+        }
+
+    def get_generation_plan(self, constraints=None):
+        """
+        (연도, 제약 조건)에 대한 GenerationPlan을 반환합니다.
+        처음 요청될 때 한 번만 컴파일되고 LRU 캐시에 보관되므로, 같은 제약 조건의 반복 요청은 준비 작업을 건너뜁니다.
+        검증 규칙이 바뀌면 (validator.rules_version 증가) 캐시를 자동으로 비우며, config를 바꾼 뒤에는
+        clear_generation_plans()를 호출해야 합니다.
+        """
+        if self._plans_rules_version != self.validator.rules_version:
+            self.clear_generation_plans()
+            self._plans_rules_version = self.validator.rules_version
+        constraints = constraints if constraints else {}
+        year = constraints.get("year", self.current_year)
+        return self._plans.get(constraints_key(year, constraints),
+                               lambda: self._build_generation_plan(year, constraints))
+
+    def analyze_feasibility(self, constraints=None):
+        """
+        제약 조건의 실현 가능성을 생성 전에 분석합니다.
+
+        Returns:
+            FeasibilityReport: 불가능하면 위반 규칙, 가능하면 수용률·가능 조합 수·샘플링 전략
+        """
+        return analyze_feasibility(self, constraints)
+
+    def clear_generation_plans(self):
+        """캐시된 생성 계획, 샘플러, 유효성 격자를 모두 비움"""
+        self._plans.clear()
+        self._samplers.clear()
+        self._behavior_tables.clear()
+        self.constraint_compiler.clear_cache()
+
+    def _build_generation_plan(self, year, constraints):
+        year_data = self.ts_manager.get_year_data(year)
+        age_distribution = year_data.get("demographic_trends", {}).get("age_distribution", self.config["age_distribution"])
+        regional_distribution = year_data.get("demographic_trends", {}).get("regional_distribution", self.config["regional_distribution"])
+        categories = self._demographic_categories(regional_distribution)
+        for field in ("gender", "location", "education", "marital_status", "income_bracket"):
+            value = constraints.get(field)
+            if value and value not in categories[field]:
+                categories[field] = categories[field] + [value]
+
+        plan = GenerationPlan(year, constraints, age_distribution, regional_distribution, categories)
+        # 생성될 수 있는 모든 값이 검증 조회 테이블에 들어가도록 코드표를 등록
+        self.validator.extend_lookup_vocabulary(categories)
+        try:
+            plan.compiled = self._compile_plan(plan)
+        except InfeasibleConstraintsError as e:
+            plan.infeasible = e
+        return plan
+
+    def _compile_constraints(self, constraints):
+        """
+        제약 조건과 검증 규칙을 조건부 샘플링 테이블로 컴파일합니다 (생성 계획 캐시 사용).
+        만족 불가능한 제약 조건은 생성 전에 InfeasibleConstraintsError로 거부됩니다.
+        """
+        return self.get_generation_plan(constraints).require_compiled()
+
+    def _compile_plan(self, plan):
+        """생성 계획의 연령 사전 분포와 속성 사전 분포를 검증 규칙으로 마스킹해 조건부 테이블을 만듭니다"""
+        constraints = plan.constraints
+        categories = dict(plan.categories)
+
+        # 연령 사전 분포 (age_range는 균등, 그 외는 연령대 분포를 연령대 안에서 균등 분배)
+        max_age = max(100, constraints["age_range"][1]) if "age_range" in constraints else 100
+        ages = np.arange(max_age + 1)
+        age_prior = np.zeros(len(ages))
+        if "age_range" in constraints:
+            age_min, age_max = constraints["age_range"]
+            age_prior[max(age_min, 0):age_max + 1] = 1.0
+        else:
+            for age_group, weight in plan.age_distribution.items():
+                age_min, age_max = plan.age_group_ranges[age_group]
+                age_prior[age_min:age_max + 1] += weight / (age_max - age_min + 1)
+
+        def fixed(field, value):
+            table = np.zeros((len(ages), len(categories[field])))
+            table[:, categories[field].index(value)] = 1.0
+            return table
+
+        def branch_table(field):
+            table = np.zeros((len(ages), len(categories[field])))
+            lower = 0
+            for branch_max, weights in self._age_branches(field):
+                upper = len(ages) if branch_max is None else branch_max + 1
+                for label, weight in weights.items():
+                    table[lower:upper, categories[field].index(label)] += weight
+                lower = upper
+            return table
+
+        def weights_table(field, choices_dict):
+            row = np.zeros(len(categories[field]))
+            for label, weight in choices_dict.items():
+                row[categories[field].index(label)] = weight
+            return np.tile(row, (len(ages), 1))
+
+        priors = {
+            "education": fixed("education", constraints["education"]) if constraints.get("education") else branch_table("education"),
+            "occupation": branch_table("occupation")
+        }
+        if constraints.get("income_bracket"):
+            priors["income_bracket"] = fixed("income_bracket", constraints["income_bracket"])
+        else:
+            priors["income_bracket"] = weights_table("income_bracket", self.config["income_brackets"])
+            priors["income_bracket"][:19] = fixed("income_bracket", "하위 20%")[:19]  # 0~18세는 하위 20%로 고정
+        if constraints.get("marital_status"):
+            priors["marital_status"] = fixed("marital_status", constraints["marital_status"])
+        else:
+            priors["marital_status"] = weights_table("marital_status", self.config["marital_statuses"])
+
+        compiled = self.constraint_compiler.compile(ages, age_prior, priors, categories)
+        compiled.year = plan.year
+        compiled.regional_distribution = plan.regional_distribution
+        return compiled
+
+    def _generate_compiled_demographics(self, constraints, compiled):
+        """컴파일된 테이블에서 인구통계 속성을 하나 추출 (검증 규칙을 항상 만족)"""
+        sampled = compiled.sample_one(self.random)
+        gender = constraints["gender"] if constraints.get("gender") else self._weighted_choice(self.config["gender_ratio"], key="gender_ratio")
+        location = constraints["location"] if constraints.get("location") else self._weighted_choice(
+            compiled.regional_distribution, key=("regional_distribution", compiled.year))
+        return {
+            "age": sampled["age"],
+            "gender": gender,
+            "location": location,
+            "occupation": sampled["occupation"],
+            "education": sampled["education"],
+            "income_bracket": sampled["income_bracket"],
+            "marital_status": sampled["marital_status"]
+        }
+
+    def _compiled_demographics_batch(self, count, constraints, compiled, rng, ages=None):
+        """
+        컴파일된 테이블에서 인구통계 속성을 count개 추출 (generate_demographics_batch와 같은 형식).
+        ages를 주면 연령은 추출하지 않고 해당 연령 조건부로 나머지 속성만 추출합니다.
+        """
+        categories = compiled.categories
+        if ages is None:
+            batch = compiled.sample(count, rng)
+        else:
+            batch = compiled.sample_for_ages(ages, rng)
+            batch["age"] = ages
+        for field, key, choices_dict in (("gender", "gender_ratio", self.config["gender_ratio"]),
+                                         ("location", ("regional_distribution", compiled.year), compiled.regional_distribution)):
+            if constraints.get(field):
+                batch[field] = self._fill_constraint(categories, field, constraints[field], count)
+            else:
+                batch[field] = self._draw_category_codes(rng, key, choices_dict, categories[field], count)
+        batch["categories"] = categories
+        return batch
+
+    @staticmethod
+    def _demographics_batch_to_dicts(batch):
+        """배치 배열을 _generate_demographics와 같은 형태의 딕셔너리 목록으로 변환"""
+        categories = batch["categories"]
+        columns = {field: [categories[field][code] for code in batch[field].tolist()] for field in categories}
+        ages = batch["age"].tolist()
+        return [
+            {
+                "age": ages[i],
+                "gender": columns["gender"][i],
+                "location": columns["location"][i],
+                "occupation": columns["occupation"][i],
+                "education": columns["education"][i],
+                "income_bracket": columns["income_bracket"][i],
+                "marital_status": columns["marital_status"][i]
+            }
+            for i in range(len(ages))
+        ]
+
+    def _psychographic_vocabularies(self):
+        """비트마스크 열의 어휘 (기본 선택지 뒤에 세대/지역 특성으로 추가되는 항목을 이어 붙임)"""
+        nuances = self.config["korean_cultural_nuances"]
+        generational = [value for values in nuances.get("세대별 가치관", {}).values() for value in values]
+        regional = [trait for traits in nuances.get("지역별 특색", {}).values() for trait in traits]
+        return {
+            "values": list(dict.fromkeys(self.config["values"] + generational)),
+            "lifestyle_attributes": list(dict.fromkeys(self.config["lifestyle_attributes"] + regional)),
+            "interests": list(self.config["interests"]),
+            "social_relations": list(nuances.get("사회적 관계", []))
+        }
+
+    @staticmethod
+    def _vocabulary_mask(vocabulary, labels):
+        return np.uint64(sum(1 << vocabulary.index(label) for label in dict.fromkeys(labels)))
+
+    @staticmethod
+    def _sample_multi_hot(rng, count, pool_size, k_min, k_max):
+        """어휘 앞쪽 pool_size개 중 k_min~k_max개를 비복원 추출해 비트마스크로 반환 (random.sample과 같은 분포)"""
+        ranks = rng.random((count, pool_size)).argsort(axis=1).argsort(axis=1)
+        k = rng.integers(k_min, k_max + 1, size=count)
+        return encode_multi_hot(ranks < k[:, None])
+
+    def _persona_batch(self, count, constraints, compiled, rng, ids, demographics=None):
+        """
+        컴파일된 테이블로 인구통계 코드를, 비트마스크 연산으로 심리/행동 속성을 한 번에 생성합니다.
+        _build_persona + _apply_cultural_nuances와 같은 분포를 따르며 페르소나별 객체를 만들지 않습니다.
+        demographics를 주면 (예: generate_demographics_batch 결과) 인구통계 추출을 건너뜁니다.
+        """
+        nuances = self.config["korean_cultural_nuances"]
+        if demographics is None:
+            demographics = self._compiled_demographics_batch(count, constraints, compiled, rng)
+        ages = demographics["age"]
+        behavior = self._behavior_table(compiled.year)
+        categories = dict(demographics["categories"], **behavior.labels)
+
+        codes = {field: demographics[field] for field in DEMOGRAPHIC_FIELDS}
+        codes.update(behavior.sample(ages, rng))
+
+        trait_categories = self.config["personality_traits"]
+        traits = {
+            trait: rng.integers(len(options), size=count).astype(np.int16)
+            for trait, options in trait_categories.items()
+        }
+
+        vocabularies = self._psychographic_vocabularies()
+        values = self._sample_multi_hot(rng, count, len(self.config["values"]), 2, 5)
+        for generation, min_age, max_age in self.GENERATION_AGE_BANDS:
+            in_band = (ages >= min_age) if max_age is None else (ages >= min_age) & (ages <= max_age)
+            values[in_band] |= self._vocabulary_mask(
+                vocabularies["values"], nuances.get("세대별 가치관", {}).get(generation, []))
+
+        lifestyle = self._sample_multi_hot(rng, count, len(self.config["lifestyle_attributes"]), 1, 3)
+        region_masks = np.array([
+            self._vocabulary_mask(vocabularies["lifestyle_attributes"], nuances.get("지역별 특색", {}).get(location, []))
+            for location in categories["location"]
+        ], dtype=np.uint64)
+        lifestyle |= region_masks[codes["location"]]
+
+        multi_hot = {
+            "values": values,
+            "lifestyle_attributes": lifestyle,
+            "interests": self._sample_multi_hot(rng, count, len(vocabularies["interests"]), 3, 6),
+            "social_relations": self._sample_multi_hot(rng, count, len(vocabularies["social_relations"]), 1, 3)
+        }
+
+        return PersonaBatch(ids=ids, age=ages, codes=codes, categories=categories,
+                            traits=traits, trait_categories=trait_categories,
+                            multi_hot=multi_hot, vocabularies=vocabularies,
+                            created_at=datetime.now().isoformat())
+
+    def generate_persona_batch(self, count, demographics_constraints=None, rng=None, id_block=None):
+        """
+        페르소나 count명을 열 지향 PersonaBatch로 생성합니다.
+        인구통계 속성은 컴파일된 조건부 테이블에서 추출하므로 모두 검증 규칙을 만족합니다.
+
+        Args:
+            count (int): 생성할 페르소나 수
+            demographics_constraints (dict): 인구통계학적 제약 조건
+            rng (np.random.Generator): 난수 생성기 (없으면 새로 생성)
+            id_block (IdBlock): 미리 예약된 ID 블록 (기본: id_allocator에서 count개 예약)
+
+        Raises:
+            InfeasibleConstraintsError: 제약 조건을 만족하는 조합이 없는 경우
+        """
+        constraints = demographics_constraints if demographics_constraints else {}
+        compiled = self._compile_constraints(constraints)
+        rng = rng if rng is not None else np.random.default_rng()
+        id_block = id_block if id_block is not None else self.id_allocator.reserve(count)
+        return self._persona_batch(count, constraints, compiled, rng, id_block)
+
+    def generate_panel(self, count, start_year=2020, end_year=2030, demographics_constraints=None, rng=None, seed=None):
+        """
+        기준 연도 인구 count명을 한 번 생성하고 매년 나이를 더해 end_year까지 이어지는 패널을 만듭니다.
+        연도별 인구를 따로 생성하지 않으며, 매년 바뀌는 속성(연령 분기 경계를 넘은 교육/직업, 소득, 혼인 상태)과
+        그 해 age_distribution에 맞춘 출생/사망만 반영합니다. 같은 사람은 모든 연도에서 같은 ID를 가집니다.
+
+        Args:
+            count (int): 연도별 인구 수
+            start_year (int): 기준 연도
+            end_year (int): 마지막 연도
+            demographics_constraints (dict): 인구통계학적 제약 조건 (age_range와 year는 사용할 수 없음)
+            rng (np.random.Generator): 난수 생성기
+            seed (int): rng가 없을 때 사용할 시드
+
+        Returns:
+            PersonaPanel: 연도 -> PersonaBatch (waves), 연도 -> 출생/사망/재추출 집계 (events)
+        """
+        rng = rng if rng is not None else np.random.default_rng(seed)
+        return generate_panel(self, count, start_year, end_year, demographics_constraints, rng)
+
+    def iter_panel(self, count, start_year=2020, end_year=2030, demographics_constraints=None, rng=None, seed=None):
+        """generate_panel과 같지만 (연도, PersonaBatch, 변화 집계)를 연도별로 차례로 반환 (모든 연도를 메모리에 두지 않음)"""
+        rng = rng if rng is not None else np.random.default_rng(seed)
+        return iter_panel(self, count, start_year, end_year, demographics_constraints, rng)
+
     def _generate_psychological_attributes(self):
         personality_traits = {
-            trait: random.choice(self.config["personality_traits"][trait])
+            trait: self.random.choice(self.config["personality_traits"][trait])
             for trait in self.config["personality_traits"]
         }
-        values = random.sample(self.config["values"], k=random.randint(2, 5))
-        lifestyle_attributes = random.sample(self.config["lifestyle_attributes"], k=random.randint(1, 3))
+        values = self.random.sample(self.config["values"], k=self.random.randint(2, 5))
+        lifestyle_attributes = self.random.sample(self.config["lifestyle_attributes"], k=self.random.randint(1, 3))
         return {
             "personality_traits": personality_traits,
             "values": values,
             "lifestyle_attributes": lifestyle_attributes
         }
 
-    def _generate_behavioral_patterns(self):
-        interests = random.sample(self.config["interests"], k=random.randint(3, 6))
-        media_consumption = random.choice(self.config["korean_cultural_nuances"].get("미디어_소비", ["기타 미디어"]))
-        shopping_habit = random.choice(self.config["korean_cultural_nuances"].get("소비_행태", ["기타 소비"]))
+    def _generate_behavioral_patterns(self, age=None, year=None):
+        # 미디어 소비/소비 행태는 연도별 트렌드와 세대 보정으로 만든 확률 테이블에서 추출
+        interests = self.random.sample(self.config["interests"], k=self.random.randint(3, 6))
+        behavior = self._behavior_table(year if year is not None else self.current_year)
+        media_consumption = behavior.draw("media_consumption", age, self.random)
+        shopping_habit = behavior.draw("shopping_habit", age, self.random)
         
         return {
             "interests": interests,
@@ -173,14 +646,10 @@ class PersonaGenerator:
         # 세대별 가치관 적용
         age = persona["demographics"].get("age")
         if age is not None:
-            if 10 <= age <= 24: # Z세대
-                persona["psychological_attributes"].setdefault("values", []).extend(self.config["korean_cultural_nuances"].get("세대별 가치관", {}).get("Z세대", []))
-            elif 25 <= age <= 44: # 밀레니얼
-                persona["psychological_attributes"].setdefault("values", []).extend(self.config["korean_cultural_nuances"].get("세대별 가치관", {}).get("밀레니얼", []))
-            elif 45 <= age <= 59: # X세대
-                persona["psychological_attributes"].setdefault("values", []).extend(self.config["korean_cultural_nuances"].get("세대별 가치관", {}).get("X세대", []))
-            elif age >= 60: # 베이비부머
-                persona["psychological_attributes"].setdefault("values", []).extend(self.config["korean_cultural_nuances"].get("세대별 가치관", {}).get("베이비부머", []))
+            for generation, min_age, max_age in self.GENERATION_AGE_BANDS:
+                if min_age <= age and (max_age is None or age <= max_age):
+                    persona["psychological_attributes"].setdefault("values", []).extend(self.config["korean_cultural_nuances"].get("세대별 가치관", {}).get(generation, []))
+                    break
         
         # 지역별 특색 적용
         location = persona["demographics"].get("location")
@@ -188,11 +657,11 @@ class PersonaGenerator:
             persona["psychological_attributes"].setdefault("lifestyle_attributes", []).extend(self.config["korean_cultural_nuances"].get("지역별 특색", {}).get(location, []))
         
         # 한국 특유의 사회적 관계 반영
-        persona["social_relations"] = random.sample(self.config["korean_cultural_nuances"].get("사회적 관계", []), k=random.randint(1, 3))
+        persona["social_relations"] = self.random.sample(self.config["korean_cultural_nuances"].get("사회적 관계", []), k=self.random.randint(1, 3))
         
-        # 중복 제거
-        persona["psychological_attributes"]["values"] = list(set(persona["psychological_attributes"].get("values", [])))
-        persona["psychological_attributes"]["lifestyle_attributes"] = list(set(persona["psychological_attributes"].get("lifestyle_attributes", [])))
+        # 중복 제거 (순서 유지 - set 순서는 프로세스마다 달라 시드 재현성을 깨뜨림)
+        persona["psychological_attributes"]["values"] = list(dict.fromkeys(persona["psychological_attributes"].get("values", [])))
+        persona["psychological_attributes"]["lifestyle_attributes"] = list(dict.fromkeys(persona["psychological_attributes"].get("lifestyle_attributes", [])))
         return persona
 
     def generate_persona(self, constraints={}, max_retries=10):
@@ -205,31 +674,37 @@ class PersonaGenerator:
             
         Returns:
             dict: 검증된 유효한 페르소나 데이터
+
+        Raises:
+            InfeasibleConstraintsError: 제약 조건을 만족하는 조합이 없는 경우 (생성 전에 즉시 발생)
         """
-        for attempt in range(max_retries):
-            persona = {}
-            persona["demographics"] = self._generate_demographics(constraints)
-            persona["psychological_attributes"] = self._generate_psychological_attributes()
-            persona["behavioral_patterns"] = self._generate_behavioral_patterns()
-            
-            persona = self._apply_cultural_nuances(persona)
+        persona, _ = self._generate_valid_persona(constraints, self._compile_constraints(constraints), max_retries)
+        return persona
 
-            persona["id"] = str(random.randint(100000000, 999999999)) # 9자리 ID
-            persona["name"] = f"가상인물_{persona['id']}" # 임시 이름
-            persona["created_at"] = datetime.now().isoformat()
-            persona["version"] = 1
+    def _generate_valid_persona(self, constraints, compiled, max_retries=10, persona_id=None, metrics=None):
+        # 컴파일된 테이블에서 추출하므로 검증은 안전장치 역할만 함
+        # (페르소나, (오류 코드, 경고 코드))를 반환해 호출자가 경고 집계를 위해 다시 검증하지 않도록 함
+        # 메시지 문자열은 로그를 출력할 때만 만듦, metrics(GenerationMetrics)가 있으면 추출/거부를 집계
+        persona_id = persona_id if persona_id is not None else self.id_allocator.allocate()
+        for attempt in range(max_retries):
+            persona = self._build_persona(self._generate_compiled_demographics(constraints, compiled), persona_id,
+                                          year=compiled.year)
 
             # 유효성 검증
-            validation_result = self.validator.validate_persona(persona)
+            errors, warnings = self.validator.check_persona(persona)
             
-            if validation_result["is_valid"]:
+            if not errors:
+                if metrics is not None:
+                    metrics.record_acceptance(attempt)
                 # 경고가 있으면 로그에 기록하지만 페르소나는 반환
-                if validation_result["warnings"]:
-                    print(f"페르소나 {persona['id']} 경고: {validation_result['warnings']}")
-                return persona
+                if warnings:
+                    print(f"페르소나 {persona['id']} 경고: {self.validator.render_violations(warnings, persona)}")
+                return persona, (errors, warnings)
             else:
                 # 검증 실패 시 재시도
-                print(f"페르소나 생성 시도 {attempt + 1}/{max_retries} 실패: {validation_result['errors']}")
+                if metrics is not None:
+                    metrics.record_rejection(errors)
+                print(f"페르소나 생성 시도 {attempt + 1}/{max_retries} 실패: {self.validator.render_violations(errors, persona)}")
         
         # 최대 재시도 횟수 초과 시 예외 발생
         raise ValueError(f"유효한 페르소나 생성에 {max_retries}번 시도했지만 실패했습니다. 제약 조건을 확인해주세요.")
@@ -238,21 +713,31 @@ class PersonaGenerator:
         """
         기존의 검증 없는 페르소나 생성 메서드 (호환성을 위해 유지)
         """
+        return self._build_persona(self._generate_demographics(constraints),
+                                   year=constraints.get("year", self.current_year))
+
+    def _build_persona(self, demographics, persona_id=None, year=None):
+        """
+        인구통계 속성을 바탕으로 나머지 속성을 채워 페르소나를 구성합니다 (persona_id가 없으면 할당기에서 발급).
+        year는 행동 패턴 트렌드 기준 연도입니다 (기본: current_year).
+        """
         persona = {}
-        persona["demographics"] = self._generate_demographics(constraints)
+        persona["demographics"] = demographics
         persona["psychological_attributes"] = self._generate_psychological_attributes()
-        persona["behavioral_patterns"] = self._generate_behavioral_patterns()
-        
+        persona["behavioral_patterns"] = self._generate_behavioral_patterns(demographics.get("age"), year)
+
         persona = self._apply_cultural_nuances(persona)
 
-        persona["id"] = str(random.randint(100000000, 999999999)) # 9자리 ID
+        persona["id"] = persona_id if persona_id is not None else self.id_allocator.allocate()
         persona["name"] = f"가상인물_{persona['id']}" # 임시 이름
         persona["created_at"] = datetime.now().isoformat()
         persona["version"] = 1
 
         return persona
 
-    def generate_personas(self, count=1, demographics_constraints=None, diversity_constraints=None):
+    def generate_personas(self, count=1, demographics_constraints=None, diversity_constraints=None,
+                          vectorized=False, rng=None, max_retries=10,
+                          workers=None, seed=None, shard_size=DEFAULT_SHARD_SIZE, id_block=None):
         """
         여러 페르소나를 생성합니다. 유효성 검증 통계를 포함합니다.
         
@@ -260,10 +745,39 @@ class PersonaGenerator:
             count (int): 생성할 페르소나 수
             demographics_constraints (dict): 인구통계학적 제약 조건
             diversity_constraints (dict): 다양성 제약 조건
+            vectorized (bool): True이면 인구통계 속성을 NumPy 배치로 샘플링
+            rng (np.random.Generator): 배치 모드에서 사용할 난수 생성기
+            max_retries (int): 검증 실패 시 최대 재시도 횟수
+            workers (int): 2 이상이면 샤드 단위로 나눠 프로세스 풀에서 병렬 생성 (seed만 지정하면 현재 프로세스에서 순차 생성)
+            seed (int): 마스터 시드 - 지정하면 워커 수와 무관하게 같은 결과 (ID와 created_at 제외)
+            shard_size (int): 샤드 크기 (병렬/시드 모드)
+            id_block (IdBlock): count개 이상의 미리 예약된 ID 블록 (기본: id_allocator에서 count개 예약)
             
         Returns:
             dict: 생성된 페르소나 목록과 생성 통계
+                generation_stats에는 성공/실패 수와 함께 추출 수(draws), 수용률(acceptance_rate),
+                규칙별 거부 횟수(rule_rejections), 재시도 깊이 히스토그램(retry_depth_histogram)이 포함되며
+                같은 값이 제약 조건 집합별로 누적되어 generation_metrics()로 조회됩니다.
         """
+        result = self._generate_personas(count, demographics_constraints, vectorized, rng, max_retries,
+                                         workers, seed, shard_size, id_block)
+        constraints = demographics_constraints if demographics_constraints else {}
+        self.metrics.record(constraints_key(constraints.get("year", self.current_year), constraints),
+                            result["generation_stats"])
+        return result
+
+    def generation_metrics(self):
+        """
+        이 생성기로 생성한 제약 조건 집합별 누적 지표 (지표 API용)
+
+        Returns:
+            dict: {"constraint_sets": 수용률이 낮은 순의 제약 조건 집합별 지표, "totals": 전체 합계}
+        """
+        return {"constraint_sets": self.metrics.snapshot(), "totals": self.metrics.totals()}
+
+    def _generate_personas(self, count, demographics_constraints, vectorized, rng, max_retries,
+                           workers, seed, shard_size, id_block):
+        """generate_personas 본체 (샤드 워커도 이 메서드를 호출하므로 누적 지표는 바깥에서 한 번만 기록)"""
         personas = []
         validation_stats = {
             "total_attempts": 0,
@@ -271,18 +785,44 @@ class PersonaGenerator:
             "validation_failures": 0,
             "warnings_count": 0
         }
+
+        constraints = demographics_constraints if demographics_constraints else {}
+        try:
+            compiled = self._compile_constraints(constraints)
+        except InfeasibleConstraintsError as e:
+            # 불가능한 제약 조건은 count번 시도하지 않고 한 번에 거부
+            print(f"페르소나 생성 불가: {str(e)}")
+            validation_stats["validation_failures"] = count
+            validation_stats["total_attempts"] = count
+            validation_stats["infeasible_rules"] = e.violated_rules
+            GenerationMetrics(max_retries).update_stats(validation_stats)
+            return {
+                "personas": personas,
+                "generation_stats": validation_stats,
+                "success_rate": 0.0
+            }
+
+        # 생성 전에 ID를 한 블록으로 예약하므로 샤드/프로세스 간에도 ID가 겹치지 않음
+        id_block = id_block if id_block is not None else self.id_allocator.reserve(count)
+
+        if workers is not None or seed is not None:
+            return self._generate_personas_sharded(count, constraints, vectorized, max_retries, workers, seed, shard_size, id_block)
+
+        if vectorized:
+            return self._generate_personas_vectorized(count, constraints, compiled, rng, max_retries, id_block)
         
+        metrics = GenerationMetrics(max_retries)
         for i in range(count):
             try:
                 # diversity_constraints는 현재 단순화된 모델에서는 직접적으로 사용되지 않음.
                 # 향후 LLM 연동 시, LLM 프롬프트에 제약 조건으로 활용 가능.
-                persona = self.generate_persona(demographics_constraints if demographics_constraints else {})
+                persona, (_, warnings) = self._generate_valid_persona(constraints, compiled, max_retries, id_block[i],
+                                                                      metrics)
                 personas.append(persona)
                 validation_stats["successful_generations"] += 1
                 
                 # 경고가 있는지 확인
-                validation_result = self.validator.validate_persona(persona)
-                if validation_result["warnings"]:
+                if warnings:
                     validation_stats["warnings_count"] += 1
                     
             except ValueError as e:
@@ -291,6 +831,7 @@ class PersonaGenerator:
                 continue
         
         validation_stats["total_attempts"] = validation_stats["successful_generations"] + validation_stats["validation_failures"]
+        metrics.update_stats(validation_stats)
         
         return {
             "personas": personas,
@@ -298,6 +839,128 @@ class PersonaGenerator:
             "success_rate": validation_stats["successful_generations"] / max(validation_stats["total_attempts"], 1) * 100
         }
 
+    def _generate_personas_vectorized(self, count, constraints, compiled, rng, max_retries, id_block):
+        """
+        배치 모드 생성: 인구통계 속성을 한 번에 샘플링해 코드 배열 그대로 validate_batch로 검증하고,
+        실패한 행만 모아 다시 배치로 샘플링합니다. 딕셔너리는 통과한 행에 대해서만 만듭니다.
+        수용률이 충분히 높으면 기존 분포에서 뽑고 검증(rejection), 아니면 컴파일된 조건부 테이블에서 추출(conditional)합니다.
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        strategy = self.analyze_feasibility(constraints).strategy
+        validation_stats = {
+            "total_attempts": 0,
+            "successful_generations": 0,
+            "validation_failures": 0,
+            "warnings_count": 0
+        }
+
+        metrics = GenerationMetrics(max_retries)
+        personas = [None] * count
+        pending = np.arange(count)
+        for attempt in range(max_retries):
+            if len(pending) == 0:
+                break
+            demographics = None
+            if strategy == "rejection":
+                demographics = self.generate_demographics_batch(len(pending), constraints, rng)
+            batch = self._persona_batch(len(pending), constraints, compiled, rng,
+                                        [id_block[slot] for slot in pending.tolist()], demographics)
+            validation = self.validator.validate_batch(batch.age, batch.codes, batch.categories)
+            valid = validation["is_valid"]
+            metrics.record_batch(attempt, validation)
+            validation_stats["warnings_count"] += int(validation["has_warning"][valid].sum())
+            for slot, persona in zip(pending[valid].tolist(), batch.take(valid)):
+                personas[slot] = persona
+            pending = pending[~valid]
+
+        personas = [persona for persona in personas if persona is not None]
+        validation_stats["successful_generations"] = len(personas)
+        validation_stats["validation_failures"] = len(pending)
+        validation_stats["total_attempts"] = count
+        validation_stats["sampling_strategy"] = strategy
+        metrics.update_stats(validation_stats)
+        if len(pending):
+            print(f"페르소나 {len(pending)}명 생성 실패: {max_retries}번 시도 후에도 유효한 조합을 찾지 못했습니다.")
+
+        return {
+            "personas": personas,
+            "generation_stats": validation_stats,
+            "success_rate": validation_stats["successful_generations"] / max(validation_stats["total_attempts"], 1) * 100
+        }
+
+    def _generate_personas_sharded(self, count, constraints, vectorized, max_retries, workers, seed, shard_size, id_block):
+        """count를 샤드로 나눠 샤드별 독립 난수 스트림으로 생성한 뒤 샤드 순서대로 합칩니다"""
+        payload = (self, constraints, vectorized, max_retries, id_block)
+        shard_results = run_sharded(_generate_persona_shard, payload, count,
+                                    seed=seed, workers=workers, shard_size=shard_size)
+
+        personas = []
+        validation_stats = {}
+        for result in shard_results:
+            personas.extend(result["personas"])
+            merge_generation_stats(validation_stats, result["generation_stats"])
+
+        return {
+            "personas": personas,
+            "generation_stats": validation_stats,
+            "success_rate": validation_stats["successful_generations"] / max(validation_stats["total_attempts"], 1) * 100
+        }
+
+    def iter_personas(self, count, chunk_size=DEFAULT_SHARD_SIZE, demographics_constraints=None,
+                      vectorized=True, max_retries=10, workers=1, seed=None, as_batches=False):
+        """
+        페르소나를 chunk_size개씩 생성해 청크(list) 단위로 내보냅니다.
+        한 번에 하나의 청크만 메모리에 유지하므로 5천만 명 규모도 전체 수와 무관한 메모리로 생성할 수 있으며,
+        각 청크는 DatabaseInterface.insert_personas나 persona_export.export_personas에 그대로 전달할 수 있습니다.
+        같은 seed와 chunk_size는 generate_personas(seed=seed, shard_size=chunk_size)와 같은 페르소나를 만듭니다 (ID 제외).
+
+        Args:
+            count (int): 생성할 전체 페르소나 수
+            chunk_size (int): 청크 크기
+            demographics_constraints (dict): 인구통계학적 제약 조건
+            vectorized (bool): True이면 청크마다 인구통계 속성을 NumPy 배치로 샘플링
+            max_retries (int): 검증 실패 시 최대 재시도 횟수
+            workers (int): 청크를 병렬 생성할 프로세스 수 (진행 중인 청크는 워커 수의 2배로 제한)
+            seed (int): 마스터 시드
+            as_batches (bool): True이면 청크를 PersonaBatch(열 지향)로 내보냄 - 프로세스 간 전송과 메모리가 훨씬 작음
+
+        Yields:
+            list 또는 PersonaBatch: 페르소나 청크
+
+        Raises:
+            InfeasibleConstraintsError: 제약 조건을 만족하는 페르소나가 없는 경우 (첫 청크 생성 전)
+        """
+        constraints = demographics_constraints if demographics_constraints else {}
+        self._compile_constraints(constraints)
+
+        payload = (self, constraints, vectorized, max_retries, self.id_allocator.reserve(count))
+        shard_fn = _generate_persona_batch_shard if as_batches else _generate_persona_shard
+        key = constraints_key(constraints.get("year", self.current_year), constraints)
+        for result in iter_sharded(shard_fn, payload, count,
+                                   seed=seed, workers=workers, shard_size=chunk_size):
+            if as_batches:
+                yield result
+            else:
+                self.metrics.record(key, result["generation_stats"])
+                yield result["personas"]
+
+
+def _generate_persona_shard(task):
+    """프로세스 풀 워커: 샤드 하나를 샤드 전용 난수 스트림으로 생성"""
+    (generator, constraints, vectorized, max_retries, id_block), shard_index, start, size, seed_sequence = task
+    np_rng, rand = shard_random_streams(seed_sequence)
+    shard_generator = copy.copy(generator)
+    shard_generator.random = rand
+    return shard_generator._generate_personas(size, constraints, vectorized, np_rng, max_retries,
+                                              None, None, DEFAULT_SHARD_SIZE, id_block.slice(start, size))
+
+
+def _generate_persona_batch_shard(task):
+    """프로세스 풀 워커: 샤드 하나를 PersonaBatch로 생성"""
+    (generator, constraints, vectorized, max_retries, id_block), shard_index, start, size, seed_sequence = task
+    np_rng, _ = shard_random_streams(seed_sequence)
+    return generator.generate_persona_batch(size, constraints, rng=np_rng, id_block=id_block.slice(start, size))
+
 if __name__ == "__main__":
     generator = PersonaGenerator()
     
@@ -316,17 +979,18 @@ if __name__ == "__main__":
 
     print("\n--- 여러 페르소나 생성 (5명) ---")
     multiple_personas = generator.generate_personas(count=5)
-    for p in multiple_personas:
+    for p in multiple_personas["personas"]:
         print(json.dumps(p, indent=2, ensure_ascii=False))
         print("-" * 30)
 
     print("""\
---- 5천만 페르소나 생성 (개념적 설명) ---
-5천만 페르소나를 생성하는 것은 현재 SQLite 및 단일 프로세스 환경에서는 매우 오랜 시간이 소요되며, 시스템 리소스 제약으로 인해 실제 실행이 어렵습니다.
-이를 위해서는 다음과 같은 확장성 전략이 필요합니다:
-1. 분산 데이터베이스 시스템 (예: PostgreSQL, Cassandra) 사용
-2. 배치 처리 및 비동기 처리 도입
-3. 클라우드 기반의 분산 컴퓨팅 환경 (예: AWS Lambda, Kubernetes) 활용
-4. LLM 연동 시, LLM API 호출 비용 및 속도 고려
-현재 구현은 한국 인구통계 및 문화적 특성을 반영한 페르소나 생성 로직에 중점을 둡니다.
+--- 대규모 페르소나 생성 (스트리밍) ---
+iter_personas(count, chunk_size)는 페르소나를 고정 크기 청크로 나눠 생성하므로 5천만 명 규모도 일정한 메모리로 생성할 수 있습니다.
+    from database_factory import get_database
+    db = get_database()
+    for chunk in generator.iter_personas(50_000_000, chunk_size=10000, workers=8, seed=42):
+        db.insert_personas(chunk)
+
+    from persona_export import export_personas
+    export_personas(generator.iter_personas(50_000_000, chunk_size=10000), "personas.jsonl")
 """)
@@ -3,75 +3,155 @@
 상식에 어긋나는 데이터 조합을 필터링하여 데이터 품질을 보장합니다.
 """
 
+import copy
 import logging
 
+import numpy as np
+
+from rule_engine import NON_INTEGRAL_AGE_ENTRY, CompiledRules, decode_violation
+from validation_core import AGE_AXIS, CODE_DTYPE, ValidationCore
+from rule_packs import load_rule_pack
+
+# validate_batch가 반환하는 규칙별 위반 코드 배열의 이름 (0 = 위반 없음)
+BATCH_ERROR_RULES = ("age_limits", "age_occupation", "age_education", "age_marital", "age_income")
+BATCH_WARNING_RULES = ("education_occupation",)
+
+# 조회 테이블 축 (연령 다음 순서) 과 플래그 비트
+LOOKUP_FIELDS = ("occupation", "education", "marital_status", "income_bracket")
+LOOKUP_RULE_BITS = (("age_occupation", "occupation", 0), ("age_education", "education", 1),
+                    ("age_marital", "marital_status", 2), ("age_income", "income_bracket", 3))
+LOOKUP_WARNING_BIT = 4
+LOOKUP_OTHER_INCOME = "(기타 소득구간)"
+
+
+class _RuleDict(dict):
+    """변경될 때마다 콜백을 호출하는 규칙 사전 (중첩 사전도 자동으로 감쌈)"""
+
+    def __init__(self, data, on_change):
+        super().__init__()
+        self._on_change = on_change
+        for key, value in data.items():
+            dict.__setitem__(self, key, self._wrap(value))
+
+    def __reduce__(self):
+        # pickle/deepcopy 시 콜백이 설정된 뒤에 항목을 채우도록 생성자 인자로 복원
+        return _RuleDict, (dict(self), self._on_change)
+
+    def _wrap(self, value):
+        return _RuleDict(value, self._on_change) if isinstance(value, dict) and not isinstance(value, _RuleDict) else value
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, self._wrap(value))
+        self._on_change()
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._on_change()
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            dict.__setitem__(self, key, self._wrap(value))
+        self._on_change()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, *args):
+        value = dict.pop(self, *args)
+        self._on_change()
+        return value
+
+    def popitem(self):
+        item = dict.popitem(self)
+        self._on_change()
+        return item
+
+    def clear(self):
+        dict.clear(self)
+        self._on_change()
+
 class PersonaValidator:
     """페르소나 데이터의 논리적 일관성을 검증하는 클래스"""
     
-    def __init__(self):
+    def __init__(self, use_lookup_table=True, rule_pack=None):
+        """
+        Args:
+            use_lookup_table: 전체 조합 조회 테이블로 validate_persona를 가속할지 여부
+            rule_pack: 적용할 RulePack (기본: rules/default_rule_pack.json)
+        """
         self.logger = logging.getLogger(__name__)
-        self.validation_rules = self._load_validation_rules()
-    
-    def _load_validation_rules(self):
-        """검증 규칙을 정의합니다."""
-        return {
-            # 나이 범위 제한
-            "age_limits": {
-                "min_age": 0,
-                "max_age": 99  # 100세 이상 제외
-            },
-            
-            # 연령-직업 관계 규칙
-            "age_occupation_rules": {
-                "기타 무직": {"min_age": 0, "max_age": 6},
-                "무직": {"min_age": 0, "max_age": 6},
-                "초등학생": {"min_age": 7, "max_age": 12},
-                "중학생": {"min_age": 13, "max_age": 15},
-                "고등학생": {"min_age": 16, "max_age": 18},
-                "대학생": {"min_age": 18, "max_age": 28},
-                "대학원생": {"min_age": 22, "max_age": 35},
-                "취업준비생": {"min_age": 18, "max_age": 35},
-                "은퇴자": {"min_age": 55, "max_age": 99},
-                "전업주부": {"min_age": 20, "max_age": 80},
-                "육아휴직중": {"min_age": 20, "max_age": 45}
-            },
-            
-            # 연령-교육수준 관계 규칙
-            "age_education_rules": {
-                "없음": {"min_age": 0, "max_age": 12},
-                "초졸": {"min_age": 13, "max_age": 99},
-                "중졸": {"min_age": 16, "max_age": 99},
-                "고졸": {"min_age": 18, "max_age": 99},
-                "대졸": {"min_age": 22, "max_age": 99},
-                "대학원졸": {"min_age": 24, "max_age": 99}
-            },
-            
-            # 연령-소득 관계 규칙
-            "age_income_rules": {
-                0: {"max_age": 6, "income_brackets": ["하위 20%"]},
-                7: {"min_age": 7, "max_age": 12, "income_brackets": ["하위 20%"]},
-                13: {"min_age": 13, "max_age": 15, "income_brackets": ["하위 20%"]},
-                16: {"min_age": 16, "max_age": 18, "income_brackets": ["하위 20%"]}
-            },
-            
-            # 연령-결혼상태 관계 규칙
-            "age_marital_rules": {
-                "미혼": {"min_age": 0, "max_age": 99},
-                "기혼": {"min_age": 18, "max_age": 99},  # 법적 결혼 가능 연령
-                "이혼": {"min_age": 20, "max_age": 99},  # 실질적 이혼 가능 연령
-                "사별": {"min_age": 25, "max_age": 99}   # 현실적 사별 발생 연령
-            },
-            
-            # 교육수준-직업 논리적 관계 (선택적 규칙)
-            "education_occupation_preferences": {
-                "의사": ["대졸", "대학원졸"],
-                "변호사": ["대졸", "대학원졸"],
-                "교사": ["대졸", "대학원졸"],
-                "교수": ["대학원졸"],
-                "연구원": ["대졸", "대학원졸"]
-            }
-        }
+        self.rules_version = 0  # validation_rules가 바뀔 때마다 증가 (파생 테이블 재생성 기준)
+        self._batch_tables = {}  # 코드표별 규칙 경계 테이블 (validate_batch용)
+        self._batch_tables_version = None
+        self._compiled_rules = (None, None)  # (규칙 버전, CompiledRules) - 한 번의 대입으로 교체
+        self.apply_rule_pack(rule_pack if rule_pack is not None else load_rule_pack())
+
+        # 조회 테이블 모드: (연령, 직업, 교육, 결혼, 소득) 전체 조합의 위반/경고 플래그를 미리 계산
+        self.use_lookup_table = use_lookup_table
+        self._lookup_vocabulary = {field: [""] for field in LOOKUP_FIELDS}
+        self._lookup_index = {field: {"": 0} for field in LOOKUP_FIELDS}
+        self._lookup = None  # (규칙 버전, 플래그 bytes, 축별 stride, 최소 연령, 연령 수, 코드표, 기타 소득 코드)
+
+    @property
+    def validation_rules(self):
+        return self._validation_rules
+
+    @validation_rules.setter
+    def validation_rules(self, rules):
+        self._validation_rules = _RuleDict(rules, self.invalidate_rule_caches)
+        self.invalidate_rule_caches()
+
+    def invalidate_rule_caches(self):
+        """
+        규칙에서 파생된 테이블(배치 검증 테이블, 조회 테이블, 생성기의 유효성 격자)을 다음 사용 시 다시 만들게 합니다.
+        validation_rules의 사전 값 변경은 자동으로 감지되며, 규칙 안의 리스트를 직접 수정한 경우에만 호출하면 됩니다.
+        """
+        self.rules_version += 1
     
+    def apply_rule_pack(self, rule_pack):
+        """
+        규칙 팩을 적용합니다. 컴파일된 규칙과 규칙 사전을 새 객체로 한 번에 교체하므로
+        실행 중에 호출해도 검증 호출은 이전 규칙 또는 새 규칙 중 하나로만 판정됩니다.
+        """
+        rules = _RuleDict(copy.deepcopy(rule_pack.validation_rules), self.invalidate_rule_caches)
+        version = self.rules_version + 1
+        self._compiled_rules = (version, rule_pack.compiled_rules)
+        self._validation_rules = rules
+        self.rule_pack = rule_pack
+        self.rules_version = version
+
+    @property
+    def compiled_rules(self):
+        """현재 validation_rules를 컴파일한 규칙 엔진 (규칙이 바뀌면 다시 컴파일)"""
+        version, compiled = self._compiled_rules
+        if compiled is None or version != self.rules_version:
+            version = self.rules_version
+            compiled = CompiledRules(self.validation_rules)
+            self._compiled_rules = (version, compiled)
+        return compiled
+
+    def check_persona(self, persona):
+        """
+        페르소나를 검사해 위반을 정수 코드로만 반환합니다 (메시지를 만들지 않는 빠른 경로).
+        코드는 rule_engine.decode_violation으로 (규칙, 항목)을, render_violations로 메시지를 얻을 수 있습니다.
+
+        Returns:
+            tuple: (오류 코드 목록, 경고 코드 목록)
+
+        Raises:
+            TypeError: 연령이 숫자가 아닌 경우
+        """
+        # 조회 테이블에서 위반/경고가 없는 조합으로 확인되면 규칙을 평가하지 않음
+        if self.use_lookup_table and self.lookup_flags(persona) == 0:
+            return [], []
+        return self.compiled_rules.check(persona.get("demographics", {}))
+
+    def render_violations(self, codes, persona):
+        """check_persona가 반환한 위반 코드를 메시지 목록으로 변환"""
+        return self.compiled_rules.render_all(codes, persona.get("demographics", {}))
+
     def validate_persona(self, persona):
         """
         페르소나 데이터의 유효성을 검증합니다.
@@ -82,142 +162,211 @@ class PersonaValidator:
         Returns:
             dict: {"is_valid": bool, "errors": list, "warnings": list}
         """
-        validation_result = {
-            "is_valid": True,
-            "errors": [],
-            "warnings": []
-        }
-        
         try:
-            demographics = persona.get("demographics", {})
-            age = demographics.get("age")
-            occupation = demographics.get("occupation", "")
-            education = demographics.get("education", "")
-            marital_status = demographics.get("marital_status", "")
-            income_bracket = demographics.get("income_bracket", "")
-            
-            # 1. 나이 범위 검증
-            if not self._validate_age_range(age):
-                validation_result["is_valid"] = False
-                validation_result["errors"].append(f"나이가 유효 범위를 벗어남: {age}세")
-            
-            # 2. 연령-직업 관계 검증
-            age_occupation_error = self._validate_age_occupation(age, occupation)
-            if age_occupation_error:
-                validation_result["is_valid"] = False
-                validation_result["errors"].append(age_occupation_error)
-            
-            # 3. 연령-교육수준 관계 검증
-            age_education_error = self._validate_age_education(age, education)
-            if age_education_error:
-                validation_result["is_valid"] = False
-                validation_result["errors"].append(age_education_error)
-            
-            # 4. 연령-결혼상태 관계 검증
-            age_marital_error = self._validate_age_marital_status(age, marital_status)
-            if age_marital_error:
-                validation_result["is_valid"] = False
-                validation_result["errors"].append(age_marital_error)
-            
-            # 5. 연령-소득 관계 검증 (0~18세는 하위 20%만 허용)
-            age_income_error = self._validate_age_income(age, income_bracket)
-            if age_income_error:
-                validation_result["is_valid"] = False
-                validation_result["errors"].append(age_income_error)
-            
-            # 6. 교육수준-직업 논리성 검증 (경고만, 필터링하지 않음)
-            education_occupation_warning = self._validate_education_occupation(education, occupation)
-            if education_occupation_warning:
-                validation_result["warnings"].append(education_occupation_warning)
-            
+            errors, warnings = self.check_persona(persona)
+            if not errors and not warnings:
+                return {"is_valid": True, "errors": [], "warnings": []}
+            return {
+                "is_valid": not errors,
+                "errors": self.render_violations(errors, persona),
+                "warnings": self.render_violations(warnings, persona)
+            }
         except Exception as e:
-            validation_result["is_valid"] = False
-            validation_result["errors"].append(f"검증 중 오류 발생: {str(e)}")
             self.logger.error(f"Validation error: {e}")
-        
-        return validation_result
-    
+            return {"is_valid": False, "errors": [f"검증 중 오류 발생: {str(e)}"], "warnings": []}
+
+    def _render_code(self, code, **demographics):
+        return self.compiled_rules.render(code, demographics) if code else None
+
     def _validate_age_range(self, age):
         """나이가 유효한 범위 내에 있는지 검증"""
-        if age is None:
-            return False
-        
-        limits = self.validation_rules["age_limits"]
-        return limits["min_age"] <= age <= limits["max_age"]
+        return not self.compiled_rules.age_limits(age)
     
     def _validate_age_occupation(self, age, occupation):
         """연령과 직업의 논리적 일관성을 검증"""
-        if age is None or not occupation:
-            return None
-        
-        rules = self.validation_rules["age_occupation_rules"]
-        
-        for occupation_key in rules:
-            if occupation_key in occupation:
-                rule = rules[occupation_key]
-                if not (rule["min_age"] <= age <= rule["max_age"]):
-                    return f"연령-직업 불일치: {age}세 {occupation} (적정연령: {rule['min_age']}-{rule['max_age']}세)"
-        
-        return None
+        return self._render_code(self.compiled_rules.age_occupation(age, occupation), age=age, occupation=occupation)
     
     def _validate_age_education(self, age, education):
         """연령과 교육수준의 논리적 일관성을 검증"""
-        if age is None or not education:
-            return None
-        
-        rules = self.validation_rules["age_education_rules"]
-        
-        if education in rules:
-            rule = rules[education]
-            if not (rule["min_age"] <= age <= rule["max_age"]):
-                return f"연령-교육수준 불일치: {age}세 {education} (최소연령: {rule['min_age']}세)"
-        
-        return None
+        return self._render_code(self.compiled_rules.age_education(age, education), age=age, education=education)
     
     def _validate_age_marital_status(self, age, marital_status):
         """연령과 결혼상태의 논리적 일관성을 검증"""
-        if age is None or not marital_status:
-            return None
-        
-        rules = self.validation_rules["age_marital_rules"]
-        
-        if marital_status in rules:
-            rule = rules[marital_status]
-            if not (rule["min_age"] <= age <= rule["max_age"]):
-                return f"연령-결혼상태 불일치: {age}세 {marital_status} (최소연령: {rule['min_age']}세)"
-        
-        return None
+        return self._render_code(self.compiled_rules.age_marital(age, marital_status),
+                                 age=age, marital_status=marital_status)
     
     def _validate_age_income(self, age, income_bracket):
         """연령과 소득의 논리적 일관성을 검증"""
-        if age is None or not income_bracket:
-            return None
-        
-        # 0~18세는 하위 20%만 허용
-        if age <= 18:
-            if income_bracket != "하위 20%":
-                return f"연령-소득 불일치: {age}세는 하위 20% 소득만 가능 (현재: {income_bracket})"
-        
-        return None
+        return self._render_code(self.compiled_rules.age_income(age, income_bracket),
+                                 age=age, income_bracket=income_bracket)
     
     def _validate_education_occupation(self, education, occupation):
         """교육수준과 직업의 논리적 일관성을 검증 (경고용)"""
-        if not education or not occupation:
-            return None
-        
-        preferences = self.validation_rules["education_occupation_preferences"]
-        
-        for occupation_key, required_educations in preferences.items():
-            if occupation_key in occupation:
-                if education not in required_educations:
-                    return f"교육수준-직업 권장사항 불일치: {occupation}은 보통 {'/'.join(required_educations)} 수준을 요구함 (현재: {education})"
-        
-        return None
+        return self._render_code(self.compiled_rules.education_occupation(education, occupation),
+                                 education=education, occupation=occupation)
     
+    def validate_batch(self, age, codes, categories):
+        """
+        코드 배열로 표현된 페르소나 묶음을 NumPy 비교 연산으로 한 번에 검증합니다.
+        validate_persona와 같은 규칙을 적용하며, 코드표별 규칙 테이블은 한 번만 만들고
+        validation_rules가 바뀌면 자동으로 다시 만듭니다.
+
+        Args:
+            age: 연령 배열
+            codes: 필드 -> 코드 배열 (occupation, education, marital_status, income_bracket 중 있는 것만 검사)
+            categories: 필드 -> 코드표 (코드 = 리스트 인덱스)
+
+        Returns:
+            dict: {
+                "is_valid": 불리언 배열,
+                "violations": 규칙 -> 위반 코드 배열 (0 = 통과, k = 규칙 사전의 k번째 항목 위반),
+                "warnings": 규칙 -> 경고 코드 배열,
+                "has_warning": 불리언 배열
+            }
+        """
+        age = np.asarray(age)
+        core = self._batch_core(categories)
+        results = core.check_batch(age, {field: np.asarray(codes[field]) for field in LOOKUP_FIELDS if field in codes})
+        no_violation = np.zeros(len(age), dtype=CODE_DTYPE)
+        violations = {rule: results.get(rule, no_violation) for rule in BATCH_ERROR_RULES}
+        warnings = {rule: results.get(rule, no_violation) for rule in BATCH_WARNING_RULES}
+
+        is_valid = np.ones(len(age), dtype=bool)
+        for rule_violations in violations.values():
+            is_valid &= rule_violations == 0
+        has_warning = np.zeros(len(age), dtype=bool)
+        for rule_warnings in warnings.values():
+            has_warning |= rule_warnings != 0
+
+        return {"is_valid": is_valid, "violations": violations, "warnings": warnings, "has_warning": has_warning}
+
+    def _refresh_batch_tables(self):
+        """validation_rules가 바뀌었으면 캐시된 규칙 테이블을 버림"""
+        if self._batch_tables_version != self.rules_version:
+            self._batch_tables.clear()
+            self._batch_tables_version = self.rules_version
+
+    def extend_lookup_vocabulary(self, categories):
+        """
+        조회 테이블이 다룰 속성값을 추가합니다 (예: 생성기의 코드표). 테이블에 없는 값은 규칙 함수로 검증됩니다.
+
+        Args:
+            categories: 필드 -> 값 목록 (LOOKUP_FIELDS 외의 필드는 무시)
+        """
+        for field in LOOKUP_FIELDS:
+            for label in categories.get(field, []):
+                if label not in self._lookup_index[field]:
+                    self._lookup_index[field][label] = len(self._lookup_vocabulary[field])
+                    self._lookup_vocabulary[field].append(label)
+                    self._lookup = None
+
+    def lookup_flags(self, persona):
+        """
+        조회 테이블로 페르소나의 위반/경고 플래그를 구합니다 (0 = 위반·경고 없음, 비트는 LOOKUP_RULE_BITS 참고).
+        테이블 범위 밖의 입력(유효 범위 밖 연령, 정수가 아닌 연령, 등록되지 않은 값 등)은 None을 반환합니다.
+        """
+        lookup = self._lookup
+        if lookup is None or lookup[0] != self.rules_version:
+            lookup = self._rebuild_lookup_table()
+        _, flat, strides, min_age, age_count, codes, other_income = lookup
+
+        try:
+            demographics = persona.get("demographics", {})
+            age = demographics.get("age")
+            if type(age) is not int:
+                return None
+            offset = age - min_age
+            if not 0 <= offset < age_count:
+                return None
+            occupation, education, marital_status, income_bracket = codes
+            position = (offset * strides[0]
+                        + occupation[demographics.get("occupation") or ""] * strides[1]
+                        + education[demographics.get("education") or ""] * strides[2]
+                        + marital_status[demographics.get("marital_status") or ""] * strides[3]
+                        + income_bracket.get(demographics.get("income_bracket") or "", other_income))
+        except (KeyError, TypeError, AttributeError):
+            return None
+        return flat[position]
+
+    def _rebuild_lookup_table(self):
+        """규칙이나 어휘가 바뀌었으면 조회 테이블을 다시 만듦 (규칙에 등장하는 값은 항상 포함)"""
+        version = self.rules_version
+        rules = self.validation_rules
+        self.extend_lookup_vocabulary({
+            "occupation": list(rules["age_occupation_rules"]) + list(rules["education_occupation_preferences"]),
+            "education": list(rules["age_education_rules"]),
+            "marital_status": list(rules["age_marital_rules"]),
+            # 소득 규칙은 "하위 20%" 여부만 보므로 그 밖의 값은 모두 대표값 하나로 조회
+            "income_bracket": ["하위 20%", LOOKUP_OTHER_INCOME]
+        })
+        codes = tuple(dict(self._lookup_index[field]) for field in LOOKUP_FIELDS)
+        table = self._build_lookup_table()
+        # 조회에 필요한 상태를 튜플 하나로 교체 (규칙 교체 중에도 일관된 테이블만 보이도록)
+        # 스칼라 조회는 NumPy 인덱싱보다 bytes 인덱싱이 훨씬 빠름
+        self._lookup = (version, table.tobytes(), tuple(stride // table.itemsize for stride in table.strides),
+                        rules["age_limits"]["min_age"], table.shape[0], codes, codes[3][LOOKUP_OTHER_INCOME])
+        return self._lookup
+
+    def _build_lookup_table(self):
+        """
+        [연령, 직업, 교육, 결혼, 소득] 조밀 플래그 테이블을 만듭니다.
+        각 규칙은 (연령, 속성) 또는 (교육, 직업)에만 의존하므로 2차원 결과를 브로드캐스트해 합칩니다.
+        """
+        limits = self.validation_rules["age_limits"]
+        ages = np.arange(limits["min_age"], limits["max_age"] + 1)
+        vocabulary = self._lookup_vocabulary
+        shape = (len(ages),) + tuple(len(vocabulary[field]) for field in LOOKUP_FIELDS)
+        table = np.zeros(shape, dtype=np.uint8)
+
+        for rule, field, bit in LOOKUP_RULE_BITS:
+            labels = vocabulary[field]
+            grid_ages = np.repeat(ages, len(labels))
+            grid_codes = np.tile(np.arange(len(labels)), len(ages))
+            violated = self.validate_batch(grid_ages, {field: grid_codes}, vocabulary)["violations"][rule] != 0
+            axis_shape = [len(ages), 1, 1, 1, 1]
+            axis_shape[1 + LOOKUP_FIELDS.index(field)] = len(labels)
+            table |= (violated.reshape(len(ages), len(labels)).astype(np.uint8) << bit).reshape(axis_shape)
+
+        # 규칙 코어의 [직업, 교육] 테이블에서 '어휘에 없는 값' 행/열을 제외
+        warned = self._batch_core(vocabulary).rule("education_occupation").table[:-1, :-1] != 0
+        table |= (warned.astype(np.uint8) << LOOKUP_WARNING_BIT)[None, :, :, None, None]
+        return table
+
+    def _batch_core(self, categories):
+        """
+        코드표에 대한 ValidationCore (규칙 코어 어댑터). 각 규칙을 (연령 × 속성값) 또는 (직업 × 교육)
+        위반 코드 테이블로 컴파일하며, 코드표별로 한 번만 만들고 validation_rules가 바뀌면 다시 만듭니다.
+        """
+        self._refresh_batch_tables()
+        key = tuple((field, tuple(categories[field])) for field in LOOKUP_FIELDS if field in categories)
+        core = self._batch_tables.get(key)
+        if core is None:
+            rules = self.compiled_rules
+
+            def entry(code):
+                return decode_violation(code)[1] if code else 0
+
+            core = self._batch_tables[key] = ValidationCore.compile(
+                rules.age_axis_range(), dict(key),
+                [("age_limits", (AGE_AXIS,), lambda age: entry(rules.age_limits(age)), "error")] + [
+                    (rule, (AGE_AXIS, field), lambda age, label, check=check: entry(check(age, label)), "error")
+                    for rule, field, check in (("age_occupation", "occupation", rules.age_occupation),
+                                               ("age_education", "education", rules.age_education),
+                                               ("age_marital", "marital_status", rules.age_marital),
+                                               ("age_income", "income_bracket", rules.age_income))
+                    if field in categories
+                ] + ([("education_occupation", ("occupation", "education"),
+                       lambda occupation, education: entry(rules.education_occupation(education, occupation)),
+                       "warning")] if "occupation" in categories and "education" in categories else []),
+                age_rule=("age_limits", NON_INTEGRAL_AGE_ENTRY)
+            )
+        return core
+
     def get_validation_statistics(self):
         """검증 규칙에 대한 통계 정보를 반환"""
         rules = self.validation_rules
         return {
+            "rule_pack": f"{self.rule_pack.name} {self.rule_pack.version}",
             "age_range": f"{rules['age_limits']['min_age']}-{rules['age_limits']['max_age']}세",
             "occupation_rules_count": len(rules["age_occupation_rules"]),
             "education_rules_count": len(rules["age_education_rules"]),
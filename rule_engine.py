@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+검증 규칙 엔진 모듈
+PersonaValidator의 규칙 사전을 한 번 컴파일해 직업 → 적용 규칙 색인과 속성값별 허용 연령표를 만들고,
+위반은 정수 코드로만 반환합니다. 오류 메시지는 필요할 때(render) 만들어지므로
+위반 개수만 세는 생성 경로에서는 문자열 포맷 비용이 들지 않습니다.
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 위반 코드 = (규칙 번호 << 16) | 규칙 사전의 항목 번호 (둘 다 1부터, 0 = 위반 없음)
+VIOLATION_RULES = ("age_limits", "age_occupation", "age_education", "age_marital", "age_income",
+                   "education_occupation")
+WARNING_RULES = ("education_occupation",)
+_ENTRY_BITS = 16
+_ENTRY_MASK = (1 << _ENTRY_BITS) - 1
+_RULE_NUMBERS = {rule: number for number, rule in enumerate(VIOLATION_RULES, 1)}
+
+# age_limits 위반의 항목 번호: 1 = 유효 범위 밖, 2 = 정수가 아닌 연령
+NON_INTEGRAL_AGE_ENTRY = 2
+
+# 나이 제한이 있는 소득 규칙: 이 연령 이하는 INCOME_MINOR_BRACKET만 허용
+INCOME_MINOR_MAX_AGE = 18
+INCOME_MINOR_BRACKET = "하위 20%"
+
+
+def violation_code(rule: str, entry: int = 1) -> int:
+    """(규칙 이름, 항목 번호) -> 정수 위반 코드"""
+    return (_RULE_NUMBERS[rule] << _ENTRY_BITS) | entry
+
+
+def decode_violation(code: int) -> Tuple[str, int]:
+    """정수 위반 코드 -> (규칙 이름, 항목 번호)"""
+    return VIOLATION_RULES[(code >> _ENTRY_BITS) - 1], code & _ENTRY_MASK
+
+
+class SubstringRuleIndex:
+    """
+    라벨에 키가 부분 문자열로 포함되면 적용되는 규칙의 색인.
+    이미 본 라벨은 완전 일치 사전에서 바로 찾고, 처음 보는 라벨은 키를 첫 글자로 묶은 접두 색인으로
+    라벨의 각 위치에서 시작하는 키만 확인합니다 (모든 키에 대해 `key in label`을 반복하지 않음).
+    """
+
+    def __init__(self, keys: Iterable[str]):
+        self.keys = list(keys)
+        self._by_first_char = defaultdict(list)
+        for entry, key in enumerate(self.keys):
+            if key:
+                self._by_first_char[key[0]].append((entry, key))
+        self._matches = {}  # 라벨 -> 적용되는 항목 번호 (규칙 사전 순서)
+
+    def match(self, label: str) -> Tuple[int, ...]:
+        """label에 적용되는 항목 번호(0부터)를 규칙 사전 순서로 반환"""
+        matches = self._matches.get(label)
+        if matches is None:
+            found = set()
+            for position, char in enumerate(label):
+                for entry, key in self._by_first_char.get(char, ()):
+                    if label.startswith(key, position):
+                        found.add(entry)
+            if "" in self.keys:
+                found.add(self.keys.index(""))  # 빈 키는 모든 라벨에 포함됨
+            matches = self._matches[label] = tuple(sorted(found))
+        return matches
+
+
+class CompiledRules:
+    """규칙 사전을 색인과 허용 연령표로 컴파일한 결과 (규칙이 바뀌면 새로 만듦)"""
+
+    def __init__(self, rules: Dict[str, Any]):
+        self.min_age = rules["age_limits"]["min_age"]
+        self.max_age = rules["age_limits"]["max_age"]
+
+        occupation_rules = rules["age_occupation_rules"]
+        self.occupation_index = SubstringRuleIndex(occupation_rules)
+        self.occupation_bounds = [(entry["min_age"], entry["max_age"]) for entry in occupation_rules.values()]
+
+        # 교육·결혼은 완전 일치: 라벨 -> (항목 번호, 최소 연령, 최대 연령)
+        self.education_bounds = self._exact_bounds(rules["age_education_rules"])
+        self.marital_bounds = self._exact_bounds(rules["age_marital_rules"])
+
+        preferences = rules["education_occupation_preferences"]
+        self.preference_index = SubstringRuleIndex(preferences)
+        self.preference_educations = [list(educations) for educations in preferences.values()]
+        self._preference_sets = [frozenset(educations) for educations in preferences.values()]
+
+    @staticmethod
+    def _exact_bounds(rules: Dict[str, Any]) -> Dict[str, Tuple[int, int, int]]:
+        return {label: (entry, rule["min_age"], rule["max_age"]) for entry, (label, rule) in enumerate(rules.items(), 1)}
+
+    def age_axis_range(self) -> Tuple[int, int]:
+        """모든 연령 규칙의 결과가 이 범위 밖에서는 변하지 않는 연령 축 (규칙 코어 테이블용)"""
+        bounds = [self.min_age, self.max_age, INCOME_MINOR_MAX_AGE + 1]
+        for min_age, max_age in self.occupation_bounds:
+            bounds += [min_age, max_age]
+        for _, min_age, max_age in list(self.education_bounds.values()) + list(self.marital_bounds.values()):
+            bounds += [min_age, max_age]
+        return int(min(bounds)) - 1, int(max(bounds)) + 1
+
+    def age_limits(self, age) -> int:
+        if age is None:
+            return violation_code("age_limits")
+        in_range = self.min_age <= age <= self.max_age
+        if age % 1:
+            return violation_code("age_limits", NON_INTEGRAL_AGE_ENTRY)
+        return 0 if in_range else violation_code("age_limits")
+
+    def age_occupation(self, age, occupation) -> int:
+        """적용되는 직업 규칙 중 연령을 벗어나는 첫 항목의 위반 코드"""
+        if age is None or not occupation:
+            return 0
+        for entry in self.occupation_index.match(occupation):
+            min_age, max_age = self.occupation_bounds[entry]
+            if not min_age <= age <= max_age:
+                return violation_code("age_occupation", entry + 1)
+        return 0
+
+    def age_education(self, age, education) -> int:
+        return self._exact_check("age_education", self.education_bounds, age, education)
+
+    def age_marital(self, age, marital_status) -> int:
+        return self._exact_check("age_marital", self.marital_bounds, age, marital_status)
+
+    @staticmethod
+    def _exact_check(rule, bounds, age, label) -> int:
+        if age is None or not label:
+            return 0
+        bound = bounds.get(label)
+        if bound is not None and not bound[1] <= age <= bound[2]:
+            return violation_code(rule, bound[0])
+        return 0
+
+    def age_income(self, age, income_bracket) -> int:
+        if age is None or not income_bracket:
+            return 0
+        if age <= INCOME_MINOR_MAX_AGE and income_bracket != INCOME_MINOR_BRACKET:
+            return violation_code("age_income")
+        return 0
+
+    def education_occupation(self, education, occupation) -> int:
+        """적용되는 권장 학력 중 education이 없는 첫 항목의 경고 코드"""
+        if not education or not occupation:
+            return 0
+        for entry in self.preference_index.match(occupation):
+            if education not in self._preference_sets[entry]:
+                return violation_code("education_occupation", entry + 1)
+        return 0
+
+    def check(self, demographics: Dict[str, Any]) -> Tuple[List[int], List[int]]:
+        """
+        인구통계 속성을 검사해 (오류 코드 목록, 경고 코드 목록)을 반환합니다 (메시지는 만들지 않음).
+        연령이 숫자가 아니면 비교 연산에서 TypeError가 발생합니다. 정수가 아닌 연령은 age_limits 위반으로만
+        보고하고, 나머지 연령 규칙은 연령이 없는 경우처럼 평가하지 않습니다.
+        """
+        age = demographics.get("age")
+        limits = self.age_limits(age)
+        if limits and decode_violation(limits)[1] == NON_INTEGRAL_AGE_ENTRY:
+            age = None
+        occupation = demographics.get("occupation", "")
+        education = demographics.get("education", "")
+        errors = [code for code in (
+            limits,
+            self.age_occupation(age, occupation),
+            self.age_education(age, education),
+            self.age_marital(age, demographics.get("marital_status", "")),
+            self.age_income(age, demographics.get("income_bracket", ""))
+        ) if code]
+        warning = self.education_occupation(education, occupation)
+        return errors, [warning] if warning else []
+
+    def render(self, code: int, demographics: Dict[str, Any]) -> str:
+        """위반 코드를 기존 validate_persona 형식의 메시지로 변환"""
+        rule, entry = decode_violation(code)
+        age = demographics.get("age")
+        if rule == "age_limits":
+            if entry == NON_INTEGRAL_AGE_ENTRY:
+                return f"나이가 정수가 아님: {age}세"
+            return f"나이가 유효 범위를 벗어남: {age}세"
+        if rule == "age_occupation":
+            min_age, max_age = self.occupation_bounds[entry - 1]
+            return f"연령-직업 불일치: {age}세 {demographics.get('occupation')} (적정연령: {min_age}-{max_age}세)"
+        if rule == "age_education":
+            education = demographics.get("education")
+            return f"연령-교육수준 불일치: {age}세 {education} (최소연령: {self.education_bounds[education][1]}세)"
+        if rule == "age_marital":
+            marital_status = demographics.get("marital_status")
+            return f"연령-결혼상태 불일치: {age}세 {marital_status} (최소연령: {self.marital_bounds[marital_status][1]}세)"
+        if rule == "age_income":
+            return f"연령-소득 불일치: {age}세는 하위 20% 소득만 가능 (현재: {demographics.get('income_bracket')})"
+        required = "/".join(self.preference_educations[entry - 1])
+        return (f"교육수준-직업 권장사항 불일치: {demographics.get('occupation')}은 보통 {required} 수준을 요구함 "
+                f"(현재: {demographics.get('education')})")
+
+    def render_all(self, codes: Sequence[int], demographics: Dict[str, Any]) -> List[str]:
+        return [self.render(code, demographics) for code in codes]
+
+    def age_rule_bounds(self, rule: str, label: Optional[str]) -> List[Tuple[int, float, float]]:
+        """label에 적용되는 (항목 번호, 최소 연령, 최대 연령) 목록 (배치 검증 테이블용)"""
+        if not label:
+            return []
+        if rule == "age_income":
+            return [] if label == INCOME_MINOR_BRACKET else [(1, INCOME_MINOR_MAX_AGE + 1, float("inf"))]
+        if rule == "age_occupation":
+            return [(entry + 1,) + self.occupation_bounds[entry] for entry in self.occupation_index.match(label)]
+        bound = (self.education_bounds if rule == "age_education" else self.marital_bounds).get(label)
+        return [bound] if bound is not None else []
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+검증 규칙 팩 모듈
+PersonaValidator의 검증 규칙과 HierarchicalPersonaGenerator의 기본 제약조건을 버전이 있는 JSON 파일
+(규칙 팩)에서 읽어 컴파일합니다. 검사를 마친 규칙은 파일 내용의 SHA-256 해시와 컴파일러 버전을 키로
+디스크에 정규화된 JSON으로 캐시되어, 같은 규칙 팩으로 다시 시작할 때는 검사를 건너뛰고 CompiledRules만
+다시 만듭니다 (캐시 파일을 읽어도 코드가 실행되지 않음).
+실행 중인 프로세스는 RulePackWatcher로 파일 변경을 감지해 재시작 없이 규칙을 교체할 수 있습니다.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from rule_engine import CompiledRules
+from validation_core import MAX_VIOLATION_CODE
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RULE_PACK_PATH = Path(__file__).resolve().parent / "rules" / "default_rule_pack.json"
+# 컴파일 캐시 디렉토리 (환경 변수로 변경 가능)
+RULE_PACK_CACHE_DIR_ENV = "PERSONA_RULE_CACHE_DIR"
+DEFAULT_RULE_PACK_CACHE_DIR = DEFAULT_RULE_PACK_PATH.parent / ".compiled"
+
+# 규칙 팩 파일 형식 버전과 캐시 파일 형식 버전 (캐시에 저장하는 구성이 바뀌면 올려서 이전 캐시를 무시)
+RULE_PACK_FORMAT_VERSION = 1
+COMPILED_FORMAT_VERSION = 2
+# 규칙 컴파일러 버전: parse_rule_pack의 검사나 CompiledRules의 해석이 바뀌면 올림
+# (캐시된 규칙 팩은 검사를 다시 거치지 않으므로, 올리지 않으면 이전 규칙으로 검사한 캐시가 그대로 쓰임)
+# 2: 규칙 사전 항목 수를 MAX_VIOLATION_CODE로 제한
+RULE_COMPILER_VERSION = 2
+
+VALIDATOR_SECTIONS = ("age_limits", "age_occupation_rules", "age_education_rules", "age_income_rules",
+                      "age_marital_rules", "education_occupation_preferences")
+HIERARCHICAL_SECTIONS = ("age_constraints", "default_age_constraints", "education_income_mapping",
+                         "occupation_education_requirements")
+AGE_CONSTRAINT_FIELDS = ("min_age", "max_age", "valid_education_levels", "valid_marital_statuses",
+                         "min_income", "max_income", "occupation_categories")
+
+
+class RulePackError(ValueError):
+    """규칙 팩 파일 형식이 잘못된 경우"""
+
+
+class RulePack:
+    """컴파일된 규칙 팩 (불변으로 취급하며, 교체할 때는 새 RulePack을 적용)"""
+
+    def __init__(self, name: str, version: str, content_hash: str, validation_rules: Dict[str, Any],
+                 hierarchical: Dict[str, Any], compiled_rules: CompiledRules, source: Optional[str] = None):
+        self.name = name
+        self.version = version
+        self.content_hash = content_hash
+        self.validation_rules = validation_rules  # PersonaValidator용 규칙 사전
+        self.hierarchical = hierarchical  # HierarchicalPersonaGenerator용 기본 제약조건 (문자열 값)
+        self.compiled_rules = compiled_rules
+        self.source = source
+
+    def __repr__(self) -> str:
+        return f"RulePack({self.name!r}, version={self.version!r}, hash={self.content_hash[:12]})"
+
+
+def _require_sections(section: Any, names, where: str) -> Dict[str, Any]:
+    if not isinstance(section, dict):
+        raise RulePackError(f"규칙 팩의 {where} 항목이 객체가 아닙니다")
+    missing = [name for name in names if name not in section]
+    if missing:
+        raise RulePackError(f"규칙 팩의 {where}에 필요한 항목이 없습니다: {', '.join(missing)}")
+    return section
+
+
+def parse_rule_pack(data: Dict[str, Any], content_hash: str, source: Optional[str] = None) -> RulePack:
+    """
+    규칙 팩 JSON 객체를 검사하고 PersonaValidator 규칙을 CompiledRules로 컴파일합니다.
+
+    Raises:
+        RulePackError: 필수 항목이 없거나 형식 버전을 지원하지 않는 경우
+    """
+    if not isinstance(data, dict):
+        raise RulePackError("규칙 팩 최상위는 객체여야 합니다")
+    if data.get("format_version") != RULE_PACK_FORMAT_VERSION:
+        raise RulePackError(f"지원하지 않는 규칙 팩 형식 버전: {data.get('format_version')}")
+
+    validation_rules = _restore_income_keys(copy.deepcopy(
+        _require_sections(data.get("persona_validator"), VALIDATOR_SECTIONS, "persona_validator")))
+
+    # 위반 코드는 규칙 사전의 항목 번호(1부터)이므로 검증 테이블 코드 범위를 넘는 항목 수는 거부
+    for section in VALIDATOR_SECTIONS:
+        entries = validation_rules[section]
+        if isinstance(entries, dict) and len(entries) > MAX_VIOLATION_CODE:
+            raise RulePackError(f"persona_validator.{section} 항목이 너무 많습니다: "
+                                f"{len(entries)}개 (최대 {MAX_VIOLATION_CODE}개)")
+
+    hierarchical = copy.deepcopy(_require_sections(data.get("hierarchical"), HIERARCHICAL_SECTIONS, "hierarchical"))
+    for constraints in hierarchical["age_constraints"] + [hierarchical["default_age_constraints"]]:
+        _require_sections(constraints, AGE_CONSTRAINT_FIELDS, "hierarchical.age_constraints")
+
+    try:
+        compiled_rules = CompiledRules(validation_rules)
+    except (KeyError, TypeError) as e:
+        raise RulePackError(f"persona_validator 규칙을 컴파일할 수 없습니다: {e}") from e
+
+    return RulePack(data.get("name", "unnamed"), str(data.get("version", "0")), content_hash,
+                    validation_rules, hierarchical, compiled_rules, source)
+
+
+def _restore_income_keys(validation_rules: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON 객체 키는 문자열이므로 연령 경계를 키로 쓰는 소득 규칙은 정수 키로 복원"""
+    validation_rules["age_income_rules"] = {
+        int(key) if str(key).isdigit() else key: value
+        for key, value in validation_rules["age_income_rules"].items()
+    }
+    return validation_rules
+
+
+def _cache_dir(cache_dir: Optional[Union[str, Path]]) -> Path:
+    if cache_dir is not None:
+        return Path(cache_dir)
+    return Path(os.environ.get(RULE_PACK_CACHE_DIR_ENV, DEFAULT_RULE_PACK_CACHE_DIR))
+
+
+def _cache_path(cache_dir: Path, content_hash: str) -> Path:
+    return cache_dir / f"{content_hash}-c{RULE_COMPILER_VERSION}-v{COMPILED_FORMAT_VERSION}.json"
+
+
+def _read_cached(path: Path, content_hash: str) -> Optional[RulePack]:
+    """검사를 마친 규칙을 JSON으로 읽어 CompiledRules를 다시 만듦 (없거나 손상·불일치하면 None)"""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if (data["compiler_version"], data["format_version"], data["content_hash"]) != (
+                RULE_COMPILER_VERSION, COMPILED_FORMAT_VERSION, content_hash):
+            raise ValueError("캐시 버전 또는 내용 해시가 일치하지 않습니다")
+        validation_rules = _restore_income_keys(data["validation_rules"])
+        return RulePack(data["name"], data["version"], content_hash, validation_rules, data["hierarchical"],
+                        CompiledRules(validation_rules), data["source"])
+    except FileNotFoundError:
+        return None
+    except Exception as e:  # 손상되었거나 호환되지 않는 캐시는 무시하고 다시 컴파일
+        logger.warning(f"규칙 팩 캐시를 읽지 못했습니다 ({path}): {e}")
+        return None
+
+
+def _write_cached(path: Path, pack: RulePack):
+    """임시 파일에 쓴 뒤 os.replace로 교체 (동시에 시작한 워커가 반쯤 쓰인 캐시를 읽지 않도록)"""
+    data = {
+        "compiler_version": RULE_COMPILER_VERSION, "format_version": COMPILED_FORMAT_VERSION,
+        "content_hash": pack.content_hash, "name": pack.name, "version": pack.version, "source": pack.source,
+        "validation_rules": pack.validation_rules, "hierarchical": pack.hierarchical
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:  # 읽기 전용 배포 환경 등에서는 캐시 없이 동작
+        logger.warning(f"규칙 팩 캐시를 저장하지 못했습니다 ({path}): {e}")
+
+
+_loaded_packs: Dict[str, RulePack] = {}  # 내용 해시 -> RulePack (프로세스 내 재사용)
+_loaded_lock = threading.Lock()
+
+
+def load_rule_pack(path: Optional[Union[str, Path]] = None, cache_dir: Optional[Union[str, Path]] = None,
+                   use_cache: bool = True) -> RulePack:
+    """
+    규칙 팩 파일을 읽어 컴파일된 RulePack을 반환합니다.
+    같은 내용(해시)의 규칙 팩은 프로세스 안에서는 메모리에서, 다른 프로세스에서는 디스크 캐시에서 재사용됩니다.
+
+    Args:
+        path: 규칙 팩 JSON 경로 (기본: rules/default_rule_pack.json)
+        cache_dir: 컴파일 캐시 디렉토리 (기본: PERSONA_RULE_CACHE_DIR 환경 변수 또는 rules/.compiled)
+        use_cache: False이면 캐시를 읽거나 쓰지 않고 항상 컴파일
+
+    Raises:
+        RulePackError: 규칙 팩 형식이 잘못된 경우
+    """
+    path = Path(path) if path is not None else DEFAULT_RULE_PACK_PATH
+    raw = path.read_bytes()
+    content_hash = hashlib.sha256(raw).hexdigest()
+
+    if use_cache:
+        with _loaded_lock:
+            pack = _loaded_packs.get(content_hash)
+        if pack is not None:
+            return pack
+        cache_path = _cache_path(_cache_dir(cache_dir), content_hash)
+        pack = _read_cached(cache_path, content_hash)
+        if pack is not None:
+            logger.debug(f"컴파일된 규칙 팩 캐시 사용: {cache_path}")
+        else:
+            pack = _compile_file(raw, content_hash, path)
+            _write_cached(cache_path, pack)
+        with _loaded_lock:
+            return _loaded_packs.setdefault(content_hash, pack)
+
+    return _compile_file(raw, content_hash, path)
+
+
+def _compile_file(raw: bytes, content_hash: str, path: Path) -> RulePack:
+    try:
+        data = json.loads(raw.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise RulePackError(f"규칙 팩 JSON을 읽을 수 없습니다 ({path}): {e}") from e
+    return parse_rule_pack(data, content_hash, str(path))
+
+
+class RulePackWatcher:
+    """
+    규칙 팩 파일의 변경을 감지해 대상(apply_rule_pack 메서드를 가진 객체)에 새 규칙 팩을 적용합니다.
+    워커는 요청 사이나 청크 사이에 check()를 호출하면 재시작 없이 규칙을 교체할 수 있습니다.
+    잘못된 규칙 팩이 저장되면 경고만 남기고 기존 규칙을 유지합니다.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, *targets,
+                 cache_dir: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path is not None else DEFAULT_RULE_PACK_PATH
+        self.targets = list(targets)
+        self.cache_dir = cache_dir
+        self.current = load_rule_pack(self.path, cache_dir)
+        self._stat = self._file_stat()
+        self._lock = threading.Lock()
+
+    def _file_stat(self):
+        stat = self.path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def add_target(self, target):
+        """대상을 추가하고 현재 규칙 팩을 바로 적용"""
+        target.apply_rule_pack(self.current)
+        self.targets.append(target)
+
+    def check(self) -> bool:
+        """파일이 바뀌었으면 새 규칙 팩을 읽어 모든 대상에 적용 (적용했으면 True)"""
+        with self._lock:
+            try:
+                stat = self._file_stat()
+                if stat == self._stat:
+                    return False
+                self._stat = stat
+                pack = load_rule_pack(self.path, self.cache_dir)
+            except (OSError, RulePackError) as e:
+                logger.warning(f"규칙 팩을 다시 읽지 못해 기존 규칙을 유지합니다: {e}")
+                return False
+            if pack.content_hash == self.current.content_hash:
+                return False
+            self.current = pack
+            for target in self.targets:
+                target.apply_rule_pack(pack)
+            logger.info(f"규칙 팩 교체: {pack}")
+            return True
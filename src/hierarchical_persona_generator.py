@@ -14,15 +14,26 @@
 """
 
 import random
-import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, Iterator, List, NamedTuple, Tuple, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
+import copy
 import json
 import logging
+import sys
 from pathlib import Path
 
+# 스크립트로 직접 실행할 때도 프로젝트 루트 모듈을 찾을 수 있도록 경로 추가
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from census_reference import CensusCounts, CensusJointSampler, load_census_counts
+from parallel_generation import DEFAULT_SHARD_SIZE, iter_sharded, run_sharded, shard_random_streams
+from rule_packs import RulePack, load_rule_pack
+from validation_core import ValidationCore
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -59,204 +70,439 @@ class PersonaConstraints:
     max_income: int
     occupation_categories: List[str]
 
+
+class BaseRules(NamedTuple):
+    """규칙 팩에서 변환한 기본 제약조건 묶음"""
+    age_constraints: Dict[Tuple[int, int], PersonaConstraints]
+    default_age_constraints: PersonaConstraints
+    education_income_mapping: Dict[EducationLevel, Tuple[int, int]]
+    occupation_education_requirements: Dict[str, List[EducationLevel]]
+    validation_core: ValidationCore
+
+
+# validate_persona 검증 기준
+REQUIRED_FIELDS = ('age', 'gender', 'education', 'marital_status', 'occupation', 'income', 'location')
+STUDENT_OCCUPATIONS = ("학생", "아르바이트")
+CRITICAL_JOBS = ("의사", "변호사", "교수", "판사", "검사")
+UNIVERSITY_OR_HIGHER = (EducationLevel.UNIVERSITY.value, EducationLevel.MASTER.value, EducationLevel.DOCTORATE.value)
+GRADUATE_DEGREES = (EducationLevel.MASTER.value, EducationLevel.DOCTORATE.value)
+MINOR_MARITAL_STATUSES = (MaritalStatus.MARRIED.value, MaritalStatus.DIVORCED.value, MaritalStatus.WIDOWED.value)
+MINOR_MAX_INCOME = 2000000
+STUDENT_MAX_INCOME = 1000000
+
+# 연령 분포 (절단 정규분포: 평균, 표준편차, 기본 범위)
+AGE_MEAN = 35
+AGE_STD = 12
+DEFAULT_MIN_AGE = 15
+DEFAULT_MAX_AGE = 65
+
+# 배치 생성에서 쓰는 열거형 코드 순서 (코드 = 목록 인덱스, 교육 수준 순서는 참조 통계 열 순서와 같음)
+GENDER_ORDER = [Gender.MALE, Gender.FEMALE]
+EDUCATION_ORDER = list(EducationLevel)
+MARITAL_ORDER = list(MaritalStatus)
+
+# 검증 실패시 재생성 횟수와, 그래도 실패하면 쓰는 안전한 직업
+MAX_GENERATION_ATTEMPTS = 10
+FALLBACK_OCCUPATIONS = ('사무직', '엔지니어', '교사', '간호사')
+
+# 2022년 통계청 실제 인구 분포 기반 지역 가중치
+LOCATIONS = (
+    "서울특별시", "부산광역시", "대구광역시", "인천광역시",
+    "광주광역시", "대전광역시", "울산광역시", "세종특별자치시",
+    "경기도", "강원도", "충청북도", "충청남도",
+    "전라북도", "전라남도", "경상북도", "경상남도", "제주특별자치도"
+)
+LOCATION_WEIGHTS = (0.195, 0.066, 0.047, 0.057, 0.029, 0.030, 0.022, 0.007,
+                    0.264, 0.028, 0.030, 0.039, 0.033, 0.031, 0.048, 0.062,
+                    0.012)
+
+# 소득 샘플링: 연령 구간 상한(미만) -> 연령별 조정 계수 (마지막 구간 이상은 INCOME_AGE_MULTIPLIER_DEFAULT)
+INCOME_AGE_MULTIPLIERS = ((25, 0.6), (30, 0.8), (40, 1.2), (50, 1.5), (60, 1.3))
+INCOME_AGE_MULTIPLIER_DEFAULT = 0.8
+# 직업별 소득 조정 계수 (없으면 1.0)
+OCCUPATION_INCOME_MULTIPLIERS = {
+    "의사": 3.0, "변호사": 2.5, "교수": 2.0, "임원": 2.8,
+    "연구원": 1.5, "엔지니어": 1.3, "프로그래머": 1.4,
+    "교사": 1.1, "간호사": 1.2, "회계사": 1.3,
+    "사원": 0.8, "사무직": 0.9, "서비스직": 0.7,
+    "학생": 0.1, "무직": 0.2, "아르바이트": 0.3
+}
+DEFAULT_INCOME_RANGE = (2000000, 5000000)
+
+# 호환 직업이 없을 때의 교육 수준별 기본 안전한 직업
+SAFE_JOBS = {
+    EducationLevel.MIDDLE_SCHOOL: ["서비스직", "자영업"],
+    EducationLevel.HIGH_SCHOOL: ["사무직", "서비스직", "영업사원"],
+    EducationLevel.COLLEGE: ["사무직", "엔지니어", "간호사"],        # 대학(4년제 미만)
+    EducationLevel.UNIVERSITY: ["사무직", "엔지니어", "교사"],     # 대학교(4년제 이상)
+    EducationLevel.MASTER: ["연구원", "교사", "전문직"],          # 석사
+    EducationLevel.DOCTORATE: ["교수", "연구원", "전문직"]       # 박사
+}
+
+# 참조 통계 라벨 -> 생성기 열거형 (통계표의 혼인상태는 미혼/유배우뿐)
+CENSUS_GENDERS = {"여자": Gender.FEMALE, "남자": Gender.MALE}
+CENSUS_MARITAL_STATUSES = {"미혼": MaritalStatus.SINGLE, "유배우": MaritalStatus.MARRIED}
+
+# 규칙 코어의 규칙 이름 -> 오류 메시지 (규칙 순서가 곧 메시지 순서, 위반한 경우에만 포맷)
+VALIDATION_MESSAGES = {
+    "age_group": "15세 미만은 통계 데이터가 없습니다: {age}세",
+    "age_education": "연령 {age}세에 부적절한 교육 수준: {education}",
+    "age_marital": "연령 {age}세에 부적절한 혼인 상태: {marital_status}",
+    "age_income": "연령 {age}세에 부적절한 소득: {income:,}원",
+    "occupation_education": "직업 {occupation}에 부적절한 교육 수준: {education}",
+    "minor_university": "{age}세는 대학교 이상 교육을 받을 수 없습니다",
+    "graduate_age": "{age}세는 대학원 학위를 가질 수 없습니다",
+    "doctorate_age": "{age}세는 박사 학위를 가질 수 없습니다",
+    "minor_marital": "{age}세 미성년자는 혼인 상태를 가질 수 없습니다",
+    "minor_occupation": "{age}세는 학생 또는 아르바이트만 가능합니다",
+    "adult_student": "{age}세는 일반적으로 학생이 아닙니다",
+    "critical_job_education": "직업 '{occupation}'은 대학교 이상 교육이 필요합니다",
+    "minor_income": "{age}세의 소득 {income:,}원은 비현실적입니다",
+    "student_income": "학생의 소득 {income:,}원은 비현실적입니다",
+}
+# age_group 위반 코드: 1 = 15세 미만, 2 = 정수가 아닌 연령 (나머지 연령 규칙은 평가하지 않음)
+NON_INTEGRAL_AGE_CODE = 2
+NON_INTEGRAL_AGE_MESSAGE = "연령은 정수여야 합니다: {age}세"
+
+
+def _compile_validation_core(age_constraints: Dict[Tuple[int, int], PersonaConstraints],
+                             default_age_constraints: PersonaConstraints,
+                             occupation_education_requirements: Dict[str, List[EducationLevel]]) -> ValidationCore:
+    """
+    validate_persona 규칙을 규칙 코어 테이블로 컴파일 (계층적 스키마 어댑터).
+    어휘에 없는 값은 판정 함수에 None으로 전달되어 어떤 허용 목록에도 속하지 않는 값으로 취급됩니다.
+    """
+    def age_group(age):
+        for (min_age, max_age), constraints in age_constraints.items():
+            if min_age <= age <= max_age:
+                return constraints
+        return None if age < 15 else default_age_constraints
+
+    requirements = {occupation: [education.value for education in educations]
+                    for occupation, educations in occupation_education_requirements.items()}
+
+    def age_education(age, education):
+        group = age_group(age)
+        return int(group is not None and education not in [e.value for e in group.valid_education_levels])
+
+    def age_marital(age, marital_status):
+        group = age_group(age)
+        return int(group is not None and marital_status not in [m.value for m in group.valid_marital_statuses])
+
+    def age_income(age):
+        group = age_group(age)
+        return (group.min_income, group.max_income) if group is not None else (-np.inf, np.inf)
+
+    # 연령 축: 연령대 경계와 고정 기준 연령(18~30세) 밖에서는 모든 규칙의 결과가 같음
+    bounds = [bound for key in age_constraints for bound in key] + [15, 30, default_age_constraints.min_age]
+    vocabularies = {
+        "education": [education.value for education in EducationLevel],
+        "marital_status": [status.value for status in MaritalStatus],
+        "occupation": sorted(set(requirements) | set(STUDENT_OCCUPATIONS) | set(CRITICAL_JOBS))
+    }
+    return ValidationCore.compile((min(bounds) - 1, max(bounds) + 1), vocabularies, [
+        ("age_group", ("age",), lambda age: int(age_group(age) is None), "error"),
+        ("age_education", ("age", "education"), age_education, "error"),
+        ("age_marital", ("age", "marital_status"), age_marital, "error"),
+        ("occupation_education", ("occupation", "education"),
+         lambda occupation, education: int(occupation in requirements and education not in requirements[occupation]),
+         "error"),
+        ("minor_university", ("age", "education"),
+         lambda age, education: int(age < 18 and education in UNIVERSITY_OR_HIGHER), "error"),
+        ("graduate_age", ("age", "education"),
+         lambda age, education: int(age < 22 and education in GRADUATE_DEGREES), "error"),
+        ("doctorate_age", ("age", "education"),
+         lambda age, education: int(age < 26 and education == EducationLevel.DOCTORATE.value), "error"),
+        ("minor_marital", ("age", "marital_status"),
+         lambda age, marital_status: int(age < 18 and marital_status in MINOR_MARITAL_STATUSES), "error"),
+        ("minor_occupation", ("age", "occupation"),
+         lambda age, occupation: int(age <= 19 and occupation not in STUDENT_OCCUPATIONS), "error"),
+        ("adult_student", ("age", "occupation"),
+         lambda age, occupation: int(occupation == "학생" and age > 30), "error"),
+        ("critical_job_education", ("occupation", "education"),
+         lambda occupation, education: int(occupation in CRITICAL_JOBS and education not in UNIVERSITY_OR_HIGHER),
+         "error"),
+    ], [
+        ("age_income", "income", "age", age_income),
+        ("minor_income", "income", "age",
+         lambda age: (-np.inf, MINOR_MAX_INCOME if age <= 19 else np.inf)),
+        ("student_income", "income", "occupation",
+         lambda occupation: (-np.inf, STUDENT_MAX_INCOME if occupation == "학생" else np.inf)),
+    ], order=list(VALIDATION_MESSAGES), age_rule=("age_group", NON_INTEGRAL_AGE_CODE))
+
+
+def _normalized(weights) -> np.ndarray:
+    """가중치 -> 합이 1인 확률 배열"""
+    weights = np.asarray(weights, dtype=np.float64)
+    return weights / weights.sum()
+
+
+def _persona_constraints(data: Dict[str, Any]) -> PersonaConstraints:
+    """규칙 팩의 연령대 제약조건(문자열 값)을 열거형 기반 PersonaConstraints로 변환"""
+    return PersonaConstraints(
+        min_age=data["min_age"], max_age=data["max_age"],
+        valid_education_levels=[EducationLevel(value) for value in data["valid_education_levels"]],
+        valid_marital_statuses=[MaritalStatus(value) for value in data["valid_marital_statuses"]],
+        min_income=data["min_income"], max_income=data["max_income"],
+        occupation_categories=list(data["occupation_categories"])
+    )
+
+class ConditionalTable:
+    """
+    연령대 × 조건 키 조건부 범주 분포 (CPT).
+    probabilities[연령대, 키 코드(keys 인덱스), 수준 코드(levels 인덱스)]는 유효하지 않은 수준이 0이고
+    행마다 합이 1입니다. 연령대는 분포가 같은 연속 연령을 묶은 것입니다.
+    교육/혼인은 키가 성별(GENDER_ORDER), 직업은 키가 교육 수준(EDUCATION_ORDER)입니다.
+    """
+    
+    def __init__(self, levels: List[Any], keys: List[Any], age_bands: List[Tuple[int, int]],
+                 probabilities: np.ndarray):
+        self.levels = list(levels)
+        self.keys = list(keys)
+        self.age_bands = list(age_bands)  # 행별 (최소 연령, 최대 연령)
+        self.probabilities = probabilities
+        self.min_age = age_bands[0][0]
+        self.max_age = age_bands[-1][1]
+        self._band_of_age = np.repeat(np.arange(len(age_bands)), [high - low + 1 for low, high in age_bands])
+        self._cdfs = np.cumsum(probabilities, axis=2)
+        # 부동소수점 오차로 확률 0인 뒤쪽 코드가 뽑히지 않도록 행별 마지막 유효 코드로 제한
+        self._last_codes = np.where(probabilities > 0, np.arange(len(self.levels)), 0).max(axis=2)
+    
+    @classmethod
+    def compile(cls, levels: List[Any], min_age: int, max_age: int, weights,
+                valid_levels=None, keys: List[Any] = GENDER_ORDER) -> 'ConditionalTable':
+        """
+        연령(min_age..max_age)·키마다 weights(age, key) -> {수준: 가중치}를 한 번씩 계산해 확률표를 만듭니다.
+        valid_levels(age)에 없는 수준은 0으로 가리고, 가중치가 모두 0이면 유효 수준 균등 분포를 사용합니다.
+        """
+        rows = np.zeros((max_age - min_age + 1, len(keys), len(levels)))
+        for age in range(min_age, max_age + 1):
+            valid = np.ones(len(levels), dtype=bool) if valid_levels is None else \
+                np.array([level in valid_levels(age) for level in levels])
+            for k, key in enumerate(keys):
+                table = weights(age, key)
+                row = np.array([table.get(level, 0) for level in levels], dtype=np.float64) * valid
+                rows[age - min_age, k] = _normalized(row if row.sum() > 0 else valid)
+        # 분포가 같은 연속 연령을 한 연령대로 묶음
+        starts = [0] + [i for i in range(1, len(rows)) if not np.array_equal(rows[i], rows[i - 1])]
+        ends = starts[1:] + [len(rows)]
+        age_bands = [(min_age + start, min_age + end - 1) for start, end in zip(starts, ends)]
+        return cls(levels, keys, age_bands, rows[starts])
+    
+    def bands(self, ages: np.ndarray) -> np.ndarray:
+        """연령 배열 -> 연령대 행 (max_age 이상은 마지막 연령대)"""
+        ages = np.asarray(ages)
+        if ages.size and ages.min() < self.min_age:
+            raise ValueError(f"{self.min_age}세 미만은 통계 데이터가 없습니다: {int(ages.min())}세")
+        return self._band_of_age[np.minimum(ages, self.max_age) - self.min_age]
+    
+    def row(self, age: int, key: int) -> np.ndarray:
+        """한 연령·키 코드의 수준별 확률"""
+        return self.probabilities[self.bands([age])[0], key]
+    
+    def candidates(self, age: int, key: int) -> Dict[Any, float]:
+        """한 연령·키 코드에서 확률이 0보다 큰 수준 -> 확률"""
+        row = self.row(age, key)
+        return {self.levels[code]: float(row[code]) for code in np.flatnonzero(row)}
+    
+    def to_records(self) -> List[Dict[str, Any]]:
+        """감사용 평면 목록: 연령대·키별 (min_age, max_age, key, candidates)"""
+        return [
+            {
+                'min_age': min_age,
+                'max_age': max_age,
+                'key': getattr(key, 'value', key),
+                'candidates': {getattr(self.levels[code], 'value', self.levels[code]): float(row[code])
+                               for code in np.flatnonzero(row)}
+            }
+            for band, (min_age, max_age) in enumerate(self.age_bands)
+            for key, row in zip(self.keys, self.probabilities[band])
+        ]
+    
+    def draw(self, age: int, key: int, rng=np.random) -> Any:
+        """한 건 추출: 누적 확률 행에서 균등 난수 하나로 선택 (rng: np.random 모듈 또는 np.random.Generator)"""
+        band = self.bands([age])[0]
+        row = self._cdfs[band, key]
+        code = int(np.searchsorted(row, rng.random() * row[-1]))
+        return self.levels[min(code, int(self._last_codes[band, key]))]
+    
+    def draw_codes(self, ages: np.ndarray, keys: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """연령·키 코드 배열별로 수준 코드(levels 인덱스)를 한 번에 추출"""
+        bands = self.bands(ages)
+        rows = self._cdfs[bands, keys]
+        codes = (rows < rng.random(len(bands))[:, None] * rows[:, -1:]).sum(axis=1)
+        return np.minimum(codes, self._last_codes[bands, keys])
+
+
 class HierarchicalPersonaGenerator:
     """계층적 규칙 기반 페르소나 생성기"""
     
-    def __init__(self, reference_data_path: Optional[str] = None):
+    def __init__(self, reference_data_path: Optional[str] = None, rule_pack: Optional[RulePack] = None):
         """
         초기화
         
         Args:
             reference_data_path: 참조 통계 데이터 경로
+            rule_pack: 기본 제약조건 규칙 팩 (기본: rules/default_rule_pack.json)
         """
         self.reference_data_path = reference_data_path
         self.education_stats = {}
         self.marital_stats = {}
         self.income_stats = {}
         self.occupation_stats = {}
+        self.census: Optional[CensusCounts] = None  # 참조 통계 인구수 텐서 (성별 × 행정구역 × 연령대 × 혼인 × 교육)
+        self._joint = None  # (기본 제약조건, CensusJointSampler) - 규칙 팩이 바뀌면 다시 만듦
+        self._tables = None  # (기본 제약조건, 교육 조건부 확률표, 혼인 조건부 확률표, 직업 호환 행렬, 대체 교육/혼인 확률표)
+        
+        # 난수원 (기본: 전역 상태, 샤드 생성 시 샤드 전용 스트림으로 교체)
+        self.rng = np.random
+        self.random = random
         
         # 기본 제약조건 정의
-        self._define_base_constraints()
+        self._define_base_constraints(rule_pack)
         
         # 참조 데이터 로드
         if reference_data_path:
             self._load_reference_data()
-    
-    def _define_base_constraints(self):
-        """기본 제약조건 정의"""
         
+        # 교육/혼인 조건부 확률표와 직업 호환 행렬 사전 계산
+        self._compiled_tables()
+    
+    def __getstate__(self):
+        """프로세스 풀 전달용: pickle할 수 없는 전역 난수 모듈은 제외"""
+        state = self.__dict__.copy()
+        if state.get('rng') is np.random:
+            state['rng'] = None
+        if state.get('random') is random:
+            state['random'] = None
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.rng is None:
+            self.rng = np.random
+        if self.random is None:
+            self.random = random
+    
+    def _define_base_constraints(self, rule_pack: Optional[RulePack] = None):
+        """기본 제약조건 정의 (규칙 팩 파일에서 로드)"""
+        self.apply_rule_pack(rule_pack if rule_pack is not None else load_rule_pack())
+    
+    def apply_rule_pack(self, rule_pack: RulePack):
+        """
+        규칙 팩의 hierarchical 항목으로 기본 제약조건을 교체합니다.
+        변환한 제약조건 묶음을 한 번의 대입으로 바꾸므로 실행 중에 호출해도 안전합니다.
+        """
+        rules = rule_pack.hierarchical
         # 연령대별 제약조건 (통계청 데이터 기준)
-        self.age_constraints = {
-            (15, 19): PersonaConstraints(
-                min_age=15, max_age=19,
-                valid_education_levels=[EducationLevel.MIDDLE_SCHOOL, EducationLevel.HIGH_SCHOOL],
-                valid_marital_statuses=[MaritalStatus.SINGLE],
-                min_income=0, max_income=1000000,
-                occupation_categories=["학생", "아르바이트"]
-            ),
-            (20, 24): PersonaConstraints(
-                min_age=20, max_age=24,
-                valid_education_levels=[EducationLevel.HIGH_SCHOOL, EducationLevel.COLLEGE, EducationLevel.UNIVERSITY],
-                valid_marital_statuses=[MaritalStatus.SINGLE, MaritalStatus.MARRIED],
-                min_income=0, max_income=3000000,
-                occupation_categories=["학생", "사원", "인턴", "프리랜서"]
-            ),
-            (25, 29): PersonaConstraints(
-                min_age=25, max_age=29,
-                valid_education_levels=[EducationLevel.HIGH_SCHOOL, EducationLevel.COLLEGE, 
-                                      EducationLevel.UNIVERSITY, EducationLevel.MASTER],
-                valid_marital_statuses=[MaritalStatus.SINGLE, MaritalStatus.MARRIED],
-                min_income=1500000, max_income=5000000,
-                occupation_categories=["사원", "대리", "연구원", "전문직", "프리랜서"]
-            ),
-            (30, 39): PersonaConstraints(
-                min_age=30, max_age=39,
-                valid_education_levels=[EducationLevel.HIGH_SCHOOL, EducationLevel.COLLEGE,
-                                      EducationLevel.UNIVERSITY, EducationLevel.MASTER, EducationLevel.DOCTORATE],
-                valid_marital_statuses=[MaritalStatus.SINGLE, MaritalStatus.MARRIED, MaritalStatus.DIVORCED],
-                min_income=2000000, max_income=8000000,
-                occupation_categories=["과장", "차장", "팀장", "전문직", "관리직", "자영업"]
-            ),
-            (40, 49): PersonaConstraints(
-                min_age=40, max_age=49,
-                valid_education_levels=[EducationLevel.HIGH_SCHOOL, EducationLevel.COLLEGE,
-                                      EducationLevel.UNIVERSITY, EducationLevel.MASTER, EducationLevel.DOCTORATE],
-                valid_marital_statuses=[MaritalStatus.MARRIED, MaritalStatus.DIVORCED, MaritalStatus.SINGLE],
-                min_income=2500000, max_income=12000000,
-                occupation_categories=["부장", "이사", "임원", "전문직", "자영업", "프리랜서"]
-            ),
-            (50, 64): PersonaConstraints(
-                min_age=50, max_age=64,
-                valid_education_levels=[EducationLevel.HIGH_SCHOOL, EducationLevel.COLLEGE,
-                                      EducationLevel.UNIVERSITY, EducationLevel.MASTER, EducationLevel.DOCTORATE],
-                valid_marital_statuses=[MaritalStatus.MARRIED, MaritalStatus.DIVORCED, MaritalStatus.WIDOWED],
-                min_income=2000000, max_income=15000000,
-                occupation_categories=["임원", "전문직", "자영업", "컨설턴트", "무직"]
-            )
-        }
-        
-        # 교육 수준별 소득 범위 (통계 기반 추정)
-        self.education_income_mapping = {
-            EducationLevel.MIDDLE_SCHOOL: (1200000, 3000000),
-            EducationLevel.HIGH_SCHOOL: (1500000, 4000000),
-            EducationLevel.COLLEGE: (2000000, 5000000),        # 대학(4년제 미만)
-            EducationLevel.UNIVERSITY: (2500000, 8000000),     # 대학교(4년제 이상)
-            EducationLevel.MASTER: (3500000, 12000000),        # 석사
-            EducationLevel.DOCTORATE: (4500000, 20000000)      # 박사
+        age_constraints = {
+            (constraints["min_age"], constraints["max_age"]): _persona_constraints(constraints)
+            for constraints in rules["age_constraints"]
         }
-        
+        # 65세 이상 기본 제약조건
+        default_age_constraints = _persona_constraints(rules["default_age_constraints"])
         # 직업별 교육 요구사항 (통계청 기준 수정)
-        self.occupation_education_requirements = {
-            "의사": [EducationLevel.UNIVERSITY, EducationLevel.MASTER, EducationLevel.DOCTORATE],
-            "변호사": [EducationLevel.UNIVERSITY, EducationLevel.MASTER, EducationLevel.DOCTORATE],
-            "교수": [EducationLevel.MASTER, EducationLevel.DOCTORATE],
-            "연구원": [EducationLevel.UNIVERSITY, EducationLevel.MASTER, EducationLevel.DOCTORATE],
-            "엔지니어": [EducationLevel.COLLEGE, EducationLevel.UNIVERSITY, EducationLevel.MASTER],
-            "간호사": [EducationLevel.HIGH_SCHOOL, EducationLevel.COLLEGE, EducationLevel.UNIVERSITY],
-            "교사": [EducationLevel.UNIVERSITY, EducationLevel.MASTER],
-            "회계사": [EducationLevel.UNIVERSITY, EducationLevel.MASTER],
-            "디자이너": [EducationLevel.COLLEGE, EducationLevel.UNIVERSITY, EducationLevel.MASTER],
-            "프로그래머": [EducationLevel.COLLEGE, EducationLevel.UNIVERSITY, EducationLevel.MASTER],
-            "마케터": [EducationLevel.UNIVERSITY, EducationLevel.MASTER],
-            "영업사원": [EducationLevel.HIGH_SCHOOL, EducationLevel.COLLEGE, EducationLevel.UNIVERSITY],
-            "사무직": [EducationLevel.HIGH_SCHOOL, EducationLevel.COLLEGE, EducationLevel.UNIVERSITY],
-            "서비스직": [EducationLevel.MIDDLE_SCHOOL, EducationLevel.HIGH_SCHOOL, EducationLevel.COLLEGE],
-            "자영업": [EducationLevel.MIDDLE_SCHOOL, EducationLevel.HIGH_SCHOOL, 
-                      EducationLevel.COLLEGE, EducationLevel.UNIVERSITY],
-            "학생": [EducationLevel.MIDDLE_SCHOOL, EducationLevel.HIGH_SCHOOL, 
-                    EducationLevel.COLLEGE, EducationLevel.UNIVERSITY, EducationLevel.MASTER],
-            "무직": [EducationLevel.MIDDLE_SCHOOL, EducationLevel.HIGH_SCHOOL, 
-                    EducationLevel.COLLEGE, EducationLevel.UNIVERSITY, 
-                    EducationLevel.MASTER, EducationLevel.DOCTORATE]
+        occupation_education_requirements = {
+            occupation: [EducationLevel(education) for education in educations]
+            for occupation, educations in rules["occupation_education_requirements"].items()
         }
+        self._base_rules = BaseRules(
+            age_constraints=age_constraints,
+            default_age_constraints=default_age_constraints,
+            # 교육 수준별 소득 범위 (통계 기반 추정)
+            education_income_mapping={
+                EducationLevel(education): tuple(income_range)
+                for education, income_range in rules["education_income_mapping"].items()
+            },
+            occupation_education_requirements=occupation_education_requirements,
+            validation_core=_compile_validation_core(age_constraints, default_age_constraints,
+                                                     occupation_education_requirements)
+        )
+        self.rule_pack = rule_pack
+    
+    @property
+    def age_constraints(self) -> Dict[Tuple[int, int], PersonaConstraints]:
+        return self._base_rules.age_constraints
+    
+    @property
+    def education_income_mapping(self) -> Dict[EducationLevel, Tuple[int, int]]:
+        return self._base_rules.education_income_mapping
+    
+    @property
+    def occupation_education_requirements(self) -> Dict[str, List[EducationLevel]]:
+        return self._base_rules.occupation_education_requirements
     
     def _load_reference_data(self):
-        """참조 통계 데이터 로드"""
+        """참조 통계 데이터 로드 (변환 결과는 CSV 해시별로 캐시되어 다음 생성부터는 CSV를 파싱하지 않음)"""
         try:
-            # EUC-KR 인코딩으로 파일 읽기
-            with open(self.reference_data_path, 'r', encoding='euc-kr') as f:
-                df = pd.read_csv(f, skiprows=1)
-            
-            logger.info(f"참조 데이터 로드 완료: {df.shape}")
-            
-            # 연령별 교육 수준 통계 계산
-            self._calculate_education_stats(df)
-            
-            # 연령별 혼인 상태 통계 계산
-            self._calculate_marital_stats(df)
-            
+            census = load_census_counts(self.reference_data_path)
         except Exception as e:
             logger.warning(f"참조 데이터 로드 실패: {e}")
             logger.info("기본 통계를 사용합니다.")
+            return
+        
+        logger.info(f"참조 데이터 로드 완료: {census.counts.shape}")
+        self.census = census
+        # 연령별 교육 수준 / 혼인 상태 통계
+        self.education_stats = census.education_stats()
+        self.marital_stats = census.marital_stats()
+        self._tables = None
+    
+    def joint_sampler(self) -> Optional[CensusJointSampler]:
+        """
+        참조 통계의 (성별, 지역, 연령, 혼인 상태, 교육 수준) 결합 분포 샘플러 (참조 데이터가 없으면 None).
+        연령·혼인·교육 조합 중 검증 규칙을 위반하는 칸은 제외하며, 규칙 팩이 바뀌면 다시 만듭니다.
+        """
+        if self.census is None:
+            return None
+        base_rules = self._base_rules
+        if self._joint is None or self._joint[0] is not base_rules:
+            core = base_rules.validation_core
+            max_age = base_rules.default_age_constraints.max_age
+            marital = [CENSUS_MARITAL_STATUSES[label].value for label in self.census.marital_statuses]
+            ages, marital_codes, education_codes = np.meshgrid(
+                np.arange(max_age + 1), core.encode_column('marital_status', marital),
+                core.encode_column('education', list(self.census.educations)), indexing='ij')
+            # 연령·혼인·교육 축만 가진 규칙만 적용됨 (직업/소득 규칙은 축이 없어 건너뜀)
+            violations = core.check_batch(ages.ravel(), {'marital_status': marital_codes.ravel(),
+                                                         'education': education_codes.ravel()})
+            valid = np.ones(ages.size, dtype=bool)
+            for codes in violations.values():
+                valid &= codes == 0
+            self._joint = (base_rules, CensusJointSampler(self.census, max_age, valid.reshape(ages.shape)))
+        return self._joint[1]
     
-    def _calculate_education_stats(self, df: pd.DataFrame):
-        """교육 수준 통계 계산"""
-        education_cols = ['중학교', '고등학교', '대학(4년제 미만)', 
-                         '대학교(4년제 이상)', '대학원(석사 과정)', '대학원(박사 과정)']
+    def sample_joint_demographics(self, count: int, rng: Optional[np.random.Generator] = None) -> Dict[str, np.ndarray]:
+        """
+        참조 통계 결합 분포에서 count명의 (연령, 성별, 지역, 혼인 상태, 교육 수준)을 한 번에 추출합니다.
         
-        for _, row in df.iterrows():
-            age_group = row['연령별'].strip()
-            gender = row['성별']
-            marital = row['혼인상태별']
-            
-            # 연령 그룹 파싱
-            if '~' in age_group:
-                try:
-                    age_range = age_group.replace('　', '').split('~')
-                    min_age = int(age_range[0])
-                    max_age = int(age_range[1])
-                    age_key = (min_age, max_age)
-                    
-                    if age_key not in self.education_stats:
-                        self.education_stats[age_key] = {}
-                    
-                    key = (gender, marital)
-                    if key not in self.education_stats[age_key]:
-                        self.education_stats[age_key][key] = {}
-                    
-                    # 교육 수준별 인구수 저장
-                    for i, col in enumerate(education_cols):
-                        value = row[col]
-                        if pd.notna(value) and str(value) != '-':
-                            self.education_stats[age_key][key][i] = int(value)
-                    
-                except (ValueError, IndexError) as e:
-                    continue
-    
-    def _calculate_marital_stats(self, df: pd.DataFrame):
-        """혼인 상태 통계 계산"""
-        for _, row in df.iterrows():
-            age_group = row['연령별'].strip()
-            gender = row['성별']
-            marital = row['혼인상태별']
-            
-            if '~' in age_group:
-                try:
-                    age_range = age_group.replace('　', '').split('~')
-                    min_age = int(age_range[0])
-                    max_age = int(age_range[1])
-                    age_key = (min_age, max_age)
-                    
-                    if age_key not in self.marital_stats:
-                        self.marital_stats[age_key] = {}
-                    
-                    if gender not in self.marital_stats[age_key]:
-                        self.marital_stats[age_key][gender] = {}
-                    
-                    # 혼인 상태별 총합 계산
-                    education_cols = ['중학교', '고등학교', '대학(4년제 미만)', 
-                                    '대학교(4년제 이상)', '대학원(석사 과정)', '대학원(박사 과정)']
-                    total = 0
-                    for col in education_cols:
-                        value = row[col]
-                        if pd.notna(value) and str(value) != '-':
-                            total += int(value)
-                    
-                    if total > 0:
-                        self.marital_stats[age_key][gender][marital] = total
-                        
-                except (ValueError, IndexError):
-                    continue
+        Returns:
+            속성 -> 배열 (age는 정수, 나머지는 페르소나에 들어가는 문자열 값)
+        
+        Raises:
+            ValueError: 참조 데이터가 로드되지 않은 경우
+        """
+        sampler = self.joint_sampler()
+        if sampler is None:
+            raise ValueError("참조 통계 데이터가 없어 결합 분포로 추출할 수 없습니다")
+        codes = sampler.sample(count, rng if rng is not None else np.random.default_rng())
+        census = self.census
+        return {
+            'age': codes['age'],
+            'gender': np.array([CENSUS_GENDERS[label].value for label in census.genders])[codes['gender']],
+            'location': np.array(census.regions)[codes['region']],
+            'marital_status': np.array([CENSUS_MARITAL_STATUSES[label].value
+                                        for label in census.marital_statuses])[codes['marital_status']],
+            'education': np.array(census.educations)[codes['education']]
+        }
+    
+    def _sample_joint_one(self, sampler: CensusJointSampler) -> Tuple[int, Gender, str, MaritalStatus, EducationLevel]:
+        """결합 분포에서 한 명의 (연령, 성별, 지역, 혼인 상태, 교육 수준)을 추출"""
+        codes = sampler.sample_one(self.random)
+        census = self.census
+        return (codes['age'], CENSUS_GENDERS[census.genders[codes['gender']]], census.regions[codes['region']],
+                CENSUS_MARITAL_STATUSES[census.marital_statuses[codes['marital_status']]],
+                EducationLevel(census.educations[codes['education']]))
     
     def get_age_group_constraints(self, age: int) -> PersonaConstraints:
         """연령에 해당하는 제약조건 반환"""
@@ -269,37 +515,87 @@ class HierarchicalPersonaGenerator:
             raise ValueError(f"15세 미만은 통계 데이터가 없습니다: {age}세")
         
         # 기본값 반환 (65세 이상)
-        return PersonaConstraints(
-            min_age=65, max_age=100,
-            valid_education_levels=[EducationLevel.HIGH_SCHOOL, EducationLevel.COLLEGE, 
-                                  EducationLevel.UNIVERSITY, EducationLevel.MASTER, EducationLevel.DOCTORATE],
-            valid_marital_statuses=[MaritalStatus.MARRIED, MaritalStatus.DIVORCED, MaritalStatus.WIDOWED],
-            min_income=1500000, max_income=5000000,
-            occupation_categories=["은퇴", "무직", "자영업"]
-        )
+        return self._base_rules.default_age_constraints
     
-    def sample_age(self, min_age: int = 15, max_age: int = 65) -> int:
+    def sample_age(self, min_age: int = DEFAULT_MIN_AGE, max_age: int = DEFAULT_MAX_AGE) -> int:
         """연령 샘플링 (현실적 분포 기반)"""
         # 더 현실적인 연령 분포 (18-65세 중심)
-        mean_age = 35
-        std_age = 12
-        
         attempt = 0
         while attempt < 50:  # 무한루프 방지
-            age = int(np.random.normal(mean_age, std_age))
+            age = int(self.rng.normal(AGE_MEAN, AGE_STD))
             if min_age <= age <= max_age:
                 return age
             attempt += 1
         
         # 실패시 안전한 범위에서 균등분포
-        return random.randint(max(min_age, 20), min(max_age, 60))
+        return self.random.randint(max(min_age, 20), min(max_age, 60))
     
     def sample_gender(self) -> Gender:
         """성별 샘플링 (50:50 비율)"""
-        return random.choice([Gender.MALE, Gender.FEMALE])
+        return self.random.choice([Gender.MALE, Gender.FEMALE])
     
     def sample_education_by_age_gender(self, age: int, gender: Gender) -> EducationLevel:
-        """연령과 성별에 기반한 교육 수준 샘플링"""
+        """연령과 성별에 기반한 교육 수준 샘플링 (사전 계산된 조건부 확률표에서 한 번 추출)"""
+        return self.education_table.draw(age, GENDER_ORDER.index(gender), self.rng)
+    
+    def sample_marital_status_by_age_gender(self, age: int, gender: Gender) -> MaritalStatus:
+        """연령과 성별에 기반한 혼인 상태 샘플링 (사전 계산된 조건부 확률표에서 한 번 추출)"""
+        return self.marital_table.draw(age, GENDER_ORDER.index(gender), self.rng)
+    
+    @property
+    def education_table(self) -> 'ConditionalTable':
+        """교육 수준 조건부 확률표 [연령대, 성별, 교육 수준]"""
+        return self._compiled_tables()[0]
+    
+    @property
+    def marital_table(self) -> 'ConditionalTable':
+        """혼인 상태 조건부 확률표 [연령대, 성별, 혼인 상태]"""
+        return self._compiled_tables()[1]
+    
+    @property
+    def occupation_table(self) -> 'ConditionalTable':
+        """직업 호환 행렬 [연령대, 교육 수준, 직업] - 후보 직업은 같은 확률 (감사용: to_records())"""
+        return self._compiled_tables()[2]
+    
+    def _compiled_tables(self) -> Tuple['ConditionalTable', 'ConditionalTable', 'ConditionalTable']:
+        """교육/혼인 조건부 확률표와 직업 호환 행렬 (참조 데이터 로드 시 만들고, 규칙 팩이 바뀌면 다시 만듦)"""
+        base_rules = self._base_rules
+        if self._tables is None or self._tables[0] is not base_rules:
+            min_age = min(min_age for min_age, _ in self.age_constraints)
+            max_age = max([max_age for _, max_age in self.age_constraints] +
+                          [base_rules.default_age_constraints.max_age])
+            education = ConditionalTable.compile(
+                EDUCATION_ORDER, min_age, max_age, self._education_weights,
+                lambda age: self.get_age_group_constraints(age).valid_education_levels)
+            marital = ConditionalTable.compile(
+                MARITAL_ORDER, min_age, max_age, self._marital_weights,
+                lambda age: self.get_age_group_constraints(age).valid_marital_statuses)
+            # 직업 어휘: 모든 (연령, 교육 수준) 후보의 등장 순서
+            occupations = list(dict.fromkeys(
+                occupation for age in range(min_age, max_age + 1) for education in EDUCATION_ORDER
+                for occupation in self._occupation_candidates(education, age)))
+            occupation = ConditionalTable.compile(
+                occupations, min_age, max_age,
+                lambda age, education: dict.fromkeys(self._occupation_candidates(education, age), 1),
+                keys=EDUCATION_ORDER)
+            # 대체 페르소나(20-45세, 고등학교/대학교) 배치 추출용 확률표
+            fallback_education = ConditionalTable.compile(
+                EDUCATION_ORDER, 20, 45,
+                lambda age, gender: {EducationLevel.HIGH_SCHOOL: 1, EducationLevel.UNIVERSITY: 1},
+                lambda age: self.get_age_group_constraints(age).valid_education_levels)
+            fallback_marital = ConditionalTable.compile(
+                MARITAL_ORDER, 20, 45, lambda age, gender: dict.fromkeys(MARITAL_ORDER, 1),
+                lambda age: self.get_age_group_constraints(age).valid_marital_statuses)
+            self._tables = (base_rules, education, marital, occupation, fallback_education, fallback_marital)
+        return self._tables[1:4]
+    
+    def _fallback_tables(self) -> Tuple['ConditionalTable', 'ConditionalTable']:
+        """대체 페르소나용 교육/혼인 조건부 확률표 (_compiled_tables와 함께 만들고 버림)"""
+        self._compiled_tables()
+        return self._tables[4:]
+    
+    def _education_weights(self, age: int, gender: Gender) -> Dict[EducationLevel, float]:
+        """연령과 성별에 따른 교육 수준 가중치 (조건부 확률표 생성용)"""
         constraints = self.get_age_group_constraints(age)
         valid_educations = constraints.valid_education_levels
         
@@ -309,78 +605,36 @@ class HierarchicalPersonaGenerator:
         if (age_group in self.education_stats and 
             self.education_stats[age_group]):
             
-            # 통계 기반 샘플링 (유효한 교육 수준만)
-            education_mapping = [
-                EducationLevel.MIDDLE_SCHOOL,    # 중학교
-                EducationLevel.HIGH_SCHOOL,      # 고등학교  
-                EducationLevel.COLLEGE,          # 대학(4년제 미만)
-                EducationLevel.UNIVERSITY,       # 대학교(4년제 이상)
-                EducationLevel.MASTER,           # 대학원(석사 과정)
-                EducationLevel.DOCTORATE         # 대학원(박사 과정)
-            ]
-            
-            # 유효한 교육 수준에 대해서만 가중치 계산
-            valid_education_weights = []
-            valid_education_levels = []
-            
-            for i, edu_level in enumerate(education_mapping):
+            # 통계 기반 가중치 (유효한 교육 수준만)
+            weights = {}
+            for i, edu_level in enumerate(EDUCATION_ORDER):
                 if edu_level in valid_educations:
-                    # 통계에서 가중치 추출
-                    weight = 0
-                    for key, stats in self.education_stats[age_group].items():
-                        if key[0] == gender.value:  # 성별 매칭
-                            weight += stats.get(i, 0)
-                    
-                    if weight > 0:  # 가중치가 0보다 큰 경우만 포함
-                        valid_education_weights.append(weight)
-                        valid_education_levels.append(edu_level)
+                    # 통계에서 가중치 추출 (성별 매칭)
+                    weights[edu_level] = sum(stats.get(i, 0) for key, stats in self.education_stats[age_group].items()
+                                             if key[0] == gender.value)
             
-            if len(valid_education_levels) > 0 and sum(valid_education_weights) > 0:
-                # 가중치 정규화 및 선택
-                total_weight = sum(valid_education_weights)
-                probabilities = [w/total_weight for w in valid_education_weights]
-                
-                try:
-                    return np.random.choice(valid_education_levels, p=probabilities)
-                except ValueError:
-                    # 확률 합계 문제 발생시 기본 분포 사용
-                    logger.debug("통계 기반 샘플링 실패, 기본 분포 사용")
-                    pass
+            if sum(weights.values()) > 0:
+                return weights
         
         # 기본값: 연령별 일반적 패턴
         if age < 20:
-            return random.choice([EducationLevel.MIDDLE_SCHOOL, EducationLevel.HIGH_SCHOOL])
+            return {EducationLevel.MIDDLE_SCHOOL: 1, EducationLevel.HIGH_SCHOOL: 1}
         elif age < 25:
-            return random.choice([EducationLevel.HIGH_SCHOOL, EducationLevel.COLLEGE, EducationLevel.UNIVERSITY])
-        else:
-            # 유효한 교육 수준에 대해서만 가중치 생성
-            education_levels = list(valid_educations)
-            if len(education_levels) == 1:
-                return education_levels[0]
-            
-            # 연령별 기본 선호도
-            preferences = {
-                EducationLevel.MIDDLE_SCHOOL: 0.05 if age < 50 else 0.15,
-                EducationLevel.HIGH_SCHOOL: 0.30 if age < 50 else 0.45,
-                EducationLevel.COLLEGE: 0.20,
-                EducationLevel.UNIVERSITY: 0.35 if age < 50 else 0.25,
-                EducationLevel.MASTER: 0.08 if age < 50 else 0.10,
-                EducationLevel.DOCTORATE: 0.02 if age < 50 else 0.05
-            }
-            
-            # 유효한 교육 수준에 대한 가중치만 추출
-            weights = [preferences.get(edu, 0.1) for edu in education_levels]
-            
-            # 가중치 정규화
-            total_weight = sum(weights)
-            if total_weight > 0:
-                weights = [w / total_weight for w in weights]
-                return np.random.choice(education_levels, p=weights)
-            else:
-                return random.choice(education_levels)
+            return {EducationLevel.HIGH_SCHOOL: 1, EducationLevel.COLLEGE: 1, EducationLevel.UNIVERSITY: 1}
+        
+        # 유효한 교육 수준에 대해서만 연령별 기본 선호도 적용
+        preferences = {
+            EducationLevel.MIDDLE_SCHOOL: 0.05 if age < 50 else 0.15,
+            EducationLevel.HIGH_SCHOOL: 0.30 if age < 50 else 0.45,
+            EducationLevel.COLLEGE: 0.20,
+            EducationLevel.UNIVERSITY: 0.35 if age < 50 else 0.25,
+            EducationLevel.MASTER: 0.08 if age < 50 else 0.10,
+            EducationLevel.DOCTORATE: 0.02 if age < 50 else 0.05
+        }
+        return {edu: preferences.get(edu, 0.1) for edu in valid_educations}
     
-    def sample_marital_status_by_age_gender(self, age: int, gender: Gender) -> MaritalStatus:
-        """연령과 성별에 기반한 혼인 상태 샘플링"""
+    def _marital_weights(self, age: int, gender: Gender) -> Dict[MaritalStatus, float]:
+        """연령과 성별에 따른 혼인 상태 가중치 (조건부 확률표 생성용)"""
         constraints = self.get_age_group_constraints(age)
         valid_statuses = constraints.valid_marital_statuses
         
@@ -391,34 +645,22 @@ class HierarchicalPersonaGenerator:
             gender.value in self.marital_stats[age_group]):
             
             stats = self.marital_stats[age_group][gender.value]
-            weights = []
-            status_mapping = []
+            # 이혼, 사별은 별도 처리 필요 (가중치 0)
+            weights = {status: stats.get("미혼", 0) if status == MaritalStatus.SINGLE
+                       else stats.get("유배우", 0) if status == MaritalStatus.MARRIED else 0
+                       for status in valid_statuses}
             
-            for status in valid_statuses:
-                if status == MaritalStatus.SINGLE:
-                    weight = stats.get("미혼", 0)
-                elif status == MaritalStatus.MARRIED:
-                    weight = stats.get("유배우", 0)
-                else:
-                    weight = 0  # 이혼, 사별은 별도 처리 필요
-                
-                weights.append(weight)
-                status_mapping.append(status)
-            
-            if sum(weights) > 0:
-                total_weight = sum(weights)
-                probabilities = [w/total_weight for w in weights]
-                return np.random.choice(status_mapping, p=probabilities)
+            if sum(weights.values()) > 0:
+                return weights
         
         # 기본값: 연령별 일반적 패턴
         if age < 25:
-            return MaritalStatus.SINGLE
+            return {MaritalStatus.SINGLE: 1}
         elif age < 30:
-            return random.choices([MaritalStatus.SINGLE, MaritalStatus.MARRIED], weights=[0.6, 0.4])[0]
+            return {MaritalStatus.SINGLE: 0.6, MaritalStatus.MARRIED: 0.4}
         elif age < 35:
-            return random.choices([MaritalStatus.SINGLE, MaritalStatus.MARRIED], weights=[0.3, 0.7])[0]
-        else:
-            return random.choices(valid_statuses, weights=[0.1, 0.8, 0.08, 0.02][:len(valid_statuses)])[0]
+            return {MaritalStatus.SINGLE: 0.3, MaritalStatus.MARRIED: 0.7}
+        return dict(zip(valid_statuses, [0.1, 0.8, 0.08, 0.02]))
     
     def _get_age_group_key(self, age: int) -> Tuple[int, int]:
         """연령을 연령 그룹 키로 변환"""
@@ -428,18 +670,25 @@ class HierarchicalPersonaGenerator:
         return (65, 100)  # 기본값
     
     def sample_occupation_by_education_age(self, education: EducationLevel, age: int) -> str:
-        """교육 수준과 연령에 기반한 직업 샘플링 (엄격한 검증)"""
+        """교육 수준과 연령에 기반한 직업 샘플링 (엄격한 검증, 직업 호환 행렬에서 한 번 추출)"""
+        return self.occupation_table.draw(age, EDUCATION_ORDER.index(education), self.rng)
+    
+    def _occupation_candidates(self, education: EducationLevel, age: int) -> List[str]:
+        """교육 수준과 연령에 맞는 직업 후보 (직업 호환 행렬 생성용, 후보 중 균등 선택)"""
         constraints = self.get_age_group_constraints(age)
         valid_occupations = constraints.occupation_categories
         
         # 연령대별 강제 직업 할당
         if age <= 19:
             if education == EducationLevel.HIGH_SCHOOL and age >= 18:
-                return random.choice(["학생", "아르바이트"])
-            else:
-                return "학생"
+                return ["학생", "아르바이트"]
+            return ["학생"]
         elif age <= 22 and education in [EducationLevel.UNIVERSITY, EducationLevel.COLLEGE]:
-            return random.choice(["학생", "인턴"])  # 대학생 연령
+            return ["학생", "인턴"]  # 대학생 연령
+        
+        # 연령대별 추가 조정
+        if age >= 60:
+            return ["은퇴", "무직", "자영업"]
         
         # 교육 요구사항에 맞는 직업 필터링
         compatible_occupations = []
@@ -453,57 +702,21 @@ class HierarchicalPersonaGenerator:
                 if job_matches_age or occupation in valid_occupations:
                     compatible_occupations.append(occupation)
         
-        # 연령대별 추가 조정
-        if age >= 60:
-            return random.choice(["은퇴", "무직", "자영업"])
-        
-        # 호환되는 직업이 있으면 선택
-        if compatible_occupations:
-            return random.choice(compatible_occupations)
-        
-        # 기본 안전한 직업 (교육 수준 고려)
-        safe_jobs = {
-            EducationLevel.MIDDLE_SCHOOL: ["서비스직", "자영업"],
-            EducationLevel.HIGH_SCHOOL: ["사무직", "서비스직", "영업사원"],
-            EducationLevel.COLLEGE: ["사무직", "엔지니어", "간호사"],        # 대학(4년제 미만)
-            EducationLevel.UNIVERSITY: ["사무직", "엔지니어", "교사"],     # 대학교(4년제 이상)
-            EducationLevel.MASTER: ["연구원", "교사", "전문직"],          # 석사
-            EducationLevel.DOCTORATE: ["교수", "연구원", "전문직"]       # 박사
-        }
-        
-        return random.choice(safe_jobs.get(education, ["사무직"]))
+        # 호환되는 직업이 없으면 기본 안전한 직업 (교육 수준 고려)
+        return compatible_occupations or SAFE_JOBS.get(education, ["사무직"])
     
     def sample_income_by_education_occupation_age(self, education: EducationLevel, 
                                                 occupation: str, age: int) -> int:
         """교육, 직업, 연령에 기반한 소득 샘플링"""
         # 기본 소득 범위 (교육 수준 기반)
-        base_min, base_max = self.education_income_mapping.get(education, (2000000, 5000000))
+        base_min, base_max = self.education_income_mapping.get(education, DEFAULT_INCOME_RANGE)
         
         # 연령별 조정 계수
-        age_multiplier = 1.0
-        if age < 25:
-            age_multiplier = 0.6
-        elif age < 30:
-            age_multiplier = 0.8
-        elif age < 40:
-            age_multiplier = 1.2
-        elif age < 50:
-            age_multiplier = 1.5
-        elif age < 60:
-            age_multiplier = 1.3
-        else:
-            age_multiplier = 0.8
+        age_multiplier = next((multiplier for limit, multiplier in INCOME_AGE_MULTIPLIERS if age < limit),
+                              INCOME_AGE_MULTIPLIER_DEFAULT)
         
         # 직업별 조정 계수
-        occupation_multipliers = {
-            "의사": 3.0, "변호사": 2.5, "교수": 2.0, "임원": 2.8,
-            "연구원": 1.5, "엔지니어": 1.3, "프로그래머": 1.4,
-            "교사": 1.1, "간호사": 1.2, "회계사": 1.3,
-            "사원": 0.8, "사무직": 0.9, "서비스직": 0.7,
-            "학생": 0.1, "무직": 0.2, "아르바이트": 0.3
-        }
-        
-        occupation_multiplier = occupation_multipliers.get(occupation, 1.0)
+        occupation_multiplier = OCCUPATION_INCOME_MULTIPLIERS.get(occupation, 1.0)
         
         # 최종 소득 계산
         adjusted_min = int(base_min * age_multiplier * occupation_multiplier)
@@ -523,130 +736,69 @@ class HierarchicalPersonaGenerator:
         log_mean = (log_min + log_max) / 2
         log_std = (log_max - log_min) / 6  # 99.7%가 범위 내에 있도록
         
-        log_income = np.random.normal(log_mean, log_std)
+        log_income = self.rng.normal(log_mean, log_std)
         income = int(np.exp(log_income))
         
         return max(final_min, min(final_max, income))
     
     def sample_location(self) -> str:
         """지역 샘플링 (2022년 통계청 인구 분포 기반)"""
-        locations = [
-            "서울특별시", "부산광역시", "대구광역시", "인천광역시",
-            "광주광역시", "대전광역시", "울산광역시", "세종특별자치시",
-            "경기도", "강원도", "충청북도", "충청남도",
-            "전라북도", "전라남도", "경상북도", "경상남도", "제주특별자치도"
-        ]
-        
-        # 2022년 통계청 실제 인구 분포 기반 가중치
-        weights = [0.195, 0.066, 0.047, 0.057, 0.029, 0.030, 0.022, 0.007,
-                  0.264, 0.028, 0.030, 0.039, 0.033, 0.031, 0.048, 0.062,
-                  0.012]
-        
-        # 가중치 정규화 (안전장치)
-        total_weight = sum(weights)
-        if total_weight != 1.0:
-            weights = [w / total_weight for w in weights]
-        
-        return np.random.choice(locations, p=weights)
+        return self.rng.choice(LOCATIONS, p=_normalized(LOCATION_WEIGHTS))
     
     def validate_persona(self, persona: Dict[str, Any]) -> Tuple[bool, List[str]]:
-        """페르소나 유효성 검증"""
-        errors = []
-        
+        """
+        페르소나 유효성 검증 (컴파일된 규칙 코어 사용)
+        15세 미만, 정수가 아닌 연령, 알 수 없는 교육 수준도 예외 없이 오류 메시지로 보고합니다.
+        """
         # 기본 속성 존재 확인
-        required_fields = ['age', 'gender', 'education', 'marital_status', 
-                          'occupation', 'income', 'location']
-        
-        for field in required_fields:
-            if field not in persona:
-                errors.append(f"필수 필드 누락: {field}")
-        
+        errors = [f"필수 필드 누락: {field}" for field in REQUIRED_FIELDS if field not in persona]
         if errors:
             return False, errors
         
-        age = persona['age']
-        education = persona['education']
-        marital_status = persona['marital_status']
-        occupation = persona['occupation']
-        income = persona['income']
-        
-        # 연령별 제약조건 검증
-        constraints = self.get_age_group_constraints(age)
-        
-        # 교육 수준 검증
-        if education not in [e.value for e in constraints.valid_education_levels]:
-            errors.append(f"연령 {age}세에 부적절한 교육 수준: {education}")
-        
-        # 혼인 상태 검증
-        if marital_status not in [m.value for m in constraints.valid_marital_statuses]:
-            errors.append(f"연령 {age}세에 부적절한 혼인 상태: {marital_status}")
-        
-        # 소득 범위 검증
-        if not (constraints.min_income <= income <= constraints.max_income):
-            errors.append(f"연령 {age}세에 부적절한 소득: {income:,}원")
-        
-        # 직업-교육 호환성 검증
-        if occupation in self.occupation_education_requirements:
-            required_educations = self.occupation_education_requirements[occupation]
-            education_enum = EducationLevel(education)
-            if education_enum not in required_educations:
-                errors.append(f"직업 {occupation}에 부적절한 교육 수준: {education}")
-        
-        # 강화된 논리적 일관성 검증 (통계청 기준)
-        
-        # 1. 연령-교육 일관성
-        if age < 18 and education in [EducationLevel.UNIVERSITY.value, EducationLevel.MASTER.value, EducationLevel.DOCTORATE.value]:
-            errors.append(f"{age}세는 대학교 이상 교육을 받을 수 없습니다")
-        
-        if age < 22 and education in [EducationLevel.MASTER.value, EducationLevel.DOCTORATE.value]:
-            errors.append(f"{age}세는 대학원 학위를 가질 수 없습니다")
-        
-        if age < 26 and education == EducationLevel.DOCTORATE.value:
-            errors.append(f"{age}세는 박사 학위를 가질 수 없습니다")
-        
-        # 2. 연령-혼인 일관성
-        if age < 18 and marital_status in [MaritalStatus.MARRIED.value, MaritalStatus.DIVORCED.value, MaritalStatus.WIDOWED.value]:
-            errors.append(f"{age}세 미성년자는 혼인 상태를 가질 수 없습니다")
-        
-        # 3. 연령-직업 일관성  
-        if age <= 19 and occupation not in ["학생", "아르바이트"]:
-            errors.append(f"{age}세는 학생 또는 아르바이트만 가능합니다")
-        
-        if occupation == "학생" and age > 30:
-            errors.append(f"{age}세는 일반적으로 학생이 아닙니다")
-        
-        # 4. 교육-직업 호환성 (더 엄격하게)
-        critical_jobs = ["의사", "변호사", "교수", "판사", "검사"]
-        if occupation in critical_jobs and education not in [EducationLevel.UNIVERSITY.value, EducationLevel.MASTER.value, EducationLevel.DOCTORATE.value]:
-            errors.append(f"직업 '{occupation}'은 대학교 이상 교육이 필요합니다")
-        
-        # 5. 소득 현실성 검증
-        if age <= 19 and income > 2000000:
-            errors.append(f"{age}세의 소득 {income:,}원은 비현실적입니다")
-        
-        if occupation == "학생" and income > 1000000:
-            errors.append(f"학생의 소득 {income:,}원은 비현실적입니다")
-        
+        violations = self._base_rules.validation_core.check(
+            persona['age'],
+            {field: persona[field] for field in ('education', 'marital_status', 'occupation')},
+            {'income': persona['income']}
+        )
+        errors = [(NON_INTEGRAL_AGE_MESSAGE if (rule.name, code) == ("age_group", NON_INTEGRAL_AGE_CODE)
+                   else VALIDATION_MESSAGES[rule.name]).format(**persona) for rule, code in violations]
         return len(errors) == 0, errors
     
+    def validate_batch(self, personas: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """
+        배치 검증: 규칙 이름 -> 페르소나별 위반 코드 배열 (0 = 통과, 규칙 순서는 validate_persona와 같음)
+        모든 페르소나에 필수 필드가 있어야 하며, 정수가 아닌 연령은 age_group 위반(NON_INTEGRAL_AGE_CODE)으로 보고합니다.
+        """
+        core = self._base_rules.validation_core
+        count = len(personas)
+        age = np.fromiter((p['age'] for p in personas), dtype=np.float64, count=count)
+        codes = {field: core.encode_column(field, [p[field] for p in personas])
+                 for field in ('education', 'marital_status', 'occupation')}
+        income = np.fromiter((p['income'] for p in personas), dtype=np.float64, count=count)
+        return core.check_batch(age, codes, {'income': income})
+    
     def generate_persona(self) -> Dict[str, Any]:
         """단일 페르소나 생성"""
-        max_attempts = 10
+        joint = self.joint_sampler()
         
-        for attempt in range(max_attempts):
+        for attempt in range(MAX_GENERATION_ATTEMPTS):
             try:
-                # 1단계: 기본 속성 생성 (연령, 성별)
-                age = self.sample_age()
-                gender = self.sample_gender()
-                
-                # 2단계: 계층적 의존 속성 생성
-                education = self.sample_education_by_age_gender(age, gender)
-                marital_status = self.sample_marital_status_by_age_gender(age, gender)
+                if joint is not None:
+                    # 1-2단계: 참조 통계 결합 분포에서 연령, 성별, 지역, 혼인 상태, 교육 수준을 함께 추출
+                    age, gender, location, marital_status, education = self._sample_joint_one(joint)
+                else:
+                    # 1단계: 기본 속성 생성 (연령, 성별)
+                    age = self.sample_age()
+                    gender = self.sample_gender()
+                    
+                    # 2단계: 계층적 의존 속성 생성
+                    education = self.sample_education_by_age_gender(age, gender)
+                    marital_status = self.sample_marital_status_by_age_gender(age, gender)
+                    location = self.sample_location()
                 
                 # 3단계: 파생 속성 생성
                 occupation = self.sample_occupation_by_education_age(education, age)
                 income = self.sample_income_by_education_occupation_age(education, occupation, age)
-                location = self.sample_location()
                 
                 # 페르소나 구성
                 persona = {
@@ -680,22 +832,21 @@ class HierarchicalPersonaGenerator:
     def _generate_fallback_persona(self) -> Dict[str, Any]:
         """기본 페르소나 생성 (검증 실패시) - 무작위 안전한 조합"""
         # 안전한 연령대 선택 (20-45세)  
-        age = random.randint(20, 45)
-        gender = random.choice([Gender.MALE, Gender.FEMALE])
+        age = self.random.randint(20, 45)
+        gender = self.random.choice([Gender.MALE, Gender.FEMALE])
         
         # 해당 연령의 제약조건 가져오기
         constraints = self.get_age_group_constraints(age)
         
         # 안전한 교육 수준 (대학교/고등학교)
         safe_educations = [EducationLevel.HIGH_SCHOOL, EducationLevel.UNIVERSITY]
-        education = random.choice([e for e in safe_educations if e in constraints.valid_education_levels])
+        education = self.random.choice([e for e in safe_educations if e in constraints.valid_education_levels])
         
         # 안전한 혼인 상태
-        marital_status = random.choice(constraints.valid_marital_statuses)
+        marital_status = self.random.choice(constraints.valid_marital_statuses)
         
         # 안전한 직업 (사무직/엔지니어)
-        safe_occupations = ['사무직', '엔지니어', '교사', '간호사']
-        occupation = random.choice(safe_occupations)
+        occupation = self.random.choice(FALLBACK_OCCUPATIONS)
         
         # 교육과 직업에 맞는 소득 계산
         income = self.sample_income_by_education_occupation_age(education, occupation, age)
@@ -714,8 +865,196 @@ class HierarchicalPersonaGenerator:
             'generation_attempt': 'fallback'
         }
     
-    def generate_personas(self, count: int) -> List[Dict[str, Any]]:
-        """다중 페르소나 생성"""
+    def generate_persona_columns(self, count: int, rng: Optional[np.random.Generator] = None) -> Dict[str, np.ndarray]:
+        """
+        count명의 페르소나를 속성별 배열로 한 번에 생성합니다 (배치 경로).
+        generate_persona와 같은 분포와 제약조건을 따르며, 검증에 실패한 행만 최대 MAX_GENERATION_ATTEMPTS번
+        다시 뽑고 그래도 실패하면 안전한 조합(fallback)으로 채웁니다.
+        
+        Args:
+            count: 생성할 페르소나 수
+            rng: 난수 생성기 (기본: 새 np.random.default_rng())
+        
+        Returns:
+            속성 -> 길이 count 배열 (age/income은 정수, generation_attempt는 시도 횟수 또는 'fallback')
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        columns = {
+            'age': np.zeros(count, dtype=np.int64),
+            **{field: np.empty(count, dtype=object)
+               for field in ('gender', 'education', 'marital_status', 'occupation')},
+            'income': np.zeros(count, dtype=np.int64),
+            'location': np.empty(count, dtype=object),
+            'generation_attempt': np.empty(count, dtype=object)
+        }
+        
+        pending = np.arange(count)
+        for attempt in range(1, MAX_GENERATION_ATTEMPTS + 1):
+            if not len(pending):
+                break
+            drawn = self._draw_persona_columns(len(pending), rng)
+            valid = self._valid_rows(drawn)
+            rows = pending[valid]
+            for field, values in drawn.items():
+                columns[field][rows] = values[valid]
+            columns['generation_attempt'][rows] = attempt
+            pending = pending[~valid]
+        
+        if len(pending):
+            logger.warning(f"최대 시도 횟수 초과, 기본 페르소나 {len(pending)}개 사용")
+            for field, values in self._draw_fallback_columns(len(pending), rng).items():
+                columns[field][pending] = values
+            columns['generation_attempt'][pending] = 'fallback'
+        return columns
+    
+    def _draw_persona_columns(self, size: int, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+        """배치 한 번 추출 (검증 전): 1-2단계 인구통계 -> 3단계 직업/소득"""
+        joint = self.joint_sampler()
+        if joint is not None:
+            # 참조 통계 결합 분포에서 연령, 성별, 지역, 혼인 상태, 교육 수준을 함께 추출
+            codes = joint.sample(size, rng)
+            census = self.census
+            age = codes['age'].astype(np.int64)
+            gender = np.array([GENDER_ORDER.index(CENSUS_GENDERS[label]) for label in census.genders])[codes['gender']]
+            education = np.array([EDUCATION_ORDER.index(EducationLevel(label))
+                                  for label in census.educations])[codes['education']]
+            marital_status = np.array([MARITAL_ORDER.index(CENSUS_MARITAL_STATUSES[label])
+                                       for label in census.marital_statuses])[codes['marital_status']]
+            location = np.array(census.regions, dtype=object)[codes['region']]
+        else:
+            age = self._sample_age_batch(size, rng)
+            gender = rng.integers(len(GENDER_ORDER), size=size)
+            education = self.education_table.draw_codes(age, gender, rng)
+            marital_status = self.marital_table.draw_codes(age, gender, rng)
+            location = self._sample_location_batch(size, rng)
+        
+        occupation = self._sample_occupation_batch(education, age, rng)
+        return self._encode_columns(age, gender, education, marital_status, occupation,
+                                    self._sample_income_batch(education, occupation, age, rng), location)
+    
+    def _draw_fallback_columns(self, size: int, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+        """_generate_fallback_persona의 배치판: 20-45세, 고등학교/대학교, 안전한 직업"""
+        age = rng.integers(20, 46, size=size)
+        gender = rng.integers(len(GENDER_ORDER), size=size)
+        
+        education_table, marital_table = self._fallback_tables()
+        education = education_table.draw_codes(age, gender, rng)
+        marital_status = marital_table.draw_codes(age, gender, rng)
+        occupation = np.array(FALLBACK_OCCUPATIONS, dtype=object)[rng.integers(len(FALLBACK_OCCUPATIONS), size=size)]
+        return self._encode_columns(age, gender, education, marital_status, occupation,
+                                    self._sample_income_batch(education, occupation, age, rng),
+                                    self._sample_location_batch(size, rng))
+    
+    @staticmethod
+    def _encode_columns(age, gender, education, marital_status, occupation, income, location) -> Dict[str, np.ndarray]:
+        """열거형 코드 배열 -> 페르소나 값 배열"""
+        return {
+            'age': age,
+            'gender': np.array([g.value for g in GENDER_ORDER], dtype=object)[gender],
+            'education': np.array([e.value for e in EDUCATION_ORDER], dtype=object)[education],
+            'marital_status': np.array([m.value for m in MARITAL_ORDER], dtype=object)[marital_status],
+            'occupation': occupation,
+            'income': income,
+            'location': location
+        }
+    
+    def _valid_rows(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """배치 검증: 모든 규칙을 통과한 행 마스크 (validate_persona와 같은 규칙 코어)"""
+        core = self._base_rules.validation_core
+        codes = {}
+        for field in ('education', 'marital_status', 'occupation'):
+            labels, inverse = np.unique(columns[field].astype(str), return_inverse=True)
+            codes[field] = core.encode_column(field, labels.tolist())[inverse]
+        violations = core.check_batch(columns['age'], codes, {'income': columns['income'].astype(np.float64)})
+        valid = np.ones(len(columns['age']), dtype=bool)
+        for rule_codes in violations.values():
+            valid &= rule_codes == 0
+        return valid
+    
+    def _sample_age_batch(self, size: int, rng: np.random.Generator,
+                          min_age: int = DEFAULT_MIN_AGE, max_age: int = DEFAULT_MAX_AGE) -> np.ndarray:
+        """sample_age의 배치판: 범위를 벗어난 행만 다시 뽑는 절단 정규분포"""
+        age = np.zeros(size, dtype=np.int64)
+        pending = np.arange(size)
+        for _ in range(50):  # 무한루프 방지
+            if not len(pending):
+                return age
+            drawn = rng.normal(AGE_MEAN, AGE_STD, size=len(pending)).astype(np.int64)
+            inside = (drawn >= min_age) & (drawn <= max_age)
+            age[pending[inside]] = drawn[inside]
+            pending = pending[~inside]
+        # 실패시 안전한 범위에서 균등분포
+        age[pending] = rng.integers(max(min_age, 20), min(max_age, 60) + 1, size=len(pending))
+        return age
+    
+    def _sample_occupation_batch(self, education: np.ndarray, age: np.ndarray,
+                                 rng: np.random.Generator) -> np.ndarray:
+        """sample_occupation_by_education_age의 배치판: 직업 호환 행렬에서 한 번에 추출"""
+        table = self.occupation_table
+        return np.array(table.levels, dtype=object)[table.draw_codes(age, education, rng)]
+    
+    def _sample_income_batch(self, education: np.ndarray, occupation: np.ndarray, age: np.ndarray,
+                             rng: np.random.Generator) -> np.ndarray:
+        """sample_income_by_education_occupation_age의 배치판 (같은 계수와 로그 정규분포)"""
+        base = np.array([self.education_income_mapping.get(level, DEFAULT_INCOME_RANGE)
+                         for level in EDUCATION_ORDER], dtype=np.float64)[education]
+        age_multiplier = np.full(len(age), INCOME_AGE_MULTIPLIER_DEFAULT)
+        for limit, multiplier in reversed(INCOME_AGE_MULTIPLIERS):
+            age_multiplier[age < limit] = multiplier
+        labels, inverse = np.unique(occupation.astype(str), return_inverse=True)
+        occupation_multiplier = np.array([OCCUPATION_INCOME_MULTIPLIERS.get(label, 1.0) for label in labels])[inverse]
+        adjusted = (base * age_multiplier[:, None] * occupation_multiplier[:, None]).astype(np.int64)
+        
+        # 제약조건 적용
+        ages, age_inverse = np.unique(age, return_inverse=True)
+        limits = np.array([(c.min_income, c.max_income)
+                           for c in map(self.get_age_group_constraints, ages.tolist())], dtype=np.int64)[age_inverse]
+        final_min = np.maximum(adjusted[:, 0], limits[:, 0])
+        final_max = np.minimum(adjusted[:, 1], limits[:, 1])
+        
+        # 로그 정규분포 기반 샘플링 (범위가 없는 행은 final_min)
+        income = final_min.copy()
+        spread = final_min < final_max
+        log_min = np.log(final_min[spread])
+        log_max = np.log(final_max[spread])
+        log_income = rng.normal((log_min + log_max) / 2, (log_max - log_min) / 6)
+        income[spread] = np.clip(np.exp(log_income).astype(np.int64), final_min[spread], final_max[spread])
+        return income
+    
+    @staticmethod
+    def _sample_location_batch(size: int, rng: np.random.Generator) -> np.ndarray:
+        return np.array(LOCATIONS, dtype=object)[rng.choice(len(LOCATIONS), size=size, p=_normalized(LOCATION_WEIGHTS))]
+    
+    def generate_personas(self, count: int, workers: Optional[int] = None,
+                          seed: Optional[int] = None,
+                          shard_size: int = DEFAULT_SHARD_SIZE,
+                          vectorized: bool = False,
+                          rng: Optional[np.random.Generator] = None) -> List[Dict[str, Any]]:
+        """
+        다중 페르소나 생성
+        
+        Args:
+            count: 생성할 페르소나 수
+            workers: 2 이상이면 샤드 단위로 나눠 프로세스 풀에서 병렬 생성 (seed만 지정하면 현재 프로세스에서 순차 생성)
+            seed: 마스터 시드 - 지정하면 워커 수와 무관하게 같은 결과
+            shard_size: 샤드 크기 (병렬/시드 모드)
+            vectorized: True면 generate_persona 반복 대신 배치 경로(generate_persona_columns)로 생성
+            rng: 배치 경로의 난수 생성기 (지정하면 vectorized=True로 간주, 병렬/시드 모드에서는 샤드별 스트림 사용)
+        """
+        vectorized = vectorized or rng is not None
+        if workers is not None or seed is not None:
+            shard_results = run_sharded(_generate_hierarchical_shard, (self, vectorized), count,
+                                        seed=seed, workers=workers, shard_size=shard_size)
+            personas = [persona for shard in shard_results for persona in shard]
+            logger.info(f"페르소나 생성 완료: {len(personas)}개 (샤드 {len(shard_results)}개)")
+            return personas
+        
+        if vectorized:
+            columns = self.generate_persona_columns(count, rng)
+            personas = [dict(zip(columns, values)) for values in zip(*(column.tolist() for column in columns.values()))]
+            logger.info(f"페르소나 생성 완료: {len(personas)}개 (배치)")
+            return personas
+        
         personas = []
         
         logger.info(f"{count}개의 페르소나 생성 시작")
@@ -730,6 +1069,23 @@ class HierarchicalPersonaGenerator:
         logger.info(f"페르소나 생성 완료: {len(personas)}개")
         return personas
     
+    def iter_personas(self, count: int, chunk_size: int = DEFAULT_SHARD_SIZE,
+                      workers: Optional[int] = 1,
+                      seed: Optional[int] = None,
+                      vectorized: bool = False) -> Iterator[List[Dict[str, Any]]]:
+        """
+        페르소나를 chunk_size개씩 생성해 청크 단위로 내보냄 (메모리 사용량이 전체 수와 무관)
+        
+        Args:
+            count: 생성할 전체 페르소나 수
+            chunk_size: 청크 크기 (같은 seed와 chunk_size는 generate_personas와 같은 결과)
+            workers: 청크를 병렬 생성할 프로세스 수
+            seed: 마스터 시드
+            vectorized: 청크를 배치 경로로 생성
+        """
+        yield from iter_sharded(_generate_hierarchical_shard, (self, vectorized), count,
+                                seed=seed, workers=workers, shard_size=chunk_size)
+    
     def save_personas(self, personas: List[Dict[str, Any]], 
                      output_path: str, format: str = 'json'):
         """페르소나 데이터 저장"""
@@ -741,6 +1097,7 @@ class HierarchicalPersonaGenerator:
                 json.dump(personas, f, ensure_ascii=False, indent=2)
         
         elif format.lower() == 'csv':
+            import pandas as pd
             df = pd.DataFrame(personas)
             df.to_csv(output_path, index=False, encoding='utf-8-sig')
         
@@ -785,12 +1142,17 @@ class HierarchicalPersonaGenerator:
             location = persona['location']
             location_dist[location] = location_dist.get(location, 0) + 1
         
-        # 검증 오류 분석
+        # 검증 오류 분석 (배치 검증으로 개수를 세고, 보고할 상위 10개 메시지만 만듦)
+        violations = self.validate_batch(personas)
+        error_count = sum(int(np.count_nonzero(codes)) for codes in violations.values())
+        invalid = np.zeros(total_count, dtype=bool)
+        for codes in violations.values():
+            invalid |= codes != 0
         validation_errors = []
-        for persona in personas:
-            is_valid, errors = self.validate_persona(persona)
-            if not is_valid:
-                validation_errors.extend(errors)
+        for index in np.flatnonzero(invalid):
+            if len(validation_errors) >= 10:
+                break
+            validation_errors.extend(self.validate_persona(personas[index])[1])
         
         return {
             'total_count': total_count,
@@ -813,12 +1175,22 @@ class HierarchicalPersonaGenerator:
                 'occupation': occupation_dist,
                 'location': location_dist
             },
-            'validation_error_count': len(validation_errors),
+            'validation_error_count': error_count,
             'validation_errors': validation_errors[:10],  # 상위 10개만
-            'quality_score': max(0, 100 - len(validation_errors) / total_count * 100)
+            'quality_score': max(0, 100 - error_count / total_count * 100)
         }
 
 
+def _generate_hierarchical_shard(task) -> List[Dict[str, Any]]:
+    """프로세스 풀 워커: 샤드 하나를 샤드 전용 난수 스트림으로 생성"""
+    (generator, vectorized), shard_index, start, size, seed_sequence = task
+    shard_generator = copy.copy(generator)
+    shard_generator.rng, shard_generator.random = shard_random_streams(seed_sequence)
+    if vectorized:
+        return shard_generator.generate_personas(size, rng=shard_generator.rng)
+    return shard_generator.generate_personas(size)
+
+
 def main():
     """메인 실행 함수"""
     import argparse
@@ -207,6 +207,18 @@ CREATE INDEX IF NOT EXISTS idx_virtualpeople_personas_created_at ON virtualpeopl
             self.logger.error(f"폴백 삽입도 실패: {e}")
             return False
     
+    def insert_personas(self, personas: List[Dict[str, Any]]) -> int:
+        """페르소나 청크를 한 번의 요청으로 일괄 삽입합니다 (실패 시 한 건씩 삽입)"""
+        if not personas:
+            return 0
+        try:
+            rows = [self._flatten_persona(persona) for persona in personas]
+            result = self.supabase.schema(self.schema).table(self.table_name).insert(rows).execute()
+            return len(result.data)
+        except Exception as e:
+            self.logger.error(f"페르소나 일괄 삽입 실패, 한 건씩 삽입합니다: {e}")
+            return super().insert_personas(personas)
+    
     def get_persona(self, persona_id: str) -> Optional[Dict[str, Any]]:
         """특정 ID의 페르소나를 조회합니다"""
         try:
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+트렌드 기반 행동 패턴 추출 테스트
+================================
+
+미디어 소비/소비 행태가 연도별 트렌드와 세대 보정으로 만든 확률 테이블을 따르는지 확인
+"""
+
+import random
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from behavior_sampling import build_behavior_tables
+from persona_generator import PersonaGenerator
+
+
+class TestBehaviorSampling(unittest.TestCase):
+    """행동 패턴 확률 테이블 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.generator = PersonaGenerator()
+        self.tables = self.generator._behavior_table(2024)
+
+    def test_tables_follow_trends(self):
+        """확률은 행마다 합이 1이고, 연도 트렌드와 세대 디지털 친화도를 반영"""
+        for field, probabilities in self.tables.probabilities.items():
+            np.testing.assert_allclose(probabilities.sum(axis=1), 1.0)
+        shopping = self.tables.labels["shopping_habit"]
+        secondhand = shopping.index("중고거래 활발")
+        # 중고거래 지표는 2020년 이후 증가
+        self.assertGreater(self.generator._behavior_table(2024).probabilities["shopping_habit"][0, secondhand],
+                           self.generator._behavior_table(2020).probabilities["shopping_habit"][0, secondhand])
+        # 베이비부머(마지막 행)는 Z세대(행 1)보다 SNS 비중이 낮고 뉴스 앱/포털 비중이 높음
+        media = self.tables.labels["media_consumption"]
+        probabilities = self.tables.probabilities["media_consumption"]
+        self.assertLess(probabilities[-1, media.index("SNS 활발")], probabilities[1, media.index("SNS 활발")])
+        self.assertGreater(probabilities[-1, media.index("뉴스 앱/포털 이용")], probabilities[1, media.index("뉴스 앱/포털 이용")])
+
+    def test_batch_and_scalar_sampling(self):
+        """묶음 추출과 한 건 추출이 세대 행의 확률을 따름"""
+        ages = np.repeat(np.array([5, 30, 70], dtype=np.int16), 40000)
+        codes = self.tables.sample(ages, np.random.default_rng(3))["media_consumption"]
+        for age in (5, 30, 70):
+            row = self.tables.generation_row(age)
+            frequencies = np.bincount(codes[ages == age], minlength=len(self.tables.labels["media_consumption"])) / 40000
+            np.testing.assert_allclose(frequencies, self.tables.probabilities["media_consumption"][row], atol=0.01)
+
+        rand = random.Random(5)
+        labels = self.tables.labels["media_consumption"]
+        draws = [labels.index(self.tables.draw("media_consumption", 70, rand)) for _ in range(20000)]
+        np.testing.assert_allclose(np.bincount(draws, minlength=len(labels)) / 20000,
+                                   self.tables.probabilities["media_consumption"][-1], atol=0.015)
+
+        batch = self.generator.generate_persona_batch(200, {"year": 2030}, rng=np.random.default_rng(1))
+        self.assertEqual(batch.categories["media_consumption"], labels)
+
+    def test_unknown_options_use_default_weight(self):
+        """지표가 없는 선택지도 기본 가중치로 추출 가능"""
+        tables = build_behavior_tables(self.generator.ts_manager, 2024,
+                                       {"shopping_habit": ["온라인 쇼핑 선호", "전통시장 이용"]},
+                                       self.generator.GENERATION_AGE_BANDS)
+        self.assertTrue((tables.probabilities["shopping_habit"] > 0).all())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
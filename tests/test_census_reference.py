@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+인구총조사 참조 통계 변환 테스트
+==============================
+
+참조 CSV를 인구수 텐서로 한 번에 변환하고, CSV 해시별 캐시에서 다시 읽는지 확인
+"""
+
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import census_reference
+from census_reference import CensusReferenceError, load_census_counts, parse_age_band
+from src.hierarchical_persona_generator import HierarchicalPersonaGenerator
+
+REFERENCE_PATH = project_root / "ref" / "2022년_교육정도별인구_성_연령_혼인_행정구역__20250820094542.csv"
+
+
+@unittest.skipUnless(REFERENCE_PATH.exists(), "참조 데이터가 없음")
+class TestCensusReference(unittest.TestCase):
+    """참조 통계 텐서/캐시 테스트"""
+
+    def setUp(self):
+        """테스트 설정: 임시 캐시 디렉토리와 비어 있는 프로세스 내 캐시"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = mock.patch.dict(census_reference._loaded_counts, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_dense_counts(self):
+        """텐서 축은 CSV 등장 순서의 라벨이고, 값은 CSV 인구수와 같음 ('-'는 0, present는 False)"""
+        census = load_census_counts(REFERENCE_PATH, use_cache=False)
+        self.assertEqual(census.counts.shape, (2, 17, 15, 2, 6))
+        self.assertEqual(census.genders, ("여자", "남자"))
+        self.assertEqual(census.age_bands[0], (15, 19))
+        self.assertEqual(census.age_bands[-1], (85, None))
+        # 첫 행: 여자, 서울특별시, 15~19, 미혼 = 27744, 126592, 12579, 30917, -, -
+        np.testing.assert_array_equal(census.counts[0, 0, 0, 0], [27744, 126592, 12579, 30917, 0, 0])
+        np.testing.assert_array_equal(census.present[0, 0, 0, 0], [True] * 4 + [False] * 2)
+
+        education = census.education_stats()
+        marital = census.marital_stats()
+        self.assertNotIn((85, None), education)
+        self.assertEqual(education[(15, 19)][("여자", "미혼")][0], int(census.counts[0, :, 0, 0, 0].sum()))
+        self.assertEqual(marital[(20, 24)]["남자"]["유배우"], int(census.counts[1, :, 1, 1].sum()))
+
+    def test_cached_load_skips_csv_parsing(self):
+        """두 번째 프로세스(빈 메모리 캐시)는 CSV를 파싱하지 않고 .npz 캐시에서 같은 텐서를 읽음"""
+        first = load_census_counts(REFERENCE_PATH, cache_dir=self.tmp.name)
+        census_reference._loaded_counts.clear()
+        with mock.patch.object(census_reference, "parse_census_csv", side_effect=AssertionError("reparsed")):
+            second = load_census_counts(REFERENCE_PATH, cache_dir=self.tmp.name)
+        np.testing.assert_array_equal(second.counts, first.counts)
+        self.assertEqual(second.education_stats(), first.education_stats())
+        self.assertEqual(second.age_bands, first.age_bands)
+
+    def test_invalid_input(self):
+        """필요한 열이 없거나 연령대를 해석할 수 없으면 CensusReferenceError"""
+        path = Path(self.tmp.name) / "broken.csv"
+        path.write_bytes("연도\n성별,연령별\n여자,15~19\n".encode("euc-kr"))
+        with self.assertRaises(CensusReferenceError):
+            load_census_counts(path, use_cache=False)
+        self.assertEqual(parse_age_band("　85세이상"), (85, None))
+        with self.assertRaises(CensusReferenceError):
+            parse_age_band("계")
+
+
+@unittest.skipUnless(REFERENCE_PATH.exists(), "참조 데이터가 없음")
+class TestCensusJointSampler(unittest.TestCase):
+    """참조 통계 결합 분포 샘플러 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        """테스트 설정"""
+        cls.generator = HierarchicalPersonaGenerator(str(REFERENCE_PATH))
+        cls.sampler = cls.generator.joint_sampler()
+
+    def test_joint_draw_preserves_cross_correlations(self):
+        """한 번의 추출로 얻은 (성별, 지역, 혼인, 교육) 결합 빈도가 인구수 텐서 비율과 같음"""
+        census = self.generator.census
+        codes = self.sampler.sample(400000, np.random.default_rng(2))
+        # 30~49세 고등학교 이상은 검증 규칙으로 제외되는 칸이 없으므로 인구수 비율 그대로 추출되어야 함
+        selected = (codes["age"] >= 30) & (codes["age"] <= 49)
+        bands = [band for band, (low, high) in enumerate(census.age_bands) if low >= 30 and high is not None and high <= 49]
+        expected = census.counts[:, :, bands][..., 1:].sum(axis=(2, 3))  # [성별, 행정구역, 교육]
+        observed = np.zeros_like(expected)
+        np.add.at(observed, (codes["gender"][selected], codes["region"][selected], codes["education"][selected] - 1), 1)
+        np.testing.assert_allclose(observed / observed.sum(), expected / expected.sum(), atol=0.002)
+
+        probabilities = self.sampler.probabilities()
+        self.assertAlmostEqual(float(probabilities.sum()), 1.0)
+        # 검증 규칙상 불가능한 조합(15~17세 대학교 이상, 미성년 기혼)은 확률 0
+        university = census.educations.index("대학교(4년제 이상)")
+        self.assertEqual(probabilities[:, :, 15:18, :, university:].sum(), 0.0)
+        self.assertEqual(probabilities[:, :, :18, census.marital_statuses.index("유배우")].sum(), 0.0)
+        self.assertEqual(probabilities[:, :, :15].sum(), 0.0)
+
+    def test_generated_personas_use_joint_distribution(self):
+        """참조 데이터가 있으면 생성된 페르소나의 지역/교육이 결합 분포에서 나오고 모두 검증을 통과"""
+        demographics = self.generator.sample_joint_demographics(1000, np.random.default_rng(4))
+        self.assertTrue(set(demographics["location"]) <= set(self.generator.census.regions))
+        self.assertTrue(set(demographics["gender"]) <= {"남성", "여성"})
+
+        personas = [self.generator.generate_persona() for _ in range(200)]
+        for persona in personas:
+            self.assertIn(persona['location'], self.generator.census.regions)
+            self.assertTrue(self.generator.validate_persona(persona)[0])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
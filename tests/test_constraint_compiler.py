@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+제약 조건 컴파일러 테스트
+========================
+
+검증 규칙에서 컴파일한 조건부 샘플링 테이블이 항상 유효한 조합만 만들고,
+불가능한 제약 조건은 생성 전에 거부하는지 확인
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from persona_generator import PersonaGenerator
+from constraint_compiler import InfeasibleConstraintsError
+
+
+class TestConstraintCompiler(unittest.TestCase):
+    """ConstraintCompiler 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.generator = PersonaGenerator()
+        self.rng = np.random.default_rng(7)
+
+    def _assert_all_valid(self, constraints, count=20000):
+        compiled = self.generator._compile_constraints(constraints)
+        batch = self.generator._compiled_demographics_batch(count, constraints, compiled, self.rng)
+        for demographics in self.generator._demographics_batch_to_dicts(batch):
+            result = self.generator.validator.validate_persona({"demographics": demographics})
+            self.assertTrue(result["is_valid"], f"무효한 조합 생성: {demographics} {result['errors']}")
+        return batch
+
+    def test_unconstrained_draws_are_valid(self):
+        """제약 없는 추출이 모두 검증을 통과하는지 확인"""
+        self._assert_all_valid({})
+
+    def test_tight_constraints_are_valid(self):
+        """좁은 연령 범위 + 결혼 상태 제약도 재시도 없이 유효해야 함"""
+        batch = self._assert_all_valid({"age_range": [16, 20], "marital_status": "기혼"}, count=2000)
+        self.assertTrue(np.all(batch["age"] >= 18))
+
+    def test_single_draw_is_valid(self):
+        """단일 추출 경로도 항상 유효해야 함"""
+        constraints = {"age_range": [7, 15]}
+        compiled = self.generator._compile_constraints(constraints)
+        for _ in range(500):
+            demographics = self.generator._generate_compiled_demographics(constraints, compiled)
+            result = self.generator.validator.validate_persona({"demographics": demographics})
+            self.assertTrue(result["is_valid"], result["errors"])
+
+    def test_infeasible_constraints_rejected_up_front(self):
+        """불가능한 제약 조건은 위반 규칙과 함께 즉시 거부"""
+        with self.assertRaises(InfeasibleConstraintsError) as context:
+            self.generator._compile_constraints({"age_range": [16, 18], "marital_status": "이혼"})
+        self.assertIn("age_marital", context.exception.violated_rules)
+
+        result = self.generator.generate_personas(count=50, demographics_constraints={
+            "age_range": [5, 10], "education": "대학원졸"})
+        self.assertEqual(len(result["personas"]), 0)
+        self.assertIn("age_education", result["generation_stats"]["infeasible_rules"])
+
+    def test_empty_string_overrides_are_unconstrained(self):
+        """빈 문자열 제약 값은 제약 없음으로 취급 (한 건/배치 생성, 실현 가능성 분석, 배치 추출 모두)"""
+        for field in ("gender", "location", "education", "marital_status", "income_bracket"):
+            constraints = {field: ""}
+            self.assertTrue(self.generator.analyze_feasibility(constraints).feasible)
+            for vectorized in (False, True):
+                result = self.generator.generate_personas(5, constraints, vectorized=vectorized)
+                self.assertEqual(len(result["personas"]), 5)
+                self.assertTrue(all(persona["demographics"][field] for persona in result["personas"]))
+            batch = self.generator.generate_demographics_batch(50, constraints, rng=self.rng)
+            self.assertNotIn("", batch["categories"][field])
+
+    def test_matches_rejection_sampling(self):
+        """컴파일된 분포가 '생성 후 검증' 방식의 분포와 일치하는지 확인"""
+        raw = self.generator.generate_demographics_batch(100000, rng=self.rng)
+        accepted = [
+            demographics for demographics in self.generator._demographics_batch_to_dicts(raw)
+            if self.generator.validator.validate_persona({"demographics": demographics})["is_valid"]
+        ]
+        compiled = self.generator._compile_constraints({})
+        batch = self.generator._compiled_demographics_batch(len(accepted), {}, compiled, self.rng)
+
+        self.assertAlmostEqual(np.mean([d["age"] for d in accepted]), batch["age"].mean(), delta=0.5)
+        married = compiled.categories["marital_status"].index("기혼")
+        self.assertAlmostEqual(
+            np.mean([d["marital_status"] == "기혼" for d in accepted]),
+            np.mean(batch["marital_status"] == married), delta=0.01)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+제약 조건 실현 가능성 분석 테스트
+================================
+
+불가능한 제약 조건은 위반 규칙과 함께 즉시 거부하고, 가능한 제약 조건은 수용률과 전략을 계산하는지 확인
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from persona_generator import PersonaGenerator
+
+
+class TestFeasibility(unittest.TestCase):
+    """analyze_feasibility 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.generator = PersonaGenerator()
+
+    def test_infeasible_constraints_report_rule(self):
+        """불가능한 조합은 위반 규칙과 함께 거부"""
+        report = self.generator.analyze_feasibility({"age_range": [5, 10], "education": "대학원졸"})
+        self.assertFalse(report.feasible)
+        self.assertEqual(report.violated_rules, ["age_education"])
+        self.assertIsNone(report.strategy)
+
+        report = self.generator.analyze_feasibility({"age_range": [16, 17], "marital_status": "사별"})
+        self.assertIn("age_marital", report.violated_rules)
+
+    def test_malformed_age_range(self):
+        """잘못된 age_range 형식은 컴파일 전에 거부"""
+        for age_range in ([10, 5], [10], "20-30", [1.5, 30]):
+            report = self.generator.analyze_feasibility({"age_range": age_range})
+            self.assertFalse(report.feasible, age_range)
+            self.assertEqual(report.violated_rules, ["age_range"])
+
+    def test_acceptance_rate_matches_rejection_sampling(self):
+        """추정 수용률이 '생성 후 검증' 방식의 실제 통과율과 일치"""
+        report = self.generator.analyze_feasibility({})
+        self.assertTrue(report.feasible)
+        self.assertEqual(report.strategy, "conditional")
+
+        raw = self.generator.generate_demographics_batch(50000, rng=np.random.default_rng(0))
+        accepted = np.mean([
+            self.generator.validator.validate_persona({"demographics": demographics})["is_valid"]
+            for demographics in self.generator._demographics_batch_to_dicts(raw)
+        ])
+        self.assertAlmostEqual(report.acceptance_rate, accepted, delta=0.01)
+
+    def test_feasible_space(self):
+        """가능한 연령 범위가 규칙으로 좁혀짐"""
+        report = self.generator.analyze_feasibility({"age_range": [16, 20], "marital_status": "기혼"})
+        self.assertTrue(report.feasible)
+        self.assertEqual(report.feasible_age_range, (18, 20))
+        self.assertGreater(report.feasible_combinations, 0)
+
+    def test_rejection_strategy_generates_valid_personas(self):
+        """rejection 전략이 선택되어도 모든 페르소나는 검증을 통과"""
+        with mock.patch("feasibility.REJECTION_MIN_ACCEPTANCE", 0.0):
+            result = self.generator.generate_personas(300, {"age_range": [30, 39]}, vectorized=True,
+                                                      rng=np.random.default_rng(1))
+        self.assertEqual(result["generation_stats"]["sampling_strategy"], "rejection")
+        self.assertEqual(len(result["personas"]), 300)
+        for persona in result["personas"]:
+            self.assertTrue(self.generator.validator.validate_persona(persona)["is_valid"])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+생성 지표 테스트
+===============
+
+generation_stats의 규칙별 거부 횟수, 재시도 깊이 히스토그램, 수용률과
+제약 조건 집합별 누적 지표를 확인
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from persona_generator import PersonaGenerator
+from rule_engine import violation_code
+
+
+class TestGenerationMetrics(unittest.TestCase):
+    """generation_stats 지표 및 GenerationMetricsRegistry 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.generator = PersonaGenerator()
+
+    def assertConsistent(self, stats):
+        self.assertEqual(sum(stats["retry_depth_histogram"]), stats["successful_generations"])
+        self.assertEqual(stats["accepted_draws"], stats["successful_generations"])
+        self.assertAlmostEqual(stats["acceptance_rate"], stats["accepted_draws"] / stats["draws"])
+
+    def test_batch_rejections_by_rule(self):
+        """rejection 전략에서는 거부된 추출이 규칙별로 집계됨"""
+        with mock.patch("feasibility.REJECTION_MIN_ACCEPTANCE", 0.0):
+            stats = self.generator.generate_personas(2000, vectorized=True,
+                                                     rng=np.random.default_rng(0))["generation_stats"]
+        self.assertConsistent(stats)
+        self.assertGreater(stats["draws"], stats["accepted_draws"])
+        self.assertGreater(stats["rule_rejections"]["age_occupation"], 0)
+        self.assertGreaterEqual(sum(stats["rule_rejections"].values()), stats["draws"] - stats["accepted_draws"])
+        self.assertGreater(stats["retry_depth_histogram"][1], 0)
+
+    def test_scalar_retry_depth(self):
+        """스칼라 경로: 재시도한 페르소나는 해당 시도 깊이에 집계"""
+        check_persona = self.generator.validator.check_persona
+        rejected = iter([([violation_code("age_marital", 2)], [])] * 2)
+        self.generator.validator.check_persona = lambda persona: next(rejected, None) or check_persona(persona)
+
+        stats = self.generator.generate_personas(5)["generation_stats"]
+        self.assertConsistent(stats)
+        self.assertEqual(stats["draws"], 7)
+        self.assertEqual(stats["rule_rejections"]["age_marital"], 2)
+        self.assertEqual(stats["retry_depth_histogram"][:3], [4, 0, 1])
+
+    def test_sharded_stats_merged(self):
+        """샤드별 지표가 합산됨"""
+        stats = self.generator.generate_personas(30, seed=1, shard_size=10, vectorized=True)["generation_stats"]
+        self.assertConsistent(stats)
+        self.assertEqual(stats["successful_generations"], 30)
+
+    def test_metrics_per_constraint_set(self):
+        """제약 조건 집합별 누적 지표, 수용률이 낮은 순으로 정렬"""
+        self.generator.generate_personas(10, vectorized=True)
+        self.generator.generate_personas(10, {"age_range": [30, 39]}, vectorized=True)
+        self.generator.generate_personas(10, {"age_range": [30, 39]}, vectorized=True)
+        self.generator.generate_personas(10, {"age_range": [5, 10], "education": "대학원졸"})
+        for _ in self.generator.iter_personas(20, chunk_size=10, demographics_constraints={"age_range": [30, 39]}):
+            pass
+
+        metrics = self.generator.generation_metrics()
+        by_constraints = {str(entry["constraints"]): entry for entry in metrics["constraint_sets"]}
+        self.assertEqual(by_constraints[str({"age_range": [30, 39]})]["requests"], 4)
+        self.assertEqual(by_constraints[str({"age_range": [30, 39]})]["successful_generations"], 40)
+        infeasible = metrics["constraint_sets"][0]
+        self.assertEqual(infeasible["infeasible_requests"], 1)
+        self.assertEqual(infeasible["infeasible_rules"], ["age_education"])
+        self.assertEqual(metrics["totals"]["successful_generations"], 50)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+생성 계획 캐시 테스트
+====================
+
+(연도, 제약 조건)별 GenerationPlan이 한 번만 컴파일되고 LRU로 재사용되는지 확인
+"""
+
+import pickle
+import threading
+import unittest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from persona_generator import PersonaGenerator
+from constraint_compiler import InfeasibleConstraintsError
+from generation_plan import GenerationPlanCache, parse_age_group
+
+
+class TestGenerationPlan(unittest.TestCase):
+    """GenerationPlan 및 캐시 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.generator = PersonaGenerator()
+
+    def test_parse_age_group(self):
+        """연령대 문자열 파싱"""
+        self.assertEqual(parse_age_group("20-29"), (20, 29))
+        self.assertEqual(parse_age_group("80+"), (80, 100))
+
+    def test_same_constraints_reuse_plan(self):
+        """같은 제약 조건(키 순서 무관)은 같은 계획을 재사용"""
+        first = self.generator.get_generation_plan({"age_range": [30, 39], "gender": "남성"})
+        second = self.generator.get_generation_plan({"gender": "남성", "age_range": [30, 39]})
+        self.assertIs(first, second)
+        self.assertEqual(first.overrides, {"gender": "남성"})
+        self.assertEqual(first.age_range, (30, 39))
+
+        other_year = self.generator.get_generation_plan({"age_range": [30, 39], "gender": "남성", "year": 2022})
+        self.assertIsNot(first, other_year)
+
+    def test_repeated_generation_skips_setup(self):
+        """반복 생성 시 연도 데이터 조회와 컴파일을 다시 하지 않음"""
+        calls = []
+        get_year_data = self.generator.ts_manager.get_year_data
+        self.generator.ts_manager.get_year_data = lambda year: calls.append(year) or get_year_data(year)
+
+        constraints = {"age_range": [20, 29], "location": "부산"}
+        self.generator.generate_personas(5, constraints)
+        self.generator.generate_personas(5, constraints, vectorized=True)
+        for _ in range(5):
+            self.generator._generate_demographics(constraints)
+        self.assertEqual(len(calls), 1)
+
+    def test_infeasible_plan_cached(self):
+        """만족 불가능한 제약 조건도 캐시되어 매번 같은 예외로 즉시 거부"""
+        constraints = {"age_range": [5, 10], "education": "대학원졸"}
+        for _ in range(2):
+            with self.assertRaises(InfeasibleConstraintsError):
+                self.generator._compile_constraints(constraints)
+        self.assertEqual(self.generator._plans.info()["misses"], 1)
+
+    def test_lru_eviction(self):
+        """최대 크기를 넘으면 가장 오래 사용하지 않은 계획부터 제거"""
+        cache = GenerationPlanCache(maxsize=2)
+        cache.get((2024, "a"), lambda: "plan-a")
+        cache.get((2024, "b"), lambda: "plan-b")
+        cache.get((2024, "a"), lambda: "rebuilt-a")
+        cache.get((2024, "c"), lambda: "plan-c")
+        self.assertEqual(cache.get((2024, "a"), lambda: "rebuilt-a"), "plan-a")
+        self.assertEqual(cache.get((2024, "b"), lambda: "rebuilt-b"), "rebuilt-b")
+
+    def test_concurrent_access(self):
+        """여러 스레드가 공유해도 LRU 순서와 크기가 유지되고, 같은 키는 같은 계획을 받음"""
+        cache = GenerationPlanCache(maxsize=8)
+
+        def worker(thread):
+            for step in range(2000):
+                cache.get((2024, str((thread * 7 + step) % 12)), lambda: object())
+
+        threads = [threading.Thread(target=worker, args=(thread,)) for thread in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = cache.info()
+        self.assertLessEqual(info["size"], 8)
+        self.assertEqual(info["hits"] + info["misses"], 8 * 2000)
+
+        shared = {}
+        barrier = threading.Barrier(4)
+
+        def same_key(index):
+            barrier.wait()
+            shared[index] = cache.get((2025, "same"), lambda: object())
+
+        threads = [threading.Thread(target=same_key, args=(index,)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len({id(plan) for plan in shared.values()}), 1)
+        self.assertEqual(len(pickle.loads(pickle.dumps(cache))), len(cache))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+계층적 생성기 배치 경로 테스트
+==============================
+
+generate_persona_columns가 한 건씩 생성하는 generate_persona와 같은 분포/제약조건을 따르는지 확인
+"""
+
+import collections
+import json
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from rule_packs import DEFAULT_RULE_PACK_PATH, parse_rule_pack
+from src.hierarchical_persona_generator import (
+    AGE_MEAN, GENDER_ORDER, REQUIRED_FIELDS, EducationLevel, Gender, HierarchicalPersonaGenerator,
+    MaritalStatus
+)
+
+
+class TestHierarchicalBatch(unittest.TestCase):
+    """배치 경로 테스트 (참조 데이터 없이 기본 분포 사용)"""
+
+    @classmethod
+    def setUpClass(cls):
+        """테스트 설정"""
+        cls.generator = HierarchicalPersonaGenerator()
+        cls.columns = cls.generator.generate_persona_columns(40000, np.random.default_rng(7))
+
+    def test_batch_personas_are_valid(self):
+        """배치로 만든 페르소나는 모두 필수 필드를 갖고 검증을 통과"""
+        personas = self.generator.generate_personas(2000, rng=np.random.default_rng(1))
+        self.assertEqual(len(personas), 2000)
+        for persona in personas:
+            self.assertTrue(set(REQUIRED_FIELDS) <= set(persona))
+            self.assertIsInstance(persona['age'], int)
+            is_valid, errors = self.generator.validate_persona(persona)
+            self.assertTrue(is_valid, errors)
+        violations = self.generator.validate_batch(personas)
+        self.assertTrue(all((codes == 0).all() for codes in violations.values()))
+
+    def test_seeded_reproducibility(self):
+        """같은 Generator 시드와 같은 샤드 크기는 같은 결과"""
+        first = self.generator.generate_personas(500, rng=np.random.default_rng(3))
+        second = self.generator.generate_personas(500, rng=np.random.default_rng(3))
+        self.assertEqual(first, second)
+        sharded = self.generator.generate_personas(300, seed=5, vectorized=True, shard_size=100)
+        parallel = self.generator.generate_personas(300, seed=5, vectorized=True, shard_size=100, workers=2)
+        self.assertEqual(sharded, parallel)
+        chunks = list(self.generator.iter_personas(300, chunk_size=100, seed=5, vectorized=True))
+        self.assertEqual([persona for chunk in chunks for persona in chunk], sharded)
+
+    def test_truncated_normal_age(self):
+        """연령은 15-65세로 절단된 정규분포"""
+        age = self.columns['age']
+        self.assertGreaterEqual(age.min(), 15)
+        self.assertLessEqual(age.max(), 65)
+        self.assertAlmostEqual(age.mean(), AGE_MEAN, delta=1.0)
+
+    def test_distributions_match_conditional_tables(self):
+        """조건부 교육/혼인 분포는 한 건 추출과 같은 조건부 확률표를 따름"""
+        age, gender = self.columns['age'], self.columns['gender']
+        female = GENDER_ORDER.index(Gender.FEMALE)
+        for value, table, field in ((30, self.generator.education_table, 'education'),
+                                    (32, self.generator.marital_table, 'marital_status')):
+            selected = (age == value) & (gender == Gender.FEMALE.value)
+            self.assertGreater(selected.sum(), 300)
+            counts = collections.Counter(self.columns[field][selected])
+            observed = np.array([counts[level.value] for level in table.levels]) / selected.sum()
+            np.testing.assert_allclose(observed, table.row(value, female), atol=0.06)
+
+        # 19세 이하는 학생/아르바이트, 소득은 연령대 상한 이하
+        teen = age <= 19
+        self.assertTrue(set(self.columns['occupation'][teen]) <= {"학생", "아르바이트"})
+        self.assertTrue((self.columns['income'][teen] <= 1000000).all())
+
+
+class TestConditionalTables(unittest.TestCase):
+    """교육/혼인 조건부 확률표와 직업 호환 행렬 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.generator = HierarchicalPersonaGenerator()
+
+    def test_tables_mask_invalid_levels(self):
+        """확률표는 행마다 합이 1이고, 연령 제약조건상 유효하지 않은 수준은 확률 0"""
+        for table, valid_levels in ((self.generator.education_table, 'valid_education_levels'),
+                                    (self.generator.marital_table, 'valid_marital_statuses')):
+            np.testing.assert_allclose(table.probabilities.sum(axis=2), 1.0)
+            for band, (min_age, max_age) in enumerate(table.age_bands):
+                for age in (min_age, max_age):
+                    valid = getattr(self.generator.get_age_group_constraints(age), valid_levels)
+                    invalid = [code for code, level in enumerate(table.levels) if level not in valid]
+                    self.assertEqual(table.probabilities[band][:, invalid].sum(), 0.0)
+            with self.assertRaises(ValueError):
+                table.row(14, 0)
+        # 19세 미만 기혼은 불가능, 65세 이상은 마지막 연령대를 사용
+        married = self.generator.marital_table.levels.index(MaritalStatus.MARRIED)
+        self.assertEqual(self.generator.marital_table.row(18, 0)[married], 0.0)
+        np.testing.assert_array_equal(self.generator.education_table.row(120, 1),
+                                      self.generator.education_table.row(100, 1))
+
+    def test_scalar_draws_follow_table(self):
+        """한 건 추출도 같은 확률표 행에서 추출"""
+        self.generator.rng = np.random.default_rng(8)
+        table = self.generator.education_table
+        draws = [table.levels.index(self.generator.sample_education_by_age_gender(45, Gender.MALE))
+                 for _ in range(20000)]
+        np.testing.assert_allclose(np.bincount(draws, minlength=len(table.levels)) / 20000,
+                                   table.row(45, GENDER_ORDER.index(Gender.MALE)), atol=0.015)
+
+    def test_occupation_matrix(self):
+        """직업 호환 행렬: 후보는 같은 확률이고 교육 요구사항을 지키며, 감사용 목록과 배치 추출이 행렬을 따름"""
+        table = self.generator.occupation_table
+        self.assertEqual(table.keys, list(EducationLevel))
+        np.testing.assert_allclose(table.probabilities.sum(axis=2), 1.0)
+        high_school = table.keys.index(EducationLevel.HIGH_SCHOOL)
+        self.assertEqual(table.candidates(18, high_school), {"학생": 0.5, "아르바이트": 0.5})
+        self.assertEqual(set(table.candidates(70, high_school)), {"은퇴", "무직", "자영업"})
+        for education in (EducationLevel.HIGH_SCHOOL, EducationLevel.UNIVERSITY):
+            for occupation in table.candidates(35, table.keys.index(education)):
+                required = self.generator.occupation_education_requirements.get(occupation)
+                self.assertTrue(required is None or education in required, occupation)
+
+        records = table.to_records()
+        self.assertEqual(len(records), len(table.age_bands) * len(table.keys))
+        self.assertEqual(records[0]['key'], EducationLevel.MIDDLE_SCHOOL.value)
+
+        age = np.full(20000, 35)
+        education = np.full(20000, table.keys.index(EducationLevel.UNIVERSITY))
+        codes = table.draw_codes(age, education, np.random.default_rng(9))
+        np.testing.assert_allclose(np.bincount(codes, minlength=len(table.levels)) / 20000,
+                                   table.row(35, education[0]), atol=0.015)
+
+    def test_tables_follow_rule_pack(self):
+        """규칙 팩이 바뀌면 확률표를 다시 만듦"""
+        data = json.loads(DEFAULT_RULE_PACK_PATH.read_text(encoding="utf-8"))
+        for constraints in data["hierarchical"]["age_constraints"]:
+            if constraints["min_age"] == 30:
+                constraints["valid_education_levels"] = [EducationLevel.HIGH_SCHOOL.value]
+        self.generator.apply_rule_pack(parse_rule_pack(data, "high-school-only"))
+        high_school = self.generator.education_table.levels.index(EducationLevel.HIGH_SCHOOL)
+        self.assertEqual(self.generator.education_table.row(35, 0)[high_school], 1.0)
+
+    def test_fallback_tables_are_cached(self):
+        """대체 페르소나 확률표는 한 번만 만들고, 규칙 팩이 바뀌면 다시 만듦"""
+        tables = self.generator._fallback_tables()
+        self.generator._draw_fallback_columns(100, np.random.default_rng(4))
+        self.assertIs(self.generator._fallback_tables()[0], tables[0])
+        self.assertIs(self.generator._fallback_tables()[1], tables[1])
+
+        education, _ = tables
+        university = education.levels.index(EducationLevel.UNIVERSITY)
+        high_school = education.levels.index(EducationLevel.HIGH_SCHOOL)
+        self.assertAlmostEqual(education.row(30, 0)[university] + education.row(30, 0)[high_school], 1.0)
+
+        data = json.loads(DEFAULT_RULE_PACK_PATH.read_text(encoding="utf-8"))
+        self.generator.apply_rule_pack(parse_rule_pack(data, "reloaded"))
+        self.assertIsNot(self.generator._fallback_tables()[0], tables[0])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+페르소나 ID 할당기 테스트
+========================
+
+대량/병렬 생성과 DB 저장에서 ID가 충돌하지 않는지 확인
+"""
+
+import unittest
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from id_allocator import BlockIdAllocator, LocalIdBlockStore, TimeWorkerIdAllocator
+from database import SQLiteDatabase
+from persona_generator import PersonaGenerator
+
+
+class TestIdAllocator(unittest.TestCase):
+    """IdAllocator 구현 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self.temp_dir.name) / "personas.db")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_time_worker_ids_unique(self):
+        """같은 할당기의 단건/블록 할당과 다른 워커 간에 ID가 겹치지 않아야 함"""
+        first = TimeWorkerIdAllocator(worker_id=1)
+        second = TimeWorkerIdAllocator(worker_id=2)
+        ids = [first.allocate() for _ in range(5000)] + list(first.reserve(50000))
+        ids += [second.allocate() for _ in range(5000)]
+        self.assertEqual(len(set(ids)), len(ids))
+
+    def test_time_worker_copy_uses_new_worker(self):
+        """자동 워커 ID 할당기를 복사하면 원본과 다른 워커 ID를 사용"""
+        allocator = TimeWorkerIdAllocator()
+        allocator.allocate()
+        copied = pickle.loads(pickle.dumps(allocator))
+        self.assertNotEqual(allocator.worker_id, copied.worker_id)
+
+    def test_sqlite_blocks_disjoint_across_connections(self):
+        """같은 DB 파일을 쓰는 두 인스턴스의 블록 할당이 겹치지 않아야 함"""
+        first = BlockIdAllocator(SQLiteDatabase(self.db_path), block_size=100)
+        second = BlockIdAllocator(SQLiteDatabase(self.db_path), block_size=100)
+        ids = []
+        for _ in range(3):
+            ids += [first.allocate() for _ in range(150)]
+            ids += [second.allocate() for _ in range(150)]
+            ids += list(first.reserve(70))
+        self.assertEqual(len(set(ids)), len(ids))
+
+    def test_bulk_generation_never_loses_rows(self):
+        """대량 생성 ID가 모두 유일하고 DB에 빠짐없이 저장되어야 함"""
+        db = SQLiteDatabase(self.db_path)
+        generator = PersonaGenerator(id_allocator=BlockIdAllocator(db))
+        result = generator.generate_personas(3000, vectorized=True)
+        ids = [persona["id"] for persona in result["personas"]]
+        self.assertEqual(len(set(ids)), 3000)
+        self.assertEqual(db.insert_personas(result["personas"]), 3000)
+        self.assertEqual(db.get_total_count(), 3000)
+
+    def test_sharded_ids_contiguous(self):
+        """샤드 생성 ID는 하나의 예약 블록에서 순서대로 나와야 함"""
+        generator = PersonaGenerator(id_allocator=BlockIdAllocator(LocalIdBlockStore(start=1)))
+        result = generator.generate_personas(250, seed=1, workers=2, shard_size=100, vectorized=True)
+        self.assertEqual([persona["id"] for persona in result["personas"]], [str(i) for i in range(1, 251)])
+
+    def test_missing_id_assigned_on_insert(self):
+        """ID 없이 삽입한 페르소나는 DB 할당기에서 ID를 받음"""
+        db = SQLiteDatabase(self.db_path)
+        persona = PersonaGenerator().generate_persona()
+        del persona["id"]
+        self.assertTrue(db.insert_persona(persona))
+        self.assertIsNotNone(db.get_persona(persona["id"]))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
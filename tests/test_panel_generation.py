@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+패널(종단) 생성 테스트
+======================
+
+기준 연도 인구를 나이 들게 하며 만든 연도별 인구가 ID를 유지하고, 그 해 연령 분포와 검증 규칙을 따르는지 확인
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from persona_batch import PersonaBatch
+from persona_generator import PersonaGenerator
+from panel_generation import _apportion
+
+
+class TestPanelGeneration(unittest.TestCase):
+    """패널 생성 테스트"""
+
+    @classmethod
+    def setUpClass(cls):
+        """테스트 설정: 작은 패널을 한 번 생성"""
+        cls.generator = PersonaGenerator()
+        cls.panel = cls.generator.generate_panel(3000, 2022, 2026, seed=11)
+
+    def _matched(self, before, after):
+        """두 연도에 모두 있는 사람의 (이전 인덱스, 이후 인덱스)"""
+        position = {persona_id: index for index, persona_id in enumerate(after.ids)}
+        pairs = [(index, position[persona_id]) for index, persona_id in enumerate(before.ids) if persona_id in position]
+        return np.array(pairs).T
+
+    def test_survivors_keep_identity(self):
+        """생존자는 ID, 성별, 지역이 유지되고 매년 한 살씩 늘며 학력이 낮아지지 않음"""
+        self.assertEqual(self.panel.years, list(range(2022, 2027)))
+        for year in self.panel.years[1:]:
+            before, after = self.panel[year - 1], self.panel[year]
+            previous, current = self._matched(before, after)
+            self.assertGreater(len(previous), 0.8 * len(before))
+            np.testing.assert_array_equal(after.age[current], before.age[previous] + 1)
+            for field in ("gender", "location"):
+                np.testing.assert_array_equal(after.codes[field][current], before.codes[field][previous])
+            self.assertTrue((after.codes["education"][current] >= before.codes["education"][previous]).all())
+            events = self.panel.events[year]
+            self.assertEqual(events["population"], 3000)
+            self.assertEqual(events["deaths"], len(before) - len(previous))
+
+    def test_waves_follow_year_distribution_and_rules(self):
+        """기준 연도 이후 연령대 인원이 그 해 age_distribution 배분과 같고, 모든 사람이 검증 규칙을 통과"""
+        for year, batch in self.panel:
+            validation = self.generator.validator.validate_batch(batch.age, batch.codes, batch.categories)
+            self.assertTrue(validation["is_valid"].all())
+            self.assertEqual(len(set(batch.ids)), len(batch))
+            if year == self.panel.years[0]:
+                continue
+            plan = self.generator.get_generation_plan({"year": year})
+            weights = np.array([plan.age_distribution[group] for group in plan.age_group_sampler.items])
+            counts = [int(((batch.age >= low) & (batch.age <= high)).sum()) for low, high in plan.age_group_bounds.tolist()]
+            self.assertEqual(counts, _apportion(len(batch), weights).tolist())
+
+    def test_seed_and_constraints(self):
+        """같은 시드는 같은 패널을 만들고, 연령 범위 제약은 지원하지 않음"""
+        first = self.generator.generate_panel(500, 2024, 2026, seed=3)
+        second = self.generator.generate_panel(500, 2024, 2026, seed=3)
+        for year in first.years:
+            np.testing.assert_array_equal(first[year].age, second[year].age)
+            self.assertEqual(first[year].decode("occupation"), second[year].decode("occupation"))
+
+        constrained = self.generator.generate_panel(300, 2024, 2025, {"gender": "여성"}, seed=3)
+        self.assertEqual(set(constrained[2025].decode("gender")), {"여성"})
+        with self.assertRaises(ValueError):
+            self.generator.generate_panel(100, 2024, 2025, {"age_range": (20, 30)})
+
+    def test_concatenate_recodes_categories(self):
+        """코드표가 다른 묶음을 이어 붙이면 첫 묶음 코드표 기준으로 다시 코딩"""
+        batch = self.panel[2022].take(np.arange(4))
+        other = batch.take(np.arange(4))
+        labels = other.categories["gender"]
+        other.categories = dict(other.categories, gender=list(reversed(labels)))
+        other.codes = dict(other.codes, gender=(len(labels) - 1 - other.codes["gender"]).astype(other.codes["gender"].dtype))
+        merged = PersonaBatch.concatenate([batch, other])
+        self.assertEqual(merged.decode("gender"), batch.decode("gender") * 2)
+        self.assertEqual(merged.ids, list(batch.ids) * 2)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
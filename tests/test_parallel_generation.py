@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+병렬 샤드 생성 테스트
+====================
+
+마스터 시드가 같으면 워커 수와 무관하게 같은 결과가 나오는지 확인
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import parallel_generation
+from parallel_generation import iter_sharded, plan_shards
+from persona_generator import PersonaGenerator
+from src.hierarchical_persona_generator import HierarchicalPersonaGenerator
+
+
+def _without_timestamps(result):
+    # ID는 호출마다 새 블록에서 예약되므로 비교에서 제외
+    return [{k: v for k, v in persona.items() if k not in ("id", "name", "created_at")}
+            for persona in result["personas"]]
+
+
+class _CountingPayload:
+    """pickle될 때마다 횟수를 세는 payload (부모 프로세스에서 세어짐)"""
+    pickled = 0
+
+    def __getstate__(self):
+        type(self).pickled += 1
+        return self.__dict__
+
+
+def _shard_size(task):
+    payload, shard_index, start, size, seed_sequence = task
+    return shard_index, size, type(payload).__name__
+
+
+class TestParallelGeneration(unittest.TestCase):
+    """샤드 분할 및 재현성 테스트"""
+
+    def test_plan_shards(self):
+        """샤드 분할이 전체 수를 빠짐없이 나누는지 확인"""
+        self.assertEqual(plan_shards(25, 10), [(0, 10), (10, 10), (20, 5)])
+        self.assertEqual(plan_shards(0, 10), [])
+
+    def test_payload_sent_once_per_worker(self):
+        """payload는 샤드마다가 아니라 워커 프로세스마다 한 번만 전달"""
+        _CountingPayload.pickled = 0
+        results = list(iter_sharded(_shard_size, _CountingPayload(), 95, seed=1, workers=2, shard_size=10))
+        self.assertEqual(results, [(index, 10 if index < 9 else 5, "_CountingPayload") for index in range(10)])
+        self.assertLessEqual(_CountingPayload.pickled, 2)
+
+    def test_seed_alone_runs_sequentially(self):
+        """workers 없이 seed만 지정하면 프로세스 풀 없이 현재 프로세스에서 샤드 생성"""
+        with mock.patch("os.cpu_count", return_value=32), \
+                mock.patch.object(parallel_generation, "ProcessPoolExecutor", side_effect=AssertionError("풀 생성")):
+            result = PersonaGenerator().generate_personas(30, seed=1, shard_size=10)
+            personas = HierarchicalPersonaGenerator().generate_personas(30, seed=1, shard_size=10)
+        self.assertEqual(len(result["personas"]), 30)
+        self.assertEqual(len(personas), 30)
+
+    def test_persona_generator_reproducible_across_workers(self):
+        """PersonaGenerator: 같은 시드는 워커 수와 무관하게 같은 결과"""
+        generator = PersonaGenerator()
+        sequential = generator.generate_personas(600, seed=11, workers=1, shard_size=200, vectorized=True)
+        parallel = generator.generate_personas(600, seed=11, workers=3, shard_size=200, vectorized=True)
+
+        self.assertEqual(len(sequential["personas"]), 600)
+        self.assertEqual(_without_timestamps(sequential), _without_timestamps(parallel))
+        self.assertEqual(sequential["generation_stats"], parallel["generation_stats"])
+
+    def test_different_seeds_differ(self):
+        """다른 시드는 다른 결과"""
+        generator = PersonaGenerator()
+        first = generator.generate_personas(50, seed=1, workers=1, vectorized=True)
+        second = generator.generate_personas(50, seed=2, workers=1, vectorized=True)
+        self.assertNotEqual(_without_timestamps(first), _without_timestamps(second))
+
+    def test_hierarchical_generator_reproducible_across_workers(self):
+        """HierarchicalPersonaGenerator: 같은 시드는 워커 수와 무관하게 같은 결과"""
+        generator = HierarchicalPersonaGenerator()
+        sequential = generator.generate_personas(300, seed=5, workers=1, shard_size=100)
+        parallel = generator.generate_personas(300, seed=5, workers=3, shard_size=100)
+
+        self.assertEqual(len(sequential), 300)
+        self.assertEqual(sequential, parallel)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
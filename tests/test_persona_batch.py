@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+PersonaBatch 테스트
+==================
+
+열 지향 페르소나 묶음이 기존 딕셔너리 구조를 그대로 재현하고, 분포가 스칼라 경로와 일치하는지 확인
+"""
+
+import unittest
+import sys
+from pathlib import Path
+from collections import Counter
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from persona_generator import PersonaGenerator
+from persona_batch import PersonaBatch
+
+
+class TestPersonaBatch(unittest.TestCase):
+    """PersonaBatch 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.generator = PersonaGenerator()
+        self.rng = np.random.default_rng(3)
+
+    def test_dicts_match_legacy_structure(self):
+        """to_dicts() 결과가 generate_persona와 같은 키 구조를 가지고 검증을 통과해야 함"""
+        batch = self.generator.generate_persona_batch(500, rng=self.rng)
+        legacy = self.generator.generate_persona()
+        personas = batch.to_dicts()
+
+        self.assertEqual(len(batch), 500)
+        for persona in personas:
+            self.assertEqual(list(persona), list(legacy))
+            self.assertEqual(list(persona["demographics"]), list(legacy["demographics"]))
+            self.assertEqual(list(persona["psychological_attributes"]), list(legacy["psychological_attributes"]))
+            self.assertEqual(list(persona["behavioral_patterns"]), list(legacy["behavioral_patterns"]))
+            self.assertTrue(self.generator.validator.validate_persona(persona)["is_valid"])
+        self.assertEqual(len({persona["id"] for persona in personas}), 500)
+
+    def test_indexing_and_take(self):
+        """인덱싱/슬라이스/마스크 선택이 to_dicts()와 일치해야 함"""
+        batch = self.generator.generate_persona_batch(50, rng=self.rng)
+        personas = batch.to_dicts()
+        self.assertEqual(batch[7], personas[7])
+        self.assertEqual(batch[-1], personas[-1])
+        self.assertEqual(batch[10:20].to_dicts(), personas[10:20])
+
+        seoul = batch.take(np.array(batch.decode("location")) == "서울")
+        self.assertIsInstance(seoul, PersonaBatch)
+        self.assertTrue(all(persona["demographics"]["location"] == "서울" for persona in seoul))
+
+    def test_multi_hot_matches_scalar_distribution(self):
+        """비트마스크 샘플링이 스칼라 경로와 같은 분포를 따라야 함 (관심사 수, 세대별 가치관)"""
+        batch = self.generator.generate_persona_batch(20000, rng=self.rng)
+        counts = Counter(len(interests) for interests in batch.decode_labels("interests"))
+        for k in range(3, 7):
+            self.assertAlmostEqual(counts[k] / len(batch), 0.25, delta=0.02)
+
+        young = (batch.age >= 10) & (batch.age <= 24)
+        self.assertTrue(np.all(batch.has("values", "디지털 네이티브")[young]))
+        self.assertFalse(np.any(batch.has("values", "디지털 네이티브")[batch.age >= 60]))
+
+    def test_iter_personas_as_batches(self):
+        """iter_personas(as_batches=True)는 같은 시드의 딕셔너리 청크와 같은 크기의 PersonaBatch를 내보냄"""
+        chunks = list(self.generator.iter_personas(250, chunk_size=100, seed=5, as_batches=True))
+        self.assertTrue(all(isinstance(chunk, PersonaBatch) for chunk in chunks))
+        self.assertEqual([len(chunk) for chunk in chunks], [100, 100, 50])
+        self.assertLess(chunks[0].nbytes / len(chunks[0]), 200)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
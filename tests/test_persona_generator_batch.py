@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+PersonaGenerator 배치 생성 테스트
+================================
+
+NumPy 배치 인구통계 샘플링과 배치 모드 generate_personas 검증
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from persona_generator import PersonaGenerator
+
+
+class TestDemographicsBatch(unittest.TestCase):
+    """배치 인구통계 샘플링 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.generator = PersonaGenerator()
+        self.rng = np.random.default_rng(42)
+
+    def test_batch_shapes_and_codes(self):
+        """모든 속성이 같은 길이의 배열이고 코드가 코드표 범위 안에 있는지 확인"""
+        batch = self.generator.generate_demographics_batch(5000, rng=self.rng)
+        categories = batch["categories"]
+
+        self.assertEqual(len(batch["age"]), 5000)
+        for field, labels in categories.items():
+            self.assertEqual(len(batch[field]), 5000)
+            self.assertTrue(np.all(batch[field] >= 0))
+            self.assertTrue(np.all(batch[field] < len(labels)))
+
+    def test_age_dependent_branches(self):
+        """연령별 교육/직업/소득 분기가 배치에서도 유지되는지 확인"""
+        batch = self.generator.generate_demographics_batch(20000, rng=self.rng)
+        categories = batch["categories"]
+        ages = batch["age"]
+
+        education = np.array(categories["education"])[batch["education"]]
+        occupation = np.array(categories["occupation"])[batch["occupation"]]
+        income = np.array(categories["income_bracket"])[batch["income_bracket"]]
+
+        self.assertTrue(np.all(education[ages <= 6] == "없음"))
+        self.assertTrue(np.all(occupation[(ages > 6) & (ages <= 12)] == "초등학생"))
+        self.assertTrue(np.all(occupation[(ages > 12) & (ages <= 15)] == "중학생"))
+        self.assertTrue(np.all(income[ages <= 18] == "하위 20%"))
+
+    def test_constraints_applied(self):
+        """제약 조건이 배치 전체에 적용되는지 확인"""
+        batch = self.generator.generate_demographics_batch(
+            1000, {"age_range": [30, 39], "gender": "남성", "location": "부산"}, rng=self.rng)
+        categories = batch["categories"]
+
+        self.assertTrue(np.all((batch["age"] >= 30) & (batch["age"] <= 39)))
+        self.assertTrue(np.all(batch["gender"] == categories["gender"].index("남성")))
+        self.assertTrue(np.all(batch["location"] == categories["location"].index("부산")))
+
+    def test_vectorized_generate_personas(self):
+        """배치 모드 generate_personas가 검증된 페르소나만 반환하는지 확인"""
+        result = self.generator.generate_personas(count=200, vectorized=True, rng=self.rng)
+
+        self.assertEqual(len(result["personas"]), 200)
+        for persona in result["personas"]:
+            self.assertTrue(self.generator.validator.validate_persona(persona)["is_valid"])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+검증 규칙 엔진 테스트
+====================
+
+직업 규칙 색인이 부분 문자열 매칭과 같은 결과를 내고, 위반이 정수 코드로 반환되며
+메시지는 요청할 때 기존 형식으로 만들어지는지 확인
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from persona_validator import PersonaValidator
+from rule_engine import SubstringRuleIndex, decode_violation, violation_code
+
+
+class TestRuleEngine(unittest.TestCase):
+    """CompiledRules 및 PersonaValidator.check_persona 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.validator = PersonaValidator()
+
+    def test_index_matches_substring_search(self):
+        """색인 결과가 모든 키에 대한 `key in label` 검사와 같음"""
+        keys = list(self.validator.validation_rules["age_occupation_rules"]) + ["의사", "교수", "사"]
+        index = SubstringRuleIndex(keys)
+        for label in ("기타 무직", "무직", "대학원생", "전문직(의사, 변호사 등)", "교수", "회사원", "", "사"):
+            expected = tuple(entry for entry, key in enumerate(keys) if key in label)
+            self.assertEqual(index.match(label), expected, label)
+            self.assertEqual(index.match(label), expected, label)  # 두 번째는 완전 일치 사전에서 조회
+
+    def test_violation_codes(self):
+        """위반은 (규칙, 규칙 사전 항목 번호) 코드로 반환"""
+        persona = {"demographics": {"age": 12, "occupation": "대학생", "education": "대졸",
+                                    "marital_status": "기혼", "income_bracket": "상위 20%"}}
+        errors, warnings = self.validator.check_persona(persona)
+        rules = self.validator.validation_rules
+        self.assertEqual([decode_violation(code) for code in errors], [
+            ("age_occupation", list(rules["age_occupation_rules"]).index("대학생") + 1),
+            ("age_education", list(rules["age_education_rules"]).index("대졸") + 1),
+            ("age_marital", list(rules["age_marital_rules"]).index("기혼") + 1),
+            ("age_income", 1)
+        ])
+        self.assertEqual(warnings, [])
+        self.assertEqual(decode_violation(violation_code("age_limits")), ("age_limits", 1))
+        self.assertEqual(self.validator.check_persona({"demographics": {"age": 40, "occupation": "교사"}}), ([], []))
+
+    def test_lazy_messages(self):
+        """메시지는 기존 validate_persona 형식으로 렌더링"""
+        persona = {"demographics": {"age": 12, "occupation": "대학생", "education": "대졸",
+                                    "marital_status": "기혼", "income_bracket": "상위 20%"}}
+        self.assertEqual(self.validator.validate_persona(persona), {
+            "is_valid": False,
+            "errors": [
+                "연령-직업 불일치: 12세 대학생 (적정연령: 18-28세)",
+                "연령-교육수준 불일치: 12세 대졸 (최소연령: 22세)",
+                "연령-결혼상태 불일치: 12세 기혼 (최소연령: 18세)",
+                "연령-소득 불일치: 12세는 하위 20% 소득만 가능 (현재: 상위 20%)"
+            ],
+            "warnings": []
+        })
+
+        persona = {"demographics": {"age": 45, "occupation": "교수", "education": "대졸"}}
+        result = self.validator.validate_persona(persona)
+        self.assertTrue(result["is_valid"])
+        self.assertEqual(result["warnings"], ["교육수준-직업 권장사항 불일치: 교수은 보통 대학원졸 수준을 요구함 (현재: 대졸)"])
+
+        self.assertEqual(self.validator.validate_persona({"demographics": {"age": None}})["errors"],
+                         ["나이가 유효 범위를 벗어남: None세"])
+        self.assertEqual(self.validator.validate_persona({"demographics": {"age": "스무살"}})["is_valid"], False)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+검증 규칙 팩 테스트
+==================
+
+규칙 팩 파일 로드, 내용 해시 기반 컴파일 캐시, 실행 중 규칙 교체를 확인
+"""
+
+import json
+import os
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import rule_packs
+from rule_packs import DEFAULT_RULE_PACK_PATH, RulePackError, RulePackWatcher, load_rule_pack
+from persona_validator import PersonaValidator
+from src.hierarchical_persona_generator import HierarchicalPersonaGenerator, EducationLevel
+
+
+class TestRulePacks(unittest.TestCase):
+    """규칙 팩 로드/캐시/교체 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache_dir = Path(self.tmp.name) / "cache"
+        self.pack_path = Path(self.tmp.name) / "rules.json"
+        self.data = json.loads(DEFAULT_RULE_PACK_PATH.read_text(encoding="utf-8"))
+        self._write(self.data)
+
+    def _write(self, data, mtime=None):
+        self.pack_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        if mtime is not None:
+            os.utime(self.pack_path, ns=(mtime, mtime))
+
+    def test_default_pack(self):
+        """기본 규칙 팩이 두 생성기의 규칙으로 적용됨"""
+        pack = load_rule_pack()
+        self.assertEqual(pack.name, "korea-default")
+        self.assertEqual(sorted(pack.validation_rules["age_income_rules"]), [0, 7, 13, 16])
+
+        validator = PersonaValidator()
+        self.assertIs(validator.rule_pack, pack)
+        self.assertEqual(validator.validation_rules["age_marital_rules"]["기혼"]["min_age"], 18)
+
+        generator = HierarchicalPersonaGenerator()
+        self.assertEqual(list(generator.age_constraints)[0], (15, 19))
+        self.assertEqual(generator.get_age_group_constraints(70).max_income, 5000000)
+        self.assertEqual(generator.occupation_education_requirements["교수"],
+                         [EducationLevel.MASTER, EducationLevel.DOCTORATE])
+
+    def test_compiled_cache_keyed_by_content_hash(self):
+        """같은 내용은 디스크 캐시에서 읽고 컴파일하지 않음, 내용이 바뀌면 새 캐시"""
+        pack = load_rule_pack(self.pack_path, self.cache_dir)
+        self.assertTrue(rule_packs._cache_path(self.cache_dir, pack.content_hash).exists())
+
+        with mock.patch.dict(rule_packs._loaded_packs, clear=True), \
+                mock.patch("rule_packs.parse_rule_pack", side_effect=AssertionError("recompiled")):
+            cached = load_rule_pack(self.pack_path, self.cache_dir)
+        self.assertEqual(cached.content_hash, pack.content_hash)
+        self.assertEqual(cached.validation_rules, pack.validation_rules)
+        self.assertEqual(cached.hierarchical, pack.hierarchical)
+        self.assertEqual(cached.compiled_rules.check({"age": 15, "marital_status": "기혼"}),
+                         pack.compiled_rules.check({"age": 15, "marital_status": "기혼"}))
+
+        self.data["version"] = "2024.2"
+        self._write(self.data)
+        self.assertNotEqual(load_rule_pack(self.pack_path, self.cache_dir).content_hash, pack.content_hash)
+        self.assertEqual(len(list(self.cache_dir.glob("*.json"))), 2)
+
+    def test_compiled_cache_is_not_executable_and_versioned(self):
+        """캐시는 코드를 실행하지 않는 JSON이고, 컴파일러 버전이 다르거나 손상된 캐시는 다시 컴파일"""
+        loaded = mock.patch.dict(rule_packs._loaded_packs, clear=True)
+        loaded.start()
+        self.addCleanup(loaded.stop)
+        pack = load_rule_pack(self.pack_path, use_cache=False)
+        # 이전 형식의 pickle 캐시는 읽지 않음
+        legacy = self.cache_dir / f"{pack.content_hash}-v1.pickle"
+        legacy.parent.mkdir(parents=True)
+        legacy.write_bytes(b"not a pickle")
+        with mock.patch("pickle.load", side_effect=AssertionError("unpickled")):
+            load_rule_pack(self.pack_path, self.cache_dir)
+        cache_path = rule_packs._cache_path(self.cache_dir, pack.content_hash)
+        self.assertEqual(json.loads(cache_path.read_text(encoding="utf-8"))["compiler_version"],
+                         rule_packs.RULE_COMPILER_VERSION)
+
+        for contents in ("{broken", json.dumps(dict(json.loads(cache_path.read_text(encoding="utf-8")),
+                                                    compiler_version=rule_packs.RULE_COMPILER_VERSION - 1))):
+            cache_path.write_text(contents, encoding="utf-8")
+            with mock.patch.dict(rule_packs._loaded_packs, clear=True), \
+                    mock.patch("rule_packs.parse_rule_pack", wraps=rule_packs.parse_rule_pack) as parse:
+                reloaded = load_rule_pack(self.pack_path, self.cache_dir)
+            parse.assert_called_once()
+            self.assertEqual(reloaded.validation_rules, pack.validation_rules)
+
+        with mock.patch.object(rule_packs, "RULE_COMPILER_VERSION", rule_packs.RULE_COMPILER_VERSION + 1):
+            self.assertNotEqual(rule_packs._cache_path(self.cache_dir, pack.content_hash), cache_path)
+
+    def test_invalid_pack(self):
+        """필수 항목이 없으면 RulePackError"""
+        del self.data["persona_validator"]["age_marital_rules"]
+        self._write(self.data)
+        with self.assertRaises(RulePackError):
+            load_rule_pack(self.pack_path, use_cache=False)
+
+    def test_watcher_swaps_rules(self):
+        """파일이 바뀌면 실행 중인 검증기/생성기에 새 규칙 팩 적용, 잘못된 파일은 무시"""
+        validator = PersonaValidator()
+        generator = HierarchicalPersonaGenerator()
+        watcher = RulePackWatcher(self.pack_path, cache_dir=self.cache_dir)
+        watcher.add_target(validator)
+        watcher.add_target(generator)
+        self.assertFalse(watcher.check())
+
+        persona = {"demographics": {"age": 17, "marital_status": "기혼"}}
+        self.assertFalse(validator.validate_persona(persona)["is_valid"])
+
+        self.data["version"] = "2024.2"
+        self.data["persona_validator"]["age_marital_rules"]["기혼"]["min_age"] = 16
+        self.data["hierarchical"]["default_age_constraints"]["max_income"] = 6000000
+        self._write(self.data, mtime=10 ** 18)
+        self.assertTrue(watcher.check())
+        self.assertEqual(validator.rule_pack.version, "2024.2")
+        self.assertTrue(validator.validate_persona(persona)["is_valid"])
+        self.assertEqual(generator.get_age_group_constraints(70).max_income, 6000000)
+
+        self.pack_path.write_text("{", encoding="utf-8")
+        os.utime(self.pack_path, ns=(2 * 10 ** 18, 2 * 10 ** 18))
+        self.assertFalse(watcher.check())
+        self.assertEqual(validator.rule_pack.version, "2024.2")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+스트리밍 생성 테스트
+===================
+
+iter_personas 청크가 일괄 생성 결과와 일치하고, DB 일괄 삽입 및 파일 내보내기에 그대로 연결되는지 확인
+"""
+
+import unittest
+import csv
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from persona_generator import PersonaGenerator
+from constraint_compiler import InfeasibleConstraintsError
+from database import SQLiteDatabase
+from persona_export import export_personas
+from src.hierarchical_persona_generator import HierarchicalPersonaGenerator
+
+
+def _without_timestamps(personas):
+    # ID는 호출마다 새 블록에서 예약되므로 비교에서 제외
+    return [{k: v for k, v in persona.items() if k not in ("id", "name", "created_at")} for persona in personas]
+
+
+class TestStreamingGeneration(unittest.TestCase):
+    """iter_personas 및 청크 소비자 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.generator = PersonaGenerator()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_chunks_match_seeded_batch(self):
+        """청크 크기가 일정하고, 이어붙인 결과가 같은 시드의 일괄 생성과 같아야 함"""
+        chunks = list(self.generator.iter_personas(250, chunk_size=100, seed=3))
+        self.assertEqual([len(chunk) for chunk in chunks], [100, 100, 50])
+
+        batch = self.generator.generate_personas(250, seed=3, shard_size=100, vectorized=True)
+        streamed = [persona for chunk in chunks for persona in chunk]
+        self.assertEqual(_without_timestamps(streamed), _without_timestamps(batch["personas"]))
+
+    def test_infeasible_constraints_raise_before_first_chunk(self):
+        """불가능한 제약 조건은 첫 청크 전에 거부"""
+        chunks = self.generator.iter_personas(100, demographics_constraints={
+            "age_range": [5, 10], "education": "대학원졸"})
+        with self.assertRaises(InfeasibleConstraintsError):
+            next(chunks)
+
+    def test_chunks_into_sqlite(self):
+        """청크를 SQLite에 일괄 삽입"""
+        db = SQLiteDatabase(str(Path(self.temp_dir.name) / "personas.db"))
+        inserted = sum(db.insert_personas(chunk)
+                       for chunk in self.generator.iter_personas(120, chunk_size=50, seed=1))
+        self.assertEqual(inserted, 120)
+        self.assertEqual(db.get_total_count(), 120)
+
+    def test_bad_rows_do_not_drop_chunk(self):
+        """중복 ID나 필드가 빠진 행이 있어도 나머지 행은 저장되고 실제 저장 수를 반환"""
+        db = SQLiteDatabase(str(Path(self.temp_dir.name) / "personas.db"))
+        personas = self.generator.generate_personas(20, vectorized=True)["personas"]
+        self.assertEqual(db.insert_personas(personas[:5]), 5)
+        broken = dict(personas[10])
+        del broken["behavioral_patterns"]
+        inserted = db.insert_personas(personas[3:10] + [broken] + personas[11:])
+        self.assertEqual(inserted, 5 + 9)  # 중복 2개와 필드 누락 1개만 제외
+        self.assertEqual(db.get_total_count(), 19)
+
+    def test_chunks_into_files(self):
+        """청크를 JSONL/CSV 파일로 내보내기"""
+        jsonl_path = Path(self.temp_dir.name) / "personas.jsonl"
+        written = export_personas(self.generator.iter_personas(30, chunk_size=8, seed=2), jsonl_path)
+        lines = jsonl_path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(written, 30)
+        self.assertEqual(len(lines), 30)
+        self.assertIn("demographics", json.loads(lines[0]))
+
+        csv_path = Path(self.temp_dir.name) / "personas.csv"
+        export_personas(HierarchicalPersonaGenerator().iter_personas(20, chunk_size=7, seed=2), csv_path, format="csv")
+        with open(csv_path, encoding="utf-8-sig", newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 20)
+        self.assertIn("education", rows[0])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
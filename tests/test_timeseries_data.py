@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+시계열 데이터 관리자 테스트
+==========================
+
+연도별 트렌드 데이터의 배열 저장, 캐시된 읽기 전용 조회, 기존 사전 형식 호환성을 확인
+"""
+
+import json
+import pickle
+import shutil
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from timeseries_data import DEFAULT_TIMESERIES_DIR, TimeSeriesDataError, TimeSeriesDataManager, TimeSeriesStore
+
+
+class TestTimeSeriesData(unittest.TestCase):
+    """시계열 배열/조회 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.manager = TimeSeriesDataManager()
+
+    def test_arrays_match_yearly_data(self):
+        """배열 값이 연도별 원본 데이터와 같고, 데이터 없는 연도는 NaN"""
+        series = self.manager.series["technology_adoption"]
+        self.assertEqual(series.values.shape, (11, len(series.metrics)))
+        row = self.manager.year_index(2022)
+        for metric, value in self.manager.timeseries_data["technology_adoption"][2022].items():
+            self.assertEqual(series.values[row, series.metric_index[metric]], value)
+
+        media = self.manager.series["media_consumption"]
+        self.assertFalse(media.present[self.manager.year_index(2027)])
+        self.assertTrue(np.isnan(self.manager.metric_values("media_consumption", 2027)).all())
+        self.assertEqual(self.manager.get_year_data(2027)["media_consumption"], {})
+
+    def test_distributions_normalized(self):
+        """분포는 행 합이 1인 확률 벡터로 제공"""
+        buckets, probabilities = self.manager.distribution("demographic_trends", "regional_distribution", 2030)
+        self.assertIn("경기", buckets)
+        self.assertAlmostEqual(float(probabilities.sum()), 1.0)
+        raw = self.manager.get_year_data(2030)["demographic_trends"]["regional_distribution"]
+        self.assertAlmostEqual(float(probabilities[buckets.index("경기")]), raw["경기"] / sum(raw.values()))
+
+    def test_cached_read_only_views(self):
+        """같은 연도의 조회는 캐시된 객체를 반환하고, 수정할 수 없음"""
+        data = self.manager.get_year_data(2023)
+        self.assertIs(data, self.manager.get_year_data(2023))
+        self.assertIs(self.manager.get_generational_trends(2023), self.manager.get_generational_trends(2023))
+        with self.assertRaises(TypeError):
+            data["cultural_trends"]["health_consciousness"] = 1.0
+        with self.assertRaises(ValueError):
+            self.manager.metric_values("cultural_trends", 2023)[0] = 1.0
+        self.assertEqual(pickle.loads(pickle.dumps(data)), data)
+
+    def test_out_of_range_year(self):
+        """데이터 범위 밖의 연도는 기준 연도 값 사용"""
+        self.assertIs(self.manager.get_year_data(2050), self.manager.get_year_data(2024))
+        self.assertEqual(self.manager.get_trend_factor("cultural_trends", "health_consciousness", 2050), 0.814)
+        self.assertEqual(self.manager.get_trend_factor("cultural_trends", "unknown_metric", 2024), 0.5)
+        # 지역 트렌드의 연도 보정값은 요청 연도 그대로 사용
+        self.assertEqual(self.manager.get_regional_trends(2040)["서울"]["cultural_diversity"], 1.0)
+
+    def test_fractional_interpolation(self):
+        """소수 시점 보간: 정수 연도는 원본 값, 중간 시점은 선형 보간, 분포는 정규화"""
+        trends = self.manager.interpolate([2021, 2022.5, 2026.25])
+        series = self.manager.series["cultural_trends"]
+        np.testing.assert_allclose(trends.values["cultural_trends"][0], series.values[1])
+        np.testing.assert_allclose(trends.values["cultural_trends"][1], (series.values[2] + series.values[3]) / 2)
+        _, probabilities = trends.distribution("demographic_trends", "age_distribution")
+        np.testing.assert_allclose(probabilities.sum(axis=1), 1.0)
+        # 2024년까지만 있는 카테고리는 데이터가 있는 연도 범위에서 외삽 방식 적용
+        self.assertAlmostEqual(trends.metric("media_consumption", "youtube_usage")[2], 0.900)
+
+    def test_extrapolation_modes_and_grid(self):
+        """외삽 방식별 범위 밖 시점 처리와 미리 계산된 월별 격자"""
+        times = [2018, 2032]
+        metric = ("technology_adoption", "internet_usage")
+        np.testing.assert_allclose(self.manager.interpolate(times, "clamp").metric(*metric), [0.914, 0.99])
+        np.testing.assert_allclose(self.manager.interpolate(times, "linear").metric(*metric), [0.896, 0.99])
+        np.testing.assert_allclose(self.manager.interpolate(times, "base_year").metric(*metric), [0.950, 0.950])
+        self.assertTrue(np.isnan(self.manager.interpolate(times, "nan").metric(*metric)).all())
+        with self.assertRaises(ValueError):
+            self.manager.interpolate(times, "cubic")
+
+        grid = self.manager.trend_grid(2020, 2030, steps_per_year=12)
+        self.assertEqual(len(grid), 121)
+        self.assertIs(grid, self.manager.trend_grid(2020, 2030, steps_per_year=12))
+        row = grid.time_index(2023 + 7 / 12)
+        np.testing.assert_allclose(grid.values["cultural_trends"][row],
+                                   self.manager.interpolate(2023 + 7 / 12).values["cultural_trends"][0])
+
+
+class TestTimeSeriesStore(unittest.TestCase):
+    """파일 기반 시계열 저장소 테스트"""
+
+    def setUp(self):
+        """테스트 설정: 기본 시계열 디렉토리를 임시 디렉토리로 복사"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.directory = Path(self.tmp.name) / "timeseries"
+        shutil.copytree(DEFAULT_TIMESERIES_DIR, self.directory, ignore=shutil.ignore_patterns(".compiled"))
+        self.cache_dir = Path(self.tmp.name) / "cache"
+
+    def _store(self):
+        return TimeSeriesStore(self.directory, self.cache_dir)
+
+    def test_lazy_category_loading(self):
+        """관리자 생성 시에는 카테고리 파일을 읽지 않고, 조회한 카테고리만 읽음"""
+        manager = TimeSeriesDataManager(self._store())
+        self.assertEqual(manager.store.loaded_categories(), ())
+        manager.get_trend_factor("cultural_trends", "health_consciousness", 2022)
+        self.assertEqual(manager.store.loaded_categories(), ("cultural_trends",))
+        # 통계가 없는 연도는 예측 규칙으로 채움 (2025년 = min(0.90, 2024년 + 0.034))
+        self.assertAlmostEqual(manager.get_trend_factor("cultural_trends", "health_consciousness", 2025), 0.848)
+
+    def test_cache_memory_mapped(self):
+        """두 번째 저장소는 JSON을 다시 변환하지 않고 캐시를 메모리 맵으로 엶"""
+        expected = TimeSeriesDataManager(self._store()).get_year_data(2030)
+        with mock.patch.object(TimeSeriesStore, "_parse_series", side_effect=AssertionError("reparsed")):
+            manager = TimeSeriesDataManager(self._store())
+            self.assertEqual(manager.get_year_data(2030), expected)
+        self.assertIsInstance(manager.series["demographic_trends"].values, np.memmap)
+        # 프로세스 풀로 보낼 때 저장소는 공유 저장소 참조로 전달됨
+        self.assertEqual(pickle.loads(pickle.dumps(manager)).get_year_data(2030), expected)
+
+    def test_new_year_without_code_change(self):
+        """파일에 연도를 추가하면 새 캐시로 다시 변환되어 반영됨"""
+        path = self.directory / "media_consumption.json"
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["years"]["2025"] = dict(data["years"]["2024"], youtube_usage=0.95)
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+        manager = TimeSeriesDataManager(self._store())
+        self.assertEqual(manager.get_trend_factor("media_consumption", "youtube_usage", 2025), 0.95)
+        self.assertEqual(manager.get_year_data(2026)["media_consumption"], {})
+
+        path.write_text("{", encoding="utf-8")
+        with self.assertRaises(TimeSeriesDataError):
+            TimeSeriesStore(self.directory, use_cache=False).load_series("media_consumption")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+공통 검증 규칙 코어 테스트
+==========================
+
+두 생성기의 검증이 같은 규칙 코어(ValidationCore)를 사용하고, 한 건 검증과 배치 검증 결과가 같은지 확인
+"""
+
+import random
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from persona_validator import PersonaValidator
+from rule_engine import NON_INTEGRAL_AGE_ENTRY, decode_violation, violation_code
+from validation_core import ValidationCore
+from src.hierarchical_persona_generator import (
+    NON_INTEGRAL_AGE_CODE, HierarchicalPersonaGenerator, EducationLevel, MaritalStatus
+)
+
+
+class TestUnifiedValidation(unittest.TestCase):
+    """규칙 코어 / 계층적 생성기 어댑터 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.generator = HierarchicalPersonaGenerator()
+        rng = random.Random(7)
+        occupations = list(self.generator.occupation_education_requirements) + ["학생", "아르바이트", "판사", "회사원"]
+        self.personas = [
+            {
+                'age': rng.randint(0, 110),
+                'gender': '여성',
+                'education': rng.choice([e.value for e in EducationLevel] + ["박사"]),
+                'marital_status': rng.choice([m.value for m in MaritalStatus]),
+                'occupation': rng.choice(occupations),
+                'income': rng.choice([0, 1000001, 2000001, rng.randint(0, 15000000)]),
+                'location': '서울특별시'
+            }
+            for _ in range(500)
+        ]
+
+    def test_core_batch_matches_scalar(self):
+        """규칙 코어의 배치 검증과 한 건 검증이 같은 결과"""
+        core = ValidationCore.compile(
+            (0, 40), {"job": ["학생", "교사"]},
+            [("adult_only", ("age", "job"), lambda age, job: int(job == "교사" and age < 25) * 3, "error")],
+            [("student_income", "income", "job", lambda job: (0, 100 if job == "학생" else np.inf))]
+        )
+        ages = np.array([10, 24, 25, 70, 30])
+        jobs = ["교사", "교사", "교사", "학생", "무직"]
+        incomes = np.array([0, 50, 0, 150, -1])
+        batch = core.check_batch(ages, {"job": core.encode_column("job", jobs)}, {"income": incomes})
+        self.assertEqual(batch["adult_only"].tolist(), [3, 3, 0, 0, 0])
+        self.assertEqual(batch["student_income"].tolist(), [0, 0, 0, 1, 1])
+        for i, (age, job, income) in enumerate(zip(ages, jobs, incomes)):
+            scalar = {rule.name: code for rule, code in core.check(age, {"job": job}, {"income": income})}
+            self.assertEqual(scalar, {name: int(codes[i]) for name, codes in batch.items() if codes[i]})
+
+    def test_hierarchical_batch_matches_scalar(self):
+        """계층적 생성기의 validate_batch가 validate_persona와 같은 위반을 보고"""
+        personas = self.personas + self.generator.generate_personas(50)
+        batch = self.generator.validate_batch(personas)
+        for index, persona in enumerate(personas):
+            is_valid, errors = self.generator.validate_persona(persona)
+            violated = sum(1 for codes in batch.values() if codes[index])
+            self.assertEqual(len(errors), violated)
+            self.assertEqual(is_valid, violated == 0)
+
+    def test_out_of_range_values_reported(self):
+        """15세 미만과 알 수 없는 교육 수준은 예외 대신 오류로 보고"""
+        persona = dict(self.personas[0], age=13, education="석사", occupation="학생", income=0,
+                       marital_status="미혼")
+        is_valid, errors = self.generator.validate_persona(persona)
+        self.assertFalse(is_valid)
+        self.assertIn("15세 미만은 통계 데이터가 없습니다: 13세", errors)
+
+        persona = dict(persona, age=40, occupation="교수", income=3000000, marital_status="기혼")
+        is_valid, errors = self.generator.validate_persona(persona)
+        self.assertFalse(is_valid)
+        self.assertIn("연령 40세에 부적절한 교육 수준: 석사", errors)
+        self.assertIn("직업 교수에 부적절한 교육 수준: 석사", errors)
+
+    def test_fractional_age_rejected(self):
+        """정수가 아닌 연령은 잘라서 검증하지 않고, 모든 진입점에서 연령 규칙 위반으로 보고 (정수 값의 실수는 허용)"""
+        core = ValidationCore.compile(
+            (0, 40), {"job": ["학생", "교사"]},
+            [("age_known", ("age",), lambda age: 0, "error"),
+             ("adult_only", ("age", "job"), lambda age, job: int(job == "교사" and age < 20), "error"),
+             ("known_job", ("job",), lambda job: int(job is None), "error")],
+            age_rule=("age_known", 2)
+        )
+        self.assertEqual(core.check(20.0, {"job": "교사"}), [])
+        self.assertEqual([(rule.name, code) for rule, code in core.check(19.5, {"job": "의사"})],
+                         [("age_known", 2), ("known_job", 1)])
+        batch = core.check_batch(np.array([30.0, 19.0, 19.5, np.nan]),
+                                 {"job": core.encode_column("job", ["교사"] * 4)})
+        self.assertEqual(batch["age_known"].tolist(), [0, 0, 2, 2])
+        self.assertEqual(batch["adult_only"].tolist(), [0, 1, 0, 0])
+
+        for age in (19.5, 30.5):
+            persona = dict(self.personas[0], age=age)
+            is_valid, errors = self.generator.validate_persona(persona)
+            self.assertFalse(is_valid)
+            self.assertEqual(errors[0], f"연령은 정수여야 합니다: {age}세")
+            batch = self.generator.validate_batch([persona])
+            self.assertEqual(int(batch["age_group"][0]), NON_INTEGRAL_AGE_CODE)
+            self.assertEqual(len(errors), sum(1 for codes in batch.values() if codes[0]))
+        self.assertEqual(self.generator.analyze_generation_quality([persona])['validation_error_count'], len(errors))
+
+        validator = PersonaValidator()
+        demographics = {"age": 30.5, "occupation": "교사", "education": "대졸", "marital_status": "기혼",
+                        "income_bracket": "40-60%"}
+        result = validator.validate_persona({"demographics": demographics})
+        self.assertFalse(result["is_valid"])
+        self.assertEqual(result["errors"], ["나이가 정수가 아님: 30.5세"])
+        categories = {field: [label] for field, label in demographics.items() if field != "age"}
+        codes = {field: np.array([0]) for field in categories}
+        batch = validator.validate_batch(np.array([30.5]), codes, categories)
+        self.assertFalse(batch["is_valid"][0])
+        self.assertEqual(decode_violation(violation_code("age_limits", int(batch["violations"]["age_limits"][0]))),
+                         ("age_limits", NON_INTEGRAL_AGE_ENTRY))
+        self.assertTrue(validator.validate_batch(np.array([30.0]), codes, categories)["is_valid"][0])
+
+    def test_quality_analysis_counts(self):
+        """품질 분석의 오류 개수가 한 건씩 검증한 오류 개수와 같음"""
+        analysis = self.generator.analyze_generation_quality(self.personas)
+        errors = [error for persona in self.personas for error in self.generator.validate_persona(persona)[1]]
+        self.assertEqual(analysis['validation_error_count'], len(errors))
+        self.assertEqual(analysis['validation_errors'], errors[:10])
+        self.assertAlmostEqual(analysis['quality_score'], max(0, 100 - len(errors) / len(self.personas) * 100))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
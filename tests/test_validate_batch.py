@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+배치 검증 테스트
+===============
+
+PersonaValidator.validate_batch가 코드 배열에 대해 validate_persona와 같은 판정을 내리는지 확인
+"""
+
+import json
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from persona_validator import PersonaValidator, BATCH_ERROR_RULES
+from rule_packs import DEFAULT_RULE_PACK_PATH, RulePackError, parse_rule_pack
+from validation_core import MAX_VIOLATION_CODE
+
+CATEGORIES = {
+    "occupation": ["초등학생", "중학생", "고등학생", "대학생", "대학원생", "사무직", "전문직(의사, 변호사 등)",
+                   "교사", "교수", "취업준비생", "은퇴자", "기타 무직", "전업주부", "육아휴직중", ""],
+    "education": ["없음", "초졸", "중졸", "고졸", "대졸", "대학원졸"],
+    "marital_status": ["미혼", "기혼", "이혼", "사별"],
+    "income_bracket": ["하위 20%", "20-40%", "40-60%", "60-80%", "상위 20%"]
+}
+
+
+class TestValidateBatch(unittest.TestCase):
+    """validate_batch 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.validator = PersonaValidator()
+        rng = np.random.default_rng(0)
+        self.count = 20000
+        self.age = rng.integers(-1, 105, self.count)
+        self.codes = {field: rng.integers(len(labels), size=self.count) for field, labels in CATEGORIES.items()}
+
+    def _demographics(self, index):
+        return {"age": int(self.age[index]),
+                **{field: CATEGORIES[field][self.codes[field][index]] for field in CATEGORIES}}
+
+    def test_matches_scalar_validation(self):
+        """유효성, 오류 수, 경고 여부가 validate_persona와 일치"""
+        result = self.validator.validate_batch(self.age, self.codes, CATEGORIES)
+        for index in range(self.count):
+            scalar = self.validator.validate_persona({"demographics": self._demographics(index)})
+            self.assertEqual(bool(result["is_valid"][index]), scalar["is_valid"], self._demographics(index))
+            self.assertEqual(sum(int(result["violations"][rule][index] != 0) for rule in BATCH_ERROR_RULES),
+                             len(scalar["errors"]))
+            self.assertEqual(bool(result["has_warning"][index]), bool(scalar["warnings"]))
+
+    def test_violation_codes_identify_rule_entry(self):
+        """위반 코드는 규칙 사전의 항목 순서 (1부터)"""
+        result = self.validator.validate_batch(np.array([13, 30]), {
+            "marital_status": np.array([1, 0]), "education": np.array([4, 4])
+        }, CATEGORIES)
+        marital_rules = list(self.validator.validation_rules["age_marital_rules"])
+        education_rules = list(self.validator.validation_rules["age_education_rules"])
+        self.assertEqual(result["violations"]["age_marital"].tolist(), [marital_rules.index("기혼") + 1, 0])
+        self.assertEqual(result["violations"]["age_education"].tolist(), [education_rules.index("대졸") + 1, 0])
+        self.assertEqual(result["is_valid"].tolist(), [False, True])
+
+    def test_rule_change_rebuilds_tables(self):
+        """validation_rules를 바꾸면 다음 호출에 반영"""
+        age = np.array([17])
+        codes = {"marital_status": np.array([1])}
+        self.assertFalse(self.validator.validate_batch(age, codes, CATEGORIES)["is_valid"][0])
+        self.validator.validation_rules["age_marital_rules"]["기혼"]["min_age"] = 16
+        self.assertTrue(self.validator.validate_batch(age, codes, CATEGORIES)["is_valid"][0])
+
+    def test_large_rule_dictionaries_keep_entry_numbers(self):
+        """항목이 256개를 넘는 규칙 사전도 위반 코드가 넘치지 않고, 코드 범위를 넘는 규칙 팩은 거부"""
+        data = json.loads(DEFAULT_RULE_PACK_PATH.read_text(encoding="utf-8"))
+        rules = data["persona_validator"]["age_occupation_rules"]
+        for index in range(300):
+            rules[f"직업{index}"] = {"min_age": 0, "max_age": 99}
+        rules["직업255"] = {"min_age": 50, "max_age": 99}
+        validator = PersonaValidator(rule_pack=parse_rule_pack(data, "many-occupations"))
+        categories = dict(CATEGORIES, occupation=["직업255"])
+        result = validator.validate_batch(np.array([20, 60]), {"occupation": np.array([0, 0])}, categories)
+        self.assertEqual(result["violations"]["age_occupation"].tolist(), [list(rules).index("직업255") + 1, 0])
+        self.assertEqual(result["is_valid"].tolist(), [False, True])
+
+        for index in range(300, MAX_VIOLATION_CODE + 1):
+            rules[f"직업{index}"] = {"min_age": 0, "max_age": 99}
+        with self.assertRaises(RulePackError):
+            parse_rule_pack(data, "too-many-occupations")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+검증 조회 테이블 테스트
+======================
+
+validate_persona의 조회 테이블 판정이 규칙 함수와 일치하고, 규칙이 바뀌면 테이블이 다시 만들어지는지 확인
+"""
+
+import unittest
+import sys
+from itertools import product
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from persona_validator import PersonaValidator
+from persona_generator import PersonaGenerator
+
+CATEGORIES = {
+    "occupation": ["초등학생", "고등학생", "대학생", "대학원생", "사무직", "전문직(의사, 변호사 등)", "교수",
+                   "은퇴자", "전업주부", "육아휴직중", ""],
+    "education": ["없음", "초졸", "중졸", "고졸", "대졸", "대학원졸", ""],
+    "marital_status": ["미혼", "기혼", "이혼", "사별", ""],
+    "income_bracket": ["하위 20%", "40-60%", ""]
+}
+
+
+class TestValidationLookup(unittest.TestCase):
+    """PersonaValidator 조회 테이블 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.validator = PersonaValidator()
+        self.validator.extend_lookup_vocabulary(CATEGORIES)
+        self.reference = PersonaValidator(use_lookup_table=False)
+
+    def test_matches_rule_functions(self):
+        """모든 조합에서 조회 테이블 결과가 규칙 함수 결과와 같음"""
+        for age in range(-1, 102, 3):
+            for values in product(*CATEGORIES.values()):
+                persona = {"demographics": {"age": age, **dict(zip(CATEGORIES, values))}}
+                self.assertEqual(self.validator.validate_persona(persona),
+                                 self.reference.validate_persona(persona), persona)
+
+    def test_rule_change_rebuilds_table(self):
+        """validation_rules를 바꾸면 다음 조회에 반영"""
+        persona = {"demographics": {"age": 17, "marital_status": "기혼"}}
+        self.assertFalse(self.validator.validate_persona(persona)["is_valid"])
+
+        self.validator.validation_rules["age_marital_rules"]["기혼"]["min_age"] = 16
+        self.assertEqual(self.validator.lookup_flags(persona), 0)
+        self.assertTrue(self.validator.validate_persona(persona)["is_valid"])
+
+        # 리스트를 직접 수정한 경우에는 invalidate_rule_caches()로 알림
+        persona = {"demographics": {"age": 40, "occupation": "교수", "education": "대졸"}}
+        self.assertTrue(self.validator.validate_persona(persona)["warnings"])
+        self.validator.validation_rules["education_occupation_preferences"]["교수"].append("대졸")
+        self.validator.invalidate_rule_caches()
+        self.assertEqual(self.validator.validate_persona(persona)["warnings"], [])
+
+    def test_unknown_input_falls_back(self):
+        """테이블에 없는 값이나 정수가 아닌 연령은 규칙 함수로 검증"""
+        for demographics in ({"age": 30, "occupation": "우주비행사"}, {"age": 30.5, "education": "대졸"},
+                             {"age": None}, {"age": 150, "occupation": "사무직"}):
+            persona = {"demographics": demographics}
+            self.assertIsNone(self.validator.lookup_flags(persona))
+            self.assertEqual(self.validator.validate_persona(persona),
+                             self.reference.validate_persona(persona))
+
+    def test_generator_registers_categories(self):
+        """생성기의 코드표가 조회 테이블에 등록되고, 규칙 변경 시 생성 계획도 다시 만들어짐"""
+        generator = PersonaGenerator()
+        personas = generator.generate_personas(50)["personas"]
+        for persona in personas:
+            self.assertIsNotNone(generator.validator.lookup_flags(persona), persona["demographics"])
+
+        plan = generator.get_generation_plan({})
+        generator.validator.validation_rules["age_limits"]["max_age"] = 80
+        self.assertIsNot(generator.get_generation_plan({}), plan)
+        self.assertEqual(generator.get_generation_plan({}).compiled.feasible_age_range()[1], 80)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+별칭 테이블 샘플러 테스트
+========================
+
+AliasSampler의 단일/대량 추출 분포 검증
+"""
+
+import unittest
+import random
+import sys
+from pathlib import Path
+from collections import Counter
+
+import numpy as np
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from weighted_sampler import AliasSampler
+
+
+class TestAliasSampler(unittest.TestCase):
+    """AliasSampler 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.distribution = {"미혼": 0.40, "기혼": 0.50, "이혼": 0.07, "사별": 0.03}
+        self.sampler = AliasSampler(self.distribution)
+
+    def test_bulk_draw_matches_distribution(self):
+        """대량 추출 빈도가 가중치와 일치하는지 확인 (±1%)"""
+        codes = self.sampler.draw_codes(200000, np.random.default_rng(0))
+        frequencies = np.bincount(codes, minlength=len(self.sampler)) / len(codes)
+
+        for item, expected in self.distribution.items():
+            self.assertAlmostEqual(frequencies[self.sampler.items.index(item)], expected, delta=0.01)
+
+    def test_single_draw_matches_distribution(self):
+        """단일 추출 빈도가 가중치와 일치하는지 확인 (±1%)"""
+        rand = random.Random(0)
+        counts = Counter(self.sampler.draw(rand) for _ in range(100000))
+
+        for item, expected in self.distribution.items():
+            self.assertAlmostEqual(counts[item] / 100000, expected, delta=0.01)
+
+    def test_zero_weight_never_drawn(self):
+        """가중치 0인 항목은 추출되지 않아야 함"""
+        sampler = AliasSampler({"없음": 0.0, "초졸": 1.0})
+        self.assertEqual(set(sampler.draw_many(1000, np.random.default_rng(1))), {"초졸"})
+
+    def test_invalid_weights_rejected(self):
+        """빈 분포나 합이 0인 분포는 거부"""
+        with self.assertRaises(ValueError):
+            AliasSampler({})
+        with self.assertRaises(ValueError):
+            AliasSampler({"a": 0.0})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -2,372 +2,495 @@
 """
 시계열 데이터 모듈: 연도별 한국 사회 트렌드 변화 반영
 Korean Time-Series Data Module for Demographic and Cultural Trends
+
+연도별 통계는 timeseries/ 디렉토리의 JSON 파일(카테고리별 1개, manifest.json에 등록)에 있으며,
+카테고리를 처음 조회할 때 읽어 배열로 변환합니다. 변환 결과는 원본 파일 해시를 키로 .npy 파일에 캐시되어
+다음 시작부터는 메모리 맵으로 열립니다. 새 연도의 통계는 JSON 파일에 연도를 추가하면 됩니다.
 """
 
-from datetime import datetime
-from typing import Dict, Any, Optional
-import random
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMESERIES_DIR = Path(__file__).resolve().parent / "timeseries"
+MANIFEST_FILE = "manifest.json"
+# 변환 캐시 디렉토리 (환경 변수로 변경 가능)
+TIMESERIES_CACHE_DIR_ENV = "PERSONA_TIMESERIES_CACHE_DIR"
+DEFAULT_TIMESERIES_CACHE_DIR = DEFAULT_TIMESERIES_DIR / ".compiled"
+# 시계열 파일 형식 버전과 캐시 형식 버전 (TrendSeries 배열 구성이 바뀌면 올려서 이전 캐시를 무시)
+TIMESERIES_FORMAT_VERSION = 1
+COMPILED_FORMAT_VERSION = 1
+
+DEFAULT_TREND_FACTOR = 0.5
+# 데이터가 있는 연도 범위 밖 시점의 처리 방식
+# clamp: 양 끝 연도 값 유지, linear: 양 끝 구간의 기울기로 연장, base_year: 기준 연도 값 (get_trend_factor와 같은 방식), nan: NaN
+EXTRAPOLATION_MODES = ("clamp", "linear", "base_year", "nan")
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+class _FrozenDict(dict):
+    """캐시된 연도 데이터용 읽기 전용 사전 (호출자가 캐시를 수정하지 못하도록)"""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("캐시된 시계열 데이터는 수정할 수 없습니다")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return _FrozenDict, (dict(self),)
+
+
+def _interpolate_rows(years: np.ndarray, table: np.ndarray, times: np.ndarray,
+                      extrapolation: str, base_year: int) -> np.ndarray:
+    """
+    연도 × 열 표를 소수 시점들에서 한 번에 선형 보간 (시점 × 열).
+    값이 모두 NaN인 연도(데이터 없는 연도)는 건너뛰고 데이터가 있는 연도 사이에서 보간합니다.
+    """
+    known = ~np.isnan(table).all(axis=1)
+    known_years = years[known].astype(np.float64)
+    rows = table[known]
+    first, last = known_years[0], known_years[-1]
+    outside = (times < first) | (times > last)
+    if extrapolation == "clamp":
+        times = np.clip(times, first, last)
+    elif extrapolation == "base_year":
+        times = np.where(outside, np.clip(float(base_year), first, last), times)
+
+    if len(known_years) == 1:
+        result = np.repeat(rows, len(times), axis=0)
+    else:
+        left = np.clip(np.searchsorted(known_years, times, side="right") - 1, 0, len(known_years) - 2)
+        weight = ((times - known_years[left]) / (known_years[left + 1] - known_years[left]))[:, None]
+        result = rows[left] * (1.0 - weight) + rows[left + 1] * weight
+    if extrapolation == "nan":
+        result[outside] = np.nan
+    return result
+
+
+class TimeSeriesDataError(ValueError):
+    """시계열 데이터 파일 형식이 잘못된 경우"""
+
+
+class TrendDistribution:
+    """연도 × 구간 비율 분포 (values는 원본 비율, probabilities는 행 합이 1인 샘플링용 확률, 데이터 없는 연도는 NaN)"""
+
+    def __init__(self, buckets: Sequence[str], values: np.ndarray, probabilities: Optional[np.ndarray] = None):
+        self.buckets = tuple(buckets)
+        self.bucket_index = {bucket: i for i, bucket in enumerate(self.buckets)}
+        self.values = _read_only(values)
+        if probabilities is None:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                probabilities = values / values.sum(axis=1, keepdims=True)
+        self.probabilities = _read_only(probabilities)
+
+
+class TrendSeries:
+    """
+    카테고리 하나의 시계열 배열.
+    values[연도 인덱스, 지표 인덱스]는 스칼라 지표 값(없으면 NaN)이고, 분포 항목은 distributions에 따로 저장됩니다.
+    """
+
+    def __init__(self, category: str, years: np.ndarray, metrics: Sequence[str], values: np.ndarray,
+                 present: np.ndarray, distributions: Dict[str, TrendDistribution]):
+        self.category = category
+        self.years = years
+        self.metrics = tuple(metrics)
+        self.metric_index = {metric: i for i, metric in enumerate(self.metrics)}
+        self.values = _read_only(values)
+        self.present = _read_only(present)
+        self.distributions = distributions
+
+    @classmethod
+    def from_yearly_data(cls, category: str, years: np.ndarray, yearly_data: Dict[int, Dict[str, Any]]) -> "TrendSeries":
+        """연도 -> {지표: 값 또는 {구간: 비율}} 사전을 배열로 변환"""
+        metrics, buckets = [], {}
+        for data in yearly_data.values():
+            for metric, value in data.items():
+                if isinstance(value, dict):
+                    names = buckets.setdefault(metric, [])
+                    names.extend(bucket for bucket in value if bucket not in names)
+                elif metric not in metrics:
+                    metrics.append(metric)
+        metric_index = {metric: i for i, metric in enumerate(metrics)}
+
+        values = np.full((len(years), len(metrics)), np.nan)
+        distributions = {name: np.full((len(years), len(names)), np.nan) for name, names in buckets.items()}
+        for row, year in enumerate(years.tolist()):
+            for metric, value in yearly_data.get(year, {}).items():
+                if isinstance(value, dict):
+                    table = distributions[metric]
+                    table[row] = 0.0
+                    for bucket, weight in value.items():
+                        table[row, buckets[metric].index(bucket)] = weight
+                else:
+                    values[row, metric_index[metric]] = value
+        present = np.array([int(year) in yearly_data for year in years])
+        return cls(category, years, metrics, values, present,
+                   {name: TrendDistribution(buckets[name], table) for name, table in distributions.items()})
+
+    def year_dict(self, row: int) -> Dict[str, Any]:
+        """한 연도의 값을 기존 중첩 사전 형식으로 변환 (데이터 없는 연도는 빈 사전)"""
+        if not self.present[row]:
+            return _FrozenDict()
+        data = {}
+        for name, distribution in self.distributions.items():
+            weights = distribution.values[row]
+            if not np.isnan(weights).all():
+                data[name] = _FrozenDict(zip(distribution.buckets, weights.tolist()))
+        for metric, value in zip(self.metrics, self.values[row].tolist()):
+            if value == value:  # NaN이 아닌 값만
+                data[metric] = value
+        return _FrozenDict(data)
+
+
+class InterpolatedTrends:
+    """
+    보간된 시계열 (TimeSeriesDataManager.interpolate / trend_grid 결과, 배열은 읽기 전용).
+    values[카테고리]는 시점 × 지표 배열(열 순서는 metric_names[카테고리]),
+    probabilities[(카테고리, 분포 이름)]는 시점 × 구간 확률 배열(열 순서는 buckets[(카테고리, 분포 이름)])입니다.
+    """
+
+    def __init__(self, times: np.ndarray, extrapolation: str):
+        self.times = _read_only(times)
+        self.extrapolation = extrapolation
+        self.metric_names = {}
+        self.values = {}
+        self.buckets = {}
+        self.probabilities = {}
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def metric(self, category: str, metric: str) -> np.ndarray:
+        """지표 하나의 시점별 값"""
+        return self.values[category][:, self.metric_names[category].index(metric)]
+
+    def distribution(self, category: str, name: str) -> Tuple[Tuple[str, ...], np.ndarray]:
+        """(구간 이름, 시점 × 구간 확률 배열)"""
+        return self.buckets[(category, name)], self.probabilities[(category, name)]
+
+    def time_index(self, time: float) -> int:
+        """가장 가까운 시점의 행 인덱스 (trend_grid 결과에서 월/분기 시점 조회용)"""
+        return int(np.abs(self.times - time).argmin())
+
+
+def _project(value: float, rule: Optional[Dict[str, float]]) -> float:
+    """예측 규칙 하나 적용: 전년도 값에 step을 더하되 limit(증가 시 상한, 감소 시 하한)을 넘지 않음"""
+    if rule is None:
+        return value
+    if rule["step"] >= 0:
+        return min(rule["limit"], value + rule["step"])
+    return max(rule["limit"], value + rule["step"])
+
+
+def project_yearly_data(yearly_data: Dict[int, Dict[str, Any]], projection: Dict[str, Any]) -> Dict[int, Dict[str, Any]]:
+    """
+    통계가 없는 연도를 projection.until까지 전년도 값에 예측 규칙을 적용해 채웁니다.
+    규칙이 없는 지표와 분포 구간은 전년도 값을 그대로 유지합니다.
+    """
+    metric_rules = projection.get("metrics", {})
+    distribution_rules = projection.get("distributions", {})
+    for year in range(min(yearly_data) + 1, projection["until"] + 1):
+        if year in yearly_data:
+            continue
+        projected = {}
+        for metric, value in yearly_data[year - 1].items():
+            if isinstance(value, dict):
+                rules = distribution_rules.get(metric, {})
+                projected[metric] = {bucket: _project(weight, rules.get(bucket)) for bucket, weight in value.items()}
+            else:
+                projected[metric] = _project(value, metric_rules.get(metric))
+        yearly_data[year] = projected
+    return yearly_data
+
+
+def _cache_dir(cache_dir: Optional[Union[str, Path]]) -> Path:
+    if cache_dir is not None:
+        return Path(cache_dir)
+    return Path(os.environ.get(TIMESERIES_CACHE_DIR_ENV, DEFAULT_TIMESERIES_CACHE_DIR))
+
+
+class _LazySeries(Mapping):
+    """카테고리 -> TrendSeries (조회할 때 카테고리 파일을 읽음)"""
+
+    def __init__(self, store: "TimeSeriesStore"):
+        self._store = store
+
+    def __getitem__(self, category: str) -> TrendSeries:
+        return self._store.load_series(category)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.category_files)
+
+    def __len__(self) -> int:
+        return len(self._store.category_files)
+
+
+class TimeSeriesStore:
+    """
+    파일 기반 시계열 저장소 (get_timeseries_store로 프로세스 전역에서 공유).
+    생성 시에는 manifest.json만 읽고, 카테고리 파일은 처음 조회할 때 읽어 TrendSeries로 변환합니다.
+    변환 결과는 카테고리 파일 해시를 키로 .npy 파일에 캐시되어 다른 프로세스는 메모리 맵으로 엽니다.
+    """
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None, cache_dir: Optional[Union[str, Path]] = None,
+                 use_cache: bool = True):
+        """
+        Args:
+            directory: 시계열 디렉토리 (기본: timeseries/)
+            cache_dir: 변환 캐시 디렉토리 (기본: PERSONA_TIMESERIES_CACHE_DIR 환경 변수 또는 timeseries/.compiled)
+            use_cache: False이면 캐시를 읽거나 쓰지 않고 항상 JSON에서 변환
+
+        Raises:
+            TimeSeriesDataError: manifest 형식이 잘못된 경우
+        """
+        self.directory = Path(directory) if directory is not None else DEFAULT_TIMESERIES_DIR
+        self.cache_dir = cache_dir
+        self.use_cache = use_cache
+        try:
+            manifest = json.loads((self.directory / MANIFEST_FILE).read_text(encoding="utf-8"))
+            if manifest.get("format_version") != TIMESERIES_FORMAT_VERSION:
+                raise TimeSeriesDataError(f"지원하지 않는 시계열 형식 버전: {manifest.get('format_version')}")
+            self.base_year = int(manifest["base_year"])
+            self.data_range = tuple(int(year) for year in manifest["data_range"])
+            self.category_files = dict(manifest["categories"])
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            if isinstance(e, TimeSeriesDataError):
+                raise
+            raise TimeSeriesDataError(f"시계열 manifest를 읽을 수 없습니다 ({self.directory}): {e}") from e
+        self.years = _read_only(np.arange(self.data_range[0], self.data_range[1] + 1))
+        self.series = _LazySeries(self)
+        self._loaded = {}  # 카테고리 -> TrendSeries
+        self._lock = threading.Lock()
+
+    def __reduce__(self):
+        # 프로세스 풀 워커에서는 같은 디렉토리의 공유 저장소를 다시 열어 캐시(메모리 맵)를 사용
+        return get_timeseries_store, (str(self.directory), self.cache_dir, self.use_cache)
+
+    def loaded_categories(self) -> Tuple[str, ...]:
+        return tuple(self._loaded)
+
+    def load_series(self, category: str) -> TrendSeries:
+        """카테고리 시계열 (처음 조회할 때 캐시 또는 JSON에서 읽음)"""
+        series = self._loaded.get(category)
+        if series is not None:
+            return series
+        if category not in self.category_files:
+            raise KeyError(category)
+        with self._lock:
+            series = self._loaded.get(category)
+            if series is None:
+                series = self._loaded[category] = self._read_series(category)
+        return series
+
+    def _read_series(self, category: str) -> TrendSeries:
+        path = self.directory / self.category_files[category]
+        raw = path.read_bytes()
+        # 연도 축도 캐시 내용에 포함되므로 데이터 범위를 해시에 함께 반영
+        content_hash = hashlib.sha256(raw + repr(self.data_range).encode()).hexdigest()
+        cache_path = _cache_dir(self.cache_dir) / f"{category}-{content_hash[:32]}-v{COMPILED_FORMAT_VERSION}"
+        if self.use_cache:
+            series = self._read_cached(category, cache_path)
+            if series is not None:
+                return series
+        series = self._parse_series(category, raw, path)
+        if self.use_cache:
+            self._write_cached(series, cache_path)
+        return series
+
+    def _parse_series(self, category: str, raw: bytes, path: Path) -> TrendSeries:
+        try:
+            data = json.loads(raw.decode("utf-8"))
+            yearly_data = {int(year): values for year, values in data["years"].items()}
+            if not yearly_data:
+                raise TimeSeriesDataError(f"{category} 시계열에 연도 데이터가 없습니다")
+            if "projection" in data:
+                # 미래 트렌드 예측 (통계가 없는 연도)
+                project_yearly_data(yearly_data, data["projection"])
+        except (UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            if isinstance(e, TimeSeriesDataError):
+                raise
+            raise TimeSeriesDataError(f"시계열 파일을 읽을 수 없습니다 ({path}): {e}") from e
+        return TrendSeries.from_yearly_data(category, self.years, yearly_data)
+
+    def _read_cached(self, category: str, cache_path: Path) -> Optional[TrendSeries]:
+        """캐시 디렉토리의 배열을 읽기 전용 메모리 맵으로 열기 (없거나 손상되었으면 None)"""
+        try:
+            meta = json.loads((cache_path / "meta.json").read_text(encoding="utf-8"))
+
+            def load(name):
+                return np.load(cache_path / f"{name}.npy", mmap_mode="r")
+
+            distributions = {
+                name: TrendDistribution(buckets, load(f"{name}.values"), load(f"{name}.probabilities"))
+                for name, buckets in meta["distributions"].items()
+            }
+            return TrendSeries(category, self.years, meta["metrics"], load("values"), load("present"), distributions)
+        except FileNotFoundError:
+            return None
+        except Exception as e:  # 손상되었거나 호환되지 않는 캐시는 무시하고 다시 변환
+            logger.warning(f"시계열 캐시를 읽지 못했습니다 ({cache_path}): {e}")
+            return None
+
+    @staticmethod
+    def _write_cached(series: TrendSeries, cache_path: Path):
+        """임시 디렉토리에 쓴 뒤 이름을 바꿔 교체 (동시에 시작한 워커가 반쯤 쓰인 캐시를 읽지 않도록)"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = Path(tempfile.mkdtemp(dir=cache_path.parent, suffix=".tmp"))
+            try:
+                np.save(tmp_path / "values.npy", series.values)
+                np.save(tmp_path / "present.npy", series.present)
+                for name, distribution in series.distributions.items():
+                    np.save(tmp_path / f"{name}.values.npy", distribution.values)
+                    np.save(tmp_path / f"{name}.probabilities.npy", distribution.probabilities)
+                meta = {"metrics": list(series.metrics),
+                        "distributions": {name: list(d.buckets) for name, d in series.distributions.items()}}
+                (tmp_path / "meta.json").write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+                raise
+        except OSError as e:  # 읽기 전용 배포 환경이거나 다른 워커가 먼저 저장한 경우 캐시 없이 동작
+            if not cache_path.exists():
+                logger.warning(f"시계열 캐시를 저장하지 못했습니다 ({cache_path}): {e}")
+
+
+_stores: Dict[Tuple[str, Optional[str], bool], TimeSeriesStore] = {}  # (디렉토리, 캐시 디렉토리, 캐시 사용) -> 저장소
+_stores_lock = threading.Lock()
+
+
+def get_timeseries_store(directory: Optional[Union[str, Path]] = None, cache_dir: Optional[Union[str, Path]] = None,
+                         use_cache: bool = True) -> TimeSeriesStore:
+    """디렉토리별 프로세스 전역 시계열 저장소 (처음 호출할 때 생성)"""
+    key = (str(Path(directory) if directory is not None else DEFAULT_TIMESERIES_DIR),
+           str(cache_dir) if cache_dir is not None else None, use_cache)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = TimeSeriesStore(directory, cache_dir, use_cache)
+    return store
+
 
 class TimeSeriesDataManager:
-    """한국 사회의 연도별 트렌드 변화를 반영하는 시계열 데이터 관리자"""
+    """
+    한국 사회의 연도별 트렌드 변화를 반영하는 시계열 데이터 관리자.
+    데이터는 공유 저장소(TimeSeriesStore)에 있으므로 생성 비용이 거의 없습니다.
+    """
     
-    def __init__(self):
-        self.base_year = 2024
-        self.data_range = (2020, 2030)  # 2020-2030년 데이터 범위
-        self._load_timeseries_data()
+    def __init__(self, store: Optional[TimeSeriesStore] = None):
+        self.store = store if store is not None else get_timeseries_store()
+        self.base_year = self.store.base_year
+        self.data_range = self.store.data_range
+        self.years = self.store.years
+        self.series = self.store.series
+        self._year_data_cache = {}  # 연도 인덱스 -> get_year_data 결과
+        self._trend_cache = {}  # (종류, 연도) -> 세대/지역 트렌드
+        self._grid_cache = {}  # (시작, 끝, 연간 단계 수, 외삽 방식) -> InterpolatedTrends
     
-    def _load_timeseries_data(self):
-        """연도별 트렌드 데이터 로드"""
-        self.timeseries_data = {
-            # 인구통계학적 변화 트렌드
-            "demographic_trends": {
-                2020: {
-                    "age_distribution": {
-                        "0-9": 0.089, "10-19": 0.095, "20-29": 0.135, "30-39": 0.145,
-                        "40-49": 0.168, "50-59": 0.163, "60-69": 0.118, "70-79": 0.065,
-                        "80+": 0.042
-                    },
-                    "regional_distribution": {
-                        "서울": 0.188, "부산": 0.067, "대구": 0.048, "인천": 0.058, "광주": 0.029,
-                        "대전": 0.030, "울산": 0.023, "세종": 0.006, "경기": 0.250, "강원": 0.030,
-                        "충북": 0.031, "충남": 0.042, "전북": 0.036, "전남": 0.037, "경북": 0.053,
-                        "경남": 0.067, "제주": 0.013
-                    },
-                    "birth_rate": 0.84,  # 합계출산율 (2020년)
-                    "urbanization_rate": 0.813  # 도시화율
-                },
-                2021: {
-                    "age_distribution": {
-                        "0-9": 0.087, "10-19": 0.093, "20-29": 0.133, "30-39": 0.144,
-                        "40-49": 0.167, "50-59": 0.164, "60-69": 0.120, "70-79": 0.067,
-                        "80+": 0.045
-                    },
-                    "regional_distribution": {
-                        "서울": 0.185, "부산": 0.066, "대구": 0.047, "인천": 0.059, "광주": 0.029,
-                        "대전": 0.030, "울산": 0.022, "세종": 0.007, "경기": 0.254, "강원": 0.029,
-                        "충북": 0.031, "충남": 0.043, "전북": 0.035, "전남": 0.036, "경북": 0.052,
-                        "경남": 0.066, "제주": 0.014
-                    },
-                    "birth_rate": 0.81,
-                    "urbanization_rate": 0.816
-                },
-                2022: {
-                    "age_distribution": {
-                        "0-9": 0.085, "10-19": 0.091, "20-29": 0.131, "30-39": 0.143,
-                        "40-49": 0.166, "50-59": 0.165, "60-69": 0.122, "70-79": 0.069,
-                        "80+": 0.048
-                    },
-                    "regional_distribution": {
-                        "서울": 0.182, "부산": 0.065, "대구": 0.046, "인천": 0.060, "광주": 0.028,
-                        "대전": 0.029, "울산": 0.021, "세종": 0.008, "경기": 0.258, "강원": 0.029,
-                        "충북": 0.031, "충남": 0.044, "전북": 0.034, "전남": 0.035, "경북": 0.051,
-                        "경남": 0.065, "제주": 0.015
-                    },
-                    "birth_rate": 0.78,
-                    "urbanization_rate": 0.819
-                },
-                2023: {
-                    "age_distribution": {
-                        "0-9": 0.083, "10-19": 0.089, "20-29": 0.129, "30-39": 0.142,
-                        "40-49": 0.165, "50-59": 0.166, "60-69": 0.124, "70-79": 0.071,
-                        "80+": 0.051
-                    },
-                    "regional_distribution": {
-                        "서울": 0.179, "부산": 0.064, "대구": 0.045, "인천": 0.061, "광주": 0.028,
-                        "대전": 0.029, "울산": 0.020, "세종": 0.009, "경기": 0.262, "강원": 0.028,
-                        "충북": 0.031, "충남": 0.045, "전북": 0.033, "전남": 0.034, "경북": 0.050,
-                        "경남": 0.064, "제주": 0.016
-                    },
-                    "birth_rate": 0.72,
-                    "urbanization_rate": 0.822
-                },
-                2024: {
-                    "age_distribution": {
-                        "0-9": 0.081, "10-19": 0.087, "20-29": 0.127, "30-39": 0.141,
-                        "40-49": 0.164, "50-59": 0.167, "60-69": 0.126, "70-79": 0.073,
-                        "80+": 0.054
-                    },
-                    "regional_distribution": {
-                        "서울": 0.176, "부산": 0.063, "대구": 0.044, "인천": 0.062, "광주": 0.027,
-                        "대전": 0.028, "울산": 0.019, "세종": 0.010, "경기": 0.266, "강원": 0.027,
-                        "충북": 0.031, "충남": 0.046, "전북": 0.032, "전남": 0.033, "경북": 0.049,
-                        "경남": 0.063, "제주": 0.017
-                    },
-                    "birth_rate": 0.70,
-                    "urbanization_rate": 0.825
-                }
-            },
-            
-            # 기술 채택 및 디지털 트렌드
-            "technology_adoption": {
-                2020: {
-                    "smartphone_penetration": 0.945,
-                    "internet_usage": 0.914,
-                    "social_media_users": 0.756,
-                    "online_shopping_adoption": 0.678,
-                    "streaming_service_usage": 0.423,
-                    "digital_payment_usage": 0.567
-                },
-                2021: {
-                    "smartphone_penetration": 0.951,
-                    "internet_usage": 0.923,
-                    "social_media_users": 0.784,
-                    "online_shopping_adoption": 0.721,
-                    "streaming_service_usage": 0.489,
-                    "digital_payment_usage": 0.634
-                },
-                2022: {
-                    "smartphone_penetration": 0.957,
-                    "internet_usage": 0.932,
-                    "social_media_users": 0.812,
-                    "online_shopping_adoption": 0.764,
-                    "streaming_service_usage": 0.555,
-                    "digital_payment_usage": 0.701
-                },
-                2023: {
-                    "smartphone_penetration": 0.963,
-                    "internet_usage": 0.941,
-                    "social_media_users": 0.840,
-                    "online_shopping_adoption": 0.807,
-                    "streaming_service_usage": 0.621,
-                    "digital_payment_usage": 0.768
-                },
-                2024: {
-                    "smartphone_penetration": 0.969,
-                    "internet_usage": 0.950,
-                    "social_media_users": 0.868,
-                    "online_shopping_adoption": 0.850,
-                    "streaming_service_usage": 0.687,
-                    "digital_payment_usage": 0.835
-                }
-            },
-            
-            # 사회문화적 트렌드 변화
-            "cultural_trends": {
-                2020: {
-                    "work_life_balance_importance": 0.623,
-                    "environmental_consciousness": 0.445,
-                    "health_consciousness": 0.678,
-                    "individual_vs_collective": 0.534,  # 개인주의 성향 (0=집단주의, 1=개인주의)
-                    "gender_equality_awareness": 0.612,
-                    "mental_health_awareness": 0.456
-                },
-                2021: {
-                    "work_life_balance_importance": 0.651,
-                    "environmental_consciousness": 0.478,
-                    "health_consciousness": 0.712,
-                    "individual_vs_collective": 0.548,
-                    "gender_equality_awareness": 0.634,
-                    "mental_health_awareness": 0.489
-                },
-                2022: {
-                    "work_life_balance_importance": 0.679,
-                    "environmental_consciousness": 0.511,
-                    "health_consciousness": 0.746,
-                    "individual_vs_collective": 0.562,
-                    "gender_equality_awareness": 0.656,
-                    "mental_health_awareness": 0.522
-                },
-                2023: {
-                    "work_life_balance_importance": 0.707,
-                    "environmental_consciousness": 0.544,
-                    "health_consciousness": 0.780,
-                    "individual_vs_collective": 0.576,
-                    "gender_equality_awareness": 0.678,
-                    "mental_health_awareness": 0.555
-                },
-                2024: {
-                    "work_life_balance_importance": 0.735,
-                    "environmental_consciousness": 0.577,
-                    "health_consciousness": 0.814,
-                    "individual_vs_collective": 0.590,
-                    "gender_equality_awareness": 0.700,
-                    "mental_health_awareness": 0.588
-                }
-            },
-            
-            # 소비 행태 변화
-            "consumption_patterns": {
-                2020: {
-                    "online_vs_offline_shopping": 0.468,  # 온라인 비중
-                    "delivery_service_usage": 0.534,
-                    "subscription_economy": 0.234,
-                    "secondhand_market": 0.345,
-                    "local_business_preference": 0.423,
-                    "premium_vs_cost_effective": 0.456,  # 프리미엄 선호도
-                    "experiential_vs_material": 0.512   # 경험 소비 선호도
-                },
-                2021: {
-                    "online_vs_offline_shopping": 0.521,
-                    "delivery_service_usage": 0.587,
-                    "subscription_economy": 0.278,
-                    "secondhand_market": 0.378,
-                    "local_business_preference": 0.445,
-                    "premium_vs_cost_effective": 0.443,
-                    "experiential_vs_material": 0.498
-                },
-                2022: {
-                    "online_vs_offline_shopping": 0.574,
-                    "delivery_service_usage": 0.640,
-                    "subscription_economy": 0.322,
-                    "secondhand_market": 0.411,
-                    "local_business_preference": 0.467,
-                    "premium_vs_cost_effective": 0.430,
-                    "experiential_vs_material": 0.484
-                },
-                2023: {
-                    "online_vs_offline_shopping": 0.627,
-                    "delivery_service_usage": 0.693,
-                    "subscription_economy": 0.366,
-                    "secondhand_market": 0.444,
-                    "local_business_preference": 0.489,
-                    "premium_vs_cost_effective": 0.417,
-                    "experiential_vs_material": 0.470
-                },
-                2024: {
-                    "online_vs_offline_shopping": 0.680,
-                    "delivery_service_usage": 0.746,
-                    "subscription_economy": 0.410,
-                    "secondhand_market": 0.477,
-                    "local_business_preference": 0.511,
-                    "premium_vs_cost_effective": 0.404,
-                    "experiential_vs_material": 0.456
-                }
-            },
-            
-            # 미디어 소비 트렌드
-            "media_consumption": {
-                2020: {
-                    "traditional_tv": 0.623,
-                    "streaming_services": 0.434,
-                    "youtube_usage": 0.812,
-                    "social_media_time": 0.567,
-                    "podcast_usage": 0.234,
-                    "news_source_digital": 0.678,
-                    "short_form_content": 0.445
-                },
-                2021: {
-                    "traditional_tv": 0.589,
-                    "streaming_services": 0.487,
-                    "youtube_usage": 0.834,
-                    "social_media_time": 0.591,
-                    "podcast_usage": 0.267,
-                    "news_source_digital": 0.712,
-                    "short_form_content": 0.512
-                },
-                2022: {
-                    "traditional_tv": 0.555,
-                    "streaming_services": 0.540,
-                    "youtube_usage": 0.856,
-                    "social_media_time": 0.615,
-                    "podcast_usage": 0.300,
-                    "news_source_digital": 0.746,
-                    "short_form_content": 0.579
-                },
-                2023: {
-                    "traditional_tv": 0.521,
-                    "streaming_services": 0.593,
-                    "youtube_usage": 0.878,
-                    "social_media_time": 0.639,
-                    "podcast_usage": 0.333,
-                    "news_source_digital": 0.780,
-                    "short_form_content": 0.646
-                },
-                2024: {
-                    "traditional_tv": 0.487,
-                    "streaming_services": 0.646,
-                    "youtube_usage": 0.900,
-                    "social_media_time": 0.663,
-                    "podcast_usage": 0.366,
-                    "news_source_digital": 0.814,
-                    "short_form_content": 0.713
-                }
-            }
+    @property
+    def timeseries_data(self) -> Dict[str, Dict[int, Dict[str, Any]]]:
+        """카테고리 -> 연도 -> 데이터 (기존 사전 형식, 데이터가 있는 연도만)"""
+        return {
+            category: {int(year): series.year_dict(row)
+                       for row, year in enumerate(self.years) if series.present[row]}
+            for category, series in self.series.items()
         }
-        
-        # 미래 트렌드 예측 (2025-2030)
-        self._generate_future_projections()
-    
-    def _generate_future_projections(self):
-        """2025-2030년 미래 트렌드 예측 생성"""
-        # 저출산 고령화 지속
-        for year in range(2025, 2031):
-            if year not in self.timeseries_data["demographic_trends"]:
-                prev_year = year - 1
-                prev_data = self.timeseries_data["demographic_trends"][prev_year]
-                
-                # 연령 분포 변화 (고령화 가속)
-                new_age_dist = prev_data["age_distribution"].copy()
-                new_age_dist["0-9"] = max(0.05, new_age_dist["0-9"] - 0.002)
-                new_age_dist["10-19"] = max(0.06, new_age_dist["10-19"] - 0.002)
-                new_age_dist["60-69"] = min(0.15, new_age_dist["60-69"] + 0.002)
-                new_age_dist["70-79"] = min(0.10, new_age_dist["70-79"] + 0.002)
-                new_age_dist["80+"] = min(0.08, new_age_dist["80+"] + 0.003)
-                
-                # 지역 분포 변화 (수도권 집중 지속)
-                new_regional_dist = prev_data["regional_distribution"].copy()
-                new_regional_dist["경기"] = min(0.28, new_regional_dist["경기"] + 0.002)
-                new_regional_dist["세종"] = min(0.015, new_regional_dist["세종"] + 0.001)
-                
-                self.timeseries_data["demographic_trends"][year] = {
-                    "age_distribution": new_age_dist,
-                    "regional_distribution": new_regional_dist,
-                    "birth_rate": max(0.5, prev_data["birth_rate"] - 0.02),
-                    "urbanization_rate": min(0.85, prev_data["urbanization_rate"] + 0.003)
-                }
-        
-        # 기술 채택률 증가
-        for year in range(2025, 2031):
-            if year not in self.timeseries_data["technology_adoption"]:
-                prev_year = year - 1
-                prev_data = self.timeseries_data["technology_adoption"][prev_year]
-                
-                self.timeseries_data["technology_adoption"][year] = {
-                    "smartphone_penetration": min(0.99, prev_data["smartphone_penetration"] + 0.006),
-                    "internet_usage": min(0.99, prev_data["internet_usage"] + 0.009),
-                    "social_media_users": min(0.95, prev_data["social_media_users"] + 0.028),
-                    "online_shopping_adoption": min(0.95, prev_data["online_shopping_adoption"] + 0.043),
-                    "streaming_service_usage": min(0.90, prev_data["streaming_service_usage"] + 0.066),
-                    "digital_payment_usage": min(0.95, prev_data["digital_payment_usage"] + 0.067)
-                }
-        
-        # 문화적 트렌드 진화
-        for year in range(2025, 2031):
-            if year not in self.timeseries_data["cultural_trends"]:
-                prev_year = year - 1
-                prev_data = self.timeseries_data["cultural_trends"][prev_year]
-                
-                self.timeseries_data["cultural_trends"][year] = {
-                    "work_life_balance_importance": min(0.85, prev_data["work_life_balance_importance"] + 0.028),
-                    "environmental_consciousness": min(0.80, prev_data["environmental_consciousness"] + 0.033),
-                    "health_consciousness": min(0.90, prev_data["health_consciousness"] + 0.034),
-                    "individual_vs_collective": min(0.70, prev_data["individual_vs_collective"] + 0.014),
-                    "gender_equality_awareness": min(0.85, prev_data["gender_equality_awareness"] + 0.022),
-                    "mental_health_awareness": min(0.80, prev_data["mental_health_awareness"] + 0.033)
-                }
     
-    def get_year_data(self, year: int) -> Dict[str, Any]:
-        """특정 연도의 모든 트렌드 데이터 반환"""
+    def year_index(self, year: int) -> int:
+        """연도 -> 배열 행 인덱스 (데이터 범위 밖의 연도는 기준 연도)"""
         if not (self.data_range[0] <= year <= self.data_range[1]):
             year = self.base_year
-            
-        return {
-            "demographic_trends": self.timeseries_data["demographic_trends"].get(year, {}),
-            "technology_adoption": self.timeseries_data["technology_adoption"].get(year, {}),
-            "cultural_trends": self.timeseries_data["cultural_trends"].get(year, {}),
-            "consumption_patterns": self.timeseries_data["consumption_patterns"].get(year, {}),
-            "media_consumption": self.timeseries_data["media_consumption"].get(year, {})
-        }
+        return int(year) - self.data_range[0]
+    
+    def metric_values(self, category: str, year: int) -> np.ndarray:
+        """특정 연도의 카테고리 지표 벡터 (읽기 전용 뷰, 순서는 series[category].metrics, 없는 값은 NaN)"""
+        return self.series[category].values[self.year_index(year)]
+    
+    def distribution(self, category: str, name: str, year: int) -> Tuple[Tuple[str, ...], np.ndarray]:
+        """특정 연도의 (구간 이름, 정규화된 확률 벡터) - 확률 벡터는 읽기 전용 뷰"""
+        distribution = self.series[category].distributions[name]
+        return distribution.buckets, distribution.probabilities[self.year_index(year)]
+    
+    def interpolate(self, times, extrapolation: str = "clamp") -> InterpolatedTrends:
+        """
+        모든 카테고리의 지표와 분포를 소수 시점(예: 2024.25 = 2024년 2분기 시작)에서 한 번에 선형 보간합니다.
+
+        Args:
+            times: 시점 하나 또는 시점 배열 (연 단위 소수)
+            extrapolation: 데이터 범위 밖 시점 처리 방식 (EXTRAPOLATION_MODES)
+
+        Raises:
+            ValueError: 지원하지 않는 외삽 방식
+        """
+        if extrapolation not in EXTRAPOLATION_MODES:
+            raise ValueError(f"지원하지 않는 외삽 방식: {extrapolation} (가능: {', '.join(EXTRAPOLATION_MODES)})")
+        times = np.atleast_1d(np.asarray(times, dtype=np.float64))
+        trends = InterpolatedTrends(times.copy(), extrapolation)
+        for category, series in self.series.items():
+            trends.metric_names[category] = series.metrics
+            trends.values[category] = _read_only(
+                _interpolate_rows(self.years, series.values, times, extrapolation, self.base_year))
+            for name, distribution in series.distributions.items():
+                weights = _interpolate_rows(self.years, distribution.values, times, extrapolation, self.base_year)
+                if extrapolation == "linear":
+                    weights = np.clip(weights, 0.0, None)
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    probabilities = weights / weights.sum(axis=1, keepdims=True)
+                trends.buckets[(category, name)] = distribution.buckets
+                trends.probabilities[(category, name)] = _read_only(probabilities)
+        return trends
+    
+    def trend_grid(self, start: float, end: float, steps_per_year: int = 12,
+                   extrapolation: str = "clamp") -> InterpolatedTrends:
+        """
+        start부터 end까지 연간 steps_per_year개 시점(월별 12, 분기별 4)의 보간 결과를 미리 계산해 캐시합니다.
+        코호트 시뮬레이션은 시점마다 보간하지 않고 time_index로 행을 조회하면 됩니다.
+        """
+        key = (float(start), float(end), int(steps_per_year), extrapolation)
+        grid = self._grid_cache.get(key)
+        if grid is None:
+            steps = int(round((end - start) * steps_per_year))
+            grid = self._grid_cache[key] = self.interpolate(start + np.arange(steps + 1) / steps_per_year, extrapolation)
+        return grid
+    
+    def get_year_data(self, year: int) -> Dict[str, Any]:
+        """특정 연도의 모든 트렌드 데이터 반환 (연도별로 한 번 만들어 캐시한 읽기 전용 사전)"""
+        return self._year_data(year)
+
+    def _year_data(self, year: int) -> Dict[str, Any]:
+        """get_year_data 본체 (세대/지역 트렌드 계산 등 내부 조회용)"""
+        row = self.year_index(year)
+        data = self._year_data_cache.get(row)
+        if data is None:
+            data = self._year_data_cache[row] = _FrozenDict(
+                (category, series.year_dict(row)) for category, series in self.series.items()
+            )
+        return data
     
     def get_trend_factor(self, category: str, metric: str, year: int) -> float:
         """특정 메트릭의 연도별 트렌드 팩터 반환 (0.0 ~ 1.0)"""
-        if not (self.data_range[0] <= year <= self.data_range[1]):
-            year = self.base_year
-            
-        try:
-            return self.timeseries_data[category][year][metric]
-        except KeyError:
-            return 0.5  # 기본값
+        series = self.series.get(category)
+        column = series.metric_index.get(metric) if series is not None else None
+        if column is None:
+            return DEFAULT_TREND_FACTOR  # 기본값
+        value = series.values[self.year_index(year), column]
+        return DEFAULT_TREND_FACTOR if np.isnan(value) else float(value)
     
     def interpolate_trend(self, category: str, metric: str, start_year: int, end_year: int, target_year: int) -> float:
         """두 연도 사이의 트렌드 보간"""
@@ -383,10 +506,25 @@ class TimeSeriesDataManager:
         ratio = (target_year - start_year) / (end_year - start_year)
         return start_value + (end_value - start_value) * ratio
     
+    def _cached_trends(self, kind: str, year: int, build):
+        """데이터 범위 안의 연도는 트렌드 결과를 한 번만 계산해 읽기 전용으로 캐시"""
+        if not (self.data_range[0] <= year <= self.data_range[1]):
+            return build(year)
+        trends = self._trend_cache.get((kind, year))
+        if trends is None:
+            trends = self._trend_cache[(kind, year)] = _FrozenDict(
+                (name, _FrozenDict(values)) for name, values in build(year).items()
+            )
+        return trends
+    
     def get_generational_trends(self, year: int) -> Dict[str, Dict[str, float]]:
         """연도별 세대 특성 트렌드 반환"""
-        cultural_data = self.get_year_data(year)["cultural_trends"]
-        tech_data = self.get_year_data(year)["technology_adoption"]
+        return self._cached_trends("generational", year, self._build_generational_trends)
+    
+    def _build_generational_trends(self, year: int) -> Dict[str, Dict[str, float]]:
+        year_data = self._year_data(year)
+        cultural_data = year_data["cultural_trends"]
+        tech_data = year_data["technology_adoption"]
         
         # 기본 세대별 특성에 연도별 트렌드 반영
         return {
@@ -422,8 +560,12 @@ class TimeSeriesDataManager:
     
     def get_regional_trends(self, year: int) -> Dict[str, Dict[str, float]]:
         """연도별 지역 특성 트렌드 반환"""
-        tech_data = self.get_year_data(year)["technology_adoption"]
-        cultural_data = self.get_year_data(year)["cultural_trends"]
+        return self._cached_trends("regional", year, self._build_regional_trends)
+    
+    def _build_regional_trends(self, year: int) -> Dict[str, Dict[str, float]]:
+        year_data = self._year_data(year)
+        tech_data = year_data["technology_adoption"]
+        cultural_data = year_data["cultural_trends"]
         
         return {
             "서울": {
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+검증 규칙 코어 모듈
+두 생성기의 검증 규칙을 같은 형태 - 연령 축과 범주형 속성 축 위의 조밀한 위반 코드 테이블 - 로 컴파일해
+한 건 검증(테이블 조회 몇 번)과 배치 검증(NumPy 인덱싱)을 같은 코드로 수행합니다.
+각 생성기는 자기 페르소나 스키마를 (연령, 속성 코드, 수치 값)으로 바꾸는 어댑터만 가집니다.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+AGE_AXIS = "age"
+# 위반 코드 테이블 dtype과 코드 최댓값 (코드 = 규칙 사전의 항목 번호)
+CODE_DTYPE = np.int16
+MAX_VIOLATION_CODE = int(np.iinfo(CODE_DTYPE).max)
+
+
+class CoreRule:
+    """
+    테이블 하나로 표현된 검증 규칙.
+    axes는 "age" 또는 범주형 필드 이름 1~2개이며, table[인덱스...]가 0이면 통과, 양수이면 위반 코드입니다.
+    numeric이 있으면 (필드, 하한 배열, 상한 배열)로 해석해 값이 축 인덱스별 범위를 벗어나면 코드 1로 위반합니다.
+    """
+
+    def __init__(self, name: str, axes: Tuple[str, ...], table: Optional[np.ndarray] = None,
+                 severity: str = "error", numeric: Optional[Tuple[str, np.ndarray, np.ndarray]] = None):
+        self.name = name
+        self.axes = axes
+        self.table = table
+        self.severity = severity
+        self.numeric = numeric
+
+
+class ValidationCore:
+    """
+    컴파일된 규칙 테이블 묶음.
+    연령은 [age_min, age_max]로 잘라 인덱싱하므로, 어댑터는 축 밖의 연령에서 규칙 결과가 변하지 않도록
+    축 범위를 정해야 합니다. 각 범주형 필드의 마지막 코드(len(vocabulary))는 어휘에 없는 값을 뜻합니다.
+    정수가 아닌 연령은 age_rule (규칙 이름, 위반 코드)의 위반으로 보고하고, 연령 축을 쓰는 나머지 규칙은
+    평가하지 않습니다 (연령이 없는 경우와 같은 취급).
+    """
+
+    def __init__(self, age_range: Tuple[int, int], vocabularies: Dict[str, Sequence[str]], rules: List[CoreRule],
+                 age_rule: Optional[Tuple[str, int]] = None):
+        self.age_min, self.age_max = age_range
+        self.vocabularies = {field: list(labels) for field, labels in vocabularies.items()}
+        self._index = {field: {label: code for code, label in enumerate(labels)}
+                       for field, labels in self.vocabularies.items()}
+        self.rules = rules
+        self.age_rule = age_rule
+        self.ages = np.arange(self.age_min, self.age_max + 1)
+
+    @classmethod
+    def compile(cls, age_range: Tuple[int, int], vocabularies: Dict[str, Sequence[str]],
+                predicates: List[Tuple[str, Tuple[str, ...], Callable[..., int], str]],
+                numeric_rules: Sequence[Tuple[str, str, str, Callable[[Any], Tuple[float, float]]]] = (),
+                order: Optional[Sequence[str]] = None, age_rule: Optional[Tuple[str, int]] = None):
+        """
+        스칼라 판정 함수를 축의 모든 조합에서 한 번씩 평가해 테이블로 만듭니다.
+
+        Args:
+            age_range: 연령 축 (최소, 최대)
+            vocabularies: 필드 -> 알려진 값 목록 (판정 함수에는 어휘에 없는 값 대신 None이 전달됨)
+            predicates: (규칙 이름, 축, 판정 함수(축 값...) -> 위반 코드, 심각도) 목록
+            numeric_rules: (규칙 이름, 수치 필드, 축, 축 값 -> (하한, 상한)) 목록
+            order: 규칙 이름 순서 (검증 결과의 순서, 기본: predicates 다음 numeric_rules)
+            age_rule: 정수가 아닌 연령을 보고할 (규칙 이름, 위반 코드) - 연령 축 규칙이어야 함
+        """
+        core = cls(age_range, vocabularies, [], age_rule)
+        for name, axes, predicate, severity in predicates:
+            grids = [core.axis_values(axis) for axis in axes]
+            table = np.zeros([len(grid) for grid in grids], dtype=CODE_DTYPE)
+            for index in np.ndindex(*table.shape):
+                code = predicate(*(grid[i] for grid, i in zip(grids, index)))
+                if not 0 <= code <= MAX_VIOLATION_CODE:
+                    raise ValueError(f"{name} 규칙의 위반 코드 {code}가 코드 범위(0~{MAX_VIOLATION_CODE})를 벗어납니다")
+                table[index] = code
+            core.rules.append(CoreRule(name, axes, table, severity))
+        for name, field, axis, bounds in numeric_rules:
+            values = np.array([bounds(value) for value in core.axis_values(axis)], dtype=np.float64)
+            core.rules.append(CoreRule(name, (axis,), numeric=(field, values[:, 0], values[:, 1])))
+        if order is not None:
+            core.rules.sort(key=lambda rule: list(order).index(rule.name))
+        if age_rule is not None and AGE_AXIS not in core.rule(age_rule[0]).axes:
+            raise ValueError(f"{age_rule[0]} 규칙은 연령 축을 사용하지 않습니다")
+        return core
+
+    def rule(self, name: str) -> CoreRule:
+        return next(rule for rule in self.rules if rule.name == name)
+
+    def axis_values(self, axis: str) -> List[Any]:
+        """축 인덱스 순서의 값 (범주형 축의 마지막은 '어휘에 없는 값'을 뜻하는 None)"""
+        if axis == AGE_AXIS:
+            return self.ages.tolist()
+        return self.vocabularies[axis] + [None]
+
+    def encode(self, field: str, label: Any) -> int:
+        try:
+            return self._index[field].get(label, len(self.vocabularies[field]))
+        except TypeError:  # 해시할 수 없는 값
+            return len(self.vocabularies[field])
+
+    def encode_column(self, field: str, labels: Sequence[Any]) -> np.ndarray:
+        return np.fromiter((self.encode(field, label) for label in labels), dtype=np.int32, count=len(labels))
+
+    def age_index(self, age) -> int:
+        """
+        연령 -> 연령 축 인덱스 (축 밖의 연령은 양 끝으로 자름)
+
+        Raises:
+            ValueError: 정수가 아닌 연령 (19.5세를 19세로 자르지 않음)
+        """
+        if int(age) != age:
+            raise ValueError(f"연령은 정수여야 합니다: {age}")
+        return min(max(int(age), self.age_min), self.age_max) - self.age_min
+
+    def check(self, age, labels: Dict[str, Any], numbers: Optional[Dict[str, float]] = None) -> List[Tuple[CoreRule, int]]:
+        """
+        한 건 검증: 위반한 (규칙, 코드) 목록을 규칙 순서대로 반환
+
+        Raises:
+            ValueError: 정수가 아닌 연령인데 age_rule이 없는 경우
+        """
+        index = {}
+        fractional = age % 1 != 0
+        if not fractional:
+            index[AGE_AXIS] = self.age_index(age)
+        elif self.age_rule is None:
+            raise ValueError(f"연령은 정수여야 합니다: {age}")
+        for field, label in labels.items():
+            index[field] = self.encode(field, label)
+        violations = []
+        for rule in self.rules:
+            if fractional and AGE_AXIS in rule.axes:
+                if rule.name == self.age_rule[0]:
+                    violations.append((rule, self.age_rule[1]))
+                continue
+            if rule.numeric is not None:
+                field, low, high = rule.numeric
+                value = numbers.get(field) if numbers else None
+                position = index[rule.axes[0]]
+                if value is not None and not low[position] <= value <= high[position]:
+                    violations.append((rule, 1))
+                continue
+            code = int(rule.table[tuple(index[axis] for axis in rule.axes)])
+            if code:
+                violations.append((rule, code))
+        return violations
+
+    def check_batch(self, age: np.ndarray, codes: Dict[str, np.ndarray],
+                    numbers: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, np.ndarray]:
+        """
+        배치 검증: 규칙 -> 위반 코드 배열. 축 필드가 codes/numbers에 없는 규칙은 건너뜁니다.
+        codes는 encode/encode_column으로 만든 코드 배열이어야 합니다.
+
+        Raises:
+            ValueError: 정수가 아닌 연령이 있는데 age_rule이 없는 경우
+        """
+        age = np.asarray(age)
+        fractional = None
+        if not np.issubdtype(age.dtype, np.integer):
+            fractional = np.mod(age, 1) != 0
+            if not fractional.any():
+                fractional = None
+            elif self.age_rule is None:
+                raise ValueError(f"연령은 정수여야 합니다: {age[fractional][:5].tolist()}")
+            else:
+                age = np.where(fractional, self.age_min, age)
+        index = dict(codes)
+        index[AGE_AXIS] = np.clip(age, self.age_min, self.age_max).astype(np.intp) - self.age_min
+        numbers = numbers or {}
+        results = {}
+        for rule in self.rules:
+            if any(axis not in index for axis in rule.axes):
+                continue
+            if rule.numeric is not None:
+                field, low, high = rule.numeric
+                if field not in numbers:
+                    continue
+                position = index[rule.axes[0]]
+                value = np.asarray(numbers[field])
+                violations = ((value < low[position]) | (value > high[position])).astype(CODE_DTYPE)
+            else:
+                violations = rule.table[tuple(index[axis] for axis in rule.axes)]
+            if fractional is not None and AGE_AXIS in rule.axes:
+                violations[fractional] = self.age_rule[1] if rule.name == self.age_rule[0] else 0
+            results[rule.name] = violations
+        return results
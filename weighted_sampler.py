@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+가중치 샘플러 모듈
+Walker/Vose 별칭(alias) 테이블을 미리 만들어 두고 O(1)로 가중치 추출을 수행합니다.
+"""
+
+import random
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+class AliasSampler:
+    """정적 가중치 분포용 별칭 테이블 샘플러 (한 번 컴파일 후 재사용)"""
+
+    def __init__(self, choices_dict: Dict[Any, float]):
+        if not choices_dict:
+            raise ValueError("빈 분포로는 샘플러를 만들 수 없습니다")
+
+        self.items: List[Any] = list(choices_dict.keys())
+        weights = np.asarray(list(choices_dict.values()), dtype=np.float64)
+        if np.any(weights < 0) or weights.sum() <= 0:
+            raise ValueError(f"가중치는 0 이상이고 합이 양수여야 합니다: {choices_dict}")
+
+        self.probabilities = weights / weights.sum()
+        self._prob, self._alias = self._build_tables(self.probabilities)
+
+        # 단일 추출 경로용 파이썬 리스트 (NumPy 스칼라 변환 비용 회피)
+        self._prob_list = self._prob.tolist()
+        self._alias_list = self._alias.tolist()
+        self._size = len(self.items)
+
+    @staticmethod
+    def _build_tables(probabilities: np.ndarray):
+        """Vose 알고리즘으로 별칭 테이블 생성"""
+        n = len(probabilities)
+        scaled = probabilities * n
+        prob = np.ones(n, dtype=np.float64)
+        alias = np.arange(n, dtype=np.int64)
+
+        small = [i for i in range(n) if scaled[i] < 1.0]
+        large = [i for i in range(n) if scaled[i] >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] = scaled[l] + scaled[s] - 1.0
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+        # 남은 칸은 부동소수점 오차를 제외하면 확률 1
+        return prob, alias
+
+    def __len__(self) -> int:
+        return self._size
+
+    def draw(self, rand=random) -> Any:
+        """항목 하나를 추출 (rand: random 모듈 또는 random.Random 인스턴스)"""
+        u = rand.random() * self._size
+        i = int(u)
+        return self.items[i] if u - i < self._prob_list[i] else self.items[self._alias_list[i]]
+
+    def draw_codes(self, size: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """항목 인덱스(코드)를 size개 한 번에 추출"""
+        rng = rng if rng is not None else np.random.default_rng()
+        columns = rng.integers(0, self._size, size=size)
+        coin = rng.random(size)
+        return np.where(coin < self._prob[columns], columns, self._alias[columns])
+
+    def draw_many(self, size: int, rng: Optional[np.random.Generator] = None) -> List[Any]:
+        """항목을 size개 한 번에 추출"""
+        return [self.items[code] for code in self.draw_codes(size, rng).tolist()]